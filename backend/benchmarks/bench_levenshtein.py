@@ -0,0 +1,88 @@
+"""Levenshtein距離のベンチマーク.
+
+行単位の動的計画法（旧実装）とビット並列実装を、トランスクリプト名×会議名の
+組み合わせで比較する。
+
+Usage:
+    uv run python benchmarks/bench_levenshtein.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.domain.services.matching_algorithm import _levenshtein_distance  # noqa: E402
+
+DOCUMENT_NAMES = [
+    f"定例MTG - 2026/10/{day:02d} {hour:02d}:00 - Transcript" for day in range(1, 31) for hour in (10, 15)
+] + [f"Weekly Product Sync - 2026-10-{day:02d} - Gemini によるメモ" for day in range(1, 31)]
+
+MEETING_TITLES = [
+    "定例MTG",
+    "Weekly Product Sync",
+    "1on1 田中 / 佐藤",
+    "プロダクト戦略レビュー会議",
+    "Engineering All Hands",
+    "デザイン定例",
+    "営業チーム週次共有会",
+    "Customer Success Weekly",
+] * 5
+
+
+def _dynamic_programming(s1: str, s2: str) -> int:
+    """旧実装（行単位の動的計画法）."""
+    if len(s1) < len(s2):
+        return _dynamic_programming(s2, s1)
+    if len(s2) == 0:
+        return len(s1)
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def _run_all(max_distance: int | None = None) -> None:
+    for name in DOCUMENT_NAMES:
+        for title in MEETING_TITLES:
+            _levenshtein_distance(name.lower(), title.lower(), max_distance)
+
+
+def _run_all_reference() -> None:
+    for name in DOCUMENT_NAMES:
+        for title in MEETING_TITLES:
+            _dynamic_programming(name.lower(), title.lower())
+
+
+def main() -> None:
+    """各実装の実行時間を出力する."""
+    pairs = len(DOCUMENT_NAMES) * len(MEETING_TITLES)
+    for name in DOCUMENT_NAMES:
+        for title in MEETING_TITLES:
+            if _levenshtein_distance(name.lower(), title.lower()) != _dynamic_programming(name.lower(), title.lower()):
+                msg = f"mismatch: {name!r} / {title!r}"
+                raise AssertionError(msg)
+
+    cases = {
+        "dynamic programming": _run_all_reference,
+        "bit-parallel": _run_all,
+        "bit-parallel (max_distance=10)": lambda: _run_all(10),
+    }
+    baseline = None
+    for label, func in cases.items():
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        baseline = baseline or seconds
+        sys.stdout.write(
+            f"{label:<32} {seconds * 1000:8.2f} ms  {seconds / pairs * 1e6:6.2f} us/pair  x{baseline / seconds:5.1f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
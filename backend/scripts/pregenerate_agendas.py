@@ -0,0 +1,87 @@
+"""次回開催が近い定例MTGのアジェンダ下書きを事前生成する.
+
+エージェントに紐付いた定例MTGのうち、次回開催まで AGENDA_PREGENERATE_LEAD_SECONDS 以内のものについて
+アジェンダ生成ジョブを登録する（生成はワーカーが行う）。入力（ナレッジ・議事録・Slack・辞書）が
+前回の下書きから変わっていない開催回は登録しない。cron等で定期的（例: 15分ごと）に実行する。
+サービスキー（SUPABASE_SERVICE_KEY）で全ユーザーの定例MTGを扱う。
+
+Usage:
+    uv run python scripts/pregenerate_agendas.py [--lead-hours N]
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.application.use_cases.agenda_pregeneration_use_cases import PregenerateAgendasUseCase  # noqa: E402
+from src.application.use_cases.agenda_use_cases import AgendaSourceWatermarkReader  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.infrastructure.external.supabase_client import get_supabase_client  # noqa: E402
+from src.infrastructure.repositories.agenda_job_repository_impl import AgendaJobRepositoryImpl  # noqa: E402
+from src.infrastructure.repositories.agent_repository_impl import AgentRepositoryImpl  # noqa: E402
+from src.infrastructure.repositories.dictionary_repository_impl import DictionaryRepositoryImpl  # noqa: E402
+from src.infrastructure.repositories.generated_agenda_repository_impl import (  # noqa: E402
+    GeneratedAgendaRepositoryImpl,
+)
+from src.infrastructure.repositories.knowledge_repository_impl import KnowledgeRepositoryImpl  # noqa: E402
+from src.infrastructure.repositories.meeting_transcript_repository_impl import (  # noqa: E402
+    MeetingTranscriptRepositoryImpl,
+)
+from src.infrastructure.repositories.recurring_meeting_repository_impl import (  # noqa: E402
+    RecurringMeetingRepositoryImpl,
+)
+from src.infrastructure.repositories.slack_integration_repository_impl import (  # noqa: E402
+    SlackIntegrationRepositoryImpl,
+)
+
+
+async def pregenerate(lead_time: timedelta) -> None:
+    """次回開催が近い定例MTGのアジェンダ生成ジョブを登録する."""
+    client = get_supabase_client()
+    if client is None:
+        sys.exit("Supabase is not configured")
+
+    recurring_meeting_repository = RecurringMeetingRepositoryImpl(client)
+    use_case = PregenerateAgendasUseCase(
+        recurring_meeting_repository,
+        AgentRepositoryImpl(client),
+        GeneratedAgendaRepositoryImpl(client),
+        AgendaJobRepositoryImpl(client),
+        AgendaSourceWatermarkReader(
+            KnowledgeRepositoryImpl(client),
+            DictionaryRepositoryImpl(client),
+            recurring_meeting_repository,
+            MeetingTranscriptRepositoryImpl(client),
+            slack_repository=SlackIntegrationRepositoryImpl(client),
+        ),
+        lead_time=lead_time,
+        jitter=timedelta(seconds=settings.AGENDA_PREGENERATE_JITTER_SECONDS),
+        max_per_user=settings.AGENDA_PREGENERATE_MAX_PER_USER,
+        max_attempts=settings.AGENDA_JOB_MAX_ATTEMPTS,
+    )
+    summary = await use_case.execute()
+    sys.stdout.write(
+        f"enqueued {summary.enqueued}, unchanged {summary.unchanged}, "
+        f"in progress {summary.in_progress}, deferred {summary.deferred}\n"
+    )
+
+
+def main() -> None:
+    """アジェンダ生成ジョブを登録する."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--lead-hours",
+        type=float,
+        default=settings.AGENDA_PREGENERATE_LEAD_SECONDS / 3600,
+        help="次回開催までこの時間以内の定例MTGを対象にする",
+    )
+    args = parser.parse_args()
+    asyncio.run(pregenerate(timedelta(hours=args.lead_hours)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""全文検索インデックス（search_entries）を作り直す.
+
+search_entries 作成前に保存されたトランスクリプト・ナレッジを登録する。
+サービスキー（SUPABASE_SERVICE_KEY）で全ユーザーのデータを読み込む。
+
+Usage:
+    uv run python scripts/rebuild_search_index.py [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, cast
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.infrastructure.external.supabase_client import get_supabase_client  # noqa: E402
+from src.infrastructure.repositories.knowledge_repository_impl import (  # noqa: E402
+    KNOWLEDGE_COLUMNS,
+    KnowledgeRepositoryImpl,
+)
+from src.infrastructure.repositories.meeting_transcript_repository_impl import (  # noqa: E402
+    FULL_COLUMNS,
+    MeetingTranscriptRepositoryImpl,
+)
+from src.infrastructure.repositories.search_repository_impl import SearchRepositoryImpl  # noqa: E402
+from src.infrastructure.services.search_index_service import SearchIndexService  # noqa: E402
+
+
+async def rebuild(batch_size: int) -> None:
+    """全トランスクリプト・ナレッジをインデックスに登録する."""
+    client = get_supabase_client()
+    if client is None:
+        sys.exit("Supabase is not configured")
+
+    service = SearchIndexService(SearchRepositoryImpl(client))
+    transcripts = MeetingTranscriptRepositoryImpl(client)
+    knowledge = KnowledgeRepositoryImpl(client)
+
+    indexed = 0
+    start = 0
+    while True:
+        result = (
+            client.table("meeting_transcripts")
+            .select(f"{FULL_COLUMNS}, user_id, recurring_meetings(agent_id)")
+            .order("id")
+            .range(start, start + batch_size - 1)
+            .execute()
+        )
+        rows = cast(list[dict[str, Any]], result.data)
+        for row in rows:
+            meeting = row.get("recurring_meetings") or {}
+            agent_id = meeting.get("agent_id")
+            indexed += await service.index_transcript(
+                transcripts._to_entity(row),
+                UUID(str(row["user_id"])),
+                UUID(str(agent_id)) if agent_id else None,
+            )
+        sys.stdout.write(f"transcripts: {start + len(rows)} rows, {indexed} entries\n")
+        if len(rows) < batch_size:
+            break
+        start += batch_size
+
+    indexed = 0
+    start = 0
+    while True:
+        result = (
+            client.table("knowledge")
+            .select(KNOWLEDGE_COLUMNS)
+            .order("id")
+            .range(start, start + batch_size - 1)
+            .execute()
+        )
+        rows = cast(list[dict[str, Any]], result.data)
+        for row in rows:
+            indexed += await service.index_knowledge(knowledge._to_entity(row))
+        sys.stdout.write(f"knowledge: {start + len(rows)} rows, {indexed} entries\n")
+        if len(rows) < batch_size:
+            break
+        start += batch_size
+
+
+def main() -> None:
+    """インデックスを作り直す."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=100, help="1回に読み込む行数")
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""有効期限が近いGoogleのプッシュ通知チャネルを作り直す.
+
+Calendar / Driveのチャネルは有効期限（最長1週間）を過ぎると通知が止まるため、
+cron等で定期的に実行する。サービスキー（SUPABASE_SERVICE_KEY）で全ユーザーのチャネルを扱う。
+
+Usage:
+    uv run python scripts/renew_watch_channels.py [--renew-before-hours N]
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.application.use_cases.watch_use_cases import RenewWatchChannelsUseCase  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.infrastructure.external.supabase_client import get_supabase_client  # noqa: E402
+from src.infrastructure.repositories.google_integration_repository_impl import (  # noqa: E402
+    GoogleIntegrationRepositoryImpl,
+)
+from src.infrastructure.repositories.watch_channel_repository_impl import WatchChannelRepositoryImpl  # noqa: E402
+
+
+async def renew(renew_before: timedelta) -> None:
+    """有効期限が近いチャネルを作り直す."""
+    client = get_supabase_client()
+    if client is None:
+        sys.exit("Supabase is not configured")
+    if settings.GOOGLE_WEBHOOK_URL is None:
+        sys.exit("GOOGLE_WEBHOOK_URL is not configured")
+
+    use_case = RenewWatchChannelsUseCase(
+        GoogleIntegrationRepositoryImpl(client),
+        WatchChannelRepositoryImpl(client),
+        address=settings.GOOGLE_WEBHOOK_URL,
+        ttl_seconds=settings.GOOGLE_WATCH_CHANNEL_TTL_SECONDS,
+        renew_before=renew_before,
+    )
+    renewed = await use_case.execute()
+    sys.stdout.write(f"renewed {renewed} channels\n")
+
+
+def main() -> None:
+    """チャネルを更新する."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--renew-before-hours",
+        type=float,
+        default=settings.GOOGLE_WATCH_RENEW_BEFORE_SECONDS / 3600,
+        help="この時間以内に有効期限が切れるチャネルを作り直す",
+    )
+    args = parser.parse_args()
+    asyncio.run(renew(timedelta(hours=args.renew_before_hours)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""アジェンダ生成ジョブのワーカーを起動する.
+
+APIプロセスとは別にワーカーを動かす場合に使う（APIプロセス内のワーカーは
+AGENDA_JOB_WORKERS=0 で止める）。複数プロセスで起動してもジョブは重複して実行されない。
+サービスキー（SUPABASE_SERVICE_KEY）で全ユーザーのジョブを扱う。
+
+Usage:
+    uv run python scripts/run_agenda_worker.py [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.config import settings  # noqa: E402
+from src.infrastructure.external.supabase_client import get_supabase_client  # noqa: E402
+from src.presentation.api.v1.endpoints.agendas import create_agenda_job_worker_pool  # noqa: E402
+
+
+async def run(concurrency: int) -> None:
+    """停止されるまでジョブを実行する."""
+    client = get_supabase_client()
+    if client is None:
+        sys.exit("Supabase is not configured")
+
+    pool = create_agenda_job_worker_pool(client, concurrency)
+    pool.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+
+
+def main() -> None:
+    """ワーカーを起動する."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=max(settings.AGENDA_JOB_WORKERS, 1),
+        help="同時に実行するジョブの数",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""トランスクリプト本文用のzstd辞書を学習する.
+
+過去のトランスクリプト（UTF-8のテキストファイル）から辞書を学習し、
+TRANSCRIPT_ZSTD_DICTIONARY_DIR に置く *.zdict ファイルとして書き出す。
+辞書は名前順で最後のものが圧縮に使われるため、ファイル名には日付を付けること。
+古い辞書は過去の本文の展開に必要なので削除しないこと。
+
+Usage:
+    uv run python scripts/train_transcript_dictionary.py SAMPLES_DIR OUTPUT.zdict
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.infrastructure.services.transcript_body_codec import (  # noqa: E402
+    DEFAULT_DICTIONARY_SIZE,
+    TranscriptBodyCodec,
+    train_dictionary,
+)
+
+
+def main() -> None:
+    """辞書を学習して書き出す."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("samples_dir", type=Path, help="学習に使うトランスクリプト（*.txt）のディレクトリ")
+    parser.add_argument("output", type=Path, help="書き出す辞書ファイル（*.zdict）")
+    parser.add_argument("--size", type=int, default=DEFAULT_DICTIONARY_SIZE, help="辞書の最大バイト数")
+    args = parser.parse_args()
+
+    samples = [path.read_text(encoding="utf-8") for path in sorted(args.samples_dir.glob("*.txt"))]
+    if not samples:
+        parser.error(f"no *.txt samples in {args.samples_dir}")
+
+    dictionary = train_dictionary(samples, args.size)
+    args.output.write_bytes(dictionary)
+
+    raw_size = sum(len(sample.encode("utf-8")) for sample in samples)
+    plain = sum(len(TranscriptBodyCodec().compress(sample).data) for sample in samples)
+    trained = TranscriptBodyCodec([dictionary])
+    with_dictionary = sum(len(trained.compress(sample).data) for sample in samples)
+    sys.stdout.write(
+        f"dictionary id={trained.dictionary_id} size={len(dictionary)} bytes, {len(samples)} samples\n"
+        f"raw {raw_size} bytes / zstd {plain} bytes / zstd+dictionary {with_dictionary} bytes\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Use cases for agenda generation jobs.
+
+アジェンダ生成をHTTPリクエストから切り離し、ジョブキュー経由でワーカーが実行する。
+"""
+
+import logging
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from src.application.use_cases.agenda_use_cases import AgentNotFoundError, GenerateAgendaUseCase, GenerateResult
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStage, AgendaJobStatus
+from src.domain.entities.generated_agenda import AgendaSource, AgendaStatus, GeneratedAgenda
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
+from src.domain.repositories.agent_repository import AgentRepository
+from src.domain.repositories.generated_agenda_repository import GeneratedAgendaRepository
+
+logger = logging.getLogger(__name__)
+
+# ワーカーが実行中に止まり、最大実行回数を超えて再取得されたジョブのエラー
+ABANDONED_JOB_ERROR = "Agenda generation was interrupted too many times"
+
+
+def data_sources_of(result: GenerateResult) -> dict[str, Any]:
+    """生成結果からジョブに保存するデータソースの情報を取り出す.
+
+    Args:
+        result: アジェンダ生成結果
+
+    Returns:
+        データソースの情報
+    """
+    return {
+        "has_knowledge": result.has_knowledge,
+        "has_slack_messages": result.has_slack_messages,
+        "slack_message_count": result.slack_message_count,
+        "dictionary_entry_count": result.dictionary_entry_count,
+        "has_transcripts": result.has_transcripts,
+        "transcript_count": result.transcript_count,
+        "slack_error": result.slack_error,
+        "retrieved_chunk_count": result.retrieved_chunk_count,
+        "reused": result.reused,
+        "incremental": result.incremental,
+    }
+
+
+class EnqueueAgendaJobUseCase:
+    """アジェンダ生成ジョブ登録ユースケース."""
+
+    def __init__(
+        self,
+        job_repository: AgendaJobRepository,
+        agent_repository: AgentRepository,
+        max_attempts: int,
+    ) -> None:
+        self.job_repository = job_repository
+        self.agent_repository = agent_repository
+        self.max_attempts = max_attempts
+
+    async def execute(
+        self, user_id: UUID, agent_id: UUID, force: bool = False, input_fingerprint: str | None = None
+    ) -> AgendaJob:
+        """アジェンダ生成ジョブを登録する.
+
+        入力のフィンガープリントが同じ実行待ち・実行中のジョブがあれば、登録せずにそのジョブを返す
+        （同時に届いた生成要求は1件の生成にまとめ、呼び出し元はそのジョブの完了を待つ）。
+
+        Args:
+            user_id: ユーザーID
+            agent_id: エージェントID
+            force: 入力が前回の生成から変わっていなくても生成し直す
+            input_fingerprint: 現在の入力のフィンガープリント（Noneの場合はまとめない）
+
+        Returns:
+            登録したジョブ、または入力が同じ実行中のジョブ
+
+        Raises:
+            AgentNotFoundError: エージェントが見つからない場合
+        """
+        if not self.agent_repository.get_by_id(agent_id, user_id):
+            raise AgentNotFoundError("Agent not found")
+
+        now = datetime.now(UTC)
+        job = AgendaJob(
+            id=uuid4(),
+            user_id=user_id,
+            agent_id=agent_id,
+            status=AgendaJobStatus.QUEUED,
+            attempts=0,
+            max_attempts=self.max_attempts,
+            run_after=now,
+            created_at=now,
+            updated_at=now,
+            force=force,
+            input_fingerprint=input_fingerprint,
+        )
+        return await self.job_repository.create_or_get_active(job)
+
+
+class GetAgendaJobUseCase:
+    """アジェンダ生成ジョブ取得ユースケース."""
+
+    def __init__(self, job_repository: AgendaJobRepository) -> None:
+        self.job_repository = job_repository
+
+    async def execute(self, job_id: UUID, user_id: UUID) -> AgendaJob | None:
+        """IDでジョブを取得する."""
+        return await self.job_repository.get_by_id(job_id, user_id)
+
+
+class RunAgendaJobUseCase:
+    """ワーカーが取得したアジェンダ生成ジョブを実行するユースケース.
+
+    各段階の開始をジョブに記録し、失敗した場合は最大実行回数まで
+    指数バックオフでキューに戻す。エージェントが見つからない場合はリトライしない。
+    定例MTGの開催回に向けた事前生成ジョブは、生成したアジェンダを下書きとして保存する。
+    """
+
+    def __init__(
+        self,
+        job_repository: AgendaJobRepository,
+        generate_use_case: GenerateAgendaUseCase,
+        retry_base_seconds: float,
+        generated_agenda_repository: GeneratedAgendaRepository | None = None,
+    ) -> None:
+        self.job_repository = job_repository
+        self.generate_use_case = generate_use_case
+        self.retry_base_seconds = retry_base_seconds
+        self.generated_agenda_repository = generated_agenda_repository
+
+    async def execute(self, job: AgendaJob, worker_id: str) -> None:
+        """ジョブを実行する.
+
+        ジョブの更新はworker_idが取得中の場合だけ行う（期限切れで別のワーカーに
+        再取得された場合は、そのワーカーの結果を上書きしない）。
+
+        Args:
+            job: claim_nextで取得したジョブ（attemptsは今回の実行を含む）
+            worker_id: ジョブを取得したワーカーのID
+        """
+        if job.attempts > job.max_attempts:
+            await self.job_repository.mark_failed(job.id, worker_id, ABANDONED_JOB_ERROR)
+            return
+
+        async def report(stage: AgendaJobStage) -> None:
+            await self.job_repository.update_stage(job.id, worker_id, stage)
+
+        try:
+            result = await self.generate_use_case.execute(job.user_id, job.agent_id, progress=report, force=job.force)
+            await self._save_draft(job, result)
+        except AgentNotFoundError as e:
+            logger.warning("Agenda job %s failed: %s", job.id, e)
+            await self.job_repository.mark_failed(job.id, worker_id, str(e))
+            return
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            if job.can_retry:
+                run_after = datetime.now(UTC) + job.retry_delay(self.retry_base_seconds)
+                logger.warning("Agenda job %s failed (attempt %d), retrying: %s", job.id, job.attempts, error)
+                await self.job_repository.schedule_retry(job.id, worker_id, error, run_after)
+            else:
+                logger.error("Agenda job %s failed after %d attempts: %s", job.id, job.attempts, error)
+                await self.job_repository.mark_failed(job.id, worker_id, error)
+            return
+
+        await self.job_repository.mark_succeeded(job.id, worker_id, result.agenda.id, data_sources_of(result))
+
+    async def _save_draft(self, job: AgendaJob, result: GenerateResult) -> None:
+        """事前生成ジョブの場合、生成したアジェンダを開催回の下書きとして保存する."""
+        if self.generated_agenda_repository is None or job.recurring_meeting_id is None or job.target_date is None:
+            return
+
+        agenda = result.agenda
+        sources: list[AgendaSource] = []
+        if agenda.source_knowledge_id:
+            sources.append(AgendaSource("knowledge", str(agenda.source_knowledge_id), "最新のナレッジ"))
+        if result.transcript_count:
+            sources.append(AgendaSource("transcript", "", f"議事録{result.transcript_count}件"))
+        if result.slack_message_count:
+            sources.append(AgendaSource("slack", "", f"Slackメッセージ{result.slack_message_count}件"))
+
+        now = datetime.now(UTC)
+        await self.generated_agenda_repository.upsert(
+            GeneratedAgenda(
+                id=uuid4(),
+                recurring_meeting_id=job.recurring_meeting_id,
+                target_date=job.target_date,
+                agenda_content={"content": agenda.content, "data_sources": data_sources_of(result)},
+                sources=sources,
+                status=AgendaStatus.DRAFT,
+                delivered_via=None,
+                created_at=now,
+                updated_at=now,
+                agenda_id=agenda.id,
+                input_fingerprint=job.input_fingerprint,
+            )
+        )
@@ -0,0 +1,234 @@
+"""Use cases for pre-generating agendas ahead of recurring meetings.
+
+定例MTGの次回開催の前に、アジェンダ生成ジョブを登録して下書きを作っておく。
+ユーザーは生成を待たずに下書きを開ける。
+"""
+
+import logging
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from src.application.use_cases.agenda_use_cases import AgendaSourceWatermarkReader
+from src.domain.entities.agenda import Agenda
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStatus
+from src.domain.entities.generated_agenda import AgendaStatus, GeneratedAgenda
+from src.domain.entities.recurring_meeting import RecurringMeeting
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
+from src.domain.repositories.agenda_repository import AgendaRepository
+from src.domain.repositories.agent_repository import AgentRepository
+from src.domain.repositories.generated_agenda_repository import GeneratedAgendaRepository
+from src.domain.repositories.recurring_meeting_repository import RecurringMeetingRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PregenerationSummary:
+    """事前生成の登録結果.
+
+    Attributes:
+        enqueued: 生成ジョブを登録した開催回の数
+        unchanged: 入力が変わっていない・確認済みのため生成しなかった開催回の数
+        in_progress: 生成ジョブが実行待ち・実行中の開催回の数
+        deferred: ユーザーごとの上限を超えたため次回に回した開催回の数
+    """
+
+    enqueued: int = 0
+    unchanged: int = 0
+    in_progress: int = 0
+    deferred: int = 0
+
+
+def interleave_by_user(meetings: list[RecurringMeeting]) -> list[RecurringMeeting]:
+    """ユーザーごとに1件ずつ順番に並べる.
+
+    1人のユーザーの定例MTGが多くても、他のユーザーの登録が後回しにならないようにする。
+    各ユーザーの中では元の順序（次回開催日時の昇順）を保つ。
+
+    Args:
+        meetings: 定例MTGのリスト
+
+    Returns:
+        ユーザーを巡回する順に並べた定例MTGのリスト
+    """
+    by_user: dict[UUID, list[RecurringMeeting]] = {}
+    for meeting in meetings:
+        by_user.setdefault(meeting.user_id, []).append(meeting)
+
+    ordered: list[RecurringMeeting] = []
+    queues = list(by_user.values())
+    for index in range(max((len(queue) for queue in queues), default=0)):
+        ordered.extend(queue[index] for queue in queues if index < len(queue))
+    return ordered
+
+
+class PregenerateAgendasUseCase:
+    """定例MTGの次回開催前にアジェンダの下書きを生成するユースケース.
+
+    次回開催までlead_time以内のエージェント紐付け済み定例MTGについて生成ジョブを登録する。
+    全ユーザーの定例MTGを対象にするため、サービスキーのクライアントで実行する。
+    """
+
+    def __init__(
+        self,
+        recurring_meeting_repository: RecurringMeetingRepository,
+        agent_repository: AgentRepository,
+        generated_agenda_repository: GeneratedAgendaRepository,
+        job_repository: AgendaJobRepository,
+        watermark_reader: AgendaSourceWatermarkReader,
+        lead_time: timedelta,
+        jitter: timedelta,
+        max_per_user: int,
+        max_attempts: int,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.recurring_meeting_repository = recurring_meeting_repository
+        self.agent_repository = agent_repository
+        self.generated_agenda_repository = generated_agenda_repository
+        self.job_repository = job_repository
+        self.watermark_reader = watermark_reader
+        self.lead_time = lead_time
+        self.jitter = jitter
+        self.max_per_user = max_per_user
+        self.max_attempts = max_attempts
+        self.rng = rng or random.Random()  # noqa: S311 - 負荷分散のための揺らぎで、暗号用途ではない
+
+    async def execute(self, now: datetime | None = None) -> PregenerationSummary:
+        """次回開催が近い定例MTGのアジェンダ生成ジョブを登録する.
+
+        次の開催回は生成しない。
+        - 生成ジョブが実行待ち・実行中
+        - 下書きが確認済み・送信済み
+        - 下書きの生成時から入力（ナレッジ・議事録・Slack・辞書）が変わっていない
+        ユーザーごとにmax_per_user件まで登録し、実行開始をjitterの範囲でずらす。
+
+        Args:
+            now: 基準日時（省略時は現在日時）
+
+        Returns:
+            登録結果
+        """
+        now = now or datetime.now(UTC)
+        meetings = await self.recurring_meeting_repository.get_linked_occurring_between(now, now + self.lead_time)
+        summary = PregenerationSummary()
+        if not meetings:
+            return summary
+
+        meeting_ids = [meeting.id for meeting in meetings]
+        active = await self.job_repository.get_active_recurring_meeting_ids(meeting_ids)
+        drafts = {
+            (draft.recurring_meeting_id, draft.target_date): draft
+            for draft in await self.generated_agenda_repository.get_upcoming(meeting_ids, now)
+        }
+
+        enqueued_per_user: dict[UUID, int] = {}
+        for meeting in interleave_by_user(meetings):
+            if meeting.id in active:
+                summary.in_progress += 1
+                continue
+            draft = drafts.get((meeting.id, meeting.next_occurrence))
+            if draft is not None and draft.status != AgendaStatus.DRAFT:
+                summary.unchanged += 1
+                continue
+
+            agent = self.agent_repository.get_by_id(meeting.agent_id, meeting.user_id) if meeting.agent_id else None
+            if agent is None:
+                continue
+            fingerprint = (await self.watermark_reader.read(agent)).fingerprint()
+            if draft is not None and draft.input_fingerprint == fingerprint:
+                summary.unchanged += 1
+                continue
+
+            if enqueued_per_user.get(meeting.user_id, 0) >= self.max_per_user:
+                summary.deferred += 1
+                continue
+            job = self._build_job(meeting, agent.id, fingerprint, now)
+            if (await self.job_repository.create_or_get_active(job)).id != job.id:
+                # ユーザーの操作で同じ入力の生成ジョブが実行中（完了後の次回の実行で下書きにする）
+                summary.in_progress += 1
+                continue
+            enqueued_per_user[meeting.user_id] = enqueued_per_user.get(meeting.user_id, 0) + 1
+            summary.enqueued += 1
+
+        logger.info(
+            "Agenda pre-generation: %d enqueued, %d unchanged, %d in progress, %d deferred",
+            summary.enqueued,
+            summary.unchanged,
+            summary.in_progress,
+            summary.deferred,
+        )
+        return summary
+
+    def _build_job(self, meeting: RecurringMeeting, agent_id: UUID, fingerprint: str, now: datetime) -> AgendaJob:
+        """開催回の事前生成ジョブを作る.
+
+        実行開始はjitterの範囲でランダムにずらす（開催までの時間の半分を上限とする）。
+        """
+        max_delay = min(self.jitter, (meeting.next_occurrence - now) / 2)
+        delay = timedelta(seconds=self.rng.uniform(0, max(max_delay.total_seconds(), 0)))
+        return AgendaJob(
+            id=uuid4(),
+            user_id=meeting.user_id,
+            agent_id=agent_id,
+            status=AgendaJobStatus.QUEUED,
+            attempts=0,
+            max_attempts=self.max_attempts,
+            run_after=now + delay,
+            created_at=now,
+            updated_at=now,
+            recurring_meeting_id=meeting.id,
+            target_date=meeting.next_occurrence,
+            input_fingerprint=fingerprint,
+        )
+
+
+@dataclass
+class AgendaDraft:
+    """事前生成したアジェンダの下書き.
+
+    Attributes:
+        generated_agenda: 開催回の事前生成アジェンダ
+        agenda: 下書きのアジェンダ（編集後の内容）
+    """
+
+    generated_agenda: GeneratedAgenda
+    agenda: Agenda
+
+
+class GetAgendaDraftUseCase:
+    """エージェントの次回開催に向けて事前生成した下書きの取得ユースケース."""
+
+    def __init__(
+        self,
+        recurring_meeting_repository: RecurringMeetingRepository,
+        generated_agenda_repository: GeneratedAgendaRepository,
+        agenda_repository: AgendaRepository,
+    ) -> None:
+        self.recurring_meeting_repository = recurring_meeting_repository
+        self.generated_agenda_repository = generated_agenda_repository
+        self.agenda_repository = agenda_repository
+
+    async def execute(self, agent_id: UUID, user_id: UUID, now: datetime | None = None) -> AgendaDraft | None:
+        """最も近い開催回の下書きを取得する.
+
+        Args:
+            agent_id: エージェントID
+            user_id: ユーザーID
+            now: 基準日時（省略時は現在日時）
+
+        Returns:
+            下書き。事前生成されていない場合はNone
+        """
+        now = now or datetime.now(UTC)
+        meetings = await self.recurring_meeting_repository.get_list_by_agent_id(agent_id, user_id)
+        upcoming = await self.generated_agenda_repository.get_upcoming([m.id for m in meetings], now)
+
+        for generated_agenda in upcoming:
+            if generated_agenda.status != AgendaStatus.DRAFT or generated_agenda.agenda_id is None:
+                continue
+            agenda = await self.agenda_repository.get_by_id(generated_agenda.agenda_id, user_id)
+            if agenda is not None:
+                return AgendaDraft(generated_agenda=generated_agenda, agenda=agenda)
+        return None
@@ -5,6 +5,7 @@ Application layer use cases following clean architecture principles.
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
@@ -12,9 +13,13 @@ from uuid import UUID, uuid4
 from slack_sdk.errors import SlackApiError
 
 from src.domain.entities.agenda import Agenda
+from src.domain.entities.agenda_job import AgendaJobStage
 from src.domain.entities.agent import Agent
+from src.domain.entities.dictionary_entry import DictionaryEntry
+from src.domain.entities.embedding_chunk import RetrievedChunk
 from src.domain.entities.knowledge import Knowledge
 from src.domain.entities.meeting_transcript import MeetingTranscript
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.repositories.agenda_repository import AgendaRepository
 from src.domain.repositories.agent_repository import AgentRepository
 from src.domain.repositories.dictionary_repository import DictionaryRepository
@@ -22,15 +27,33 @@ from src.domain.repositories.knowledge_repository import KnowledgeRepository
 from src.domain.repositories.meeting_transcript_repository import MeetingTranscriptRepository
 from src.domain.repositories.recurring_meeting_repository import RecurringMeetingRepository
 from src.domain.repositories.slack_integration_repository import SlackIntegrationRepository
+from src.domain.services.agenda_fingerprint import AgendaSourceWatermarks
+from src.domain.services.text_chunker import extract_open_items
 from src.infrastructure.external.encryption import decrypt_token
 from src.infrastructure.external.slack_client import SlackClient, SlackMessageData
 from src.infrastructure.services.agenda_generation_service import (
     AgendaGenerationInput,
     AgendaGenerationService,
+    AgendaUpdateInput,
 )
+from src.infrastructure.services.embedding_index_service import EmbeddingIndexService
 
 logger = logging.getLogger(__name__)
 
+# 生成の各段階の開始を通知するコールバック
+ProgressCallback = Callable[[AgendaJobStage], Awaitable[None]]
+
+# 生成がタイムアウトした場合のエラーメッセージ
+GENERATION_TIMEOUT_MESSAGE = "Agenda generation timed out"
+
+
+class AgentNotFoundError(ValueError):
+    """アジェンダを生成するエージェントが見つからない（リトライしても成功しない）."""
+
+
+async def _ignore_progress(stage: AgendaJobStage) -> None:
+    """進捗を通知しない場合のコールバック."""
+
 
 @dataclass
 class GenerateResult:
@@ -44,12 +67,184 @@ class GenerateResult:
     has_transcripts: bool = False
     transcript_count: int = 0
     slack_error: str | None = None
+    retrieved_chunk_count: int = 0
+    reused: bool = False
+    incremental: bool = False
+
+
+@dataclass(frozen=True)
+class IncrementalLimits:
+    """前回のアジェンダを差分だけで更新する条件.
+
+    Attributes:
+        max_slack_messages: 前回の生成以降のSlackメッセージの上限
+        max_transcripts: 前回の生成以降に追加されたトランスクリプトの上限
+    """
+
+    max_slack_messages: int
+    max_transcripts: int
+
+
+def _as_aware(value: datetime) -> datetime:
+    """タイムゾーンのない日時をローカル時刻として扱い、比較できるようにする."""
+    return value if value.tzinfo else value.astimezone()
+
+
+def reuse_if_unchanged(previous: Agenda | None, watermarks: AgendaSourceWatermarks) -> GenerateResult | None:
+    """入力が前回の生成から変わっていなければ、前回のアジェンダを生成結果として返す.
+
+    Args:
+        previous: エージェントの最新のアジェンダ
+        watermarks: 現在の入力のウォーターマーク
+
+    Returns:
+        前回のアジェンダを再利用した生成結果。入力が変わっている・前回の生成がない場合はNone
+    """
+    if previous is None or previous.input_fingerprint != watermarks.fingerprint():
+        return None
+
+    # データソースは読み込んでいないため、件数はウォーターマークから分かる範囲のみ返す
+    return GenerateResult(
+        agenda=previous,
+        has_knowledge=watermarks.knowledge_id is not None,
+        has_slack_messages=False,
+        slack_message_count=0,
+        dictionary_entry_count=0,
+        has_transcripts=len(watermarks.transcript_ids) > 0,
+        transcript_count=len(watermarks.transcript_ids),
+        reused=True,
+    )
+
+
+async def get_latest_agenda(agenda_repository: AgendaRepository, agent: Agent) -> Agenda | None:
+    """エージェントの最新のアジェンダを取得する."""
+    latest = await agenda_repository.get_by_agent(agent.id, agent.user_id, limit=1)
+    return latest[0] if latest else None
+
+
+class AgendaSourceWatermarkReader:
+    """アジェンダ生成の入力のウォーターマークを読み取る.
+
+    本文を読み込まずにID・更新日時だけを取得するため、生成するかの判定に使える。
+    """
+
+    def __init__(
+        self,
+        knowledge_repository: KnowledgeRepository,
+        dictionary_repository: DictionaryRepository,
+        recurring_meeting_repository: RecurringMeetingRepository,
+        meeting_transcript_repository: MeetingTranscriptRepository,
+        slack_repository: SlackIntegrationRepository | None = None,
+    ) -> None:
+        self.knowledge_repository = knowledge_repository
+        self.dictionary_repository = dictionary_repository
+        self.recurring_meeting_repository = recurring_meeting_repository
+        self.meeting_transcript_repository = meeting_transcript_repository
+        self.slack_repository = slack_repository
+
+    async def read(self, agent: Agent) -> AgendaSourceWatermarks:
+        """エージェントのアジェンダ生成に使う入力のウォーターマークを読み取る.
+
+        Args:
+            agent: エージェントエンティティ
+
+        Returns:
+            ナレッジ・トランスクリプト・辞書・Slackのウォーターマーク
+        """
+        latest_knowledge = await self.knowledge_repository.get_latest_by_agent(agent.id, agent.user_id)
+
+        # GenerateAgendaUseCaseと同じく、定例MTGごとに直近transcript_count件を使う
+        transcript_ids: list[UUID] = []
+        if agent.transcript_count > 0:
+            meetings = await self.recurring_meeting_repository.get_list_by_agent_id(agent.id, agent.user_id)
+            for meeting in meetings:
+                summaries = await self.meeting_transcript_repository.get_summaries(
+                    agent.user_id, recurring_meeting_id=meeting.id, limit=agent.transcript_count
+                )
+                transcript_ids.extend(summary.id for summary in summaries)
+
+        return AgendaSourceWatermarks(
+            knowledge_id=latest_knowledge.id if latest_knowledge else None,
+            transcript_ids=tuple(transcript_ids),
+            dictionary_version=await self.dictionary_repository.get_version(agent.user_id),
+            slack_latest_ts=await self._read_slack_latest_ts(agent),
+        )
+
+    async def _read_slack_latest_ts(self, agent: Agent) -> str | None:
+        """Slackチャンネルの最新メッセージのtsを取得する（最新の1件のみ取得する）.
+
+        取得できない場合はNoneとする（生成時も取得できなければ同じフィンガープリントになる）。
+        """
+        if self.slack_repository is None or not agent.slack_channel_id:
+            return None
+        try:
+            integrations = await self.slack_repository.get_all(agent.user_id)
+            if not integrations:
+                return None
+            token = decrypt_token(integrations[0].encrypted_access_token)
+            return await asyncio.to_thread(SlackClient(token).get_latest_message_ts, agent.slack_channel_id)
+        except Exception as e:
+            logger.warning("Failed to read latest Slack message: %s", e)
+            return None
+
+
+@dataclass
+class AgendaInputCheck:
+    """生成ジョブを登録する前の入力の確認結果.
+
+    Attributes:
+        fingerprint: 現在の入力のフィンガープリント（同じ入力の生成ジョブをまとめるキー）
+        reusable: 入力が前回の生成から変わっていない場合、前回のアジェンダを再利用した生成結果
+    """
+
+    fingerprint: str
+    reusable: GenerateResult | None = None
+
+
+class CheckAgendaInputsUseCase:
+    """生成ジョブを登録する前に入力を確認するユースケース.
+
+    ウォーターマークだけを読み、前回のアジェンダを再利用できるかと、
+    同じ入力の生成ジョブをまとめるためのフィンガープリントを返す。
+    """
+
+    def __init__(
+        self,
+        agent_repository: AgentRepository,
+        agenda_repository: AgendaRepository,
+        watermark_reader: AgendaSourceWatermarkReader,
+    ) -> None:
+        self.agent_repository = agent_repository
+        self.agenda_repository = agenda_repository
+        self.watermark_reader = watermark_reader
+
+    async def execute(self, user_id: UUID, agent_id: UUID) -> AgendaInputCheck | None:
+        """入力のフィンガープリントを計算し、再利用できる前回のアジェンダを探す.
+
+        Args:
+            user_id: ユーザーID
+            agent_id: エージェントID
+
+        Returns:
+            入力の確認結果。エージェントがない場合はNone
+        """
+        agent = self.agent_repository.get_by_id(agent_id, user_id)
+        if not agent:
+            return None
+        watermarks = await self.watermark_reader.read(agent)
+        return AgendaInputCheck(
+            fingerprint=watermarks.fingerprint(),
+            reusable=reuse_if_unchanged(await get_latest_agenda(self.agenda_repository, agent), watermarks),
+        )
 
 
 class GenerateAgendaUseCase:
     """アジェンダ生成ユースケース."""
 
     TIMEOUT_SECONDS = 30
+    RETRIEVAL_TOP_K = 8
+    # 未決事項が見つからない場合に検索クエリとする末尾の文字数
+    FALLBACK_QUERY_CHARS = 1000
 
     def __init__(
         self,
@@ -61,6 +256,9 @@ class GenerateAgendaUseCase:
         generation_service: AgendaGenerationService,
         recurring_meeting_repository: RecurringMeetingRepository | None = None,
         meeting_transcript_repository: MeetingTranscriptRepository | None = None,
+        embedding_index_service: EmbeddingIndexService | None = None,
+        watermark_reader: AgendaSourceWatermarkReader | None = None,
+        incremental_limits: IncrementalLimits | None = None,
     ) -> None:
         self.agenda_repository = agenda_repository
         self.agent_repository = agent_repository
@@ -70,15 +268,52 @@ class GenerateAgendaUseCase:
         self.generation_service = generation_service
         self.recurring_meeting_repository = recurring_meeting_repository
         self.meeting_transcript_repository = meeting_transcript_repository
+        self.embedding_index_service = embedding_index_service
+        self.watermark_reader = watermark_reader
+        self.incremental_limits = incremental_limits
+
+    async def execute(
+        self,
+        user_id: UUID,
+        agent_id: UUID,
+        progress: ProgressCallback | None = None,
+        force: bool = False,
+    ) -> GenerateResult:
+        """アジェンダを生成する.
+
+        watermark_readerがある場合、入力が前回の生成から変わっていなければ
+        データソースの取得とLLMの呼び出しを行わずに前回のアジェンダを返す。
+        incremental_limitsがあり、前回の生成以降の差分が上限以内であれば、
+        前回のアジェンダと差分だけをLLMに渡して更新する。
+
+        Args:
+            user_id: ユーザーID
+            agent_id: エージェントID
+            progress: 各段階（データ収集・Slack取得・LLM生成・保存）の開始時に呼ぶコールバック
+            force: 入力が変わっていなくても、前回のアジェンダを使わずに生成し直す
+
+        Returns:
+            GenerateResult: 生成結果
+
+        Raises:
+            AgentNotFoundError: エージェントが見つからない場合
+        """
+        report = progress or _ignore_progress
 
-    async def execute(self, user_id: UUID, agent_id: UUID) -> GenerateResult:
-        """アジェンダを生成する."""
         # エージェント確認
         agent = self.agent_repository.get_by_id(agent_id, user_id)
         if not agent:
-            raise ValueError("Agent not found")
+            raise AgentNotFoundError("Agent not found")
 
         # データ収集
+        await report(AgendaJobStage.GATHERING)
+        previous = None
+        if not force and (self.watermark_reader is not None or self.incremental_limits is not None):
+            previous = await get_latest_agenda(self.agenda_repository, agent)
+        input_fingerprint, unchanged = await self._check_inputs(agent, previous)
+        if unchanged is not None:
+            return unchanged
+
         latest_knowledge = await self.knowledge_repository.get_latest_by_agent(agent_id, user_id)
         dictionary = await self.dictionary_repository.get_all(user_id)
 
@@ -86,58 +321,34 @@ class GenerateAgendaUseCase:
         transcripts = await self._collect_transcripts(agent)
         logger.info("Collected %d transcripts total", len(transcripts))
 
-        # Slack取得範囲を計算
-        slack_oldest = self._calculate_slack_oldest(agent, transcripts, latest_knowledge)
-
         # Slackメッセージ取得
-        slack_messages = []
-        slack_error: str | None = None
-        if agent.slack_channel_id and slack_oldest:
-            try:
-                integrations = await self.slack_repository.get_all(user_id)
-                if integrations:
-                    integration = integrations[0]
-                    token = decrypt_token(integration.encrypted_access_token)
-                    client = SlackClient(token)
-                    slack_messages = client.get_messages(
-                        channel_id=agent.slack_channel_id,
-                        oldest=slack_oldest,
-                    )
-
-                    # スレッド返信を取得
-                    slack_messages = self._fetch_thread_replies(client, agent.slack_channel_id, slack_messages)
-            except SlackApiError as e:
-                error_code = e.response.get("error", "")
-                if error_code == "not_in_channel":
-                    slack_error = (
-                        "アプリがチャンネルに追加されていません。Slackでチャンネルにアプリを招待してください。"
-                    )
-                elif error_code == "ratelimited":
-                    slack_error = "Slack APIのレート制限に達しました。しばらく待ってから再試行してください。"
-                else:
-                    slack_error = f"Slackからメッセージを取得できませんでした: {error_code}"
-                logger.warning("Failed to get Slack messages: %s", e)
-            except Exception as e:
-                slack_error = "Slackからメッセージを取得できませんでした"
-                logger.warning("Failed to get Slack messages: %s", e)
-
-        # アジェンダ生成（タイムアウト付き）
-        input_data = AgendaGenerationInput(
-            latest_knowledge=latest_knowledge,
-            slack_messages=slack_messages,
-            dictionary=dictionary,
-            transcripts=transcripts,
-        )
-
-        try:
-            content = await asyncio.wait_for(
-                self.generation_service.generate(input_data),
-                timeout=self.TIMEOUT_SECONDS,
+        await report(AgendaJobStage.SLACK)
+        slack_oldest = self._calculate_slack_oldest(agent, transcripts, latest_knowledge)
+        slack_messages, slack_error = await self._fetch_slack_messages(agent, slack_oldest)
+
+        # 差分が小さければ前回のアジェンダを更新し、そうでなければ全体を生成する（タイムアウト付き）
+        update_input = self._build_update_input(previous, latest_knowledge, dictionary, transcripts, slack_messages)
+        content: str | None = None
+        retrieved_chunks: list[RetrievedChunk] = []
+        if update_input is not None:
+            await report(AgendaJobStage.LLM)
+            content = await self._generate_update(update_input)
+        incremental = content is not None
+        if content is None:
+            # 未決事項に関連する過去のチャンクを検索
+            retrieved_chunks = await self._retrieve_related_chunks(agent, latest_knowledge, transcripts, slack_messages)
+            input_data = AgendaGenerationInput(
+                latest_knowledge=latest_knowledge,
+                slack_messages=slack_messages,
+                dictionary=dictionary,
+                transcripts=transcripts,
+                retrieved_chunks=retrieved_chunks,
             )
-        except TimeoutError as e:
-            raise TimeoutError("Agenda generation timed out") from e
+            await report(AgendaJobStage.LLM)
+            content = await self._with_timeout(self.generation_service.generate(input_data))
 
         # アジェンダを保存
+        await report(AgendaJobStage.PERSIST)
         agenda = Agenda(
             id=uuid4(),
             agent_id=agent_id,
@@ -146,6 +357,7 @@ class GenerateAgendaUseCase:
             source_knowledge_id=latest_knowledge.id if latest_knowledge else None,
             generated_at=datetime.now(),
             created_at=datetime.now(),
+            input_fingerprint=input_fingerprint,
         )
 
         saved_agenda = await self.agenda_repository.create(agenda)
@@ -159,8 +371,130 @@ class GenerateAgendaUseCase:
             has_transcripts=len(transcripts) > 0,
             transcript_count=len(transcripts),
             slack_error=slack_error,
+            retrieved_chunk_count=len(retrieved_chunks),
+            incremental=incremental,
+        )
+
+    async def _check_inputs(self, agent: Agent, previous: Agenda | None) -> tuple[str | None, GenerateResult | None]:
+        """入力のフィンガープリントを計算し、前回の生成から変わっていないか確認する.
+
+        Args:
+            agent: エージェントエンティティ
+            previous: エージェントの最新のアジェンダ（生成し直す場合はNone）
+
+        Returns:
+            入力のフィンガープリント（watermark_readerがない場合はNone）と、
+            再利用できる場合は前回のアジェンダの生成結果
+        """
+        if self.watermark_reader is None:
+            return None, None
+
+        watermarks = await self.watermark_reader.read(agent)
+        unchanged = reuse_if_unchanged(previous, watermarks)
+        if unchanged is not None:
+            logger.info("Agenda inputs unchanged for agent %s, reusing %s", agent.id, unchanged.agenda.id)
+        return watermarks.fingerprint(), unchanged
+
+    async def _fetch_slack_messages(
+        self, agent: Agent, oldest: datetime | None
+    ) -> tuple[list[SlackMessageData], str | None]:
+        """Slackメッセージをスレッドの返信を含めて取得する.
+
+        Args:
+            agent: エージェントエンティティ
+            oldest: 取得開始日時（Noneの場合は取得しない）
+
+        Returns:
+            取得したメッセージと、取得に失敗した場合のエラーメッセージ
+        """
+        if not agent.slack_channel_id or not oldest:
+            return [], None
+
+        try:
+            integrations = await self.slack_repository.get_all(agent.user_id)
+            if not integrations:
+                return [], None
+            token = decrypt_token(integrations[0].encrypted_access_token)
+            client = SlackClient(token)
+            # Slack SDKは同期APIのため、イベントループを止めないよう別スレッドで呼ぶ
+            messages = await asyncio.to_thread(client.get_messages, channel_id=agent.slack_channel_id, oldest=oldest)
+
+            # スレッド返信を取得
+            with_replies = await asyncio.to_thread(self._fetch_thread_replies, client, agent.slack_channel_id, messages)
+            return with_replies, None
+        except SlackApiError as e:
+            error_code = e.response.get("error", "")
+            if error_code == "not_in_channel":
+                slack_error = "アプリがチャンネルに追加されていません。Slackでチャンネルにアプリを招待してください。"
+            elif error_code == "ratelimited":
+                slack_error = "Slack APIのレート制限に達しました。しばらく待ってから再試行してください。"
+            else:
+                slack_error = f"Slackからメッセージを取得できませんでした: {error_code}"
+            logger.warning("Failed to get Slack messages: %s", e)
+            return [], slack_error
+        except Exception as e:
+            logger.warning("Failed to get Slack messages: %s", e)
+            return [], "Slackからメッセージを取得できませんでした"
+
+    def _build_update_input(
+        self,
+        previous: Agenda | None,
+        latest_knowledge: Knowledge | None,
+        dictionary: list[DictionaryEntry],
+        transcripts: list[MeetingTranscript],
+        slack_messages: list[SlackMessageData],
+    ) -> AgendaUpdateInput | None:
+        """前回のアジェンダを差分だけで更新できる場合、その入力を作る.
+
+        前回の生成以降に新しいナレッジがなく、追加されたトランスクリプトとSlackメッセージが
+        incremental_limits以内（かつどちらかがある）場合に差分更新する。
+
+        Returns:
+            差分更新の入力。全体を生成し直す場合はNone
+        """
+        limits = self.incremental_limits
+        if limits is None or previous is None:
+            return None
+        if (latest_knowledge.id if latest_knowledge else None) != previous.source_knowledge_id:
+            return None
+
+        since = _as_aware(previous.generated_at)
+        new_transcripts = [t for t in transcripts if _as_aware(t.created_at) > since]
+        new_messages = [m for m in slack_messages if _as_aware(m.posted_at) > since]
+        if not new_transcripts and not new_messages:
+            return None
+        if len(new_transcripts) > limits.max_transcripts or len(new_messages) > limits.max_slack_messages:
+            return None
+
+        logger.info(
+            "Updating agenda %s with %d new transcripts and %d new Slack messages",
+            previous.id,
+            len(new_transcripts),
+            len(new_messages),
+        )
+        return AgendaUpdateInput(
+            previous_content=previous.content,
+            previous_generated_at=previous.generated_at,
+            slack_messages=new_messages,
+            transcripts=new_transcripts,
+            dictionary=dictionary,
         )
 
+    async def _generate_update(self, update_input: AgendaUpdateInput) -> str | None:
+        """前回のアジェンダを差分で更新する（LLMの出力がパッチの形式でない場合はNone）."""
+        try:
+            return await self._with_timeout(self.generation_service.generate_update(update_input))
+        except ValueError as e:
+            logger.warning("Agenda update returned an invalid patch, regenerating: %s", e)
+            return None
+
+    async def _with_timeout(self, generation: Awaitable[str]) -> str:
+        """LLMによる生成をタイムアウト付きで待つ."""
+        try:
+            return await asyncio.wait_for(generation, timeout=self.TIMEOUT_SECONDS)
+        except TimeoutError as e:
+            raise TimeoutError(GENERATION_TIMEOUT_MESSAGE) from e
+
     async def _collect_transcripts(self, agent: Agent) -> list[MeetingTranscript]:
         """複数定例からトランスクリプトを収集する.
 
@@ -201,6 +535,83 @@ class GenerateAgendaUseCase:
         all_transcripts.sort(key=lambda t: t.meeting_date, reverse=True)
         return all_transcripts
 
+    async def _retrieve_related_chunks(
+        self,
+        agent: Agent,
+        latest_knowledge: Knowledge | None,
+        transcripts: list[MeetingTranscript],
+        slack_messages: list[SlackMessageData],
+    ) -> list[RetrievedChunk]:
+        """未決事項に関連する過去のチャンクを埋め込みインデックスから検索する.
+
+        取得したSlackメッセージはこの時点でインデックスに登録する。
+        最新のナレッジとトランスクリプトはプロンプトに含まれるため検索結果から除外する。
+
+        Args:
+            agent: エージェントエンティティ
+            latest_knowledge: 最新のナレッジ
+            transcripts: 収集したトランスクリプト（日付降順）
+            slack_messages: 取得したSlackメッセージ
+
+        Returns:
+            関連チャンクのリスト。インデックスが利用できない場合は空リスト。
+        """
+        if self.embedding_index_service is None:
+            return []
+
+        try:
+            if slack_messages and agent.slack_channel_id:
+                await self.embedding_index_service.index_slack_messages(
+                    slack_messages, agent.user_id, agent.id, agent.slack_channel_id
+                )
+
+            queries = self._build_retrieval_queries(latest_knowledge, transcripts)
+            exclude_source_ids = {str(latest_knowledge.id)} if latest_knowledge else set()
+            if transcripts:
+                exclude_source_ids.add(str(transcripts[0].id))
+
+            return await self.embedding_index_service.retrieve(
+                agent.user_id,
+                queries,
+                self.RETRIEVAL_TOP_K,
+                agent_id=agent.id,
+                recurring_meeting_ids=list({t.recurring_meeting_id for t in transcripts}),
+                exclude_source_ids=exclude_source_ids,
+            )
+        except Exception as e:
+            logger.warning("Failed to retrieve related chunks: %s", e)
+            return []
+
+    def _build_retrieval_queries(
+        self,
+        latest_knowledge: Knowledge | None,
+        transcripts: list[MeetingTranscript],
+    ) -> list[str]:
+        """類似検索用のクエリ（未決事項）を構築する.
+
+        Args:
+            latest_knowledge: 最新のナレッジ
+            transcripts: 収集したトランスクリプト（日付降順）
+
+        Returns:
+            検索クエリのリスト
+        """
+        sources: list[str] = []
+        if latest_knowledge:
+            sources.append(latest_knowledge.normalized_text)
+        if transcripts:
+            sources.append(transcripts[0].raw_text)
+
+        queries: list[str] = []
+        for text in sources:
+            queries.extend(extract_open_items(text))
+
+        # 未決事項が見つからない場合は直近の議論の末尾をクエリにする
+        if not queries and sources:
+            queries.append(sources[-1][-self.FALLBACK_QUERY_CHARS :])
+
+        return queries
+
     def _calculate_slack_oldest(
         self,
         agent: Agent,
@@ -282,9 +693,10 @@ class GetAgendasUseCase:
         agent_id: UUID,
         user_id: UUID,
         limit: int | None = None,
+        cursor: PageCursor | None = None,
     ) -> list[Agenda]:
         """エージェントのアジェンダ一覧を取得する."""
-        return await self.repository.get_by_agent(agent_id, user_id, limit)
+        return await self.repository.get_by_agent(agent_id, user_id, limit, cursor)
 
 
 class GetAgendaUseCase:
@@ -5,9 +5,11 @@ Following ADR-0001 clean architecture principles.
 """
 
 import logging
-from datetime import datetime
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
+from src.domain.entities.google_integration import GoogleIntegration
 from src.domain.entities.recurring_meeting import (
     Attendee,
     MeetingFrequency,
@@ -19,8 +21,12 @@ from src.domain.repositories.google_integration_repository import (
 from src.domain.repositories.recurring_meeting_repository import (
     RecurringMeetingRepository,
 )
+from src.domain.services.recurring_meeting_diff import diff_recurring_meetings
 from src.infrastructure.external.encryption import decrypt_google_token
 from src.infrastructure.external.google_calendar_client import (
+    CalendarEvent,
+    CalendarEventChanges,
+    CalendarSyncTokenExpiredError,
     GoogleCalendarClient,
 )
 from src.infrastructure.external.google_oauth_client import GoogleOAuthClient
@@ -28,11 +34,38 @@ from src.infrastructure.external.google_oauth_client import GoogleOAuthClient
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CalendarSyncResult:
+    """Result of a Google Calendar sync.
+
+    Attributes:
+        meetings: Recurring meetings present after the sync.
+        created_count: Number of newly created meetings.
+        updated_count: Number of meetings whose calendar fields changed.
+        unchanged_count: Number of meetings left as they were.
+        deleted_count: Number of meetings removed from Google Calendar.
+        full_sync: True if every calendar event was listed, False if only
+            the changes since the stored sync token were fetched.
+    """
+
+    meetings: list[RecurringMeeting]
+    created_count: int
+    updated_count: int
+    unchanged_count: int
+    deleted_count: int
+    full_sync: bool = True
+
+
 class SyncRecurringMeetingsUseCase:
     """Sync recurring meetings from Google Calendar.
 
-    This use case fetches recurring events from Google Calendar
-    and upserts them into the database.
+    This use case fetches recurring events from Google Calendar,
+    diffs them against the stored meetings in memory, and writes
+    only the changed rows in one bulk upsert.
+
+    After the first sync, the Calendar sync token stored on the integration
+    is used to fetch only the events changed since the previous sync. If
+    Google rejects the token (410 Gone), a full sync is run instead.
     """
 
     def __init__(
@@ -49,14 +82,19 @@ class SyncRecurringMeetingsUseCase:
         self._google_integration_repo = google_integration_repo
         self._recurring_meeting_repo = recurring_meeting_repo
 
-    async def execute(self, user_id: UUID) -> list[RecurringMeeting]:
+    async def execute(self, user_id: UUID) -> CalendarSyncResult:
         """Sync recurring meetings from Google Calendar.
 
+        Stored meetings are loaded once; created and updated meetings are
+        written with a single upsert and stale meetings with a single delete.
+        On an incremental sync only the stored meetings for the changed
+        events are loaded.
+
         Args:
             user_id: The user ID to sync meetings for.
 
         Returns:
-            List of synced RecurringMeeting entities.
+            CalendarSyncResult with the synced meetings and per-kind counts.
 
         Raises:
             ValueError: If no Google integration found or sync fails.
@@ -89,63 +127,160 @@ class SyncRecurringMeetingsUseCase:
             logger.error(f"Failed to refresh token: {e}")
             raise ValueError("Failed to refresh Google token. Please reconnect.") from None
 
-        # Fetch recurring events from Calendar
+        # Fetch recurring events (only the changes if a sync token is stored)
         calendar_client = GoogleCalendarClient(token_response.access_token)
+        changes = await self._fetch_changes(calendar_client, integration)
+
+        now = datetime.now()
+        incoming = [self._to_meeting(event, user_id, now) for event in changes.events]
+
+        # Diff against stored meetings and write only what changed
+        if changes.full_sync:
+            existing = await self._recurring_meeting_repo.get_all(user_id)
+        else:
+            event_ids = [m.google_event_id for m in incoming] + changes.removed_event_ids
+            existing = await self._recurring_meeting_repo.get_by_google_event_ids(user_id, event_ids)
+        diff = diff_recurring_meetings(existing, incoming, now)
+        if not changes.full_sync:
+            # Unchanged events are not returned, so move past occurrences forward here
+            diff.updated += await self._refresh_past_occurrences(user_id, {m.google_event_id for m in existing}, now)
+        await self._recurring_meeting_repo.upsert_many(diff.changed)
+        deleted_count = await self._recurring_meeting_repo.delete_by_ids([m.id for m in diff.deleted], user_id)
+
+        # Store the token only after the changes are written
+        if changes.next_sync_token != integration.calendar_sync_token:
+            await self._google_integration_repo.update_calendar_sync_token(
+                integration.id, user_id, changes.next_sync_token
+            )
+
+        logger.info(
+            "Synced recurring meetings for user %s (%s): created=%d updated=%d unchanged=%d deleted=%d",
+            user_id,
+            "full" if changes.full_sync else "incremental",
+            len(diff.created),
+            len(diff.updated),
+            len(diff.unchanged),
+            deleted_count,
+        )
+        meetings = diff.synced if changes.full_sync else await self._recurring_meeting_repo.get_all(user_id)
+        return CalendarSyncResult(
+            meetings=meetings,
+            created_count=len(diff.created),
+            updated_count=len(diff.updated),
+            unchanged_count=len(diff.unchanged),
+            deleted_count=deleted_count,
+            full_sync=changes.full_sync,
+        )
+
+    async def _refresh_past_occurrences(
+        self,
+        user_id: UUID,
+        synced_event_ids: set[str],
+        now: datetime,
+    ) -> list[RecurringMeeting]:
+        """Recompute the next occurrence of stored meetings whose occurrence has passed.
+
+        An incremental sync only returns the changed events, so the next
+        occurrence of the other meetings would otherwise stay in the past.
+
+        Args:
+            user_id: The user ID.
+            synced_event_ids: Google event IDs already diffed in this sync.
+            now: Update timestamp.
+
+        Returns:
+            Meetings whose next occurrence moved, ready to be upserted.
+        """
+        past = await self._recurring_meeting_repo.get_with_next_occurrence_before(user_id, datetime.now(UTC))
+        refreshed: list[RecurringMeeting] = []
+        for meeting in past:
+            # Rows stored without the series start cannot be expanded until the event is synced again
+            if meeting.google_event_id in synced_event_ids or meeting.start_datetime is None:
+                continue
+            next_occurrence = GoogleCalendarClient.calculate_next_occurrence(
+                meeting.rrule, meeting.start_datetime, meeting.timezone, meeting.exdates
+            )
+            # An ended series keeps its last occurrence
+            if next_occurrence != meeting.next_occurrence:
+                refreshed.append(replace(meeting, next_occurrence=next_occurrence, updated_at=now))
+        return refreshed
+
+    async def _fetch_changes(
+        self,
+        calendar_client: GoogleCalendarClient,
+        integration: GoogleIntegration,
+    ) -> CalendarEventChanges:
+        """Fetch calendar changes, falling back to a full sync on an expired token.
+
+        Args:
+            calendar_client: Calendar client with a fresh access token.
+            integration: The Google integration holding the sync token.
+
+        Returns:
+            CalendarEventChanges from Google Calendar.
+
+        Raises:
+            ValueError: If the Calendar API request fails.
+        """
         try:
-            events = await calendar_client.get_recurring_events(
+            return await calendar_client.sync_recurring_events(
+                sync_token=integration.calendar_sync_token,
                 min_attendees=1,
                 months_back=3,
             )
+        except CalendarSyncTokenExpiredError:
+            logger.info(f"Calendar sync token expired for integration {integration.id}, running full sync")
         except ValueError as e:
             logger.error(f"Failed to fetch calendar events: {e}")
             raise
 
-        # Convert and upsert meetings
-        synced_meetings: list[RecurringMeeting] = []
-        for event in events:
-            # Parse frequency from RRULE
-            frequency_str = GoogleCalendarClient.parse_frequency_from_rrule(event.rrule)
-            try:
-                frequency = MeetingFrequency(frequency_str)
-            except ValueError:
-                frequency = MeetingFrequency.WEEKLY
-
-            # Calculate next occurrence
-            next_occurrence = GoogleCalendarClient.calculate_next_occurrence(event.rrule, event.start_datetime)
-
-            # Convert attendees
-            attendees = [Attendee(email=a.email, name=a.display_name) for a in event.attendees]
-
-            # Check if meeting already exists
-            existing = await self._recurring_meeting_repo.get_by_google_event_id(user_id, event.event_id)
-
-            meeting = RecurringMeeting(
-                id=existing.id if existing else uuid4(),
-                user_id=user_id,
-                google_event_id=event.event_id,
-                title=event.summary,
-                rrule=event.rrule,
-                frequency=frequency,
-                attendees=attendees,
-                next_occurrence=next_occurrence,
-                agent_id=existing.agent_id if existing else None,
-                created_at=existing.created_at if existing else datetime.now(),
-                updated_at=datetime.now() if existing else None,
-            )
+        try:
+            return await calendar_client.sync_recurring_events(min_attendees=1, months_back=3)
+        except ValueError as e:
+            logger.error(f"Failed to fetch calendar events: {e}")
+            raise
+
+    @staticmethod
+    def _to_meeting(event: CalendarEvent, user_id: UUID, now: datetime) -> RecurringMeeting:
+        """Convert a calendar event into a new RecurringMeeting.
 
-            synced_meeting = await self._recurring_meeting_repo.upsert(meeting)
-            synced_meetings.append(synced_meeting)
+        Args:
+            event: Recurring event from Google Calendar.
+            user_id: The owning user ID.
+            now: Creation timestamp.
 
-        # Delete meetings that no longer exist in Google Calendar
-        synced_google_event_ids = [m.google_event_id for m in synced_meetings]
-        deleted_count = await self._recurring_meeting_repo.delete_by_user_except_google_event_ids(
-            user_id, synced_google_event_ids
+        Returns:
+            RecurringMeeting with a newly generated ID.
+        """
+        # Parse frequency from RRULE
+        frequency_str = GoogleCalendarClient.parse_frequency_from_rrule(event.rrule)
+        try:
+            frequency = MeetingFrequency(frequency_str)
+        except ValueError:
+            frequency = MeetingFrequency.WEEKLY
+
+        # Calculate next occurrence
+        next_occurrence = GoogleCalendarClient.calculate_next_occurrence(
+            event.rrule, event.start_datetime, event.timezone, event.exdates
         )
-        if deleted_count > 0:
-            logger.info(f"Deleted {deleted_count} stale recurring meetings for user {user_id}")
 
-        logger.info(f"Synced {len(synced_meetings)} recurring meetings for user {user_id}")
-        return synced_meetings
+        # Convert attendees
+        attendees = [Attendee(email=a.email, name=a.display_name) for a in event.attendees]
+
+        return RecurringMeeting(
+            id=uuid4(),
+            user_id=user_id,
+            google_event_id=event.event_id,
+            title=event.summary,
+            rrule=event.rrule,
+            frequency=frequency,
+            attendees=attendees,
+            next_occurrence=next_occurrence,
+            start_datetime=event.start_datetime,
+            timezone=event.timezone,
+            exdates=event.exdates,
+            created_at=now,
+        )
 
 
 class GetRecurringMeetingsUseCase:
@@ -4,6 +4,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 from src.domain.entities.dictionary_entry import DictionaryEntry
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.repositories.dictionary_repository import DictionaryRepository
 
 
@@ -55,16 +56,23 @@ class GetDictionaryEntriesUseCase:
         """Initialize use case with repository."""
         self.repository = repository
 
-    async def execute(self, user_id: UUID) -> list[DictionaryEntry]:
+    async def execute(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[DictionaryEntry]:
         """Get all dictionary entries for a user.
 
         Args:
             user_id: The user ID.
+            limit: Maximum number of entries (None for all).
+            cursor: Cursor of the previous page, or None for the first page.
 
         Returns:
             List of DictionaryEntry entities.
         """
-        return await self.repository.get_all(user_id)
+        return await self.repository.get_all(user_id, limit, cursor)
 
 
 class GetDictionaryEntryUseCase:
@@ -8,11 +8,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from src.domain.entities.embedding_chunk import ChunkSourceType
 from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.repositories.agent_repository import AgentRepository
 from src.domain.repositories.dictionary_repository import DictionaryRepository
 from src.domain.repositories.knowledge_repository import KnowledgeRepository
 from src.domain.services.normalization_service import NormalizationError, NormalizationService
+from src.infrastructure.services.embedding_index_service import EmbeddingIndexService
+from src.infrastructure.services.search_index_service import SearchIndexService
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +39,15 @@ class UploadKnowledgeUseCase:
         dictionary_repository: DictionaryRepository,
         agent_repository: AgentRepository,
         normalization_service: NormalizationService,
+        embedding_index_service: EmbeddingIndexService | None = None,
+        search_index_service: SearchIndexService | None = None,
     ) -> None:
         self.knowledge_repository = knowledge_repository
         self.dictionary_repository = dictionary_repository
         self.agent_repository = agent_repository
         self.normalization_service = normalization_service
+        self.embedding_index_service = embedding_index_service
+        self.search_index_service = search_index_service
 
     async def execute(
         self,
@@ -83,6 +91,20 @@ class UploadKnowledgeUseCase:
 
         saved_knowledge = await self.knowledge_repository.create(knowledge)
 
+        # 類似検索用にインデックス登録（失敗してもアップロードは成功扱い）
+        if self.embedding_index_service:
+            try:
+                await self.embedding_index_service.index_knowledge(saved_knowledge)
+            except Exception as e:
+                logger.warning(f"Failed to index knowledge {saved_knowledge.id}: {e}")
+
+        # 全文検索用にインデックス登録（失敗してもアップロードは成功扱い）
+        if self.search_index_service:
+            try:
+                await self.search_index_service.index_knowledge(saved_knowledge)
+            except Exception as e:
+                logger.warning(f"Failed to add knowledge {saved_knowledge.id} to search index: {e}")
+
         return UploadResult(
             knowledge=saved_knowledge,
             normalization_warning=normalization_warning,
@@ -101,9 +123,10 @@ class GetKnowledgeListUseCase:
         agent_id: UUID,
         user_id: UUID,
         limit: int | None = None,
+        cursor: PageCursor | None = None,
     ) -> list[Knowledge]:
         """エージェントのナレッジ一覧を取得する."""
-        return await self.repository.get_by_agent(agent_id, user_id, limit)
+        return await self.repository.get_by_agent(agent_id, user_id, limit, cursor)
 
 
 class GetKnowledgeUseCase:
@@ -120,9 +143,20 @@ class GetKnowledgeUseCase:
 class DeleteKnowledgeUseCase:
     """ナレッジ削除ユースケース."""
 
-    def __init__(self, repository: KnowledgeRepository) -> None:
+    def __init__(
+        self,
+        repository: KnowledgeRepository,
+        embedding_index_service: EmbeddingIndexService | None = None,
+    ) -> None:
         self.repository = repository
+        self.embedding_index_service = embedding_index_service
 
     async def execute(self, knowledge_id: UUID, user_id: UUID) -> bool:
         """ナレッジを削除する."""
-        return await self.repository.delete(knowledge_id, user_id)
+        deleted = await self.repository.delete(knowledge_id, user_id)
+        if deleted and self.embedding_index_service:
+            try:
+                await self.embedding_index_service.remove_source(user_id, ChunkSourceType.KNOWLEDGE, str(knowledge_id))
+            except Exception as e:
+                logger.warning(f"Failed to remove knowledge {knowledge_id} from index: {e}")
+        return deleted
@@ -0,0 +1,38 @@
+"""Use cases for full-text search.
+
+Application layer use cases following clean architecture principles.
+"""
+
+from dataclasses import replace
+from uuid import UUID
+
+from src.domain.entities.search_entry import SearchHit, SearchSourceType
+from src.domain.repositories.search_repository import SearchRepository
+from src.domain.services.search_tokenizer import make_snippet
+
+
+class SearchUseCase:
+    """トランスクリプト・ナレッジの全文検索ユースケース."""
+
+    def __init__(self, repository: SearchRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        source_type: SearchSourceType | None = None,
+        agent_id: UUID | None = None,
+        recurring_meeting_id: UUID | None = None,
+    ) -> list[SearchHit]:
+        """クエリの語をすべて含む発話・ナレッジを関連度の降順で検索し、スニペットを付ける."""
+        hits = await self.repository.search(
+            user_id,
+            query,
+            limit,
+            source_type=source_type,
+            agent_id=agent_id,
+            recurring_meeting_id=recurring_meeting_id,
+        )
+        return [replace(hit, snippet=make_snippet(hit.entry.content, query)) for hit in hits]
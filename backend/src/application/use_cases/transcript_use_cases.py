@@ -3,14 +3,17 @@
 Application layer use cases following clean architecture principles.
 """
 
+import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from src.domain.entities.meeting_transcript import (
     MeetingTranscript,
+    MeetingTranscriptSummary,
     TranscriptStructuredData,
 )
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.entities.recurring_meeting import RecurringMeeting
 from src.domain.repositories.meeting_transcript_repository import (
     MeetingTranscriptRepository,
@@ -18,13 +21,29 @@ from src.domain.repositories.meeting_transcript_repository import (
 from src.domain.repositories.recurring_meeting_repository import (
     RecurringMeetingRepository,
 )
-from src.domain.services.matching_algorithm import calculate_match_confidence
-from src.domain.services.transcript_parser import (
-    extract_speakers,
-    parse_to_structured_data,
+from src.domain.services.matching_algorithm import (
+    BatchMatcher,
+    DocumentMatchFeatures,
+    MeetingMatchFeatures,
 )
+from src.domain.services.recurrence_expander import build_occurrence_index
+from src.domain.services.transcript_parser import parse_transcript_with_stats
 from src.infrastructure.external.google_docs_client import GoogleDocsClient
 from src.infrastructure.external.google_drive_client import DriveFile, GoogleDriveClient
+from src.infrastructure.services.embedding_index_service import EmbeddingIndexService
+from src.infrastructure.services.search_index_service import SearchIndexService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingTranscript:
+    """取得・パース済みでマッチング待ちのトランスクリプト."""
+
+    drive_file: DriveFile
+    raw_text: str
+    structured_data: TranscriptStructuredData | None
+    speakers: list[str]
 
 
 class CreateTranscriptUseCase:
@@ -59,9 +78,10 @@ class GetTranscriptsByRecurringMeetingUseCase:
         self,
         recurring_meeting_id: UUID,
         limit: int | None = None,
+        cursor: PageCursor | None = None,
     ) -> list[MeetingTranscript]:
         """定例MTGのトランスクリプト一覧を取得する."""
-        return await self.repository.get_by_recurring_meeting(recurring_meeting_id, limit)
+        return await self.repository.get_by_recurring_meeting(recurring_meeting_id, limit, cursor=cursor)
 
 
 class GetTranscriptsByDateRangeUseCase:
@@ -104,9 +124,31 @@ class GetTranscriptsNeedingConfirmationUseCase:
         self,
         recurring_meeting_id: UUID,
     ) -> list[MeetingTranscript]:
-        """手動確認が必要なトランスクリプト一覧を取得する."""
-        all_transcripts = await self.repository.get_by_recurring_meeting(recurring_meeting_id, None)
-        return [t for t in all_transcripts if t.needs_manual_confirmation()]
+        """手動確認が必要なトランスクリプト一覧を取得する（絞り込みはDB側で行う）."""
+        return await self.repository.get_by_recurring_meeting(recurring_meeting_id, None, needs_confirmation_only=True)
+
+
+class GetTranscriptSummariesUseCase:
+    """トランスクリプト概要一覧取得ユースケース.
+
+    本文を読み込まずに一覧表示用の概要を取得する。
+    """
+
+    def __init__(self, repository: MeetingTranscriptRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self,
+        user_id: UUID,
+        recurring_meeting_id: UUID | None = None,
+        needs_confirmation_only: bool = False,
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[MeetingTranscriptSummary]:
+        """トランスクリプト概要一覧を取得する."""
+        return await self.repository.get_summaries(
+            user_id, recurring_meeting_id, needs_confirmation_only, limit, cursor
+        )
 
 
 @dataclass
@@ -135,23 +177,29 @@ class SyncTranscriptsUseCase:
         recurring_meeting_repository: RecurringMeetingRepository,
         drive_client: GoogleDriveClient,
         docs_client: GoogleDocsClient,
+        embedding_index_service: EmbeddingIndexService | None = None,
+        search_index_service: SearchIndexService | None = None,
     ) -> None:
         self.transcript_repository = transcript_repository
         self.recurring_meeting_repository = recurring_meeting_repository
         self.drive_client = drive_client
         self.docs_client = docs_client
+        self.embedding_index_service = embedding_index_service
+        self.search_index_service = search_index_service
 
-    async def execute(self, user_id: UUID) -> SyncResult:
+    async def execute(self, user_id: UUID, drive_files: list[DriveFile] | None = None) -> SyncResult:
         """トランスクリプトを同期する.
 
         1. Google DriveからMeet Recordingsフォルダのファイル一覧を取得
-        2. 各ファイルのテキストを取得してパース
+           （drive_filesを指定した場合はそのファイルだけを対象にする）
+        2. 未取込のファイルのテキストをバッチリクエストでまとめて取得してパース
         3. 定例MTG一覧を取得してマッチング
         4. 信頼度0.7以上は自動紐付け、未満はneeds_confirmation=True
         5. 重複はgoogle_doc_idでスキップ
 
         Args:
             user_id: ユーザーID
+            drive_files: 同期対象のファイル（プッシュ通知で変更が分かったファイルなど）
 
         Returns:
             SyncResult: 同期結果
@@ -162,32 +210,39 @@ class SyncTranscriptsUseCase:
         synced_transcripts: list[MeetingTranscript] = []
 
         # 1. Google DriveからMeet Recordingsファイル一覧を取得
-        drive_files = await self.drive_client.search_transcript_files()
+        if drive_files is None:
+            drive_files = await self.drive_client.search_transcript_files()
 
         # 2. 定例MTG一覧を取得
         recurring_meetings = await self.recurring_meeting_repository.get_all(user_id)
 
-        # 3. 各ファイルを処理
+        # 3. 未取込のファイルのテキストをまとめて取得してパース
+        new_files: list[DriveFile] = []
         for drive_file in drive_files:
             # 重複チェック
-            existing = await self.transcript_repository.get_by_google_doc_id(drive_file.id, user_id)
-            if existing:
+            if await self.transcript_repository.exists_by_google_doc_id(drive_file.id, user_id):
                 skipped_count += 1
                 continue
+            new_files.append(drive_file)
+
+        # Google Docsのテキストをバッチリクエストで取得
+        texts = await self.docs_client.get_documents_text([f.id for f in new_files]) if new_files else {}
 
-            # Google Docsのテキストを取得
-            raw_text = await self.docs_client.get_document_text(drive_file.id)
+        pending: list[_PendingTranscript] = []
+        for drive_file in new_files:
+            raw_text = texts.get(drive_file.id)
             if raw_text is None:
                 error_count += 1
                 continue
 
             # パースして構造化
-            structured_data = parse_to_structured_data(raw_text)
-            speakers = extract_speakers(raw_text)
+            parsed = parse_transcript_with_stats(raw_text)
+            pending.append(_PendingTranscript(drive_file, raw_text, parsed.to_structured_data(), parsed.speakers))
 
-            # 最適な定例MTGを見つける
-            best_match = self._find_best_match(drive_file, speakers, recurring_meetings)
+        # 4. 全ファイル×全定例MTGをまとめてマッチング
+        best_matches = self._find_best_matches(pending, recurring_meetings)
 
+        for item, best_match in zip(pending, best_matches, strict=True):
             if best_match is None:
                 # マッチする定例MTGがない場合はスキップ
                 error_count += 1
@@ -197,15 +252,18 @@ class SyncTranscriptsUseCase:
 
             # トランスクリプトを作成
             transcript = self._create_transcript(
-                drive_file=drive_file,
-                raw_text=raw_text,
-                structured_data=structured_data,
+                drive_file=item.drive_file,
+                raw_text=item.raw_text,
+                structured_data=item.structured_data,
                 recurring_meeting_id=recurring_meeting.id,
                 confidence=confidence,
             )
 
             # DBに保存
             created = await self.transcript_repository.create(transcript)
+            await _index_transcript(
+                self.embedding_index_service, self.search_index_service, created, user_id, recurring_meeting
+            )
             synced_transcripts.append(created)
             synced_count += 1
 
@@ -216,49 +274,49 @@ class SyncTranscriptsUseCase:
             synced_transcripts=synced_transcripts,
         )
 
-    def _find_best_match(
+    def _find_best_matches(
         self,
-        drive_file: DriveFile,
-        speakers: list[str],
+        pending: list[_PendingTranscript],
         recurring_meetings: list[RecurringMeeting],
-    ) -> tuple[RecurringMeeting, float] | None:
-        """最適な定例MTGを見つける.
+    ) -> list[tuple[RecurringMeeting, float] | None]:
+        """各ファイルに最適な定例MTGを見つける.
 
-        各定例MTGとの信頼度を計算し、最も高いものを返す。
+        定例MTGの特徴量を1回だけ計算し、全ファイルとの信頼度を行列でまとめて計算する。
+        日時は各ファイルの作成日時に最も近い開催日時と比較する。
 
         Args:
-            drive_file: Google Driveファイル情報
-            speakers: トランスクリプトの話者リスト
+            pending: 取得・パース済みのトランスクリプト
             recurring_meetings: 定例MTG一覧
 
         Returns:
-            (定例MTG, 信頼度)のタプル。マッチするものがない場合はNone。
+            ファイルごとの(定例MTG, 信頼度)のタプル。マッチするものがない場合はNone。
         """
         if not recurring_meetings:
-            return None
-
-        best_match: tuple[RecurringMeeting, float] | None = None
-        best_confidence = 0.0
-
-        for meeting in recurring_meetings:
-            # 参加者のメールアドレスリストを取得
-            attendee_emails = [a.email for a in meeting.attendees]
-
-            # 信頼度を計算
-            confidence = calculate_match_confidence(
-                doc_name=drive_file.name,
-                doc_created=drive_file.created_time,
-                event_summary=meeting.title,
-                event_datetime=meeting.next_occurrence,
-                event_attendees=attendee_emails,
-                transcript_speakers=speakers,
-            )
-
-            if confidence > best_confidence:
-                best_confidence = confidence
-                best_match = (meeting, confidence)
-
-        return best_match
+            return [None] * len(pending)
+
+        matcher = BatchMatcher(
+            [
+                MeetingMatchFeatures.from_attendee_emails(
+                    title=meeting.title,
+                    event_datetime=meeting.next_occurrence,
+                    attendee_emails=[a.email for a in meeting.attendees],
+                    occurrences=_meeting_occurrences(meeting),
+                )
+                for meeting in recurring_meetings
+            ]
+        )
+        documents = [
+            DocumentMatchFeatures.from_speakers(item.drive_file.name, item.drive_file.created_time, item.speakers)
+            for item in pending
+        ]
+        results: list[tuple[RecurringMeeting, float] | None] = []
+        for match in matcher.best_matches(documents):
+            if match is None:
+                results.append(None)
+                continue
+            index, confidence = match
+            results.append((recurring_meetings[index], confidence))
+        return results
 
     def _create_transcript(
         self,
@@ -291,9 +349,13 @@ class LinkTranscriptUseCase:
         self,
         transcript_repository: MeetingTranscriptRepository,
         recurring_meeting_repository: RecurringMeetingRepository,
+        embedding_index_service: EmbeddingIndexService | None = None,
+        search_index_service: SearchIndexService | None = None,
     ) -> None:
         self.transcript_repository = transcript_repository
         self.recurring_meeting_repository = recurring_meeting_repository
+        self.embedding_index_service = embedding_index_service
+        self.search_index_service = search_index_service
 
     async def execute(
         self,
@@ -328,7 +390,14 @@ class LinkTranscriptUseCase:
         transcript.recurring_meeting_id = recurring_meeting_id
         transcript.match_confidence = 1.0
 
-        return await self.transcript_repository.update(transcript)
+        updated = await self.transcript_repository.update(transcript)
+
+        # 紐付け先のエージェントで検索できるよう再インデックス
+        await _index_transcript(
+            self.embedding_index_service, self.search_index_service, updated, user_id, recurring_meeting
+        )
+
+        return updated
 
 
 class GetPendingTranscriptsUseCase:
@@ -340,6 +409,47 @@ class GetPendingTranscriptsUseCase:
     def __init__(self, repository: MeetingTranscriptRepository) -> None:
         self.repository = repository
 
-    async def execute(self, user_id: UUID) -> list[MeetingTranscript]:
-        """手動確認待ちトランスクリプト一覧を取得する."""
-        return await self.repository.get_needing_confirmation(user_id)
+    async def execute(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[MeetingTranscriptSummary]:
+        """手動確認待ちトランスクリプトの概要一覧を取得する."""
+        return await self.repository.get_needing_confirmation(user_id, limit, cursor)
+
+
+async def _index_transcript(
+    embedding_index_service: EmbeddingIndexService | None,
+    search_index_service: SearchIndexService | None,
+    transcript: MeetingTranscript,
+    user_id: UUID,
+    recurring_meeting: RecurringMeeting,
+) -> None:
+    """トランスクリプトを埋め込み・全文検索インデックスに登録する（失敗は警告のみ）."""
+    if embedding_index_service is not None:
+        try:
+            await embedding_index_service.index_transcript(transcript, user_id, recurring_meeting.agent_id)
+        except Exception as e:
+            logger.warning("Failed to index transcript %s: %s", transcript.id, e)
+    if search_index_service is not None:
+        try:
+            await search_index_service.index_transcript(transcript, user_id, recurring_meeting.agent_id)
+        except Exception as e:
+            logger.warning("Failed to add transcript %s to search index: %s", transcript.id, e)
+
+
+def _meeting_occurrences(meeting: RecurringMeeting) -> tuple[datetime, ...]:
+    """定例MTGのRRULEを展開した開催日時を返す.
+
+    開始日時が未保存（カレンダー再同期前）の場合やRRULEが不正な場合は空とし、
+    next_occurrenceのみで比較する。
+    """
+    if meeting.start_datetime is None or not meeting.rrule:
+        return ()
+    try:
+        index = build_occurrence_index(meeting.rrule, meeting.start_datetime, meeting.timezone, meeting.exdates)
+    except ValueError as e:
+        logger.warning("Failed to expand RRULE for recurring meeting %s: %s", meeting.id, e)
+        return ()
+    return index.occurrences
@@ -0,0 +1,369 @@
+"""Use cases for Google push-notification channels.
+
+Registers and renews Calendar/Drive watch channels, validates incoming
+notifications and runs the targeted Drive resync they trigger.
+Following ADR-0001 clean architecture principles.
+"""
+
+import logging
+import secrets
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from src.application.use_cases.transcript_use_cases import SyncResult, SyncTranscriptsUseCase
+from src.domain.entities.google_integration import GoogleIntegration
+from src.domain.entities.watch_channel import WatchChannel, WatchResourceType
+from src.domain.repositories.google_integration_repository import GoogleIntegrationRepository
+from src.domain.repositories.meeting_transcript_repository import MeetingTranscriptRepository
+from src.domain.repositories.recurring_meeting_repository import RecurringMeetingRepository
+from src.domain.repositories.watch_channel_repository import WatchChannelRepository
+from src.infrastructure.external.encryption import decrypt_google_token
+from src.infrastructure.external.google_calendar_client import GoogleCalendarClient
+from src.infrastructure.external.google_docs_client import GoogleDocsClient
+from src.infrastructure.external.google_drive_client import GoogleDriveClient
+from src.infrastructure.external.google_oauth_client import GoogleOAuthClient
+from src.infrastructure.external.google_push_channel import WatchRegistration
+from src.infrastructure.services.embedding_index_service import EmbeddingIndexService
+from src.infrastructure.services.search_index_service import SearchIndexService
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_SCOPE = "https://www.googleapis.com/auth/calendar.readonly"
+DRIVE_SCOPE = "https://www.googleapis.com/auth/drive.readonly"
+DOCS_SCOPE = "https://www.googleapis.com/auth/documents.readonly"
+
+# 監視対象ごとに必要なスコープ
+REQUIRED_SCOPES = {
+    WatchResourceType.CALENDAR: (CALENDAR_SCOPE,),
+    WatchResourceType.DRIVE: (DRIVE_SCOPE, DOCS_SCOPE),
+}
+
+# Googleが初回に送る確認通知のX-Goog-Resource-State
+SYNC_RESOURCE_STATE = "sync"
+
+
+async def _get_access_token(integration: GoogleIntegration) -> str:
+    """Google連携のリフレッシュトークンからアクセストークンを取得する.
+
+    Raises:
+        ValueError: 復号またはトークンの更新に失敗した場合
+    """
+    try:
+        refresh_token = decrypt_google_token(integration.encrypted_refresh_token)
+    except Exception as e:
+        logger.error(f"Failed to decrypt token: {e}")
+        raise ValueError("Failed to decrypt Google token. Please reconnect.") from None
+
+    try:
+        token_response = await GoogleOAuthClient().refresh_access_token(refresh_token)
+    except ValueError as e:
+        logger.error(f"Failed to refresh token: {e}")
+        raise ValueError("Failed to refresh Google token. Please reconnect.") from None
+    return token_response.access_token
+
+
+class _ChannelRegistrar:
+    """チャネルを登録し、同じ監視対象の古いチャネルを停止する."""
+
+    def __init__(
+        self,
+        channel_repository: WatchChannelRepository,
+        address: str,
+        ttl_seconds: int,
+    ) -> None:
+        self.channel_repository = channel_repository
+        self.address = address
+        self.ttl_seconds = ttl_seconds
+
+    async def replace(
+        self,
+        integration: GoogleIntegration,
+        resource_type: WatchResourceType,
+        access_token: str,
+        current: list[WatchChannel],
+    ) -> WatchChannel:
+        """新しいチャネルを登録してから古いチャネルを停止・削除する.
+
+        新しいチャネルを先に登録するため、切り替え中の通知を取りこぼさない。
+        Driveは古いチャネルのページトークンを引き継ぎ、前回以降の変更から続ける。
+        """
+        channel_id = uuid4()
+        token = secrets.token_urlsafe(32)
+        page_token = next((c.page_token for c in current if c.page_token), None)
+
+        registration: WatchRegistration
+        if resource_type is WatchResourceType.CALENDAR:
+            calendar_client = GoogleCalendarClient(access_token)
+            registration = await calendar_client.watch_events(str(channel_id), token, self.address, self.ttl_seconds)
+        else:
+            drive_client = GoogleDriveClient(access_token)
+            if page_token is None:
+                page_token = await drive_client.get_start_page_token()
+            registration = await drive_client.watch_changes(
+                page_token, str(channel_id), token, self.address, self.ttl_seconds
+            )
+
+        channel = await self.channel_repository.create(
+            WatchChannel(
+                id=channel_id,
+                user_id=integration.user_id,
+                integration_id=integration.id,
+                resource_type=resource_type,
+                resource_id=registration.resource_id,
+                token=token,
+                expiration=registration.expiration,
+                created_at=datetime.now(UTC),
+                page_token=page_token,
+            )
+        )
+
+        for old in current:
+            await self._stop(old, access_token)
+        return channel
+
+    async def _stop(self, channel: WatchChannel, access_token: str) -> None:
+        """チャネルを停止して削除する（停止の失敗は期限切れを待てばよいので記録だけする）."""
+        try:
+            if channel.resource_type is WatchResourceType.CALENDAR:
+                await GoogleCalendarClient(access_token).stop_channel(str(channel.id), channel.resource_id)
+            else:
+                await GoogleDriveClient(access_token).stop_channel(str(channel.id), channel.resource_id)
+        except ValueError as e:
+            logger.warning(f"Failed to stop watch channel {channel.id}: {e}")
+        await self.channel_repository.delete(channel.id)
+
+
+class WatchGoogleChangesUseCase:
+    """Google Calendar / Driveのプッシュ通知チャネル登録ユースケース.
+
+    許可済みスコープの監視対象ごとにチャネルを1つ保つ。
+    有効期限が近いチャネルは作り直す。
+    """
+
+    def __init__(
+        self,
+        google_integration_repository: GoogleIntegrationRepository,
+        channel_repository: WatchChannelRepository,
+        address: str,
+        ttl_seconds: int,
+        renew_before: timedelta,
+    ) -> None:
+        self.google_integration_repository = google_integration_repository
+        self.channel_repository = channel_repository
+        self.registrar = _ChannelRegistrar(channel_repository, address, ttl_seconds)
+        self.renew_before = renew_before
+
+    async def execute(self, user_id: UUID) -> list[WatchChannel]:
+        """ユーザーのGoogle連携にチャネルを登録する.
+
+        Args:
+            user_id: ユーザーID
+
+        Returns:
+            有効なチャネルの一覧
+
+        Raises:
+            ValueError: Google連携がない、またはGoogle APIの呼び出しに失敗した場合
+        """
+        # 同期処理と同じ連携（最初の連携）を監視する
+        integrations = await self.google_integration_repository.get_all(user_id)
+        if not integrations:
+            raise ValueError("No Google integration found. Please connect Google first.")
+        integration = integrations[0]
+
+        resource_types = [
+            resource_type
+            for resource_type, scopes in REQUIRED_SCOPES.items()
+            if all(integration.has_scope(scope) for scope in scopes)
+        ]
+        if not resource_types:
+            return []
+
+        access_token = await _get_access_token(integration)
+        channels: list[WatchChannel] = []
+        for resource_type in resource_types:
+            current = await self.channel_repository.get_by_integration(integration.id, resource_type)
+            if current and not current[0].expires_within(self.renew_before):
+                channels.append(current[0])
+                continue
+            channels.append(await self.registrar.replace(integration, resource_type, access_token, current))
+        return channels
+
+
+class RenewWatchChannelsUseCase:
+    """有効期限が近いプッシュ通知チャネルの更新ユースケース.
+
+    全ユーザーのチャネルを対象にするため、サービスキーのクライアントで実行する。
+    """
+
+    def __init__(
+        self,
+        google_integration_repository: GoogleIntegrationRepository,
+        channel_repository: WatchChannelRepository,
+        address: str,
+        ttl_seconds: int,
+        renew_before: timedelta,
+    ) -> None:
+        self.google_integration_repository = google_integration_repository
+        self.channel_repository = channel_repository
+        self.registrar = _ChannelRegistrar(channel_repository, address, ttl_seconds)
+        self.renew_before = renew_before
+
+    async def execute(self, now: datetime | None = None) -> int:
+        """有効期限が近いチャネルを作り直す.
+
+        1つの連携で失敗しても残りの連携は更新を続ける。
+
+        Args:
+            now: 基準日時（省略時は現在日時）
+
+        Returns:
+            作り直したチャネル数
+        """
+        now = now or datetime.now(UTC)
+        expiring = await self.channel_repository.get_expiring(now + self.renew_before)
+
+        groups: dict[tuple[UUID, WatchResourceType], list[WatchChannel]] = {}
+        for channel in expiring:
+            groups.setdefault((channel.integration_id, channel.resource_type), []).append(channel)
+
+        renewed = 0
+        for (integration_id, resource_type), channels in groups.items():
+            user_id = channels[0].user_id
+            try:
+                integration = await self.google_integration_repository.get_by_id(integration_id, user_id)
+                if integration is None:
+                    # 連携が削除済みの場合はチャネルもON DELETE CASCADEで消えている
+                    continue
+                access_token = await _get_access_token(integration)
+                await self.registrar.replace(integration, resource_type, access_token, channels)
+                renewed += 1
+            except ValueError as e:
+                logger.warning(f"Failed to renew {resource_type.value} channel for integration {integration_id}: {e}")
+        return renewed
+
+
+class HandleWatchNotificationUseCase:
+    """プッシュ通知の検証ユースケース.
+
+    通知のチャネルID・トークン・リソースIDを保存済みのチャネルと照合する。
+    """
+
+    def __init__(self, channel_repository: WatchChannelRepository) -> None:
+        self.channel_repository = channel_repository
+
+    async def execute(
+        self,
+        channel_id: str,
+        token: str | None,
+        resource_id: str | None,
+        resource_state: str,
+    ) -> WatchChannel | None:
+        """通知を検証し、同期が必要なチャネルを返す.
+
+        Args:
+            channel_id: X-Goog-Channel-ID
+            token: X-Goog-Channel-Token
+            resource_id: X-Goog-Resource-ID
+            resource_state: X-Goog-Resource-State
+
+        Returns:
+            同期が必要なチャネル。登録直後の確認通知（sync）の場合はNone。
+
+        Raises:
+            ValueError: 保存済みのチャネルと一致しない通知の場合
+        """
+        try:
+            parsed_id = UUID(channel_id)
+        except ValueError:
+            raise ValueError("Unknown watch channel") from None
+
+        channel = await self.channel_repository.get_by_id(parsed_id)
+        if (
+            channel is None
+            or token is None
+            or not secrets.compare_digest(token, channel.token)
+            or resource_id != channel.resource_id
+        ):
+            raise ValueError("Unknown watch channel")
+
+        if resource_state == SYNC_RESOURCE_STATE:
+            return None
+        return channel
+
+
+class SyncDriveChangesUseCase:
+    """Drive変更通知によるトランスクリプト差分同期ユースケース.
+
+    チャネルのページトークン以降に変更されたMeet Recordingsのファイルだけを同期する。
+    """
+
+    def __init__(
+        self,
+        google_integration_repository: GoogleIntegrationRepository,
+        channel_repository: WatchChannelRepository,
+        transcript_repository: MeetingTranscriptRepository,
+        recurring_meeting_repository: RecurringMeetingRepository,
+        embedding_index_service: EmbeddingIndexService | None = None,
+        search_index_service: SearchIndexService | None = None,
+    ) -> None:
+        self.google_integration_repository = google_integration_repository
+        self.channel_repository = channel_repository
+        self.transcript_repository = transcript_repository
+        self.recurring_meeting_repository = recurring_meeting_repository
+        self.embedding_index_service = embedding_index_service
+        self.search_index_service = search_index_service
+
+    async def execute(self, channel_id: UUID) -> SyncResult:
+        """変更されたトランスクリプトを同期し、ページトークンを進める.
+
+        ページトークンは実行時に読み直す（前回の同期で進んだ位置から続ける）。
+
+        Args:
+            channel_id: 通知を受けたDriveのチャネルID
+
+        Returns:
+            SyncResult: 同期結果
+
+        Raises:
+            ValueError: チャネルまたはGoogle連携がない、またはGoogle APIの呼び出しに失敗した場合
+        """
+        channel = await self.channel_repository.get_by_id(channel_id)
+        if channel is None:
+            raise ValueError("Watch channel not found")
+
+        integration = await self.google_integration_repository.get_by_id(channel.integration_id, channel.user_id)
+        if integration is None:
+            raise ValueError("Google integration not found")
+
+        access_token = await _get_access_token(integration)
+        drive_client = GoogleDriveClient(access_token)
+        result = SyncResult(synced_count=0, skipped_count=0, error_count=0, synced_transcripts=[])
+
+        folder_id = await drive_client.find_folder_id()
+        if channel.page_token is None or folder_id is None:
+            # 起点がない・フォルダがない場合は現在以降の変更から追う
+            await self.channel_repository.update_page_token(channel.id, await drive_client.get_start_page_token())
+            return result
+
+        changes = await drive_client.list_changed_transcript_files(channel.page_token, folder_id)
+        if changes.files:
+            use_case = SyncTranscriptsUseCase(
+                transcript_repository=self.transcript_repository,
+                recurring_meeting_repository=self.recurring_meeting_repository,
+                drive_client=drive_client,
+                docs_client=GoogleDocsClient(access_token),
+                embedding_index_service=self.embedding_index_service,
+                search_index_service=self.search_index_service,
+            )
+            result = await use_case.execute(channel.user_id, drive_files=changes.files)
+
+        # 同期の完了後にページトークンを進める（失敗時は次の通知で同じ変更から再試行する）
+        await self.channel_repository.update_page_token(channel.id, changes.new_start_page_token)
+        logger.info(
+            "Synced Drive changes for user %s: changed=%d synced=%d",
+            channel.user_id,
+            len(changes.files),
+            result.synced_count,
+        )
+        return result
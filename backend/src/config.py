@@ -29,6 +29,20 @@ class Settings(BaseSettings):
     AWS_BEARER_TOKEN_BEDROCK: str | None = None
     AWS_BEDROCK_ENDPOINT: str = "https://bedrock-runtime.us-east-1.amazonaws.com"
 
+    # Embedding index (pgvector | local | memory | disabled)
+    EMBEDDING_INDEX_BACKEND: str = "pgvector"
+    EMBEDDING_DIMENSIONS: int = 1024
+    EMBEDDING_MAX_CONCURRENCY: int = 16
+    # Local embedding cache used when Supabase is not configured
+    EMBEDDING_CACHE_PATH: str = ".cache/embeddings.sqlite3"
+    # Local vector store used when EMBEDDING_INDEX_BACKEND=local (IVF is disabled when lists is None)
+    EMBEDDING_LOCAL_INDEX_DIR: str = ".cache/vector_index"
+    EMBEDDING_LOCAL_IVF_LISTS: int | None = None
+
+    # Transcript body compression (zstd dictionaries trained by scripts/train_transcript_dictionary.py)
+    TRANSCRIPT_ZSTD_DICTIONARY_DIR: str = ""
+    TRANSCRIPT_BODY_CACHE_SIZE: int = 32
+
     # Slack OAuth
     SLACK_CLIENT_ID: str | None = None
     SLACK_CLIENT_SECRET: str | None = None
@@ -41,6 +55,42 @@ class Settings(BaseSettings):
     GOOGLE_REDIRECT_URI: str | None = None
     GOOGLE_TOKEN_ENCRYPTION_KEY: str | None = None
 
+    # Google push notifications (Calendar events.watch / Drive changes.watch)
+    # Public HTTPS URL of POST /api/v1/webhooks/google (channels are not registered when unset)
+    GOOGLE_WEBHOOK_URL: str | None = None
+    GOOGLE_WATCH_CHANNEL_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    # Channels expiring within this window are replaced by the renewal job
+    GOOGLE_WATCH_RENEW_BEFORE_SECONDS: int = 24 * 60 * 60
+    # Notifications for the same integration within this window trigger one sync
+    GOOGLE_WEBHOOK_DEBOUNCE_SECONDS: float = 30.0
+
+    # Agenda generation jobs (agenda_jobs table, claimed with FOR UPDATE SKIP LOCKED)
+    # Workers started inside the API process (0 = run scripts/run_agenda_worker.py instead)
+    AGENDA_JOB_WORKERS: int = 2
+    AGENDA_JOB_MAX_ATTEMPTS: int = 3
+    # Retry backoff: base * 2^(attempt - 1)
+    AGENDA_JOB_RETRY_BASE_SECONDS: float = 10.0
+    AGENDA_JOB_POLL_SECONDS: float = 1.0
+    # Running jobs without updates for this long are claimed again (the worker died)
+    AGENDA_JOB_STALE_SECONDS: int = 300
+    # POST /agendas/generate without "Prefer: respond-async" waits this long for its job
+    AGENDA_JOB_WAIT_SECONDS: float = 60.0
+    # Polling interval of the job status SSE stream
+    AGENDA_JOB_EVENTS_POLL_SECONDS: float = 0.5
+
+    # Agenda pre-generation (scripts/pregenerate_agendas.py)
+    # Drafts are generated for meetings whose next occurrence is within this window
+    AGENDA_PREGENERATE_LEAD_SECONDS: int = 3 * 60 * 60
+    # Pre-generation jobs start at a random delay up to this long to spread load
+    AGENDA_PREGENERATE_JITTER_SECONDS: int = 10 * 60
+    # Jobs enqueued per user per run; the rest wait for the next run
+    AGENDA_PREGENERATE_MAX_PER_USER: int = 5
+
+    # Incremental agenda updates: when the delta since the previous agenda is within these limits,
+    # only the previous agenda and the delta are sent and the model returns the changed blocks
+    AGENDA_INCREMENTAL_MAX_SLACK_MESSAGES: int = 30
+    AGENDA_INCREMENTAL_MAX_TRANSCRIPTS: int = 1
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -22,6 +22,7 @@ class Agenda:
         generated_at: アジェンダが生成された日時
         created_at: 作成日時
         updated_at: 更新日時
+        input_fingerprint: 生成時の入力（ナレッジ・議事録・Slack・辞書）のフィンガープリント
     """
 
     id: UUID
@@ -32,6 +33,7 @@ class Agenda:
     created_at: datetime
     source_knowledge_id: UUID | None = None
     updated_at: datetime | None = None
+    input_fingerprint: str | None = None
 
     def update_content(self, content: str) -> None:
         """アジェンダ内容を更新する.
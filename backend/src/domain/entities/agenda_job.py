@@ -0,0 +1,91 @@
+"""アジェンダ生成ジョブエンティティ."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+
+class AgendaJobStatus(Enum):
+    """アジェンダ生成ジョブのステータス."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class AgendaJobStage(Enum):
+    """アジェンダ生成の段階（進捗イベントとして通知する）."""
+
+    GATHERING = "gathering"
+    SLACK = "slack"
+    LLM = "llm"
+    PERSIST = "persist"
+
+
+@dataclass
+class AgendaJob:
+    """アジェンダ生成ジョブエンティティ.
+
+    Attributes:
+        id: ジョブID
+        user_id: ユーザーID
+        agent_id: アジェンダを生成するエージェントID
+        status: ステータス
+        attempts: 実行した回数（ワーカーが取得するたびに増える）
+        max_attempts: 最大実行回数
+        run_after: この日時以降に実行する（リトライ時のバックオフ）
+        created_at: 作成日時
+        updated_at: 更新日時
+        stage: 実行中の段階
+        agenda_id: 生成したアジェンダID
+        result: 生成に使ったデータソースの情報
+        error: 最後の失敗の内容
+        finished_at: 完了日時
+        recurring_meeting_id: 事前生成の対象の定例MTG ID（ユーザーの操作による生成の場合はNone）
+        target_date: 事前生成の対象の開催日時
+        input_fingerprint: 事前生成を登録した時点の入力のフィンガープリント
+        force: 入力が前回の生成から変わっていなくても生成し直す
+    """
+
+    id: UUID
+    user_id: UUID
+    agent_id: UUID
+    status: AgendaJobStatus
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    created_at: datetime
+    updated_at: datetime
+    stage: AgendaJobStage | None = None
+    agenda_id: UUID | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    finished_at: datetime | None = None
+    recurring_meeting_id: UUID | None = None
+    target_date: datetime | None = None
+    input_fingerprint: str | None = None
+    force: bool = False
+
+    @property
+    def is_finished(self) -> bool:
+        """成功・失敗のいずれかで完了しているか."""
+        return self.status in (AgendaJobStatus.SUCCEEDED, AgendaJobStatus.FAILED)
+
+    @property
+    def can_retry(self) -> bool:
+        """失敗時にもう一度実行できるか."""
+        return self.attempts < self.max_attempts
+
+    def retry_delay(self, base_seconds: float) -> timedelta:
+        """次の実行までの待ち時間（実行回数ごとに倍にする）.
+
+        Args:
+            base_seconds: 1回目の失敗後の待ち時間（秒）
+
+        Returns:
+            次の実行までの待ち時間
+        """
+        return timedelta(seconds=base_seconds * 2 ** max(self.attempts - 1, 0))
@@ -0,0 +1,64 @@
+"""EmbeddingChunk entity for domain layer.
+
+Pure Python entity without external dependencies.
+Following ADR-0001 clean architecture principles.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+
+class ChunkSourceType(Enum):
+    """埋め込みチャンクの元データ種別."""
+
+    KNOWLEDGE = "knowledge"
+    TRANSCRIPT = "transcript"
+    SLACK = "slack"
+
+
+@dataclass
+class EmbeddingChunk:
+    """埋め込みインデックスに登録されるテキストチャンク.
+
+    Attributes:
+        id: チャンクの一意識別子
+        user_id: 所有ユーザーのID
+        source_type: 元データ種別（knowledge, transcript, slack）
+        source_id: 元データのID（SlackはチャンネルID:ts）
+        chunk_index: 元データ内でのチャンク番号
+        content: チャンク本文
+        created_at: 作成日時
+        agent_id: 紐付けられたエージェントID（オプション）
+        recurring_meeting_id: 紐付けられた定例MTG ID（トランスクリプトのみ）
+        source_date: 元データの日時（MTG日時、投稿日時など）
+        speaker: 先頭発話の話者名（トランスクリプトのみ）
+        timestamp: 先頭発話のタイムスタンプ（HH:MM形式、トランスクリプトのみ）
+    """
+
+    id: UUID
+    user_id: UUID
+    source_type: ChunkSourceType
+    source_id: str
+    chunk_index: int
+    content: str
+    created_at: datetime
+    agent_id: UUID | None = None
+    recurring_meeting_id: UUID | None = None
+    source_date: datetime | None = None
+    speaker: str | None = None
+    timestamp: str | None = None
+
+
+@dataclass
+class RetrievedChunk:
+    """類似検索で取得されたチャンク.
+
+    Attributes:
+        chunk: 取得されたチャンク
+        score: クエリとのコサイン類似度
+    """
+
+    chunk: EmbeddingChunk
+    score: float
@@ -44,6 +44,8 @@ class GeneratedAgenda:
         delivered_via: 配信方法
         created_at: 作成日時
         updated_at: 更新日時
+        agenda_id: 生成したアジェンダのID（agendasテーブル）
+        input_fingerprint: 生成時の入力のフィンガープリント
     """
 
     id: UUID
@@ -55,6 +57,8 @@ class GeneratedAgenda:
     delivered_via: str | None
     created_at: datetime
     updated_at: datetime | None
+    agenda_id: UUID | None = None
+    input_fingerprint: str | None = None
 
     def mark_as_sent(self, via: str) -> None:
         """送信済みにマークする.
@@ -20,6 +20,7 @@ class GoogleIntegration:
         granted_scopes: List of OAuth scopes granted by the user.
         created_at: Timestamp when the integration was created.
         updated_at: Timestamp when the integration was last updated.
+        calendar_sync_token: Google Calendar nextSyncToken from the last sync.
     """
 
     id: UUID
@@ -29,6 +30,7 @@ class GoogleIntegration:
     granted_scopes: list[str]
     created_at: datetime
     updated_at: datetime | None
+    calendar_sync_token: str | None = None
 
     def has_scope(self, scope: str) -> bool:
         """指定スコープが許可済みか確認.
@@ -1,11 +1,14 @@
 """トランスクリプトエンティティ."""
 
-from dataclasses import dataclass
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import overload
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptEntry:
     """トランスクリプトの1エントリ.
 
@@ -20,15 +23,131 @@ class TranscriptEntry:
     text: str
 
 
+class TranscriptEntryTable(Sequence[TranscriptEntry]):
+    """発話を生テキスト上のオフセットで保持するコンパクトなエントリ列.
+
+    各発話は(話者ID, タイムスタンプの分数, 開始位置, 終了位置)として配列に保持し、
+    本文は参照されたときに生テキストから切り出す。話者名は辞書で共有する。
+    """
+
+    __slots__ = ("_raw_text", "ends", "minutes", "speaker_ids", "speakers", "starts")
+
+    def __init__(
+        self,
+        raw_text: str | Callable[[], str],
+        speakers: list[str],
+        speaker_ids: "array[int]",
+        minutes: "array[int]",
+        starts: "array[int]",
+        ends: "array[int]",
+    ) -> None:
+        """エントリ列を初期化する.
+
+        Args:
+            raw_text: オフセットの基準となる生テキスト（初回参照時に呼ぶ関数も可）
+            speakers: 話者名の辞書（話者IDの順）
+            speaker_ids: 発話ごとの話者ID
+            minutes: 発話ごとのタイムスタンプ（0時からの分数）
+            starts: 発話ごとの本文の開始位置
+            ends: 発話ごとの本文の終了位置
+        """
+        self._raw_text = raw_text
+        self.speakers = speakers
+        self.speaker_ids = speaker_ids
+        self.minutes = minutes
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def from_entries(cls, raw_text: str, entries: Sequence[TranscriptEntry]) -> "TranscriptEntryTable | None":
+        """生テキストを先頭から検索してエントリ列をオフセット表現に変換する.
+
+        本文が生テキスト上に連続して現れない発話や、タイムスタンプが
+        ゼロ埋めのHH:MM形式でない発話がある場合は変換できないためNoneを返す。
+
+        Args:
+            raw_text: 生テキスト
+            entries: 変換するエントリ
+
+        Returns:
+            TranscriptEntryTable、変換できない場合はNone
+        """
+        speaker_index: dict[str, int] = {}
+        table = cls(raw_text, [], array("H"), array("H"), array("I"), array("I"))
+        cursor = 0
+        for entry in entries:
+            minutes = parse_timestamp_minutes(entry.timestamp)
+            start = raw_text.find(entry.text, cursor) if entry.text else -1
+            if minutes is None or start < 0:
+                return None
+            speaker_id = speaker_index.setdefault(entry.speaker, len(speaker_index))
+            if speaker_id == len(table.speakers):
+                table.speakers.append(entry.speaker)
+            cursor = start + len(entry.text)
+            table.speaker_ids.append(speaker_id)
+            table.minutes.append(minutes)
+            table.starts.append(start)
+            table.ends.append(cursor)
+        return table
+
+    @property
+    def raw_text(self) -> str:
+        """オフセットの基準となる生テキスト."""
+        if callable(self._raw_text):
+            self._raw_text = self._raw_text()
+        return self._raw_text
+
+    def __len__(self) -> int:
+        """発話数を返す."""
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self, index: int) -> TranscriptEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TranscriptEntry]: ...
+
+    def __getitem__(self, index: int | slice) -> TranscriptEntry | list[TranscriptEntry]:
+        """発話を取り出す（本文はこの時点で切り出す）."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return TranscriptEntry(
+            speaker=self.speaker_at(index),
+            timestamp=format_timestamp_minutes(self.minutes[index]),
+            text=self.text_at(index),
+        )
+
+    def __iter__(self) -> Iterator[TranscriptEntry]:
+        """発話を順に返す."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        """エントリの内容が等しいかを比較する."""
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def speaker_at(self, index: int) -> str:
+        """発話の話者名を返す."""
+        return self.speakers[self.speaker_ids[index]]
+
+    def text_at(self, index: int) -> str:
+        """発話の本文を生テキストから切り出す."""
+        return self.raw_text[self.starts[index] : self.ends[index]]
+
+
 @dataclass
 class TranscriptStructuredData:
     """構造化トランスクリプトデータ.
 
     Attributes:
-        entries: トランスクリプトエントリのリスト
+        entries: トランスクリプトエントリの列（DBから読み込んだ場合はTranscriptEntryTable）
     """
 
-    entries: list[TranscriptEntry]
+    entries: Sequence[TranscriptEntry]
 
     def get_speakers(self) -> list[str]:
         """全話者名を取得する.
@@ -36,10 +155,42 @@ class TranscriptStructuredData:
         Returns:
             ユニークな話者名のリスト
         """
+        if isinstance(self.entries, TranscriptEntryTable):
+            return list(self.entries.speakers)
         return list({entry.speaker for entry in self.entries})
 
 
-@dataclass
+def parse_timestamp_minutes(timestamp: str) -> int | None:
+    """ゼロ埋めのHH:MM形式のタイムスタンプを0時からの分数に変換する.
+
+    Args:
+        timestamp: タイムスタンプ
+
+    Returns:
+        分数。HH:MM形式でない場合はNone。
+    """
+    hours, separator, minutes = timestamp.partition(":")
+    if (
+        not separator
+        or len(hours) != 2
+        or len(minutes) != 2
+        or not (hours + minutes).isascii()
+        or not (hours + minutes).isdigit()
+    ):
+        return None
+    return int(hours) * 60 + int(minutes)
+
+
+def format_timestamp_minutes(minutes: int) -> str:
+    """0時からの分数をHH:MM形式のタイムスタンプに変換する."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+# 自動紐付けとみなす信頼度の下限（未満は手動確認が必要）
+MANUAL_CONFIRMATION_THRESHOLD = 0.7
+
+
+@dataclass(init=False)
 class MeetingTranscript:
     """会議トランスクリプトエンティティ.
 
@@ -53,17 +204,59 @@ class MeetingTranscript:
         match_confidence: 紐付け信頼度（0.0-1.0）
         created_at: 作成日時
         recurring_meeting_title: 紐付けられた定例MTGの名称（アジェンダ生成用）
+
+    raw_textはdefer_raw_textで読み込み処理を登録すると、初回参照時に読み込まれる。
     """
 
     id: UUID
     recurring_meeting_id: UUID
     meeting_date: datetime
     google_doc_id: str
-    raw_text: str
     structured_data: TranscriptStructuredData | None
     match_confidence: float
     created_at: datetime
-    recurring_meeting_title: str | None = None
+    recurring_meeting_title: str | None
+    # 未読み込みの場合はNone（_raw_text_loaderで読み込む）
+    _raw_text: str | None = field(repr=False)
+    _raw_text_loader: Callable[[], str] | None = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        id: UUID,
+        recurring_meeting_id: UUID,
+        meeting_date: datetime,
+        google_doc_id: str,
+        raw_text: str,
+        structured_data: TranscriptStructuredData | None,
+        match_confidence: float,
+        created_at: datetime,
+        recurring_meeting_title: str | None = None,
+    ) -> None:
+        self.id = id
+        self.recurring_meeting_id = recurring_meeting_id
+        self.meeting_date = meeting_date
+        self.google_doc_id = google_doc_id
+        self.structured_data = structured_data
+        self.match_confidence = match_confidence
+        self.created_at = created_at
+        self.recurring_meeting_title = recurring_meeting_title
+        self._raw_text = raw_text
+        self._raw_text_loader = None
+
+    @property
+    def raw_text(self) -> str:
+        """生テキスト（未読み込みの場合はここで読み込む）."""
+        if self._raw_text is None:
+            loader = self._raw_text_loader
+            self._raw_text_loader = None
+            self._raw_text = loader() if loader is not None else ""
+        return self._raw_text
+
+    @raw_text.setter
+    def raw_text(self, value: str) -> None:
+        """生テキストを設定する（遅延読み込みは破棄する）."""
+        self._raw_text = value
+        self._raw_text_loader = None
 
     def is_auto_linked(self) -> bool:
         """自動紐付けされたかを判定する.
@@ -73,7 +266,7 @@ class MeetingTranscript:
         Returns:
             自動紐付けの場合True
         """
-        return self.match_confidence >= 0.7
+        return self.match_confidence >= MANUAL_CONFIRMATION_THRESHOLD
 
     def needs_manual_confirmation(self) -> bool:
         """手動確認が必要かを判定する.
@@ -83,4 +276,52 @@ class MeetingTranscript:
         Returns:
             手動確認が必要な場合True
         """
-        return self.match_confidence < 0.7
+        return self.match_confidence < MANUAL_CONFIRMATION_THRESHOLD
+
+    def defer_raw_text(self, loader: Callable[[], str]) -> None:
+        """raw_textの読み込みを初回参照時まで遅延する.
+
+        Args:
+            loader: raw_textを返す関数（初回参照時に1回だけ呼ばれる）
+        """
+        self._raw_text = None
+        self._raw_text_loader = loader
+
+    def is_raw_text_loaded(self) -> bool:
+        """raw_textが読み込み済みかを判定する."""
+        return self._raw_text is not None
+
+
+@dataclass
+class MeetingTranscriptSummary:
+    """一覧表示用のトランスクリプト概要.
+
+    本文・構造化データを含まないため、一覧取得では本文を読み込まない。
+
+    Attributes:
+        id: トランスクリプトID
+        recurring_meeting_id: 紐付けられた定例MTG ID
+        meeting_date: 会議日時
+        google_doc_id: Google DocsのドキュメントID
+        match_confidence: 紐付け信頼度（0.0-1.0）
+        created_at: 作成日時
+        raw_text_size: 本文のUTF-8バイト数（不明の場合はNone）
+        recurring_meeting_title: 紐付けられた定例MTGの名称
+    """
+
+    id: UUID
+    recurring_meeting_id: UUID
+    meeting_date: datetime
+    google_doc_id: str
+    match_confidence: float
+    created_at: datetime
+    raw_text_size: int | None = None
+    recurring_meeting_title: str | None = None
+
+    def is_auto_linked(self) -> bool:
+        """自動紐付けされたかを判定する."""
+        return self.match_confidence >= MANUAL_CONFIRMATION_THRESHOLD
+
+    def needs_manual_confirmation(self) -> bool:
+        """手動確認が必要かを判定する."""
+        return self.match_confidence < MANUAL_CONFIRMATION_THRESHOLD
@@ -0,0 +1,53 @@
+"""PageCursor value object for keyset pagination.
+
+Pure Python value object without SQLAlchemy/Pydantic dependencies.
+Following ADR-0001 clean architecture principles.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """キーセットページネーションのカーソル.
+
+    一覧は (sort_value, id) の降順で並べ、前ページ最後の行のキーより
+    後ろの行だけを取得する。OFFSETと違い、ページが深くなってもDBが
+    読み飛ばす行は増えない。
+
+    Attributes:
+        sort_value: 並び順の列（日付）の値
+        id: 同じ日付の行を区別するためのID
+    """
+
+    sort_value: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """クライアントに返す不透明な文字列に変換する."""
+        raw = f"{self.sort_value.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """encodeした文字列からカーソルを復元する.
+
+        Args:
+            token: encodeで作成した文字列
+
+        Returns:
+            カーソル
+
+        Raises:
+            ValueError: 不正な文字列の場合
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            sort_value, _, id_ = raw.partition("|")
+            return cls(sort_value=datetime.fromisoformat(sort_value), id=UUID(id_))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError("Invalid page cursor") from e
@@ -47,6 +47,9 @@ class RecurringMeeting:
         agent_id: 紐付けられたエージェントID（オプション）.
         created_at: 作成日時.
         updated_at: 更新日時.
+        start_datetime: シリーズの開始日時（RRULEのDTSTART、オプション）.
+        timezone: 開始日時のIANAタイムゾーン名（オプション）.
+        exdates: 除外された開催日時のリスト.
     """
 
     id: UUID
@@ -60,6 +63,9 @@ class RecurringMeeting:
     attendees: list[Attendee] = field(default_factory=list)
     agent_id: UUID | None = None
     updated_at: datetime | None = None
+    start_datetime: datetime | None = None
+    timezone: str | None = None
+    exdates: list[datetime] = field(default_factory=list)
 
     def link_agent(self, agent_id: UUID) -> None:
         """エージェントを紐付ける.
@@ -0,0 +1,65 @@
+"""SearchEntry entity for domain layer.
+
+Pure Python entity without external dependencies.
+Following ADR-0001 clean architecture principles.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+
+class SearchSourceType(Enum):
+    """全文検索の元データ種別."""
+
+    KNOWLEDGE = "knowledge"
+    TRANSCRIPT = "transcript"
+
+
+@dataclass
+class SearchEntry:
+    """全文検索インデックスに登録されるテキスト.
+
+    トランスクリプトは発話単位、ナレッジはチャンク単位で登録する。
+
+    Attributes:
+        id: エントリの一意識別子
+        user_id: 所有ユーザーのID
+        source_type: 元データ種別（knowledge, transcript）
+        source_id: 元データ（knowledge / meeting_transcripts）のID
+        entry_index: 元データ内での番号
+        content: 本文
+        agent_id: 紐付けられたエージェントID（オプション）
+        recurring_meeting_id: 紐付けられた定例MTG ID（トランスクリプトのみ）
+        source_date: 元データの日時（MTG日時）
+        speaker: 発話の話者名（トランスクリプトのみ）
+        timestamp: 発話のタイムスタンプ（HH:MM形式、トランスクリプトのみ）
+    """
+
+    id: UUID
+    user_id: UUID
+    source_type: SearchSourceType
+    source_id: UUID
+    entry_index: int
+    content: str
+    agent_id: UUID | None = None
+    recurring_meeting_id: UUID | None = None
+    source_date: datetime | None = None
+    speaker: str | None = None
+    timestamp: str | None = None
+
+
+@dataclass
+class SearchHit:
+    """全文検索でヒットしたエントリ.
+
+    Attributes:
+        entry: ヒットしたエントリ
+        score: クエリとの関連度（ts_rank_cd）
+        snippet: 一致箇所の前後を切り出した本文
+    """
+
+    entry: SearchEntry
+    score: float
+    snippet: str = ""
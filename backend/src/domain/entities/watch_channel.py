@@ -0,0 +1,60 @@
+"""WatchChannel entity for domain layer.
+
+Pure Python entity without external dependencies.
+Following ADR-0001 clean architecture principles.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from uuid import UUID
+
+
+class WatchResourceType(Enum):
+    """プッシュ通知の監視対象."""
+
+    CALENDAR = "calendar"  # Google Calendar events.watch（プライマリカレンダー）
+    DRIVE = "drive"  # Google Drive changes.watch
+
+
+@dataclass
+class WatchChannel:
+    """Googleのプッシュ通知チャネル.
+
+    Google Calendar / Driveの変更通知を受け取るために登録したチャネル。
+    通知にはチャネルIDとトークンが付くため、保存済みの値と照合して検証する。
+
+    Attributes:
+        id: チャネルID（Googleに登録したID）
+        user_id: 所有ユーザーのID
+        integration_id: 通知対象のGoogle連携ID
+        resource_type: 監視対象（calendar, drive）
+        resource_id: Googleが採番した監視対象リソースのID
+        token: 通知の検証用トークン
+        expiration: チャネルの有効期限
+        page_token: Drive変更一覧の続きを取得するページトークン（driveのみ）
+        created_at: 作成日時
+    """
+
+    id: UUID
+    user_id: UUID
+    integration_id: UUID
+    resource_type: WatchResourceType
+    resource_id: str
+    token: str
+    expiration: datetime
+    created_at: datetime
+    page_token: str | None = None
+
+    def expires_within(self, window: timedelta, now: datetime | None = None) -> bool:
+        """指定期間内に有効期限が切れるか確認する.
+
+        Args:
+            window: 判定する期間
+            now: 基準日時（省略時は現在日時）
+
+        Returns:
+            有効期限まで指定期間を切っていればTrue
+        """
+        now = now or datetime.now(UTC)
+        return self.expiration - now <= window
@@ -0,0 +1,138 @@
+"""AgendaJobRepository interface for domain layer.
+
+Abstract base class defining the contract for the agenda generation job queue.
+Implementations should be provided in the infrastructure layer.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStage
+
+
+class AgendaJobRepository(ABC):
+    """Abstract repository interface for AgendaJob entity.
+
+    Doubles as the job queue: workers claim runnable jobs atomically, so
+    several workers (and processes) can poll the same queue.
+    """
+
+    @abstractmethod
+    async def create(self, job: AgendaJob) -> AgendaJob:
+        """Enqueue a new job.
+
+        Args:
+            job: The AgendaJob entity to create.
+
+        Returns:
+            The created AgendaJob entity.
+        """
+
+    @abstractmethod
+    async def create_or_get_active(self, job: AgendaJob) -> AgendaJob:
+        """Enqueue a job unless an equivalent one is already queued or running.
+
+        Jobs are equivalent when they share user_id, agent_id and a non-null
+        input_fingerprint. The check and the insert are atomic across processes,
+        so concurrent callers all receive the same job and only it runs.
+        An existing job's run_after is moved up to the new job's run_after, so
+        an immediate request is not held back by a job scheduled for later.
+
+        Args:
+            job: The AgendaJob entity to create.
+
+        Returns:
+            The created job, or the unfinished equivalent job if one exists.
+        """
+
+    @abstractmethod
+    async def get_by_id(self, job_id: UUID, user_id: UUID) -> AgendaJob | None:
+        """Retrieve a job by its ID.
+
+        Args:
+            job_id: The unique identifier of the job.
+            user_id: The user ID for ownership verification.
+
+        Returns:
+            The AgendaJob if found, None otherwise.
+        """
+
+    @abstractmethod
+    async def get_active_recurring_meeting_ids(self, recurring_meeting_ids: list[UUID]) -> set[UUID]:
+        """Return the recurring meetings that have a queued or running pre-generation job.
+
+        Args:
+            recurring_meeting_ids: The recurring meetings to check.
+
+        Returns:
+            The subset of recurring_meeting_ids with an unfinished job.
+        """
+
+    @abstractmethod
+    async def claim_next(self, worker_id: str, stale_after: timedelta) -> AgendaJob | None:
+        """Atomically claim the next runnable job and mark it running.
+
+        Runnable jobs are queued jobs whose run_after has passed, and running
+        jobs whose worker has not reported for stale_after (the worker died).
+        A claimed job is not returned to any other worker.
+
+        Args:
+            worker_id: Identifier of the claiming worker.
+            stale_after: How long a running job may go without updates.
+
+        Returns:
+            The claimed AgendaJob with attempts incremented, or None if none is runnable.
+        """
+
+    @abstractmethod
+    async def update_stage(self, job_id: UUID, worker_id: str, stage: AgendaJobStage) -> None:
+        """Record the stage a running job has reached.
+
+        Does nothing if the job is no longer locked by worker_id.
+
+        Args:
+            job_id: The unique identifier of the job.
+            worker_id: Identifier of the worker that claimed the job.
+            stage: The stage that started.
+        """
+
+    @abstractmethod
+    async def mark_succeeded(self, job_id: UUID, worker_id: str, agenda_id: UUID, result: dict[str, Any]) -> None:
+        """Mark a job as succeeded.
+
+        Does nothing if the job is no longer locked by worker_id
+        (another worker took it over after it went stale).
+
+        Args:
+            job_id: The unique identifier of the job.
+            worker_id: Identifier of the worker that claimed the job.
+            agenda_id: The ID of the generated agenda.
+            result: Information on the data sources used.
+        """
+
+    @abstractmethod
+    async def mark_failed(self, job_id: UUID, worker_id: str, error: str) -> None:
+        """Mark a job as failed without further retries.
+
+        Does nothing if the job is no longer locked by worker_id.
+
+        Args:
+            job_id: The unique identifier of the job.
+            worker_id: Identifier of the worker that claimed the job.
+            error: Description of the failure.
+        """
+
+    @abstractmethod
+    async def schedule_retry(self, job_id: UUID, worker_id: str, error: str, run_after: datetime) -> None:
+        """Put a failed job back in the queue.
+
+        Does nothing if the job is no longer locked by worker_id.
+
+        Args:
+            job_id: The unique identifier of the job.
+            worker_id: Identifier of the worker that claimed the job.
+            error: Description of the failure.
+            run_after: When the job may run again.
+        """
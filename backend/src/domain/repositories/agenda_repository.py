@@ -9,6 +9,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from src.domain.entities.agenda import Agenda
+from src.domain.entities.page_cursor import PageCursor
 
 
 class AgendaRepository(ABC):
@@ -47,6 +48,7 @@ class AgendaRepository(ABC):
         agent_id: UUID,
         user_id: UUID,
         limit: int | None = None,
+        cursor: PageCursor | None = None,
     ) -> list[Agenda]:
         """エージェントのアジェンダ一覧を取得する.
 
@@ -54,6 +56,7 @@ class AgendaRepository(ABC):
             agent_id: エージェントの一意識別子
             user_id: 所有ユーザーのID（RLSによるアクセス制御）
             limit: 取得件数の上限（Noneの場合は全件）
+            cursor: 前ページのカーソル（(generated_at, id)、Noneの場合は先頭から）
 
         Returns:
             Agendaエンティティのリスト（生成日時の降順）
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from src.domain.entities.dictionary_entry import DictionaryEntry
+from src.domain.entities.page_cursor import PageCursor
 
 
 class DictionaryRepository(ABC):
@@ -42,16 +43,36 @@ class DictionaryRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all(self, user_id: UUID) -> list[DictionaryEntry]:
+    async def get_all(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[DictionaryEntry]:
         """Retrieve all dictionary entries for a user.
 
         Args:
             user_id: The user ID.
+            limit: Maximum number of entries (None for all).
+            cursor: Cursor of the previous page on (created_at, id), or None for the first page.
 
         Returns:
             A list of DictionaryEntry entities.
         """
 
+    @abstractmethod
+    async def get_version(self, user_id: UUID) -> str:
+        """Return a version string that changes whenever the user's dictionary changes.
+
+        Only entry IDs and timestamps are read, so this is much cheaper than get_all.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            An opaque version string.
+        """
+
     @abstractmethod
     async def update(self, entry: DictionaryEntry) -> DictionaryEntry:
         """Update an existing dictionary entry.
@@ -0,0 +1,49 @@
+"""EmbeddingCacheRepository interface for domain layer.
+
+Abstract base class defining the contract for content-addressed embedding cache operations.
+Implementations should be provided in the infrastructure layer.
+Following ADR-0001 clean architecture principles.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+import numpy as np
+import numpy.typing as npt
+
+
+class EmbeddingCacheRepository(ABC):
+    """埋め込みキャッシュリポジトリのインターフェース.
+
+    正規化済みテキストのハッシュをキーに埋め込みベクトルを永続化する。
+    同じテキストの再取り込みではモデルを呼び出さずにキャッシュから返す。
+    """
+
+    @abstractmethod
+    async def get_many(
+        self,
+        content_hashes: list[str],
+        dimensions: int,
+    ) -> dict[str, npt.NDArray[np.float32]]:
+        """ハッシュに対応するキャッシュ済みベクトルを取得する.
+
+        Args:
+            content_hashes: 正規化済みテキストのハッシュのリスト
+            dimensions: 埋め込みベクトルの次元数
+
+        Returns:
+            ハッシュをキーとするベクトルの辞書（キャッシュにないものは含まない）
+        """
+
+    @abstractmethod
+    async def put_many(
+        self,
+        embeddings: Mapping[str, npt.NDArray[np.float32]],
+        dimensions: int,
+    ) -> None:
+        """ベクトルをキャッシュに保存する.
+
+        Args:
+            embeddings: ハッシュをキーとするベクトルの辞書
+            dimensions: 埋め込みベクトルの次元数
+        """
@@ -0,0 +1,102 @@
+"""EmbeddingRepository interface for domain layer.
+
+Abstract base class defining the contract for embedding index persistence operations.
+Implementations should be provided in the infrastructure layer.
+Following ADR-0001 clean architecture principles.
+"""
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+
+from src.domain.entities.embedding_chunk import (
+    ChunkSourceType,
+    EmbeddingChunk,
+    RetrievedChunk,
+)
+
+
+class EmbeddingRepository(ABC):
+    """埋め込みインデックスリポジトリのインターフェース.
+
+    DDDのRepositoryパターンに従い、チャンクとベクトルの永続化・類似検索を定義。
+    具体的な実装（pgvector、プロセス内NumPy）はインフラ層で提供される。
+    """
+
+    @abstractmethod
+    async def upsert_chunks(
+        self,
+        chunks: list[EmbeddingChunk],
+        embeddings: npt.NDArray[np.float32],
+    ) -> None:
+        """チャンクと埋め込みベクトルを登録する.
+
+        同じ(user_id, source_type, source_id, chunk_index)のチャンクは上書きする。
+
+        Args:
+            chunks: 登録するEmbeddingChunkのリスト
+            embeddings: chunksと同じ順序の埋め込みベクトル（shape (len(chunks), 次元数)）
+        """
+
+    @abstractmethod
+    async def delete_by_source(
+        self,
+        user_id: UUID,
+        source_type: ChunkSourceType,
+        source_id: str,
+    ) -> int:
+        """元データに紐づくチャンクを全て削除する.
+
+        Args:
+            user_id: 所有ユーザーのID
+            source_type: 元データ種別
+            source_id: 元データのID
+
+        Returns:
+            削除したチャンク数
+        """
+
+    @abstractmethod
+    async def get_indexed_source_ids(
+        self,
+        user_id: UUID,
+        source_type: ChunkSourceType,
+        source_ids: list[str],
+    ) -> set[str]:
+        """指定した元データのうち、既にインデックス済みのIDを取得する.
+
+        Args:
+            user_id: 所有ユーザーのID
+            source_type: 元データ種別
+            source_ids: 確認する元データIDのリスト
+
+        Returns:
+            インデックス済みの元データIDの集合
+        """
+
+    @abstractmethod
+    async def search(
+        self,
+        user_id: UUID,
+        query_embedding: npt.NDArray[np.float32],
+        top_k: int,
+        agent_id: UUID | None = None,
+        recurring_meeting_ids: list[UUID] | None = None,
+    ) -> list[RetrievedChunk]:
+        """クエリベクトルに類似するチャンクを検索する.
+
+        agent_idに紐づくチャンク、またはrecurring_meeting_idsのいずれかに
+        紐づくチャンクを対象とする。どちらも指定しない場合はユーザーの全チャンクが対象。
+
+        Args:
+            user_id: 所有ユーザーのID
+            query_embedding: クエリの埋め込みベクトル（正規化済み）
+            top_k: 取得件数
+            agent_id: 絞り込み対象のエージェントID
+            recurring_meeting_ids: 絞り込み対象の定例MTG IDリスト
+
+        Returns:
+            RetrievedChunkのリスト（類似度の降順）
+        """
@@ -0,0 +1,43 @@
+"""GeneratedAgendaRepository interface for domain layer.
+
+Abstract base class defining the contract for agendas generated ahead of
+recurring meeting occurrences.
+Implementations should be provided in the infrastructure layer.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities.generated_agenda import GeneratedAgenda
+
+
+class GeneratedAgendaRepository(ABC):
+    """Abstract repository interface for GeneratedAgenda entity.
+
+    A recurring meeting has at most one generated agenda per occurrence
+    (recurring_meeting_id, target_date).
+    """
+
+    @abstractmethod
+    async def get_upcoming(self, recurring_meeting_ids: list[UUID], since: datetime) -> list[GeneratedAgenda]:
+        """Retrieve generated agendas for occurrences from the given time on.
+
+        Args:
+            recurring_meeting_ids: The recurring meetings to look up.
+            since: Only occurrences at or after this time are returned.
+
+        Returns:
+            A list of GeneratedAgenda entities ordered by target_date.
+        """
+
+    @abstractmethod
+    async def upsert(self, agenda: GeneratedAgenda) -> GeneratedAgenda:
+        """Create or replace the generated agenda of an occurrence.
+
+        Args:
+            agenda: The GeneratedAgenda entity to save.
+
+        Returns:
+            The saved GeneratedAgenda entity.
+        """
@@ -79,6 +79,21 @@ class GoogleIntegrationRepository(ABC):
             The updated GoogleIntegration entity.
         """
 
+    @abstractmethod
+    async def update_calendar_sync_token(
+        self,
+        integration_id: UUID,
+        user_id: UUID,
+        sync_token: str | None,
+    ) -> None:
+        """Store the Google Calendar sync token of an integration.
+
+        Args:
+            integration_id: The unique identifier of the integration.
+            user_id: The user ID.
+            sync_token: The nextSyncToken to store, or None to force a full sync.
+        """
+
     @abstractmethod
     async def delete(self, integration_id: UUID, user_id: UUID) -> bool:
         """Delete a Google integration.
@@ -9,6 +9,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.page_cursor import PageCursor
 
 
 class KnowledgeRepository(ABC):
@@ -47,6 +48,7 @@ class KnowledgeRepository(ABC):
         agent_id: UUID,
         user_id: UUID,
         limit: int | None = None,
+        cursor: PageCursor | None = None,
     ) -> list[Knowledge]:
         """エージェントのナレッジ一覧を取得する.
 
@@ -54,6 +56,7 @@ class KnowledgeRepository(ABC):
             agent_id: エージェントのID
             user_id: 所有ユーザーのID
             limit: 取得件数の上限（Noneの場合は制限なし）
+            cursor: 前ページのカーソル（(meeting_date, id)、Noneの場合は先頭から）
 
         Returns:
             Knowledgeエンティティのリスト（日付降順）
@@ -9,7 +9,8 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from uuid import UUID
 
-from src.domain.entities.meeting_transcript import MeetingTranscript
+from src.domain.entities.meeting_transcript import MeetingTranscript, MeetingTranscriptSummary
+from src.domain.entities.page_cursor import PageCursor
 
 
 class MeetingTranscriptRepository(ABC):
@@ -46,17 +47,45 @@ class MeetingTranscriptRepository(ABC):
         self,
         recurring_meeting_id: UUID,
         limit: int | None = None,
+        needs_confirmation_only: bool = False,
+        cursor: PageCursor | None = None,
     ) -> list[MeetingTranscript]:
         """定例MTGのトランスクリプト一覧を取得する.
 
         Args:
             recurring_meeting_id: 定例MTGのID
             limit: 取得件数の上限（Noneの場合は制限なし）
+            needs_confirmation_only: 手動確認が必要なもの（信頼度0.7未満）に絞り込むか
+            cursor: 前ページのカーソル（(meeting_date, id)、Noneの場合は先頭から）
 
         Returns:
             MeetingTranscriptエンティティのリスト（日付降順）
         """
 
+    @abstractmethod
+    async def get_summaries(
+        self,
+        user_id: UUID,
+        recurring_meeting_id: UUID | None = None,
+        needs_confirmation_only: bool = False,
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[MeetingTranscriptSummary]:
+        """トランスクリプトの概要一覧を取得する.
+
+        本文・構造化データを取得しないため、一覧表示に使う。
+
+        Args:
+            user_id: ユーザーID（RLSフィルタリング用）
+            recurring_meeting_id: 定例MTGのID（Noneの場合はユーザーの全トランスクリプト）
+            needs_confirmation_only: 手動確認が必要なもの（信頼度0.7未満）に絞り込むか
+            limit: 取得件数の上限（Noneの場合は制限なし）
+            cursor: 前ページのカーソル（(meeting_date, id)、Noneの場合は先頭から）
+
+        Returns:
+            MeetingTranscriptSummaryのリスト（日付降順）
+        """
+
     @abstractmethod
     async def get_by_date_range(
         self,
@@ -91,6 +120,18 @@ class MeetingTranscriptRepository(ABC):
             見つかった場合はMeetingTranscriptエンティティ、見つからない場合はNone
         """
 
+    @abstractmethod
+    async def exists_by_google_doc_id(self, google_doc_id: str, user_id: UUID) -> bool:
+        """Google Doc IDのトランスクリプトが保存済みかを判定する.
+
+        Args:
+            google_doc_id: Google DocsのドキュメントID
+            user_id: ユーザーID（RLSフィルタリング用）
+
+        Returns:
+            保存済みの場合True
+        """
+
     @abstractmethod
     async def update(self, transcript: MeetingTranscript) -> MeetingTranscript:
         """トランスクリプトを更新する.
@@ -106,16 +147,20 @@ class MeetingTranscriptRepository(ABC):
     async def get_needing_confirmation(
         self,
         user_id: UUID,
-    ) -> list[MeetingTranscript]:
-        """手動確認が必要なトランスクリプト一覧を取得する.
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[MeetingTranscriptSummary]:
+        """手動確認が必要なトランスクリプトの概要一覧を取得する.
 
-        match_confidenceが0.7未満のトランスクリプトを取得。
+        match_confidenceが0.7未満のトランスクリプトを取得。本文・構造化データは取得しない。
 
         Args:
             user_id: ユーザーID（RLSフィルタリング用）
+            limit: 取得件数の上限（Noneの場合は制限なし）
+            cursor: 前ページのカーソル（(meeting_date, id)、Noneの場合は先頭から）
 
         Returns:
-            手動確認が必要なMeetingTranscriptエンティティのリスト
+            手動確認が必要なMeetingTranscriptSummaryのリスト（日付降順）
         """
 
     @abstractmethod
@@ -5,6 +5,7 @@ Implementations should be provided in the infrastructure layer.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities.recurring_meeting import RecurringMeeting
@@ -57,6 +58,34 @@ class RecurringMeetingRepository(ABC):
             The RecurringMeeting if found, None otherwise.
         """
 
+    @abstractmethod
+    async def get_by_google_event_ids(
+        self,
+        user_id: UUID,
+        google_event_ids: list[str],
+    ) -> list[RecurringMeeting]:
+        """Retrieve the recurring meetings for several Google event IDs.
+
+        Args:
+            user_id: The user ID.
+            google_event_ids: The Google Calendar event IDs.
+
+        Returns:
+            A list of the RecurringMeeting entities that exist.
+        """
+
+    @abstractmethod
+    async def get_with_next_occurrence_before(self, user_id: UUID, before: datetime) -> list[RecurringMeeting]:
+        """Retrieve the recurring meetings whose stored next occurrence is before a datetime.
+
+        Args:
+            user_id: The user ID.
+            before: Upper bound of the stored next occurrence (exclusive).
+
+        Returns:
+            A list of RecurringMeeting entities.
+        """
+
     @abstractmethod
     async def get_all(self, user_id: UUID) -> list[RecurringMeeting]:
         """Retrieve all recurring meetings for a user.
@@ -84,6 +113,20 @@ class RecurringMeetingRepository(ABC):
             List of RecurringMeeting entities linked to the agent.
         """
 
+    @abstractmethod
+    async def get_linked_occurring_between(self, start: datetime, end: datetime) -> list[RecurringMeeting]:
+        """Retrieve agent-linked meetings of all users whose next occurrence is in [start, end).
+
+        Used by background jobs with the service key, so it is not filtered by user.
+
+        Args:
+            start: Earliest next occurrence (inclusive).
+            end: Latest next occurrence (exclusive).
+
+        Returns:
+            A list of RecurringMeeting entities ordered by next_occurrence.
+        """
+
     @abstractmethod
     async def link_to_agent(
         self,
@@ -183,3 +226,25 @@ class RecurringMeetingRepository(ABC):
         Returns:
             The created or updated RecurringMeeting entity.
         """
+
+    @abstractmethod
+    async def upsert_many(self, meetings: list[RecurringMeeting]) -> None:
+        """Create or update recurring meetings in a single request.
+
+        Rows are matched on (user_id, google_event_id).
+
+        Args:
+            meetings: The RecurringMeeting entities to write.
+        """
+
+    @abstractmethod
+    async def delete_by_ids(self, meeting_ids: list[UUID], user_id: UUID) -> int:
+        """Delete recurring meetings by ID in a single request.
+
+        Args:
+            meeting_ids: IDs of the meetings to delete.
+            user_id: The user ID for RLS filtering.
+
+        Returns:
+            Number of deleted records.
+        """
@@ -0,0 +1,60 @@
+"""SearchRepository interface for domain layer.
+
+Abstract base class defining the contract for full-text search index persistence operations.
+Implementations should be provided in the infrastructure layer.
+Following ADR-0001 clean architecture principles.
+"""
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.entities.search_entry import SearchEntry, SearchHit, SearchSourceType
+
+
+class SearchRepository(ABC):
+    """全文検索インデックスリポジトリのインターフェース.
+
+    DDDのRepositoryパターンに従い、検索エントリの永続化・全文検索を定義。
+    具体的な実装はインフラ層で提供される。
+    """
+
+    @abstractmethod
+    async def replace_source(
+        self,
+        user_id: UUID,
+        source_type: SearchSourceType,
+        source_id: UUID,
+        entries: list[SearchEntry],
+    ) -> None:
+        """元データのエントリを削除してから新しいエントリを登録する.
+
+        Args:
+            user_id: 所有ユーザーのID
+            source_type: 元データ種別
+            source_id: 元データのID
+            entries: 登録するSearchEntryのリスト
+        """
+
+    @abstractmethod
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        source_type: SearchSourceType | None = None,
+        agent_id: UUID | None = None,
+        recurring_meeting_id: UUID | None = None,
+    ) -> list[SearchHit]:
+        """クエリの語をすべて含むエントリを関連度の降順で検索する.
+
+        Args:
+            user_id: 所有ユーザーのID
+            query: 検索クエリ（空白区切りの語）
+            limit: 取得件数
+            source_type: 絞り込み対象の元データ種別
+            agent_id: 絞り込み対象のエージェントID
+            recurring_meeting_id: 絞り込み対象の定例MTG ID
+
+        Returns:
+            SearchHitのリスト（関連度の降順、スニペットは未設定）
+        """
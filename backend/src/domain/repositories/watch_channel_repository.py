@@ -0,0 +1,88 @@
+"""WatchChannelRepository interface for domain layer.
+
+Abstract base class defining the contract for push-notification channel persistence.
+Implementations should be provided in the infrastructure layer.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities.watch_channel import WatchChannel, WatchResourceType
+
+
+class WatchChannelRepository(ABC):
+    """Abstract repository interface for WatchChannel entity.
+
+    Notifications from Google carry no user context, so channels are
+    looked up by their ID alone and then validated by token.
+    """
+
+    @abstractmethod
+    async def create(self, channel: WatchChannel) -> WatchChannel:
+        """Create a new watch channel.
+
+        Args:
+            channel: The WatchChannel entity to create.
+
+        Returns:
+            The created WatchChannel entity.
+        """
+
+    @abstractmethod
+    async def get_by_id(self, channel_id: UUID) -> WatchChannel | None:
+        """Retrieve a watch channel by its channel ID.
+
+        Args:
+            channel_id: The channel ID sent with the notification.
+
+        Returns:
+            The WatchChannel if found, None otherwise.
+        """
+
+    @abstractmethod
+    async def get_by_integration(
+        self,
+        integration_id: UUID,
+        resource_type: WatchResourceType,
+    ) -> list[WatchChannel]:
+        """Retrieve the watch channels of an integration.
+
+        Args:
+            integration_id: The Google integration ID.
+            resource_type: The watched resource type.
+
+        Returns:
+            A list of WatchChannel entities, newest first.
+        """
+
+    @abstractmethod
+    async def get_expiring(self, before: datetime) -> list[WatchChannel]:
+        """Retrieve the watch channels that expire before a given time.
+
+        Args:
+            before: Channels expiring before this time are returned.
+
+        Returns:
+            A list of WatchChannel entities.
+        """
+
+    @abstractmethod
+    async def update_page_token(self, channel_id: UUID, page_token: str) -> None:
+        """Store the Drive changes page token of a channel.
+
+        Args:
+            channel_id: The channel ID.
+            page_token: The page token to resume the changes list from.
+        """
+
+    @abstractmethod
+    async def delete(self, channel_id: UUID) -> bool:
+        """Delete a watch channel.
+
+        Args:
+            channel_id: The channel ID.
+
+        Returns:
+            True if deleted, False if not found.
+        """
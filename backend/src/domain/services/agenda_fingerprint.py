@@ -0,0 +1,42 @@
+"""アジェンダ生成の入力のフィンガープリント.
+
+生成に使う各データソースの最新の位置（ウォーターマーク）だけから計算するため、
+本文を読み込まずに前回の生成から入力が変わったかを判定できる。
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class AgendaSourceWatermarks:
+    """アジェンダ生成の入力ごとのウォーターマーク.
+
+    Attributes:
+        knowledge_id: 最新のナレッジID（存在しない場合はNone）
+        transcript_ids: 生成に使うトランスクリプトのID
+        dictionary_version: 辞書のバージョン
+        slack_latest_ts: Slackチャンネルの最新メッセージのts（未連携・取得できない場合はNone）
+    """
+
+    knowledge_id: UUID | None
+    transcript_ids: tuple[UUID, ...]
+    dictionary_version: str
+    slack_latest_ts: str | None = None
+
+    def fingerprint(self) -> str:
+        """入力のフィンガープリントを計算する.
+
+        Returns:
+            ウォーターマークのSHA-256（16進数）。トランスクリプトの順序には依存しない。
+        """
+        payload = {
+            "knowledge_id": str(self.knowledge_id) if self.knowledge_id else None,
+            "transcript_ids": sorted(str(transcript_id) for transcript_id in self.transcript_ids),
+            "dictionary_version": self.dictionary_version,
+            "slack_latest_ts": self.slack_latest_ts,
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+        return hashlib.sha256(encoded).hexdigest()
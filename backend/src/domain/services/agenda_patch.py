@@ -0,0 +1,75 @@
+"""アジェンダの差分更新（パッチ）の適用.
+
+差分生成では、LLMが前回のアジェンダのうち変更する見出しブロックだけを返す。
+見出しブロックは見出し行から次の見出し行の直前までで、見出し行で前回のブロックと突き合わせる。
+"""
+
+import re
+
+# 入力に変更がなく、前回のアジェンダをそのまま使う場合の応答
+NO_CHANGES = "NO_CHANGES"
+
+# ブロックを削除する場合の本文
+DELETE_MARKER = "<!-- delete -->"
+
+_HEADING = re.compile(r"^#{1,6}\s")
+
+
+def _split_blocks(markdown: str) -> tuple[str, list[tuple[str, str]]]:
+    """マークダウンを最初の見出しより前の部分と、見出しブロックのリストに分ける.
+
+    Returns:
+        見出しより前の部分と、(見出し行, 本文) のリスト（末尾の空行は除く）
+    """
+    preamble: list[str] = []
+    blocks: list[tuple[str, list[str]]] = []
+    for line in markdown.splitlines():
+        if _HEADING.match(line):
+            blocks.append((line.rstrip(), []))
+        elif blocks:
+            blocks[-1][1].append(line)
+        else:
+            preamble.append(line)
+    return "\n".join(preamble).rstrip(), [(heading, "\n".join(body).rstrip()) for heading, body in blocks]
+
+
+def apply_agenda_patch(previous: str, patch: str) -> str:
+    """前回のアジェンダにパッチを適用する.
+
+    パッチの各ブロックは、前回と同じ見出しであれば置き換え、新しい見出しであれば
+    パッチ内で直前のブロックの後ろ（直前のブロックがなければ末尾）に追加する。
+    本文がDELETE_MARKERのブロックは削除する。ブロックの間は空行1行に揃える。
+
+    Args:
+        previous: 前回のアジェンダ（マークダウン）
+        patch: LLMが返したパッチ
+
+    Returns:
+        更新後のアジェンダ
+
+    Raises:
+        ValueError: パッチに見出しブロックがない場合
+    """
+    if patch.strip() == NO_CHANGES:
+        return previous
+
+    _, patch_blocks = _split_blocks(patch.strip())
+    if not patch_blocks:
+        raise ValueError("Agenda patch has no heading blocks")
+
+    preamble, blocks = _split_blocks(previous)
+    merged: list[tuple[str, str | None]] = list(blocks)
+    anchor: int | None = None
+    for heading, body in patch_blocks:
+        new_body = None if body.strip() == DELETE_MARKER else body
+        index = next((i for i, (h, _) in enumerate(merged) if h == heading), None)
+        if index is None:
+            index = len(merged) if anchor is None else anchor + 1
+            merged.insert(index, (heading, new_body))
+        else:
+            merged[index] = (heading, new_body)
+        anchor = index
+
+    parts = [preamble] if preamble else []
+    parts.extend(f"{heading}\n{body}".rstrip() for heading, body in merged if body is not None)
+    return "\n\n".join(parts) + "\n"
@@ -4,12 +4,32 @@ Design Doc準拠のスコア計算:
 - 会議名の類似度: 0.4 (Levenshtein距離)
 - 日時の近さ: 0.3 (+-24時間以内で線形減衰)
 - 参加者の一致率: 0.3 (Jaccard係数)
+
+複数ドキュメント×複数定例MTGをまとめて評価する場合はBatchMatcherを使用する。
 """
 
-from datetime import datetime
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from math import ceil
+
+import numpy as np
+import numpy.typing as npt
+
+NAME_WEIGHT = 0.4
+TIME_WEIGHT = 0.3
+ATTENDEE_WEIGHT = 0.3
+
+# 日時スコアが0になる時間差
+TIME_WINDOW_HOURS = 24
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)  # noqa: DTZ001
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
 
 
-def calculate_string_similarity(str1: str, str2: str) -> float:
+def calculate_string_similarity(str1: str, str2: str, threshold: float = 0.0) -> float:
     """文字列の類似度を計算する（Levenshtein距離ベース）.
 
     AC13: ドキュメント名と会議名のマッチング
@@ -17,6 +37,9 @@ def calculate_string_similarity(str1: str, str2: str) -> float:
     Args:
         str1: 文字列1
         str2: 文字列2
+        threshold: この値未満の類似度は0.0として返す。
+            閾値に届かないことが確定した時点でLevenshtein距離の計算を打ち切る。
+            信頼度の計算では正確な類似度が必要なため指定しない。
 
     Returns:
         類似度（0.0-1.0）
@@ -35,39 +58,95 @@ def calculate_string_similarity(str1: str, str2: str) -> float:
     if s1 in s2 or s2 in s1:
         shorter = min(len(s1), len(s2))
         longer = max(len(s1), len(s2))
-        return shorter / longer
+        return _apply_threshold(shorter / longer, threshold)
 
     # Levenshtein距離を計算
-    distance = _levenshtein_distance(s1, s2)
     max_len = max(len(s1), len(s2))
-
-    if max_len == 0:
-        return 1.0
+    # 類似度 >= thresholdとなる距離の上限。浮動小数点の誤差で打ち切りすぎないよう切り上げ、
+    # 最終的な判定は類似度で行う
+    max_distance = ceil((1.0 - threshold) * max_len)
+    distance = _levenshtein_distance(s1, s2, max_distance)
+    if distance > max_distance:
+        return 0.0
 
     similarity = 1.0 - (distance / max_len)
-    return max(0.0, similarity)
+    return _apply_threshold(max(0.0, similarity), threshold)
+
 
+def _apply_threshold(similarity: float, threshold: float) -> float:
+    """閾値未満の類似度を0.0にする."""
+    return similarity if similarity >= threshold else 0.0
 
-def _levenshtein_distance(s1: str, s2: str) -> int:
-    """Levenshtein距離を計算する."""
+
+def _levenshtein_distance(s1: str, s2: str, max_distance: int | None = None) -> int:
+    """Levenshtein距離を計算する.
+
+    短い方の文字列を文字ごとのビットマスクに変換し、Myers/Hyyröのビット並列法で
+    1文字あたり定数回の整数演算で計算する。Pythonの整数は任意長のため、
+    64文字を超える文字列もブロック分割せずに扱える。
+
+    Args:
+        s1: 文字列1
+        s2: 文字列2
+        max_distance: 打ち切り距離。距離がこれを超えることが確定した時点で
+            計算を打ち切り、max_distance + 1を返す。
+
+    Returns:
+        Levenshtein距離（打ち切った場合はmax_distance + 1）
+    """
     if len(s1) < len(s2):
-        return _levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
 
     if len(s2) == 0:
         return len(s1)
 
-    previous_row = list(range(len(s2) + 1))
-
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
+    full = (1 << len(s2)) - 1
+    last = 1 << (len(s2) - 1)
+    masks = _pattern_masks(s2)
+    positive = full
+    negative = 0
+    distance = len(s2)
+    remaining = len(s1)
+
+    for char in s1:
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | (~(horizontal | positive) & full)
+        horizontal_negative = positive & horizontal
+
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+
+        # 残りの文字で1ずつしか減らせないため、超過が確定したら打ち切る
+        remaining -= 1
+        if max_distance is not None and distance - remaining > max_distance:
+            return max_distance + 1
+
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = horizontal_negative | (~(vertical | horizontal_positive) & full)
+        negative = horizontal_positive & vertical
+
+    return distance
+
+
+@lru_cache(maxsize=1024)
+def _pattern_masks(pattern: str) -> dict[str, int]:
+    """文字ごとに出現位置のビットを立てたマスクを返す.
+
+    同じ会議名を多数のドキュメント名と比較するため、パターンごとにキャッシュする。
+    呼び出し側で変更しないこと。
+    """
+    masks: dict[str, int] = {}
+    for index, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << index)
+    return masks
 
 
 def calculate_time_score(
@@ -159,17 +238,196 @@ def calculate_match_confidence(
 
     # 会議名の類似度（0.4）
     name_similarity = calculate_string_similarity(doc_name, event_summary)
-    score += name_similarity * 0.4
+    score += name_similarity * NAME_WEIGHT
 
     # 日時の近さ（0.3）
     time_score = calculate_time_score(doc_created, event_datetime)
-    score += time_score * 0.3
+    score += time_score * TIME_WEIGHT
 
     # 参加者の一致率（0.3）
     # メールアドレスから名前を抽出して比較
     attendee_names = {extract_name_from_email(email) for email in event_attendees}
     speaker_names = {name.lower() for name in transcript_speakers}
     attendee_match = calculate_jaccard(attendee_names, speaker_names)
-    score += attendee_match * 0.3
+    score += attendee_match * ATTENDEE_WEIGHT
 
     return score
+
+
+@dataclass(frozen=True)
+class MeetingMatchFeatures:
+    """紐付け候補の定例MTGの特徴量（定例MTGごとに1回だけ計算する）.
+
+    Attributes:
+        title: 会議名
+        event_datetime: 比較対象のイベント日時（occurrencesが空の場合に使用）
+        attendee_names: 参加者名の集合（メールアドレスの@より前、小文字）
+        occurrences: 昇順の開催日時。指定した場合はドキュメントごとに最も近い開催日時と比較する
+    """
+
+    title: str
+    event_datetime: datetime
+    attendee_names: frozenset[str]
+    occurrences: tuple[datetime, ...] = ()
+
+    @classmethod
+    def from_attendee_emails(
+        cls,
+        title: str,
+        event_datetime: datetime,
+        attendee_emails: Sequence[str],
+        occurrences: Sequence[datetime] = (),
+    ) -> "MeetingMatchFeatures":
+        """参加者のメールアドレスから特徴量を作成する."""
+        return cls(
+            title=title,
+            event_datetime=event_datetime,
+            attendee_names=frozenset(extract_name_from_email(email) for email in attendee_emails),
+            occurrences=tuple(occurrences),
+        )
+
+
+@dataclass(frozen=True)
+class DocumentMatchFeatures:
+    """紐付け対象のトランスクリプトドキュメントの特徴量.
+
+    Attributes:
+        name: ドキュメント名
+        created: ドキュメント作成日時
+        speaker_names: 話者名の集合（小文字）
+    """
+
+    name: str
+    created: datetime
+    speaker_names: frozenset[str]
+
+    @classmethod
+    def from_speakers(cls, name: str, created: datetime, speakers: Sequence[str]) -> "DocumentMatchFeatures":
+        """話者名のリストから特徴量を作成する."""
+        return cls(name=name, created=created, speaker_names=frozenset(s.lower() for s in speakers))
+
+
+class BatchMatcher:
+    """ドキュメント×定例MTGの信頼度を行列でまとめて計算する.
+
+    calculate_match_confidenceと同じ重み・同じ演算順序で計算するため、
+    各要素のスコアはペアごとに計算した場合とビット単位で一致する。
+    日時とJaccard係数はNumPyでベクトル化し、会議名の類似度のみペアごとに計算する。
+    """
+
+    def __init__(self, meetings: Sequence[MeetingMatchFeatures]) -> None:
+        """定例MTGの特徴量を前計算する.
+
+        Args:
+            meetings: 紐付け候補の定例MTGの特徴量
+        """
+        self.meetings = list(meetings)
+        self._titles = [m.title for m in self.meetings]
+        self._meeting_aware = [m.event_datetime.tzinfo is not None for m in self.meetings]
+        # 開催日時ごとの昇順の配列（開催日時がない場合はevent_datetimeのみ）
+        self._meeting_times = [
+            np.array([_to_epoch_microseconds(t) for t in m.occurrences or (m.event_datetime,)], dtype=np.int64)
+            for m in self.meetings
+        ]
+
+        self._vocabulary: dict[str, int] = {}
+        for meeting in self.meetings:
+            for name in meeting.attendee_names:
+                self._vocabulary.setdefault(name, len(self._vocabulary))
+        self._attendees = np.zeros((len(self.meetings), len(self._vocabulary)), dtype=np.int64)
+        for row, meeting in enumerate(self.meetings):
+            self._attendees[row, [self._vocabulary[n] for n in meeting.attendee_names]] = 1
+        self._attendee_counts = self._attendees.sum(axis=1)
+
+    def score(self, documents: Sequence[DocumentMatchFeatures]) -> npt.NDArray[np.float64]:
+        """全ドキュメント×全定例MTGの信頼度行列を計算する.
+
+        Args:
+            documents: ドキュメントの特徴量
+
+        Returns:
+            shape (len(documents), len(meetings)) の信頼度行列
+
+        Raises:
+            TypeError: タイムゾーン有無の異なる日時を比較しようとした場合
+        """
+        shape = (len(documents), len(self.meetings))
+        if 0 in shape:
+            return np.zeros(shape, dtype=np.float64)
+
+        names = np.array(
+            [[calculate_string_similarity(d.name, title) for title in self._titles] for d in documents],
+            dtype=np.float64,
+        )
+        score = np.zeros(shape, dtype=np.float64)
+        score += names * NAME_WEIGHT
+        score += self._time_scores(documents) * TIME_WEIGHT
+        score += self._jaccard_scores(documents) * ATTENDEE_WEIGHT
+        return score
+
+    def best_matches(self, documents: Sequence[DocumentMatchFeatures]) -> list[tuple[int, float] | None]:
+        """ドキュメントごとに信頼度が最大の定例MTGを返す.
+
+        同点の場合は先頭の定例MTGを選び、最大値が0以下の場合はNoneとする。
+
+        Args:
+            documents: ドキュメントの特徴量
+
+        Returns:
+            ドキュメントごとの(定例MTGのインデックス, 信頼度)またはNone
+        """
+        scores = self.score(documents)
+        if scores.shape[1] == 0:
+            return [None] * len(documents)
+
+        best = np.argmax(scores, axis=1)
+        results: list[tuple[int, float] | None] = []
+        for row, column in enumerate(best):
+            confidence = float(scores[row, column])
+            results.append((int(column), confidence) if confidence > 0.0 else None)
+        return results
+
+    def _time_scores(self, documents: Sequence[DocumentMatchFeatures]) -> npt.NDArray[np.float64]:
+        """日時の近さスコア行列（calculate_time_scoreと同じ計算）.
+
+        開催日時が複数ある定例MTGは、二分探索でドキュメントごとに最も近い開催日時を選ぶ。
+        """
+        for document in documents:
+            document_aware = document.created.tzinfo is not None
+            if any(aware != document_aware for aware in self._meeting_aware):
+                raise TypeError("can't compare offset-naive and offset-aware datetimes")
+
+        document_times = np.array([_to_epoch_microseconds(d.created) for d in documents], dtype=np.int64)
+        gaps = np.empty((len(documents), len(self.meetings)), dtype=np.int64)
+        for column, times in enumerate(self._meeting_times):
+            after = np.searchsorted(times, document_times).clip(0, len(times) - 1)
+            before = (after - 1).clip(0, len(times) - 1)
+            gaps[:, column] = np.minimum(
+                np.abs(document_times - times[before]),
+                np.abs(document_times - times[after]),
+            )
+        # timedelta.total_seconds()と同じく整数マイクロ秒を10**6で割る
+        seconds = gaps / 10**6
+        diff_hours = np.abs(seconds / 3600)
+        return np.where(diff_hours > TIME_WINDOW_HOURS, 0.0, 1.0 - (diff_hours / TIME_WINDOW_HOURS))
+
+    def _jaccard_scores(self, documents: Sequence[DocumentMatchFeatures]) -> npt.NDArray[np.float64]:
+        """参加者と話者のJaccard係数行列（calculate_jaccardと同じ計算）."""
+        speakers = np.zeros((len(documents), len(self._vocabulary)), dtype=np.int64)
+        speaker_counts = np.array([len(d.speaker_names) for d in documents], dtype=np.int64)
+        for row, document in enumerate(documents):
+            columns = [self._vocabulary[n] for n in document.speaker_names if n in self._vocabulary]
+            speakers[row, columns] = 1
+
+        intersection = speakers @ self._attendees.T
+        union = speaker_counts[:, None] + self._attendee_counts[None, :] - intersection
+        both_present = (speaker_counts[:, None] > 0) & (self._attendee_counts[None, :] > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            jaccard = intersection / union
+        return np.where(both_present, jaccard, 0.0)
+
+
+def _to_epoch_microseconds(value: datetime) -> int:
+    """日時をエポックからの整数マイクロ秒に変換する（naiveはnaiveの基準で計算）."""
+    epoch = _EPOCH_AWARE if value.tzinfo is not None else _EPOCH_NAIVE
+    return (value - epoch) // _MICROSECOND
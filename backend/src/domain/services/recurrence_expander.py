@@ -0,0 +1,430 @@
+"""iCalendar RRULEの展開.
+
+RFC 5545の繰り返しルールのうちGoogle Calendarが生成する範囲
+（FREQ, INTERVAL, BYDAY（序数付きを含む）, BYMONTHDAY, BYMONTH, WKST, COUNT, UNTIL）と
+EXDATEを扱い、開催日時を昇順の配列に展開する。
+
+展開は開始日時のタイムゾーンの壁時計時刻で行うため、夏時間をまたいでも
+開催時刻（例: 毎週月曜10:00）がずれない。展開結果はルールと開始日時ごとに
+キャッシュし、同期処理をまたいで再利用する。
+"""
+
+import calendar
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta, tzinfo
+from functools import lru_cache
+from itertools import count
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# 展開範囲内の開催回数の上限（毎日開催でも展開範囲の数年分をカバーする）
+MAX_OCCURRENCES = 5000
+
+# UNTIL/COUNTのないルールを現在年から何年先まで展開するか
+EXPANSION_HORIZON_YEARS = 1
+
+# 現在年から何年前の年初以降の開催を展開するか
+EXPANSION_LOOKBACK_YEARS = 1
+
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_BYDAY_PATTERN = re.compile(r"^([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)$")
+_FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """パース済みの繰り返しルール.
+
+    Attributes:
+        frequency: DAILY, WEEKLY, MONTHLY, YEARLY のいずれか
+        interval: 繰り返し間隔
+        by_day: (序数, 曜日)のタプル。序数なしはNone、曜日は月曜=0
+        by_month_day: 日付の指定（負数は月末から数える）
+        by_month: 月の指定
+        week_start: 週の開始曜日（月曜=0）
+        count: 開催回数の上限
+        until: 最終開催日時の上限
+    """
+
+    frequency: str
+    interval: int = 1
+    by_day: tuple[tuple[int | None, int], ...] = ()
+    by_month_day: tuple[int, ...] = ()
+    by_month: tuple[int, ...] = ()
+    week_start: int = 0
+    count: int | None = None
+    until: datetime | None = None
+
+
+@dataclass(frozen=True)
+class OccurrenceIndex:
+    """昇順に並んだ開催日時の索引.
+
+    Attributes:
+        occurrences: 開催日時（昇順、EXDATE除外済み）
+    """
+
+    occurrences: tuple[datetime, ...] = field(default_factory=tuple)
+
+    def __len__(self) -> int:
+        """開催回数を返す."""
+        return len(self.occurrences)
+
+    def nearest(self, moment: datetime) -> datetime | None:
+        """指定日時に最も近い開催日時を二分探索で返す（同じ近さなら過去側）.
+
+        Args:
+            moment: 基準日時
+
+        Returns:
+            最も近い開催日時。開催がない場合はNone。
+        """
+        if not self.occurrences:
+            return None
+        index = bisect_left(self.occurrences, moment)
+        if index == 0:
+            return self.occurrences[0]
+        if index == len(self.occurrences):
+            return self.occurrences[-1]
+        before = self.occurrences[index - 1]
+        after = self.occurrences[index]
+        return before if moment - before <= after - moment else after
+
+    def next_after(self, moment: datetime) -> datetime | None:
+        """指定日時より後の最初の開催日時を返す.
+
+        Args:
+            moment: 基準日時
+
+        Returns:
+            次の開催日時。以降の開催がない場合はNone。
+        """
+        index = bisect_right(self.occurrences, moment)
+        return self.occurrences[index] if index < len(self.occurrences) else None
+
+
+def parse_rrule(rrule: str) -> RecurrenceRule:
+    """RRULE文字列をパースする.
+
+    未対応のパート（BYSETPOS, BYHOUR等）は無視する。
+
+    Args:
+        rrule: RRULE文字列（"RRULE:"接頭辞の有無は問わない）
+
+    Returns:
+        パース済みの繰り返しルール
+
+    Raises:
+        ValueError: FREQがない、または不正な値を含む場合
+    """
+    body = rrule.strip()
+    if body.upper().startswith("RRULE:"):
+        body = body[len("RRULE:") :]
+
+    parts: dict[str, str] = {}
+    for part in body.split(";"):
+        key, separator, value = part.partition("=")
+        if separator:
+            parts[key.strip().upper()] = value.strip().upper()
+
+    frequency = parts.get("FREQ", "")
+    if frequency not in _FREQUENCIES:
+        raise ValueError(f"Unsupported RRULE frequency: {frequency or '(missing)'}")
+
+    interval = int(parts.get("INTERVAL", "1"))
+    if interval < 1:
+        raise ValueError(f"Invalid RRULE interval: {interval}")
+
+    return RecurrenceRule(
+        frequency=frequency,
+        interval=interval,
+        by_day=tuple(_parse_by_day(v) for v in _split_list(parts.get("BYDAY"))),
+        by_month_day=tuple(int(v) for v in _split_list(parts.get("BYMONTHDAY"))),
+        by_month=tuple(int(v) for v in _split_list(parts.get("BYMONTH"))),
+        week_start=_WEEKDAYS.get(parts.get("WKST", "MO"), 0),
+        count=int(parts["COUNT"]) if "COUNT" in parts else None,
+        until=_parse_ical_datetime(parts["UNTIL"], UTC) if "UNTIL" in parts else None,
+    )
+
+
+def parse_exdates(recurrence: Iterable[str], start: datetime, timezone: str | None = None) -> list[datetime]:
+    """recurrence配列のEXDATE行を日時のリストに変換する.
+
+    "EXDATE;TZID=Asia/Tokyo:20261020T100000,20261027T100000"、
+    "EXDATE:20261020T010000Z"、"EXDATE;VALUE=DATE:20261020" の形式に対応する。
+    日付のみの場合は開始日時と同じ時刻の開催を除外する。
+
+    Args:
+        recurrence: Google Calendarのrecurrence配列
+        start: シリーズの開始日時
+        timezone: 開始日時のIANAタイムゾーン名
+
+    Returns:
+        除外する開催日時のリスト
+    """
+    default_zone = _resolve_zone(timezone) or start.tzinfo
+    local_start = start.astimezone(default_zone) if start.tzinfo is not None else start
+    exdates: list[datetime] = []
+    for line in recurrence:
+        name, separator, values = line.partition(":")
+        if not separator or not name.upper().startswith("EXDATE"):
+            continue
+
+        params = dict(p.partition("=")[::2] for p in name.split(";")[1:])
+        zone = _resolve_zone(params.get("TZID")) or default_zone
+        for value in _split_list(values):
+            if "T" in value.upper():
+                exdates.append(_parse_ical_datetime(value, zone))
+            else:
+                day = datetime.strptime(value, "%Y%m%d").date()  # noqa: DTZ007
+                exdates.append(datetime.combine(day, local_start.time()).replace(tzinfo=default_zone))
+    return exdates
+
+
+def build_occurrence_index(
+    rrule: str,
+    start: datetime,
+    timezone: str | None = None,
+    exdates: Iterable[datetime] = (),
+    now: datetime | None = None,
+) -> OccurrenceIndex:
+    """繰り返しルールを展開した開催日時の索引を返す.
+
+    前年の年初（EXPANSION_LOOKBACK_YEARS）から翌年末（EXPANSION_HORIZON_YEARS）までを展開し、
+    それより前の開催は直前の1回だけを含める。長期間続くシリーズでもDTSTARTからではなく
+    展開範囲の直前の周期から展開するため、開催回数の上限で現在付近が欠けることはない。
+    展開範囲は年単位で決まるため、同じルール・開始日時の索引は同期処理をまたいで
+    キャッシュから再利用される。
+
+    Args:
+        rrule: RRULE文字列
+        start: シリーズの開始日時（DTSTART）
+        timezone: 開始日時のIANAタイムゾーン名（夏時間の扱いに使用）
+        exdates: 除外する開催日時
+        now: 現在日時（テスト用）
+
+    Returns:
+        開催日時の索引
+
+    Raises:
+        ValueError: RRULEが不正な場合
+    """
+    current_year = (now or datetime.now(UTC)).year
+    return _build_occurrence_index(
+        rrule.strip().upper(),
+        start,
+        timezone,
+        frozenset(exdates),
+        current_year - EXPANSION_LOOKBACK_YEARS,
+        current_year + EXPANSION_HORIZON_YEARS,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_occurrence_index(
+    rrule: str,
+    start: datetime,
+    timezone: str | None,
+    exdates: frozenset[datetime],
+    window_start_year: int,
+    horizon_year: int,
+) -> OccurrenceIndex:
+    """build_occurrence_indexのキャッシュ本体."""
+    rule = parse_rrule(rrule)
+    zone = _resolve_zone(timezone) or start.tzinfo
+    local_start = start.astimezone(zone).replace(tzinfo=None) if start.tzinfo is not None else start
+    window_start = datetime(window_start_year, 1, 1)  # noqa: DTZ001
+    horizon = datetime(horizon_year + 1, 1, 1)  # noqa: DTZ001
+
+    # COUNTは開始日時から数えるため先頭から展開する。それ以外は展開範囲の開始
+    # （UNTILがそれより前ならUNTIL）の直前の周期から展開する
+    first_period = 0
+    if rule.count is None:
+        skip_to = window_start
+        if rule.until is not None:
+            skip_to = min(skip_to, _local_until(rule.until, zone, start.tzinfo is not None))
+        first_period = _period_before(rule, local_start, skip_to)
+
+    before_window: datetime | None = None
+    occurrences: list[datetime] = []
+    for generated, local in enumerate(_expand_local(rule, local_start, horizon, first_period)):
+        if rule.count is not None and generated >= rule.count:
+            break
+        occurrence = local.replace(tzinfo=zone) if start.tzinfo is not None else local
+        if rule.until is not None and _after_until(occurrence, rule.until):
+            break
+        if occurrence in exdates:
+            continue
+        if local < window_start:
+            before_window = occurrence
+            continue
+        occurrences.append(occurrence)
+        if len(occurrences) >= MAX_OCCURRENCES:
+            break
+
+    if before_window is not None:
+        occurrences.insert(0, before_window)
+    return OccurrenceIndex(tuple(occurrences))
+
+
+def _period_before(rule: RecurrenceRule, start: datetime, moment: datetime) -> int:
+    """指定日時を含む周期の1つ前の周期の番号を返す（開始日時より前なら0）."""
+    if moment <= start:
+        return 0
+    if rule.frequency == "DAILY":
+        period = (moment.date() - start.date()).days // rule.interval
+    elif rule.frequency == "WEEKLY":
+        week_start = start.date() - timedelta(days=(start.weekday() - rule.week_start) % 7)
+        period = (moment.date() - week_start).days // (7 * rule.interval)
+    elif rule.frequency == "MONTHLY":
+        period = ((moment.year - start.year) * 12 + moment.month - start.month) // rule.interval
+    else:
+        period = (moment.year - start.year) // rule.interval
+    return max(period - 1, 0)
+
+
+def _expand_local(
+    rule: RecurrenceRule, start: datetime, horizon: datetime, first_period: int = 0
+) -> Iterator[datetime]:
+    """開始日時以降の開催を、first_period番目の周期から壁時計時刻で昇順に生成する."""
+    start_time = start.time()
+    for period in count(first_period):
+        expanded = _period_days(rule, start.date(), period)
+        if expanded is None:
+            return
+        period_start, days = expanded
+        if datetime.combine(period_start, time.min) >= horizon:
+            return
+        for day in days:
+            moment = datetime.combine(day, start_time)
+            if start <= moment < horizon:
+                yield moment
+
+
+def _period_days(rule: RecurrenceRule, start: date, period: int) -> tuple[date, list[date]] | None:
+    """period番目の周期の初日と、その周期に含まれる開催日（昇順）を返す.
+
+    日付の表現範囲を超えた場合はNoneを返す。
+    """
+    step = period * rule.interval
+    try:
+        if rule.frequency == "DAILY":
+            period_start = start + timedelta(days=step)
+            candidates = [period_start]
+        elif rule.frequency == "WEEKLY":
+            week_start = start - timedelta(days=(start.weekday() - rule.week_start) % 7)
+            period_start = week_start + timedelta(weeks=step)
+            weekdays = [wd for _, wd in rule.by_day] or [start.weekday()]
+            candidates = sorted({period_start + timedelta(days=(wd - rule.week_start) % 7) for wd in weekdays})
+        elif rule.frequency == "MONTHLY":
+            year, month = divmod(start.month - 1 + step, 12)
+            period_start = date(start.year + year, month + 1, 1)
+            candidates = _month_days(rule, start, period_start.year, period_start.month)
+        else:
+            period_start = date(start.year + step, 1, 1)
+            months = rule.by_month or (start.month,)
+            candidates = [d for m in sorted(months) for d in _month_days(rule, start, period_start.year, m)]
+    except (OverflowError, ValueError):
+        return None
+
+    return period_start, [d for d in candidates if _matches_filters(rule, d)]
+
+
+def _month_days(rule: RecurrenceRule, start: date, year: int, month: int) -> list[date]:
+    """指定月の開催日を返す（BYMONTHDAYとBYDAYの両方がある場合は積集合）."""
+    last_day = calendar.monthrange(year, month)[1]
+
+    by_month_day: set[int] | None = None
+    if rule.by_month_day:
+        by_month_day = {d if d > 0 else last_day + d + 1 for d in rule.by_month_day}
+
+    by_day: set[int] | None = None
+    if rule.by_day:
+        by_day = set()
+        for ordinal, weekday in rule.by_day:
+            matching = [d for d in range(1, last_day + 1) if date(year, month, d).weekday() == weekday]
+            if ordinal is None:
+                by_day.update(matching)
+            elif 0 < abs(ordinal) <= len(matching):
+                by_day.add(matching[ordinal - 1 if ordinal > 0 else ordinal])
+
+    if by_month_day is None and by_day is None:
+        days = {start.day}
+    elif by_month_day is None:
+        days = by_day or set()
+    elif by_day is None:
+        days = by_month_day
+    else:
+        days = by_month_day & by_day
+
+    return [date(year, month, d) for d in sorted(days) if 1 <= d <= last_day]
+
+
+def _matches_filters(rule: RecurrenceRule, day: date) -> bool:
+    """周期の展開に使わなかったBYxxxパートで絞り込む."""
+    if rule.by_month and day.month not in rule.by_month:
+        return False
+    if rule.frequency == "DAILY":
+        if rule.by_day and day.weekday() not in {wd for _, wd in rule.by_day}:
+            return False
+        if rule.by_month_day:
+            last_day = calendar.monthrange(day.year, day.month)[1]
+            if day.day not in {d if d > 0 else last_day + d + 1 for d in rule.by_month_day}:
+                return False
+    return True
+
+
+def _after_until(occurrence: datetime, until: datetime) -> bool:
+    """UNTILを過ぎているか（開始日時がnaiveの場合はUNTILもnaiveとして比較）."""
+    if occurrence.tzinfo is None:
+        return occurrence > until.replace(tzinfo=None)
+    return occurrence > until
+
+
+def _local_until(until: datetime, zone: tzinfo | None, aware: bool) -> datetime:
+    """UNTILを開始日時のタイムゾーンの壁時計時刻（naive）に変換する."""
+    if not aware:
+        return until.replace(tzinfo=None)
+    return until.astimezone(zone).replace(tzinfo=None)
+
+
+def _parse_by_day(value: str) -> tuple[int | None, int]:
+    """BYDAYの要素（例: "MO", "2TU", "-1FR"）をパースする."""
+    match = _BYDAY_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f"Invalid RRULE BYDAY: {value}")
+    ordinal, weekday = match.groups()
+    return (int(ordinal) if ordinal else None, _WEEKDAYS[weekday])
+
+
+def _parse_ical_datetime(value: str, zone: tzinfo | None) -> datetime:
+    """iCalendarの日時（"20261020T100000Z", "20261020T100000", "20261020"）をパースする.
+
+    末尾Zの場合はUTC、それ以外はzoneの壁時計時刻とみなす。
+    日付のみの場合はその日の終わり（UNTILの包含判定用）とする。
+    """
+    value = value.strip().upper()
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+    if "T" in value:
+        parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")  # noqa: DTZ007
+    else:
+        parsed = datetime.combine(datetime.strptime(value, "%Y%m%d").date(), time.max)  # noqa: DTZ007
+    return parsed.replace(tzinfo=zone)
+
+
+def _resolve_zone(name: str | None) -> tzinfo | None:
+    """IANAタイムゾーン名を解決する（不明な名前はNone）."""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def _split_list(value: str | None) -> list[str]:
+    """カンマ区切りの値を分割する."""
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
@@ -0,0 +1,97 @@
+"""定例MTG同期の差分計算.
+
+Google Calendarから取得した定例MTGと保存済みの定例MTGを
+google_event_idで突き合わせ、作成・更新・変更なし・削除に振り分ける。
+書き込みは作成・更新分だけをまとめて行えるようにする。
+"""
+
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+
+from src.domain.entities.recurring_meeting import RecurringMeeting
+
+
+@dataclass
+class RecurringMeetingDiff:
+    """定例MTG同期の差分.
+
+    Attributes:
+        created: 新規作成する定例MTG
+        updated: 内容が変わった定例MTG（既存のID・エージェント紐付けを引き継ぐ）
+        unchanged: 内容が変わっていない定例MTG（保存済みのもの）
+        deleted: Google Calendarに存在しなくなった定例MTG
+    """
+
+    created: list[RecurringMeeting] = field(default_factory=list)
+    updated: list[RecurringMeeting] = field(default_factory=list)
+    unchanged: list[RecurringMeeting] = field(default_factory=list)
+    deleted: list[RecurringMeeting] = field(default_factory=list)
+
+    @property
+    def changed(self) -> list[RecurringMeeting]:
+        """書き込みが必要な定例MTG（作成・更新）."""
+        return self.created + self.updated
+
+    @property
+    def synced(self) -> list[RecurringMeeting]:
+        """同期後に存在する定例MTG."""
+        return self.created + self.updated + self.unchanged
+
+
+def _calendar_fields(meeting: RecurringMeeting) -> tuple[object, ...]:
+    """Google Calendarから同期される列の値."""
+    return (
+        meeting.title,
+        meeting.rrule,
+        meeting.frequency,
+        meeting.attendees,
+        meeting.next_occurrence,
+        meeting.start_datetime,
+        meeting.timezone,
+        meeting.exdates,
+    )
+
+
+def diff_recurring_meetings(
+    existing: list[RecurringMeeting],
+    incoming: list[RecurringMeeting],
+    now: datetime,
+) -> RecurringMeetingDiff:
+    """保存済みの定例MTGとGoogle Calendarの定例MTGの差分を計算する.
+
+    Args:
+        existing: 保存済みの定例MTG
+        incoming: Google Calendarから変換した定例MTG（IDは新規採番したもの）
+        now: 更新日時として設定する日時
+
+    Returns:
+        差分
+    """
+    by_event_id = {meeting.google_event_id: meeting for meeting in existing}
+    seen: set[str] = set()
+    diff = RecurringMeetingDiff()
+
+    for meeting in incoming:
+        # 同じイベントが重複している場合は最初のものを使う（一括upsertで同じ行を2回更新しない）
+        if meeting.google_event_id in seen:
+            continue
+        seen.add(meeting.google_event_id)
+
+        current = by_event_id.pop(meeting.google_event_id, None)
+        if current is None:
+            diff.created.append(meeting)
+        elif _calendar_fields(current) == _calendar_fields(meeting):
+            diff.unchanged.append(current)
+        else:
+            diff.updated.append(
+                replace(
+                    meeting,
+                    id=current.id,
+                    agent_id=current.agent_id,
+                    created_at=current.created_at,
+                    updated_at=now,
+                )
+            )
+
+    diff.deleted = list(by_event_id.values())
+    return diff
@@ -0,0 +1,107 @@
+"""全文検索用のバイグラムトークナイザー.
+
+日本語は単語の区切りがなく、PostgreSQL標準の全文検索パーサーでは
+語を切り出せないため、文字バイグラムを語彙素（lexeme）とする
+tsvector / tsquery をアプリ側で組み立てる。
+クエリの各語はバイグラムのフレーズ検索（<->）に変換するため、
+2文字以上の語は部分文字列として一致する。
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+
+# 語の連続（かな・漢字・英数字）。記号・空白で区切る
+TOKEN_RUN_PATTERN = re.compile(r"\w+")
+
+# tsvectorの位置の上限（超える位置はPostgreSQL側で丸められる）
+MAX_POSITION = 16383
+
+# スニペットの前後の文字数
+DEFAULT_SNIPPET_CONTEXT = 40
+
+
+def normalize_for_search(text: str) -> str:
+    """検索用にテキストを正規化する（全角英数・半角カナの統一、大文字小文字の同一視）."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _runs(text: str) -> list[str]:
+    return TOKEN_RUN_PATTERN.findall(normalize_for_search(text))
+
+
+def _bigrams(run: str) -> list[str]:
+    if len(run) < 2:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+def _quote(lexeme: str) -> str:
+    escaped = lexeme.replace("\\", "\\\\").replace("'", "''")
+    return f"'{escaped}'"
+
+
+def to_search_vector(text: str) -> str:
+    """テキストをバイグラムのtsvectorリテラルに変換する.
+
+    語の連続ごとに位置を1つ空け、語をまたいでフレーズ一致しないようにする。
+
+    Args:
+        text: 検索対象のテキスト
+
+    Returns:
+        tsvector型の入力文字列（語がない場合は空文字列）
+    """
+    positions: defaultdict[str, list[int]] = defaultdict(list)
+    position = 1
+    for run in _runs(text):
+        for lexeme in _bigrams(run):
+            positions[lexeme].append(min(position, MAX_POSITION))
+            position += 1
+        position += 1
+    return " ".join(f"{_quote(lexeme)}:{','.join(map(str, p))}" for lexeme, p in positions.items())
+
+
+def to_search_query(query: str) -> str | None:
+    """検索クエリをバイグラムのtsqueryリテラルに変換する.
+
+    空白・記号で区切った語をすべて含む（AND）行に一致する。
+    1文字の語はその文字で始まるバイグラムの前方一致とする。
+
+    Args:
+        query: ユーザーが入力した検索クエリ
+
+    Returns:
+        tsquery型の入力文字列（語がない場合はNone）
+    """
+    terms = []
+    for run in _runs(query):
+        if len(run) == 1:
+            terms.append(f"{_quote(run)}:*")
+        else:
+            terms.append("(" + " <-> ".join(_quote(b) for b in _bigrams(run)) + ")")
+    return " & ".join(terms) if terms else None
+
+
+def make_snippet(text: str, query: str, context: int = DEFAULT_SNIPPET_CONTEXT) -> str:
+    """クエリの語が最初に現れる位置の前後を切り出す.
+
+    正規化で文字数が変わらない場合は元のテキストから切り出す。
+
+    Args:
+        text: 検索にヒットしたテキスト
+        query: 検索クエリ
+        context: 一致箇所の前後に含める文字数
+
+    Returns:
+        スニペット（省略した側に「…」を付ける）
+    """
+    normalized = normalize_for_search(text)
+    source = text if len(normalized) == len(text) else normalized
+    hits = [index for run in _runs(query) if (index := normalized.find(run)) >= 0]
+    center = min(hits) if hits else 0
+
+    start = max(center - context, 0)
+    end = min(center + context * 2, len(source))
+    snippet = source[start:end].strip()
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(source) else "")
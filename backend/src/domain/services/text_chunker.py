@@ -0,0 +1,180 @@
+"""テキストチャンク分割サービス.
+
+埋め込みインデックス登録用にテキストを検索単位のチャンクへ分割し、
+アジェンダ生成時の検索クエリとなる未決事項を抽出する。
+"""
+
+import re
+from dataclasses import dataclass
+
+# チャンクの最大文字数（Titan Embeddings V2の入力上限より十分小さい値）
+DEFAULT_MAX_CHARS = 800
+
+# 長文を強制分割する際の重なり文字数
+DEFAULT_OVERLAP = 100
+
+# 文の区切り（句点・改行の直後で分割する）
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[。．！？!?\n])")
+
+# 未決事項とみなすキーワード
+OPEN_ITEM_KEYWORDS = (
+    "TODO",
+    "未決",
+    "未定",
+    "保留",
+    "要確認",
+    "確認中",
+    "検討",
+    "宿題",
+    "課題",
+    "次回",
+    "？",
+    "?",
+)
+
+# 行頭の箇条書き記号・チェックボックス
+BULLET_PATTERN = re.compile(r"^\s*(?:[-*・]\s*)?(?:\[[ xX]?\]|□|☐)?\s*")
+
+# チェックボックス（未完了）は常に未決事項として扱う
+UNCHECKED_BOX_PATTERN = re.compile(r"^\s*(?:[-*・]\s*)?(?:\[ ?\]|□|☐)")
+
+
+@dataclass
+class LineChunk:
+    """行単位で分割されたチャンク.
+
+    Attributes:
+        start: チャンク先頭行のインデックス
+        end: チャンク末尾行の次のインデックス
+        text: チャンク本文（行を改行で連結したもの）
+    """
+
+    start: int
+    end: int
+    text: str
+
+
+def chunk_text(
+    text: str,
+    max_chars: int = DEFAULT_MAX_CHARS,
+    overlap: int = DEFAULT_OVERLAP,
+) -> list[str]:
+    """テキストを文境界でチャンクに分割する.
+
+    文を順に詰め込み、max_charsを超える直前で区切る。
+    1文がmax_charsを超える場合はoverlap文字重ねて強制分割する。
+
+    Args:
+        text: 分割対象のテキスト
+        max_chars: チャンクの最大文字数
+        overlap: 強制分割時に前チャンクと重ねる文字数
+
+    Returns:
+        チャンク文字列のリスト（空白のみのチャンクは含まない）
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+
+    chunks: list[str] = []
+    current = ""
+
+    for sentence in SENTENCE_BOUNDARY_PATTERN.split(text):
+        if not sentence:
+            continue
+        if len(current) + len(sentence) <= max_chars:
+            current += sentence
+            continue
+        if current.strip():
+            chunks.append(current.strip())
+        current = ""
+        if len(sentence) <= max_chars:
+            current = sentence
+            continue
+        chunks.extend(_split_long_text(sentence, max_chars, overlap))
+
+    if current.strip():
+        chunks.append(current.strip())
+
+    return chunks
+
+
+def _split_long_text(text: str, max_chars: int, overlap: int) -> list[str]:
+    """長文を固定長でoverlap付きに分割する."""
+    step = max(1, max_chars - max(0, overlap))
+    pieces: list[str] = []
+    for start in range(0, len(text), step):
+        piece = text[start : start + max_chars].strip()
+        if piece:
+            pieces.append(piece)
+        if start + max_chars >= len(text):
+            break
+    return pieces
+
+
+def chunk_lines(lines: list[str], max_chars: int = DEFAULT_MAX_CHARS) -> list[LineChunk]:
+    """行のリストを最大文字数以内のチャンクにまとめる.
+
+    トランスクリプトの発話やSlackメッセージのように、
+    行の途中で分割したくないデータに使用する。
+    1行がmax_charsを超える場合はその行だけで1チャンクとする。
+
+    Args:
+        lines: 行のリスト
+        max_chars: チャンクの最大文字数
+
+    Returns:
+        LineChunkのリスト
+    """
+    chunks: list[LineChunk] = []
+    start = 0
+    size = 0
+    current: list[str] = []
+
+    for index, line in enumerate(lines):
+        if current and size + len(line) + 1 > max_chars:
+            chunks.append(LineChunk(start=start, end=index, text="\n".join(current)))
+            start = index
+            size = 0
+            current = []
+        current.append(line)
+        size += len(line) + 1
+
+    if current:
+        chunks.append(LineChunk(start=start, end=len(lines), text="\n".join(current)))
+
+    return chunks
+
+
+def extract_open_items(text: str, limit: int = 5) -> list[str]:
+    """テキストから未決事項らしい行を抽出する.
+
+    未完了のチェックボックスや「未決」「要確認」などのキーワードを含む行を
+    出現順に抽出する。アジェンダ生成時の類似検索クエリとして使用する。
+
+    Args:
+        text: ナレッジやトランスクリプトのテキスト
+        limit: 抽出する最大件数
+
+    Returns:
+        未決事項の文字列リスト（重複なし）
+    """
+    items: list[str] = []
+    seen: set[str] = set()
+
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        is_open = UNCHECKED_BOX_PATTERN.match(line) is not None or any(
+            keyword in line for keyword in OPEN_ITEM_KEYWORDS
+        )
+        if not is_open:
+            continue
+        item = BULLET_PATTERN.sub("", line).strip()
+        if len(item) < 4 or item in seen:
+            continue
+        seen.add(item)
+        items.append(item)
+        if len(items) >= limit:
+            break
+
+    return items
@@ -5,6 +5,8 @@ AC12: テキスト取得・構造化
 """
 
 import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 
 from src.domain.entities.meeting_transcript import (
     TranscriptEntry,
@@ -15,8 +17,41 @@ from src.domain.entities.meeting_transcript import (
 TRANSCRIPT_PATTERN = re.compile(r"^(?P<speaker>.+?)\s*\((?P<timestamp>\d{1,2}:\d{2})\)\s*$", re.MULTILINE)
 
 
-def parse_transcript(raw_text: str) -> list[TranscriptEntry]:
-    """Google Meetトランスクリプトをパースする.
+@dataclass
+class TranscriptParseResult:
+    """1回の走査で得られるトランスクリプトの解析結果.
+
+    Attributes:
+        entries: TranscriptEntryのリスト
+        speakers: 話者名のリスト（初出順、重複なし）
+        turn_counts: 話者ごとの発話回数
+        first_timestamp: 最初の発話のタイムスタンプ（HH:MM形式）
+        last_timestamp: 最後の発話のタイムスタンプ（HH:MM形式）
+    """
+
+    entries: list[TranscriptEntry] = field(default_factory=list)
+    speakers: list[str] = field(default_factory=list)
+    turn_counts: dict[str, int] = field(default_factory=dict)
+    first_timestamp: str | None = None
+    last_timestamp: str | None = None
+
+    @property
+    def duration_minutes(self) -> int | None:
+        """最初から最後の発話までの分数（日付をまたぐ場合は翌日とみなす）."""
+        if self.first_timestamp is None or self.last_timestamp is None:
+            return None
+        minutes = _to_minutes(self.last_timestamp) - _to_minutes(self.first_timestamp)
+        return minutes % (24 * 60)
+
+    def to_structured_data(self) -> TranscriptStructuredData | None:
+        """構造化データに変換する（エントリがない場合はNone）."""
+        if not self.entries:
+            return None
+        return TranscriptStructuredData(entries=self.entries)
+
+
+def iter_transcript_entries(raw_text: str) -> Iterator[TranscriptEntry]:
+    """Google Meetトランスクリプトを先頭から1回だけ走査し、発話を順に返す.
 
     入力形式:
     ```
@@ -27,54 +62,72 @@ def parse_transcript(raw_text: str) -> list[TranscriptEntry]:
     はい、RAGのチューニングは完了しました。
     ```
 
+    行のリストを作らずに走査するため、保持するのは現在の発話の行のみとなる。
+
     Args:
         raw_text: 生のトランスクリプトテキスト
 
-    Returns:
-        TranscriptEntryのリスト
+    Yields:
+        TranscriptEntry（本文が空の発話は除く）
     """
-    if not raw_text.strip():
-        return []
-
-    entries: list[TranscriptEntry] = []
     current_speaker: str | None = None
-    current_timestamp: str | None = None
+    current_timestamp = ""
     current_text_lines: list[str] = []
 
-    for line in raw_text.split("\n"):
+    for line in _iter_lines(raw_text):
         match = TRANSCRIPT_PATTERN.match(line)
         if match:
-            # 前の発話を保存
+            # 前の発話を返す
             if current_speaker:
-                text = "\n".join(current_text_lines).strip()
-                if text:
-                    entries.append(
-                        TranscriptEntry(
-                            speaker=current_speaker,
-                            timestamp=current_timestamp or "",
-                            text=text,
-                        )
-                    )
+                entry = _build_entry(current_speaker, current_timestamp, current_text_lines)
+                if entry is not None:
+                    yield entry
             # 新しい発話を開始
             current_speaker = match.group("speaker")
             current_timestamp = match.group("timestamp")
             current_text_lines = []
-        elif line.strip():
+        elif current_speaker and line.strip():
             current_text_lines.append(line)
 
-    # 最後の発話を保存
+    # 最後の発話を返す
     if current_speaker:
-        text = "\n".join(current_text_lines).strip()
-        if text:
-            entries.append(
-                TranscriptEntry(
-                    speaker=current_speaker,
-                    timestamp=current_timestamp or "",
-                    text=text,
-                )
-            )
+        entry = _build_entry(current_speaker, current_timestamp, current_text_lines)
+        if entry is not None:
+            yield entry
+
+
+def parse_transcript_with_stats(raw_text: str) -> TranscriptParseResult:
+    """1回の走査で発話・話者・話者ごとの発話回数・時間範囲をまとめて取得する.
 
-    return entries
+    Args:
+        raw_text: 生のトランスクリプトテキスト
+
+    Returns:
+        TranscriptParseResult
+    """
+    result = TranscriptParseResult()
+    for entry in iter_transcript_entries(raw_text):
+        result.entries.append(entry)
+        if entry.speaker not in result.turn_counts:
+            result.speakers.append(entry.speaker)
+            result.turn_counts[entry.speaker] = 0
+        result.turn_counts[entry.speaker] += 1
+        if result.first_timestamp is None:
+            result.first_timestamp = entry.timestamp
+        result.last_timestamp = entry.timestamp
+    return result
+
+
+def parse_transcript(raw_text: str) -> list[TranscriptEntry]:
+    """Google Meetトランスクリプトをパースする.
+
+    Args:
+        raw_text: 生のトランスクリプトテキスト
+
+    Returns:
+        TranscriptEntryのリスト
+    """
+    return list(iter_transcript_entries(raw_text))
 
 
 def parse_to_structured_data(raw_text: str) -> TranscriptStructuredData | None:
@@ -99,7 +152,32 @@ def extract_speakers(raw_text: str) -> list[str]:
         raw_text: 生のトランスクリプトテキスト
 
     Returns:
-        ユニークな話者名のリスト
+        ユニークな話者名のリスト（初出順）
     """
-    entries = parse_transcript(raw_text)
-    return list({entry.speaker for entry in entries})
+    return list(dict.fromkeys(entry.speaker for entry in iter_transcript_entries(raw_text)))
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """改行で区切った行（str.splitと同じ）を、リストを作らずに順に返す."""
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _build_entry(speaker: str, timestamp: str, text_lines: list[str]) -> TranscriptEntry | None:
+    """発話の行からTranscriptEntryを作る（本文が空の場合はNone）."""
+    text = "\n".join(text_lines).strip()
+    if not text:
+        return None
+    return TranscriptEntry(speaker=speaker, timestamp=timestamp, text=text)
+
+
+def _to_minutes(timestamp: str) -> int:
+    """HH:MM形式のタイムスタンプを0時からの分数に変換する."""
+    hours, _, minutes = timestamp.partition(":")
+    return int(hours) * 60 + int(minutes)
@@ -17,6 +17,13 @@ logger = logging.getLogger(__name__)
 CLAUDE_HAIKU_MODEL_ID = "us.anthropic.claude-haiku-4-5-20251001-v1:0"
 TITAN_EMBEDDINGS_MODEL_ID = "amazon.titan-embed-text-v2:0"
 
+# Status codes Bedrock returns when the caller should back off and retry
+THROTTLING_STATUS_CODES = (429, 503)
+
+
+class BedrockThrottledError(Exception):
+    """Raised when Bedrock rejects a request due to throttling."""
+
 
 def _get_headers() -> dict[str, str] | None:
     """Get headers for Bedrock API requests.
@@ -122,6 +129,56 @@ def invoke_embeddings(text: str, dimensions: int = 1024) -> list[float] | None:
         return None
 
 
+async def invoke_embeddings_async(
+    text: str,
+    dimensions: int,
+    client: httpx.AsyncClient,
+) -> list[float] | None:
+    """Invoke Titan Embeddings V2 model via Bedrock without blocking the event loop.
+
+    Args:
+        text: The input text to generate embeddings for.
+        dimensions: The dimension of the output embeddings (256, 512, or 1024).
+        client: Shared async HTTP client (reused across concurrent calls).
+
+    Returns:
+        List of embedding floats if successful, None otherwise.
+
+    Raises:
+        BedrockThrottledError: If Bedrock throttled the request.
+    """
+    headers = _get_headers()
+    if headers is None:
+        return None
+
+    if dimensions not in (256, 512, 1024):
+        return None
+
+    request_body = {
+        "inputText": text,
+        "dimensions": dimensions,
+        "normalize": True,
+    }
+
+    url = f"{settings.AWS_BEDROCK_ENDPOINT}/model/{TITAN_EMBEDDINGS_MODEL_ID}/invoke"
+
+    try:
+        response = await client.post(url, headers=headers, json=request_body)
+        if response.status_code in THROTTLING_STATUS_CODES:
+            raise BedrockThrottledError(f"Bedrock throttled request: {response.status_code}")
+        response.raise_for_status()
+
+        embedding = response.json().get("embedding")
+        if isinstance(embedding, list):
+            return [float(x) for x in embedding]
+
+        return None
+
+    except (httpx.HTTPError, json.JSONDecodeError, KeyError) as e:
+        logger.warning("Bedrock embeddings error: %s", e)
+        return None
+
+
 def is_bedrock_configured() -> bool:
     """Check if Bedrock API key is configured.
 
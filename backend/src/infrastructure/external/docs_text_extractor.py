@@ -0,0 +1,181 @@
+"""Plain-text extraction from Google Docs API document bodies.
+
+The text is the concatenation of every textRun in the body, including
+the runs inside (nested) table cells, in document order.
+
+Two extractors produce the same text:
+- extract_body_text walks an already parsed body without recursion.
+- DocsBodyTextStream consumes the raw JSON response in chunks, so the
+  document tree never has to be resident in memory.
+"""
+
+import codecs
+import io
+import json
+import re
+from collections.abc import Iterator
+from typing import Any
+
+# Object keys leading to a textRun's content, outside and inside table cells
+_BODY_PREFIX = ("body", "content")
+_TABLE_CELL_KEYS = ("table", "tableRows", "tableCells", "content")
+_TEXT_RUN_SUFFIX = ("paragraph", "elements", "textRun", "content")
+
+# One JSON token after any separators: a string (a key when followed by ":"),
+# an opening or closing bracket, or a number/literal. Separators carry no
+# state because keys are recognized by their trailing colon.
+_TOKEN = re.compile(r'[\s,:]*(?:("[^"\\]*(?:\\.[^"\\]*)*")(\s*:)?|([{\[])|([}\]])|[^\s{}\[\],:"]+)', re.DOTALL)
+_BLANK_TAIL = re.compile(r"\s*\Z")
+_SKIPPED = object()
+_IN_ARRAY = object()
+
+
+def _as_list(value: object) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _table_cell_elements(table: dict[str, Any]) -> Iterator[object]:
+    """Yield the structural elements of every table cell in order."""
+    for row in _as_list(table.get("tableRows")):
+        if not isinstance(row, dict):
+            continue
+        for cell in _as_list(row.get("tableCells")):
+            if isinstance(cell, dict):
+                yield from _as_list(cell.get("content"))
+
+
+def _write_paragraph(paragraph: dict[str, Any], out: io.StringIO) -> None:
+    for element in _as_list(paragraph.get("elements")):
+        if not isinstance(element, dict):
+            continue
+        text_run = element.get("textRun")
+        if isinstance(text_run, dict):
+            content = text_run.get("content")
+            if isinstance(content, str):
+                out.write(content)
+
+
+def extract_body_text(body: object) -> str:
+    """Extract the plain text of a parsed document body.
+
+    Tables are handled with an explicit stack of element iterators, so
+    deeply nested tables do not recurse and text is written straight
+    into a single buffer.
+
+    Args:
+        body: The "body" object of a Docs API document.
+
+    Returns:
+        The extracted text.
+    """
+    if not isinstance(body, dict):
+        return ""
+
+    out = io.StringIO()
+    stack: list[Iterator[object]] = [iter(_as_list(body.get("content")))]
+    while stack:
+        element = next(stack[-1], _SKIPPED)
+        if element is _SKIPPED:
+            stack.pop()
+            continue
+        if not isinstance(element, dict):
+            continue
+
+        paragraph = element.get("paragraph")
+        if isinstance(paragraph, dict):
+            _write_paragraph(paragraph, out)
+
+        table = element.get("table")
+        if isinstance(table, dict):
+            stack.append(_table_cell_elements(table))
+
+    return out.getvalue()
+
+
+def _is_text_run_path(keys: list[object]) -> bool:
+    """Whether the object key path points at a body textRun's content."""
+    if len(keys) < len(_BODY_PREFIX) + len(_TEXT_RUN_SUFFIX):
+        return False
+    if tuple(keys[: len(_BODY_PREFIX)]) != _BODY_PREFIX:
+        return False
+    if tuple(keys[-len(_TEXT_RUN_SUFFIX) :]) != _TEXT_RUN_SUFFIX:
+        return False
+
+    middle = keys[len(_BODY_PREFIX) : -len(_TEXT_RUN_SUFFIX)]
+    size = len(_TABLE_CELL_KEYS)
+    if len(middle) % size:
+        return False
+    return all(tuple(middle[i : i + size]) == _TABLE_CELL_KEYS for i in range(0, len(middle), size))
+
+
+class DocsBodyTextStream:
+    """Incremental text extractor for a raw Docs API document response.
+
+    Feed the response bytes as they arrive and call close() at the end.
+    Only the body's textRun strings are decoded; everything else is
+    tokenized and dropped, so memory is bounded by the chunk size and
+    the longest single string in the document.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._pending = ""
+        self._out = io.StringIO()
+        # One entry per open container: the current key of an object, or _IN_ARRAY
+        self._keys: list[object] = []
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the response body.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        self._pending += self._decoder.decode(chunk)
+        self._consume(final=False)
+
+    def close(self) -> str:
+        """Finish the stream and return the extracted text.
+
+        Raises:
+            ValueError: If the response ended in the middle of the JSON document.
+        """
+        self._pending += self._decoder.decode(b"", final=True)
+        self._consume(final=True)
+        if self._keys or self._pending.strip():
+            raise ValueError("Incomplete Google Docs JSON response")
+        return self._out.getvalue()
+
+    def _consume(self, final: bool) -> None:
+        data = self._pending
+        size = len(data)
+        keys = self._keys
+        pos = 0
+        for match in _TOKEN.finditer(data):
+            if match.start() != pos:
+                break  # An unterminated string continues in the next chunk
+            string, colon, opening, closing = match.groups()
+            if string is not None:
+                if colon is None and not final and _BLANK_TAIL.match(data, match.end()):
+                    break  # A key's colon may arrive in the next chunk
+                self._on_string(string, is_key=colon is not None)
+            elif opening is not None:
+                keys.append(None if opening == "{" else _IN_ARRAY)
+            elif closing is not None:
+                if not keys:
+                    raise ValueError("Unbalanced Google Docs JSON response")
+                keys.pop()
+            elif match.end() == size and not final:
+                break  # The number/literal may continue in the next chunk
+            pos = match.end()
+        self._pending = data[pos:]
+
+    def _on_string(self, string: str, is_key: bool) -> None:
+        keys = self._keys
+        if is_key:
+            keys[-1] = json.loads(string) if "\\" in string else string[1:-1]
+            return
+        # Cheap check first; the full path check only runs for textRun contents
+        if len(keys) < 2 or keys[-1] != "content" or keys[-2] != "textRun":
+            return
+        if _is_text_run_path([key for key in keys if key is not _IN_ARRAY]):
+            self._out.write(json.loads(string))
@@ -0,0 +1,155 @@
+"""Google API batch requests.
+
+Sends many API calls in one multipart/mixed HTTP request and splits the
+multipart response back into per-call responses, in request order.
+Media downloads (such as Drive exports) cannot be batched.
+"""
+
+import json
+import logging
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlencode
+from uuid import uuid4
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Largest number of calls Google accepts in one batch request
+MAX_BATCH_SIZE = 100
+
+_BOUNDARY_PATTERN = re.compile(r'boundary="?([^";]+)"?')
+_CONTENT_ID_PATTERN = re.compile(rb"Content-ID:\s*<?response-item(\d+)>?", re.IGNORECASE)
+_BLANK_LINE = re.compile(rb"\r?\n\r?\n")
+
+
+@dataclass
+class BatchRequest:
+    """One API call inside a batch request.
+
+    Attributes:
+        path: Request path including the API version (e.g. "/v1/documents/abc").
+        params: Query parameters of the call.
+        method: HTTP method of the call.
+    """
+
+    path: str
+    params: dict[str, str] = field(default_factory=dict)
+    method: str = "GET"
+
+
+@dataclass
+class BatchResponse:
+    """The response to one call of a batch request."""
+
+    status_code: int
+    content: bytes
+
+    def json(self) -> dict[str, Any]:
+        """Decode the response body as a JSON object."""
+        data: dict[str, Any] = json.loads(self.content)
+        return data
+
+
+async def execute_batch(
+    batch_url: str,
+    access_token: str,
+    requests: Sequence[BatchRequest],
+    batch_size: int = MAX_BATCH_SIZE,
+) -> list[BatchResponse]:
+    """Execute API calls as batch requests of up to batch_size calls each.
+
+    The Authorization header of the outer request applies to every call.
+
+    Args:
+        batch_url: Batch endpoint of the API (e.g. "https://docs.googleapis.com/batch").
+        access_token: Google OAuth access token.
+        requests: The calls to execute.
+        batch_size: Calls per HTTP request (at most MAX_BATCH_SIZE).
+
+    Returns:
+        One response per call, in the order of requests.
+
+    Raises:
+        ValueError: If a batch request itself fails.
+    """
+    batch_size = min(batch_size, MAX_BATCH_SIZE)
+    responses: list[BatchResponse] = []
+
+    async with httpx.AsyncClient() as client:
+        for start in range(0, len(requests), batch_size):
+            chunk = requests[start : start + batch_size]
+            boundary = f"batch_{uuid4().hex}"
+            response = await client.post(
+                batch_url,
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "Content-Type": f"multipart/mixed; boundary={boundary}",
+                },
+                content=_encode_batch(chunk, boundary),
+            )
+
+            if response.status_code != 200:
+                logger.error("Batch request failed: %s - %s", response.status_code, response.text)
+                raise ValueError(f"Google API batch error: {response.status_code}")
+
+            responses.extend(_decode_batch(response.content, response.headers.get("Content-Type", ""), len(chunk)))
+
+    return responses
+
+
+def _encode_batch(requests: Sequence[BatchRequest], boundary: str) -> bytes:
+    """Build the multipart/mixed body of a batch request."""
+    parts: list[str] = []
+    for index, request in enumerate(requests):
+        target = request.path + (f"?{urlencode(request.params)}" if request.params else "")
+        parts.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{index}>\r\n"
+            "\r\n"
+            f"{request.method} {target} HTTP/1.1\r\n"
+            "\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts).encode()
+
+
+def _decode_batch(content: bytes, content_type: str, size: int) -> list[BatchResponse]:
+    """Split a multipart/mixed batch response into per-call responses.
+
+    Raises:
+        ValueError: If the response is malformed or lacks a call's response.
+    """
+    match = _BOUNDARY_PATTERN.search(content_type)
+    if match is None:
+        raise ValueError("Google API batch error: response has no multipart boundary")
+    delimiter = b"--" + match.group(1).encode()
+
+    responses: list[BatchResponse | None] = [None] * size
+    for part in content.split(delimiter)[1:]:
+        if part.startswith(b"--"):
+            break  # Closing delimiter
+        # Part headers, then the call's status line and headers, then its body
+        sections = _BLANK_LINE.split(part.lstrip(b"\r\n"), maxsplit=2)
+        if len(sections) < 2:
+            continue
+        content_id = _CONTENT_ID_PATTERN.search(sections[0])
+        index = int(content_id.group(1)) if content_id else -1
+        if not 0 <= index < size:
+            continue
+
+        status_line = sections[1].split(b"\n", 1)[0].split()
+        body = sections[2] if len(sections) > 2 else b""
+        responses[index] = BatchResponse(
+            status_code=int(status_line[1]),
+            content=body.removesuffix(b"\n").removesuffix(b"\r"),
+        )
+
+    missing = [i for i, r in enumerate(responses) if r is None]
+    if missing:
+        raise ValueError(f"Google API batch error: no response for {len(missing)} calls")
+    return [r for r in responses if r is not None]
@@ -1,21 +1,51 @@
 """Google Calendar API client for fetching recurring events.
 
 Handles Calendar API access with RRULE parsing and filtering.
+Supports incremental sync with Calendar sync tokens.
 Following ADR-0003 authentication pattern.
 """
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
 
+from src.domain.services.recurrence_expander import build_occurrence_index, parse_exdates
+from src.infrastructure.external.google_push_channel import (
+    WatchRegistration,
+    build_watch_body,
+    parse_watch_response,
+    stop_channel,
+)
+
 logger = logging.getLogger(__name__)
 
 # Google Calendar API endpoint
 CALENDAR_API_URL = "https://www.googleapis.com/calendar/v3"
 
+# Largest page size the events.list endpoint accepts
+SYNC_PAGE_SIZE = 2500
+
+# How far ahead a series may start and still be synced
+LOOK_AHEAD_DAYS = 90
+
+# Partial response: only the event fields CalendarEvent is built from
+EVENT_FIELDS = (
+    "id,summary,status,recurrence,recurringEventId,start(dateTime,date,timeZone),"
+    "organizer(email),attendees(email,displayName,responseStatus)"
+)
+EVENTS_LIST_FIELDS = f"nextPageToken,nextSyncToken,items({EVENT_FIELDS})"
+
+
+class CalendarSyncTokenExpiredError(ValueError):
+    """Raised when Google Calendar rejects a sync token (410 Gone).
+
+    The caller should discard the token and run a full sync.
+    """
+
 
 @dataclass
 class CalendarAttendee:
@@ -37,6 +67,26 @@ class CalendarEvent:
     start_datetime: datetime
     organizer_email: str | None = None
     status: str = "confirmed"
+    timezone: str | None = None
+    exdates: list[datetime] = field(default_factory=list)
+
+
+@dataclass
+class CalendarEventChanges:
+    """Recurring events returned by a (full or incremental) calendar sync.
+
+    Attributes:
+        events: Recurring events meeting the criteria.
+        removed_event_ids: IDs of events that were cancelled or no longer
+            meet the criteria (only reported by incremental syncs).
+        next_sync_token: Token for the next incremental sync, if returned.
+        full_sync: True if every event was listed (no sync token was used).
+    """
+
+    events: list[CalendarEvent]
+    removed_event_ids: list[str]
+    next_sync_token: str | None
+    full_sync: bool
 
 
 class GoogleCalendarClient:
@@ -75,53 +125,195 @@ class GoogleCalendarClient:
         # Calculate time range
         now = datetime.now(UTC)
         time_min = now - timedelta(days=months_back * 30)
-        time_max = now + timedelta(days=90)  # Look ahead 3 months for next occurrence
+        time_max = now + timedelta(days=LOOK_AHEAD_DAYS)  # Look ahead 3 months for next occurrence
+
+        # singleEvents=false returns recurring event definitions with RRULE
+        params: dict[str, str | int] = {
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "singleEvents": "false",  # Get recurring event definitions
+            "maxResults": 250,
+            "orderBy": "updated",
+        }
+        items, _ = await self._list_events(params)
+
+        events: list[CalendarEvent] = []
+        for item in items:
+            event = self._filter_and_parse(item, min_attendees)
+            if event is not None:
+                events.append(event)
+
+        logger.info(f"Found {len(events)} recurring events meeting criteria")
+        return events
+
+    async def sync_recurring_events(
+        self,
+        sync_token: str | None = None,
+        min_attendees: int = 2,
+        months_back: int = 3,
+    ) -> CalendarEventChanges:
+        """Fetch recurring events, incrementally if a sync token is given.
+
+        Without a sync token every event is listed and the returned
+        next_sync_token can be stored for later calls. With a sync token only
+        events changed since that token are listed; cancelled events and
+        events that no longer meet the criteria are reported as removed.
+
+        The Calendar API does not accept timeMin/timeMax together with a sync
+        token, so the time window is applied here instead of in the request.
+
+        Args:
+            sync_token: nextSyncToken from the previous sync, or None for a full sync.
+            min_attendees: Minimum number of attendees required (default: 2).
+            months_back: Only include events active within this many months (default: 3).
+
+        Returns:
+            CalendarEventChanges with the events, removed event IDs and next sync token.
+
+        Raises:
+            CalendarSyncTokenExpiredError: If the sync token is no longer valid.
+            ValueError: If Calendar API request fails.
+        """
+        now = datetime.now(UTC)
+        time_min = now - timedelta(days=months_back * 30)
+        time_max = now + timedelta(days=LOOK_AHEAD_DAYS)
+
+        params: dict[str, str | int] = {
+            "singleEvents": "false",  # Get recurring event definitions
+            "maxResults": SYNC_PAGE_SIZE,
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        items, next_sync_token = await self._list_events(params)
 
         events: list[CalendarEvent] = []
+        removed_event_ids: list[str] = []
+        for item in items:
+            # Exception instances do not change the series definition
+            if item.get("recurringEventId"):
+                continue
+            event = self._filter_and_parse(item, min_attendees)
+            if event is not None and self._is_active_within(event, time_min, time_max):
+                events.append(event)
+            elif item.get("id"):
+                removed_event_ids.append(str(item["id"]))
+
+        logger.info(
+            "Calendar %s sync: %d recurring events, %d removed",
+            "incremental" if sync_token else "full",
+            len(events),
+            len(removed_event_ids),
+        )
+        return CalendarEventChanges(
+            events=events,
+            removed_event_ids=removed_event_ids if sync_token else [],
+            next_sync_token=next_sync_token,
+            full_sync=not sync_token,
+        )
+
+    async def watch_events(
+        self,
+        channel_id: str,
+        token: str,
+        address: str,
+        ttl_seconds: int,
+    ) -> WatchRegistration:
+        """Register a push-notification channel for primary-calendar events.
+
+        Args:
+            channel_id: Unique channel ID.
+            token: Verification token sent back with each notification.
+            address: HTTPS URL that receives the notifications.
+            ttl_seconds: Requested channel lifetime.
+
+        Returns:
+            WatchRegistration of the created channel.
+
+        Raises:
+            ValueError: If Calendar API request fails.
+        """
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{CALENDAR_API_URL}/calendars/primary/events/watch",
+                headers={"Authorization": f"Bearer {self._access_token}"},
+                json=build_watch_body(channel_id, token, address, ttl_seconds),
+            )
+        return parse_watch_response(response, "Google Calendar")
+
+    async def stop_channel(self, channel_id: str, resource_id: str) -> None:
+        """Stop a push-notification channel created by watch_events.
+
+        Args:
+            channel_id: The channel ID.
+            resource_id: The resource ID returned when the channel was created.
+
+        Raises:
+            ValueError: If Calendar API request fails.
+        """
+        await stop_channel(CALENDAR_API_URL, self._access_token, channel_id, resource_id)
+
+    async def _list_events(self, params: dict[str, str | int]) -> tuple[list[dict[str, Any]], str | None]:
+        """List primary-calendar events across all pages.
+
+        Args:
+            params: Query parameters for events.list (without pageToken).
+
+        Returns:
+            Tuple of (raw event items, nextSyncToken from the last page).
+
+        Raises:
+            CalendarSyncTokenExpiredError: If the sync token is no longer valid.
+            ValueError: If Calendar API request fails.
+        """
+        items: list[dict[str, Any]] = []
         page_token: str | None = None
 
         async with httpx.AsyncClient() as client:
             while True:
-                # Fetch primary calendar events
-                # singleEvents=false returns recurring event definitions with RRULE
-                params: dict[str, str | int] = {
-                    "timeMin": time_min.isoformat(),
-                    "timeMax": time_max.isoformat(),
-                    "singleEvents": "false",  # Get recurring event definitions
-                    "maxResults": 250,
-                    "orderBy": "updated",
-                }
+                page_params = {**params, "fields": EVENTS_LIST_FIELDS}
                 if page_token:
-                    params["pageToken"] = page_token
+                    page_params["pageToken"] = page_token
 
                 response = await client.get(
                     f"{CALENDAR_API_URL}/calendars/primary/events",
                     headers={"Authorization": f"Bearer {self._access_token}"},
-                    params=params,
+                    params=page_params,
                 )
 
                 if response.status_code == 401:
                     raise ValueError("Google Calendar access token expired or invalid")
 
+                if response.status_code == 410:
+                    raise CalendarSyncTokenExpiredError("Google Calendar sync token expired")
+
                 if response.status_code != 200:
                     error_msg = f"Google Calendar API error: {response.status_code}"
                     logger.error(f"{error_msg} - {response.text}")
                     raise ValueError(error_msg)
 
                 data = response.json()
-                items = data.get("items", [])
-
-                for item in items:
-                    event = self._filter_and_parse(item, min_attendees)
-                    if event is not None:
-                        events.append(event)
+                items.extend(data.get("items", []))
 
                 page_token = data.get("nextPageToken")
                 if not page_token:
-                    break
+                    return items, data.get("nextSyncToken")
 
-        logger.info(f"Found {len(events)} recurring events meeting criteria")
-        return events
+    @staticmethod
+    def _is_active_within(event: CalendarEvent, time_min: datetime, time_max: datetime) -> bool:
+        """Check that a series has started by time_max and not ended before time_min."""
+        if event.start_datetime > time_max:
+            return False
+
+        # Only rules with COUNT/UNTIL can end; skip expanding open-ended series
+        rrule_upper = event.rrule.upper()
+        if "COUNT=" not in rrule_upper and "UNTIL=" not in rrule_upper:
+            return True
+
+        try:
+            index = build_occurrence_index(event.rrule, event.start_datetime, event.timezone, event.exdates)
+        except ValueError:
+            return True
+        return not index.occurrences or index.occurrences[-1] >= time_min
 
     def _filter_and_parse(self, item: dict[str, Any], min_attendees: int) -> CalendarEvent | None:
         """Filter and parse a Calendar API event item.
@@ -197,6 +389,10 @@ class GoogleCalendarClient:
                 # Date only - assume midnight UTC
                 start_datetime = datetime.strptime(start_str, "%Y-%m-%d").replace(tzinfo=UTC)
 
+            # IANA time zone of the series (used to expand the RRULE across DST changes)
+            timezone = start_data.get("timeZone")
+            exdates = parse_exdates(recurrence, start_datetime, timezone)
+
             # Get organizer
             organizer = item.get("organizer", {})
             organizer_email = organizer.get("email")
@@ -211,6 +407,8 @@ class GoogleCalendarClient:
                 start_datetime=start_datetime,
                 organizer_email=organizer_email,
                 status=status,
+                timezone=timezone,
+                exdates=exdates,
             )
 
         except Exception as e:
@@ -248,15 +446,23 @@ class GoogleCalendarClient:
         return "weekly"
 
     @staticmethod
-    def calculate_next_occurrence(rrule: str, start_datetime: datetime) -> datetime:
+    def calculate_next_occurrence(
+        rrule: str,
+        start_datetime: datetime,
+        timezone: str | None = None,
+        exdates: Iterable[datetime] = (),
+    ) -> datetime:
         """Calculate the next occurrence based on RRULE.
 
-        This is a simplified implementation. For production, consider using
-        dateutil.rrule for full RRULE support.
+        Expands the rule (BYDAY, BYMONTHDAY, COUNT, UNTIL, EXDATE included)
+        and picks the first occurrence after now. If the series has ended,
+        the last occurrence is returned.
 
         Args:
             rrule: iCalendar RRULE string.
             start_datetime: The original start datetime of the event.
+            timezone: IANA time zone of the event start.
+            exdates: Excluded occurrence datetimes.
 
         Returns:
             The next occurrence datetime.
@@ -267,21 +473,13 @@ class GoogleCalendarClient:
         if start_datetime > now:
             return start_datetime
 
-        frequency = GoogleCalendarClient.parse_frequency_from_rrule(rrule)
-
-        # Simple calculation based on frequency
-        if frequency == "weekly":
-            days_since = (now - start_datetime).days
-            weeks_passed = days_since // 7
-            next_date = start_datetime + timedelta(weeks=weeks_passed + 1)
-        elif frequency == "biweekly":
-            days_since = (now - start_datetime).days
-            biweeks_passed = days_since // 14
-            next_date = start_datetime + timedelta(weeks=(biweeks_passed + 1) * 2)
-        else:  # monthly
-            # Simplified: add months by adding 30 days
-            days_since = (now - start_datetime).days
-            months_passed = days_since // 30
-            next_date = start_datetime + timedelta(days=(months_passed + 1) * 30)
-
-        return next_date
+        try:
+            index = build_occurrence_index(rrule, start_datetime, timezone, exdates)
+        except ValueError as e:
+            logger.warning(f"Failed to expand RRULE {rrule!r}: {e}")
+            return start_datetime
+
+        next_date = index.next_after(now)
+        if next_date is not None:
+            return next_date
+        return index.occurrences[-1] if index.occurrences else start_datetime
@@ -1,18 +1,40 @@
 """Google Docs API client for document operations.
 
 Provides methods for retrieving document content from Google Docs.
+Plain text is fetched through the Drive export endpoint, with a streamed
+Docs API structure walk kept as a fallback. Several documents are
+fetched at once with batch requests and partial responses.
 Following ADR-0003 Google Workspace integration pattern.
 """
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import httpx
 
+from src.infrastructure.external.docs_text_extractor import DocsBodyTextStream, extract_body_text
+from src.infrastructure.external.google_batch import BatchRequest, execute_batch
+
 logger = logging.getLogger(__name__)
 
 # Google Docs API endpoints
 DOCS_API_BASE = "https://docs.googleapis.com/v1"
+DOCS_BATCH_URL = "https://docs.googleapis.com/batch"
+
+# Partial response: only what DocsDocument needs (text runs, also inside table cells).
+# A table nested in a cell is returned whole, which the extractors handle.
+_TEXT_RUN_FIELDS = "paragraph/elements/textRun/content"
+DOCS_DOCUMENT_FIELDS = (
+    f"documentId,title,body/content({_TEXT_RUN_FIELDS},table/tableRows/tableCells/content({_TEXT_RUN_FIELDS},table))"
+)
+
+# Documents per batch request (each response holds whole transcripts in memory)
+DOCUMENT_BATCH_SIZE = 25
+
+# Google Drive API endpoint for exporting Docs as plain text
+DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
+TEXT_EXPORT_MIME_TYPE = "text/plain"
 
 
 @dataclass
@@ -34,7 +56,8 @@ class GoogleDocsClient:
         """GoogleDocsClientを初期化する.
 
         Args:
-            access_token: Google OAuth access token with documents.readonly scope.
+            access_token: Google OAuth access token with documents.readonly and
+                drive.readonly scopes.
         """
         if not access_token:
             raise ValueError("access_token is required")
@@ -56,6 +79,7 @@ class GoogleDocsClient:
             response = await client.get(
                 f"{DOCS_API_BASE}/documents/{document_id}",
                 headers={"Authorization": f"Bearer {self._access_token}"},
+                params={"fields": DOCS_DOCUMENT_FIELDS},
             )
 
             if response.status_code == 404:
@@ -73,6 +97,9 @@ class GoogleDocsClient:
     async def get_document_text(self, document_id: str) -> str | None:
         """ドキュメントIDでテキストコンテンツのみを取得する.
 
+        Drive APIのテキストエクスポートで取得し、エクスポートできない場合
+        （スコープ不足・エクスポートサイズ上限など）はDocs APIの構造から抽出する。
+
         Args:
             document_id: Google DocsのドキュメントID。
 
@@ -82,10 +109,128 @@ class GoogleDocsClient:
         Raises:
             ValueError: API呼び出しが失敗した場合。
         """
-        doc = await self.get_document_content(document_id)
-        if doc is None:
-            return None
-        return doc.body_text
+        try:
+            return await self.export_document_text(document_id)
+        except ValueError as e:
+            logger.info("Falling back to Docs API for document %s: %s", document_id, e)
+
+        return await self.stream_document_text(document_id)
+
+    async def get_documents_text(self, document_ids: Sequence[str]) -> dict[str, str | None]:
+        """複数のドキュメントのテキストをバッチリクエストでまとめて取得する.
+
+        Drive APIのエクスポートはバッチにできないため、Docs APIのドキュメントを
+        フィールドマスクで本文のテキストだけに絞って取得する。
+        バッチ内で失敗したドキュメントは1件ずつ取得し直す。
+
+        Args:
+            document_ids: Google DocsのドキュメントIDのリスト。
+
+        Returns:
+            ドキュメントIDからテキストコンテンツへの辞書。見つからない場合はNone。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        requests = [
+            BatchRequest(path=f"/v1/documents/{document_id}", params={"fields": DOCS_DOCUMENT_FIELDS})
+            for document_id in document_ids
+        ]
+        responses = await execute_batch(DOCS_BATCH_URL, self._access_token, requests, DOCUMENT_BATCH_SIZE)
+
+        texts: dict[str, str | None] = {}
+        for document_id, response in zip(document_ids, responses, strict=True):
+            if response.status_code == 200:
+                texts[document_id] = self._to_docs_document(response.json()).body_text
+            elif response.status_code == 404:
+                texts[document_id] = None
+            else:
+                logger.warning("Batched get failed for document %s: %s", document_id, response.status_code)
+                texts[document_id] = await self.get_document_text(document_id)
+        return texts
+
+    async def stream_document_text(self, document_id: str) -> str | None:
+        """Docs APIのドキュメントをストリームで読み、テキストを抽出する.
+
+        レスポンスを受信したチャンクごとに抽出器へ渡すため、
+        ドキュメント全体のツリーをメモリに展開しない。
+
+        Args:
+            document_id: Google DocsのドキュメントID。
+
+        Returns:
+            ドキュメントのテキストコンテンツ。見つからない場合はNone。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        extractor = DocsBodyTextStream()
+        async with (
+            httpx.AsyncClient() as client,
+            client.stream(
+                "GET",
+                f"{DOCS_API_BASE}/documents/{document_id}",
+                headers={"Authorization": f"Bearer {self._access_token}"},
+                params={"fields": DOCS_DOCUMENT_FIELDS},
+            ) as response,
+        ):
+            if response.status_code == 404:
+                return None
+
+            if response.status_code != 200:
+                await response.aread()
+                error_msg = response.json().get("error", {}).get("message", "Unknown error")
+                logger.error("Failed to get document: %s", error_msg)
+                raise ValueError(f"Google Docs API error: {error_msg}")
+
+            async for chunk in response.aiter_bytes():
+                extractor.feed(chunk)
+
+        return extractor.close()
+
+    async def export_document_text(self, document_id: str) -> str | None:
+        """Drive APIのエクスポートでドキュメントをプレーンテキストとして取得する.
+
+        書式情報を含むドキュメント構造を取得せず、レスポンスを
+        ストリームでバッファに読み込む。
+
+        Args:
+            document_id: Google DocsのドキュメントID。
+
+        Returns:
+            ドキュメントのテキストコンテンツ。見つからない場合はNone。
+
+        Raises:
+            ValueError: エクスポートに失敗した場合。
+        """
+        buffer = bytearray()
+        async with (
+            httpx.AsyncClient() as client,
+            client.stream(
+                "GET",
+                f"{DRIVE_API_BASE}/files/{document_id}/export",
+                params={"mimeType": TEXT_EXPORT_MIME_TYPE},
+                headers={"Authorization": f"Bearer {self._access_token}"},
+            ) as response,
+        ):
+            if response.status_code == 404:
+                return None
+
+            if response.status_code != 200:
+                raise ValueError(f"Google Drive export error: HTTP {response.status_code}")
+
+            async for chunk in response.aiter_bytes():
+                buffer.extend(chunk)
+
+        return self._normalize_exported_text(buffer.decode("utf-8"))
+
+    @staticmethod
+    def _normalize_exported_text(text: str) -> str:
+        """エクスポートされたテキストをDocs APIから抽出したテキストと同じ形式に揃える.
+
+        エクスポート結果は先頭にBOMが付き、改行がCRLFになっている。
+        """
+        return text.removeprefix("\ufeff").replace("\r\n", "\n")
 
     def _to_docs_document(self, data: dict[str, object]) -> DocsDocument:
         """APIレスポンスをDocsDocumentに変換する.
@@ -109,106 +254,10 @@ class GoogleDocsClient:
     def _extract_text_from_body(self, body: object) -> str:
         """ドキュメントボディからテキストを抽出する.
 
-        Google Docsのボディは複雑なネスト構造を持つため、
-        再帰的にテキスト要素を抽出する。
-
         Args:
             body: Google Docs APIのbodyオブジェクト。
 
         Returns:
             抽出されたテキスト。
         """
-        if not isinstance(body, dict):
-            return ""
-
-        text_parts: list[str] = []
-        content = body.get("content") or []
-
-        if not isinstance(content, list):
-            return ""
-
-        for element in content:
-            if not isinstance(element, dict):
-                continue
-            text = self._extract_text_from_element(element)
-            if text:
-                text_parts.append(text)
-
-        return "".join(text_parts)
-
-    def _extract_text_from_element(self, element: dict[str, object]) -> str:
-        """ドキュメント要素からテキストを抽出する.
-
-        Args:
-            element: Google Docs APIの要素オブジェクト。
-
-        Returns:
-            抽出されたテキスト。
-        """
-        text_parts: list[str] = []
-
-        # Paragraph要素の処理
-        text_parts.extend(self._extract_text_from_paragraph(element.get("paragraph")))
-
-        # Table要素の処理
-        text_parts.extend(self._extract_text_from_table(element.get("table")))
-
-        return "".join(text_parts)
-
-    def _extract_text_from_paragraph(self, paragraph: object) -> list[str]:
-        """Paragraph要素からテキストを抽出する."""
-        if not isinstance(paragraph, dict):
-            return []
-
-        text_parts: list[str] = []
-        elements = paragraph.get("elements") or []
-        if not isinstance(elements, list):
-            return []
-
-        for para_element in elements:
-            if not isinstance(para_element, dict):
-                continue
-            text_run = para_element.get("textRun")
-            if isinstance(text_run, dict):
-                content = text_run.get("content")
-                if isinstance(content, str):
-                    text_parts.append(content)
-
-        return text_parts
-
-    def _extract_text_from_table(self, table: object) -> list[str]:
-        """Table要素からテキストを抽出する."""
-        if not isinstance(table, dict):
-            return []
-
-        text_parts: list[str] = []
-        table_rows = table.get("tableRows") or []
-        if not isinstance(table_rows, list):
-            return []
-
-        for row in table_rows:
-            if not isinstance(row, dict):
-                continue
-            text_parts.extend(self._extract_text_from_table_row(row))
-
-        return text_parts
-
-    def _extract_text_from_table_row(self, row: dict[str, object]) -> list[str]:
-        """テーブル行からテキストを抽出する."""
-        text_parts: list[str] = []
-        cells = row.get("tableCells", [])
-        if not isinstance(cells, list):
-            return []
-
-        for cell in cells:
-            if not isinstance(cell, dict):
-                continue
-            cell_content = cell.get("content") or []
-            if isinstance(cell_content, list):
-                text_parts.extend(
-                    self._extract_text_from_element(cell_element)
-                    for cell_element in cell_content
-                    if isinstance(cell_element, dict)
-                )
-
-        return text_parts
+        return extract_body_text(body)
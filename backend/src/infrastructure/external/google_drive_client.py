@@ -7,9 +7,17 @@ Following ADR-0003 Google Workspace integration pattern.
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 import httpx
 
+from src.infrastructure.external.google_push_channel import (
+    WatchRegistration,
+    build_watch_body,
+    parse_watch_response,
+    stop_channel,
+)
+
 logger = logging.getLogger(__name__)
 
 # Google Drive API endpoints
@@ -18,6 +26,11 @@ DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 # Google Docs MIME type
 GOOGLE_DOCS_MIME_TYPE = "application/vnd.google-apps.document"
 
+# 変更一覧の1ページの最大件数
+CHANGES_PAGE_SIZE = 1000
+
+DRIVE_FILE_FIELDS = "id,name,mimeType,createdTime,modifiedTime,webViewLink"
+
 
 @dataclass
 class DriveFile:
@@ -31,6 +44,19 @@ class DriveFile:
     web_view_link: str | None
 
 
+@dataclass
+class DriveChanges:
+    """Drive変更一覧の取得結果.
+
+    Attributes:
+        files: 変更されたトランスクリプトファイル
+        new_start_page_token: 次回の変更一覧の取得に使うページトークン
+    """
+
+    files: list[DriveFile]
+    new_start_page_token: str
+
+
 class GoogleDriveClient:
     """Google Drive APIクライアント.
 
@@ -73,6 +99,132 @@ class GoogleDriveClient:
         # フォルダ内のGoogle Docsを検索
         return await self._list_docs_in_folder(folder_id, max_results)
 
+    async def find_folder_id(self, folder_name: str = "Meet Recordings") -> str | None:
+        """フォルダ名でフォルダIDを取得する.
+
+        Args:
+            folder_name: フォルダ名。デフォルトは "Meet Recordings"。
+
+        Returns:
+            フォルダID。見つからない場合はNone。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        return await self._find_folder_by_name(folder_name)
+
+    async def get_start_page_token(self) -> str:
+        """現在以降の変更を取得するためのページトークンを取得する.
+
+        Returns:
+            変更一覧の開始ページトークン。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{DRIVE_API_BASE}/changes/startPageToken",
+                headers={"Authorization": f"Bearer {self._access_token}"},
+            )
+
+        data = self._json_or_raise(response, "Failed to get start page token")
+        return str(data["startPageToken"])
+
+    async def list_changed_transcript_files(self, page_token: str, folder_id: str) -> DriveChanges:
+        """ページトークン以降に変更されたトランスクリプトファイルを取得する.
+
+        フォルダ直下のGoogle Docsのうち、ゴミ箱に入っていないものだけを返す。
+
+        Args:
+            page_token: 前回の取得で返されたページトークン。
+            folder_id: Meet RecordingsフォルダのID。
+
+        Returns:
+            変更されたファイルと次回のページトークン。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        files: list[DriveFile] = []
+        next_page_token: str | None = page_token
+
+        async with httpx.AsyncClient() as client:
+            while next_page_token:
+                response = await client.get(
+                    f"{DRIVE_API_BASE}/changes",
+                    headers={"Authorization": f"Bearer {self._access_token}"},
+                    params={
+                        "pageToken": next_page_token,
+                        "pageSize": CHANGES_PAGE_SIZE,
+                        "fields": (
+                            "nextPageToken,newStartPageToken,"
+                            f"changes(removed,file({DRIVE_FILE_FIELDS},parents,trashed))"
+                        ),
+                    },
+                )
+                data = self._json_or_raise(response, "Failed to list changes")
+
+                for change in data.get("changes", []):
+                    file_data: dict[str, Any] = change.get("file") or {}
+                    if (
+                        not change.get("removed")
+                        and not file_data.get("trashed")
+                        and file_data.get("mimeType") == GOOGLE_DOCS_MIME_TYPE
+                        and folder_id in file_data.get("parents", [])
+                    ):
+                        files.append(self._to_drive_file(file_data))
+
+                if data.get("newStartPageToken"):
+                    return DriveChanges(files=files, new_start_page_token=str(data["newStartPageToken"]))
+                next_page_token = data.get("nextPageToken")
+
+        raise ValueError("Google Drive API error: changes list ended without newStartPageToken")
+
+    async def watch_changes(
+        self,
+        page_token: str,
+        channel_id: str,
+        token: str,
+        address: str,
+        ttl_seconds: int,
+    ) -> WatchRegistration:
+        """Driveの変更のプッシュ通知チャネルを登録する（changes.watch）.
+
+        Args:
+            page_token: 通知対象の変更の開始ページトークン。
+            channel_id: チャネルID。
+            token: 通知の検証用トークン。
+            address: 通知を受け取るHTTPSのURL。
+            ttl_seconds: チャネルの有効期間（秒）。
+
+        Returns:
+            登録したチャネルの情報。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{DRIVE_API_BASE}/changes/watch",
+                headers={"Authorization": f"Bearer {self._access_token}"},
+                params={"pageToken": page_token},
+                json=build_watch_body(channel_id, token, address, ttl_seconds),
+            )
+        return parse_watch_response(response, "Google Drive")
+
+    async def stop_channel(self, channel_id: str, resource_id: str) -> None:
+        """プッシュ通知チャネルを停止する.
+
+        Args:
+            channel_id: チャネルID。
+            resource_id: 登録時に返された監視対象リソースのID。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        await stop_channel(DRIVE_API_BASE, self._access_token, channel_id, resource_id)
+
     async def get_file_by_id(self, file_id: str) -> DriveFile | None:
         """ファイルIDでファイル情報を取得する.
 
@@ -90,7 +242,7 @@ class GoogleDriveClient:
                 f"{DRIVE_API_BASE}/files/{file_id}",
                 headers={"Authorization": f"Bearer {self._access_token}"},
                 params={
-                    "fields": "id,name,mimeType,createdTime,modifiedTime,webViewLink",
+                    "fields": DRIVE_FILE_FIELDS,
                 },
             )
 
@@ -159,7 +311,7 @@ class GoogleDriveClient:
             while len(all_files) < max_results:
                 params: dict[str, str | int] = {
                     "q": query,
-                    "fields": "nextPageToken,files(id,name,mimeType,createdTime,modifiedTime,webViewLink)",
+                    "fields": f"nextPageToken,files({DRIVE_FILE_FIELDS})",
                     "pageSize": min(100, max_results - len(all_files)),
                     "orderBy": "createdTime desc",
                 }
@@ -188,7 +340,29 @@ class GoogleDriveClient:
 
         return all_files
 
-    def _to_drive_file(self, data: dict[str, str]) -> DriveFile:
+    def _json_or_raise(self, response: httpx.Response, message: str) -> dict[str, Any]:
+        """成功レスポンスのJSONを返し、失敗時はValueErrorを送出する.
+
+        Args:
+            response: Google Drive APIのレスポンス。
+            message: ログに出すメッセージ。
+
+        Returns:
+            レスポンスのJSON。
+
+        Raises:
+            ValueError: API呼び出しが失敗した場合。
+        """
+        if response.status_code != 200:
+            error_data = response.json()
+            error_msg = error_data.get("error", {}).get("message", "Unknown error")
+            logger.error("%s: %s", message, error_msg)
+            raise ValueError(f"Google Drive API error: {error_msg}")
+
+        data: dict[str, Any] = response.json()
+        return data
+
+    def _to_drive_file(self, data: dict[str, Any]) -> DriveFile:
         """APIレスポンスをDriveFileに変換する.
 
         Args:
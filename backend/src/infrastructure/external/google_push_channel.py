@@ -0,0 +1,102 @@
+"""Google API push-notification channels.
+
+Shared helpers for Calendar events.watch and Drive changes.watch channels.
+Both APIs use the same channel request/response format.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WatchRegistration:
+    """A channel registered with a Google watch request.
+
+    Attributes:
+        resource_id: Opaque ID of the watched resource (needed to stop the channel).
+        expiration: When Google stops sending notifications on the channel.
+    """
+
+    resource_id: str
+    expiration: datetime
+
+
+def build_watch_body(channel_id: str, token: str, address: str, ttl_seconds: int) -> dict[str, Any]:
+    """Build the request body of a watch request.
+
+    Args:
+        channel_id: Unique channel ID (sent back as X-Goog-Channel-ID).
+        token: Verification token (sent back as X-Goog-Channel-Token).
+        address: HTTPS URL that receives the notifications.
+        ttl_seconds: Requested channel lifetime.
+
+    Returns:
+        Request body for events.watch / changes.watch.
+    """
+    expiration_ms = int(datetime.now(UTC).timestamp() + ttl_seconds) * 1000
+    return {
+        "id": channel_id,
+        "type": "web_hook",
+        "address": address,
+        "token": token,
+        "expiration": expiration_ms,
+        "params": {"ttl": str(ttl_seconds)},
+    }
+
+
+def parse_watch_response(response: httpx.Response, api_name: str) -> WatchRegistration:
+    """Parse the response of a watch request.
+
+    Args:
+        response: HTTP response from events.watch / changes.watch.
+        api_name: API name used in error messages.
+
+    Returns:
+        WatchRegistration of the created channel.
+
+    Raises:
+        ValueError: If the watch request failed.
+    """
+    if response.status_code != 200:
+        error_msg = f"{api_name} watch error: {response.status_code}"
+        logger.error(f"{error_msg} - {response.text}")
+        raise ValueError(error_msg)
+
+    data = response.json()
+    return WatchRegistration(
+        resource_id=str(data["resourceId"]),
+        expiration=datetime.fromtimestamp(int(data["expiration"]) / 1000, tz=UTC),
+    )
+
+
+async def stop_channel(api_base: str, access_token: str, channel_id: str, resource_id: str) -> None:
+    """Stop a push-notification channel.
+
+    Channels that already expired or were stopped return 404, which is ignored.
+
+    Args:
+        api_base: Base URL of the API that created the channel.
+        access_token: Google OAuth access token.
+        channel_id: The channel ID.
+        resource_id: The resource ID returned when the channel was created.
+
+    Raises:
+        ValueError: If the stop request failed.
+    """
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            f"{api_base}/channels/stop",
+            headers={"Authorization": f"Bearer {access_token}"},
+            json={"id": channel_id, "resourceId": resource_id},
+        )
+
+    if response.status_code not in (200, 204, 404):
+        error_msg = f"Failed to stop channel: {response.status_code}"
+        logger.error(f"{error_msg} - {response.text}")
+        raise ValueError(error_msg)
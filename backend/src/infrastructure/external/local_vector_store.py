@@ -0,0 +1,499 @@
+"""Local vector store for deployments and tests without pgvector.
+
+Holds embeddings in a contiguous float32 matrix (memory-mapped from disk when a
+directory is given) and answers top-k queries by vectorized dot product, with an
+optional IVF (inverted file) index for larger corpora.
+
+Files in the store directory:
+    vectors.npy: float32 matrix of shape (capacity, dimensions), memory-mapped
+    log.jsonl: append-only log of add/delete operations with row metadata
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILENAME = "vectors.npy"
+LOG_FILENAME = "log.jsonl"
+
+# 未使用を表すID符号
+NO_CODE = -1
+
+# 削除済み行がこの数を超え、かつ有効行より多くなったら詰め直す
+COMPACTION_MIN_TOMBSTONES = 1024
+
+# IVFの1リストあたりの最小ベクトル数（これ未満の件数では全件検索の方が速い）
+IVF_MIN_POINTS_PER_LIST = 39
+
+
+@dataclass
+class VectorSearchHit:
+    """検索結果の1件.
+
+    Attributes:
+        key: 登録時のキー
+        score: クエリとの内積
+        payload: 登録時に保存した任意のメタデータ
+    """
+
+    key: str
+    score: float
+    payload: dict[str, Any]
+
+
+@dataclass
+class VectorRecord:
+    """登録するベクトルとフィルタ用の属性.
+
+    Attributes:
+        key: 一意キー（同じキーの再登録は置き換え）
+        vector: 埋め込みベクトル
+        user_id: 所有ユーザーのID
+        agent_id: エージェントID
+        recurring_meeting_id: 定例MTG ID
+        payload: 検索結果とともに返すメタデータ（JSONシリアライズ可能であること）
+    """
+
+    key: str
+    vector: npt.NDArray[np.float32]
+    user_id: str
+    agent_id: str | None = None
+    recurring_meeting_id: str | None = None
+    payload: dict[str, Any] | None = None
+
+
+class _IvfIndex:
+    """球面k-meansによる転置ファイルインデックス."""
+
+    def __init__(self, centroids: npt.NDArray[np.float32], assignments: npt.NDArray[np.int32], built_rows: int) -> None:
+        self.centroids = centroids
+        self.assignments = assignments
+        self.built_rows = built_rows
+
+    @classmethod
+    def build(
+        cls,
+        vectors: npt.NDArray[np.float32],
+        rows: npt.NDArray[np.intp],
+        capacity: int,
+        nlist: int,
+        iterations: int,
+        seed: int,
+    ) -> "_IvfIndex":
+        data = vectors[rows]
+        rng = np.random.default_rng(seed)
+        centroids = data[rng.choice(len(data), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(data @ centroids.T, axis=1)
+            for index in range(nlist):
+                members = data[labels == index]
+                if len(members) == 0:
+                    continue
+                centroid = members.sum(axis=0)
+                norm = float(np.linalg.norm(centroid))
+                if norm > 0:
+                    centroids[index] = centroid / norm
+
+        assignments = np.full(capacity, NO_CODE, dtype=np.int32)
+        assignments[rows] = np.argmax(data @ centroids.T, axis=1)
+        return cls(centroids, assignments, len(rows))
+
+    def assign(self, rows: npt.NDArray[np.intp], vectors: npt.NDArray[np.float32]) -> None:
+        self.assignments[rows] = np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def grow(self, capacity: int) -> None:
+        grown = np.full(capacity, NO_CODE, dtype=np.int32)
+        grown[: len(self.assignments)] = self.assignments
+        self.assignments = grown
+
+    def probe(self, query: npt.NDArray[np.float32], nprobe: int, count: int) -> npt.NDArray[np.intp]:
+        nprobe = min(nprobe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        return np.flatnonzero(np.isin(self.assignments[:count], lists))
+
+
+class LocalVectorStore:
+    """プロセス内ベクトルストア.
+
+    ベクトルは連続したfloat32行列に行単位で追記し、削除は墓標（alive=False）で行う。
+    フィルタ用のID（ユーザー・エージェント・定例MTG）は整数符号に変換して配列で保持し、
+    検索時はベクトル化された比較でマスクを作ってから内積を計算する。
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        directory: Path | None = None,
+        initial_capacity: int = 1024,
+        ivf_lists: int | None = None,
+        nprobe: int = 8,
+    ) -> None:
+        """ストアを初期化する（ディレクトリに既存データがあれば読み込む）.
+
+        Args:
+            dimensions: ベクトルの次元数
+            directory: 永続化先ディレクトリ（Noneの場合はメモリのみ）
+            initial_capacity: 行列の初期行数
+            ivf_lists: IVFのリスト数（Noneの場合は常に全件検索）
+            nprobe: IVF検索時に走査するリスト数
+        """
+        self.dimensions = dimensions
+        self.directory = directory
+        self.ivf_lists = ivf_lists
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+        self._ivf: _IvfIndex | None = None
+
+        self._count = 0
+        self._codes: dict[str, int] = {}
+        self._code_values: list[str] = []
+        self._key_to_row: dict[str, int] = {}
+        self._row_keys: list[str | None] = []
+        self._payloads: dict[str, dict[str, Any]] = {}
+        self._matrix: npt.NDArray[np.float32]
+
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            if (directory / LOG_FILENAME).exists():
+                self._load(directory)
+                return
+        self._allocate(initial_capacity, reset_file=True)
+
+    def __len__(self) -> int:
+        """有効なベクトル数."""
+        return len(self._key_to_row)
+
+    def add(self, records: Sequence[VectorRecord]) -> None:
+        """ベクトルを追加する（同じキーは置き換え）.
+
+        Args:
+            records: 追加するレコード
+        """
+        if not records:
+            return
+        with self._lock:
+            self._ensure_capacity(self._count + len(records))
+            log_entries = [self._append(record) for record in records]
+            self._flush_log(log_entries)
+            if self._ivf is not None:
+                rows = np.arange(self._count - len(records), self._count)
+                self._ivf.assign(rows, self._matrix[rows])
+
+    def delete(self, keys: Sequence[str]) -> int:
+        """キーのベクトルを削除する.
+
+        Args:
+            keys: 削除するキー
+
+        Returns:
+            削除した件数
+        """
+        with self._lock:
+            deleted = [key for key in keys if self._remove(key)]
+            self._flush_log([{"op": "delete", "key": key} for key in deleted])
+            if self._tombstones() > max(COMPACTION_MIN_TOMBSTONES, len(self)):
+                self.compact()
+        return len(deleted)
+
+    def items(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """有効な(キー, ペイロード)を列挙する."""
+        with self._lock:
+            snapshot = [(key, self._payloads.get(key, {})) for key in self._key_to_row]
+        return iter(snapshot)
+
+    def search(
+        self,
+        query: npt.NDArray[np.float32],
+        top_k: int,
+        user_id: str,
+        agent_id: str | None = None,
+        recurring_meeting_ids: Sequence[str] | None = None,
+    ) -> list[VectorSearchHit]:
+        """クエリとの内積が大きい順に上位k件を返す.
+
+        agent_idに紐づく行、またはrecurring_meeting_idsのいずれかに紐づく行を対象とする。
+        どちらも指定しない場合はユーザーの全行が対象。
+
+        Args:
+            query: クエリベクトル
+            top_k: 取得件数
+            user_id: 所有ユーザーのID
+            agent_id: 絞り込み対象のエージェントID
+            recurring_meeting_ids: 絞り込み対象の定例MTG IDリスト
+
+        Returns:
+            VectorSearchHitのリスト（スコアの降順）
+        """
+        with self._lock:
+            user_code = self._codes.get(user_id)
+            if top_k <= 0 or user_code is None:
+                return []
+
+            rows = self._candidate_rows(query)
+            mask = self._alive[rows] & (self._user_codes[rows] == user_code)
+            scope = self._scope_mask(rows, agent_id, recurring_meeting_ids)
+            if scope is not None:
+                mask &= scope
+            rows = rows[mask]
+            if len(rows) == 0:
+                return []
+
+            scores = self._matrix[rows] @ query
+            k = min(top_k, len(rows))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            hits = []
+            for i in top:
+                key = self._row_keys[int(rows[i])]
+                if key is not None:
+                    hits.append(VectorSearchHit(key=key, score=float(scores[i]), payload=self._payloads.get(key, {})))
+            return hits
+
+    def build_ivf(self, nlist: int | None = None, iterations: int = 10, seed: int = 0) -> bool:
+        """有効な行からIVFインデックスを構築する.
+
+        Args:
+            nlist: リスト数（Noneの場合はivf_listsを使用）
+            iterations: k-meansの反復回数
+            seed: 初期重心選択の乱数シード
+
+        Returns:
+            構築した場合True（件数が少なすぎる場合はFalse）
+        """
+        nlist = nlist or self.ivf_lists
+        with self._lock:
+            rows = np.flatnonzero(self._alive[: self._count])
+            if not nlist or len(rows) < nlist * IVF_MIN_POINTS_PER_LIST:
+                self._ivf = None
+                return False
+            self._ivf = _IvfIndex.build(self._matrix, rows, len(self._alive), nlist, iterations, seed)
+            return True
+
+    def compact(self) -> None:
+        """削除済みの行を詰めて行列とログを書き直す."""
+        with self._lock:
+            live_rows = [self._key_to_row[key] for key in self._key_to_row]
+            vectors = self._matrix[live_rows].copy() if live_rows else np.empty((0, self.dimensions), np.float32)
+            records = [
+                VectorRecord(
+                    key=key,
+                    vector=vectors[i],
+                    user_id=self._decode(self._user_codes[row]) or "",
+                    agent_id=self._decode(self._agent_codes[row]),
+                    recurring_meeting_id=self._decode(self._meeting_codes[row]),
+                    payload=self._payloads.get(key),
+                )
+                for i, (key, row) in enumerate(self._key_to_row.items())
+            ]
+            self._count = 0
+            self._codes = {}
+            self._code_values = []
+            self._key_to_row = {}
+            self._row_keys = []
+            self._payloads = {}
+            self._ivf = None
+            self._allocate(max(len(records) * 2, 1024), reset_file=True)
+            if self.directory is not None:
+                (self.directory / LOG_FILENAME).unlink(missing_ok=True)
+            self.add(records)
+
+    def flush(self) -> None:
+        """メモリマップした行列をディスクに書き出す."""
+        with self._lock:
+            if isinstance(self._matrix, np.memmap):
+                self._matrix.flush()
+
+    def _allocate(self, capacity: int, reset_file: bool = False) -> None:
+        """行列とフィルタ用配列を確保する."""
+        if self.directory is not None:
+            path = self.directory / VECTORS_FILENAME
+            if reset_file:
+                path.unlink(missing_ok=True)
+            self._matrix = np.lib.format.open_memmap(
+                path, mode="w+", dtype=np.float32, shape=(capacity, self.dimensions)
+            )
+        else:
+            self._matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._user_codes = np.full(capacity, NO_CODE, dtype=np.int32)
+        self._agent_codes = np.full(capacity, NO_CODE, dtype=np.int32)
+        self._meeting_codes = np.full(capacity, NO_CODE, dtype=np.int32)
+
+    def _ensure_capacity(self, needed: int) -> None:
+        """必要な行数が確保されるまで容量を倍々で増やす."""
+        capacity = len(self._alive)
+        if needed <= capacity:
+            return
+        new_capacity = max(capacity * 2, needed)
+
+        if self.directory is not None:
+            path = self.directory / VECTORS_FILENAME
+            tmp_path = self.directory / f"{VECTORS_FILENAME}.tmp"
+            grown = np.lib.format.open_memmap(
+                tmp_path, mode="w+", dtype=np.float32, shape=(new_capacity, self.dimensions)
+            )
+            grown[:capacity] = self._matrix
+            grown.flush()
+            del grown
+            del self._matrix
+            tmp_path.replace(path)
+            self._matrix = np.load(path, mmap_mode="r+")
+        else:
+            matrix = np.zeros((new_capacity, self.dimensions), dtype=np.float32)
+            matrix[:capacity] = self._matrix
+            self._matrix = matrix
+
+        self._alive = np.concatenate([self._alive, np.zeros(new_capacity - capacity, dtype=bool)])
+        for name in ("_user_codes", "_agent_codes", "_meeting_codes"):
+            codes = getattr(self, name)
+            setattr(self, name, np.concatenate([codes, np.full(new_capacity - capacity, NO_CODE, dtype=np.int32)]))
+        if self._ivf is not None:
+            self._ivf.grow(new_capacity)
+
+    def _append(self, record: VectorRecord) -> dict[str, Any]:
+        """レコードを末尾の行に書き込み、ログ用の辞書を返す."""
+        if record.vector.shape != (self.dimensions,):
+            raise ValueError(f"Expected vector of shape ({self.dimensions},), got {record.vector.shape}")
+        self._remove(record.key)
+        row = self._count
+        self._count += 1
+        self._matrix[row] = record.vector
+        self._set_row(row, record.key, record.user_id, record.agent_id, record.recurring_meeting_id)
+        if record.payload is not None:
+            self._payloads[record.key] = record.payload
+        return {
+            "op": "add",
+            "key": record.key,
+            "row": row,
+            "user_id": record.user_id,
+            "agent_id": record.agent_id,
+            "recurring_meeting_id": record.recurring_meeting_id,
+            "payload": record.payload,
+        }
+
+    def _set_row(
+        self,
+        row: int,
+        key: str,
+        user_id: str,
+        agent_id: str | None,
+        recurring_meeting_id: str | None,
+    ) -> None:
+        """行のフィルタ用属性とキー対応を設定する."""
+        self._alive[row] = True
+        self._user_codes[row] = self._encode(user_id)
+        self._agent_codes[row] = self._encode(agent_id)
+        self._meeting_codes[row] = self._encode(recurring_meeting_id)
+        self._key_to_row[key] = row
+        self._row_keys.extend([None] * (row + 1 - len(self._row_keys)))
+        self._row_keys[row] = key
+
+    def _remove(self, key: str) -> bool:
+        """キーの行を墓標にする."""
+        row = self._key_to_row.pop(key, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        self._row_keys[row] = None
+        self._payloads.pop(key, None)
+        return True
+
+    def _tombstones(self) -> int:
+        return self._count - len(self._key_to_row)
+
+    def _encode(self, value: str | None) -> int:
+        if value is None:
+            return NO_CODE
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._code_values)
+            self._codes[value] = code
+            self._code_values.append(value)
+        return code
+
+    def _decode(self, code: int) -> str | None:
+        return None if code == NO_CODE else self._code_values[code]
+
+    def _candidate_rows(self, query: npt.NDArray[np.float32]) -> npt.NDArray[np.intp]:
+        """検索対象の行番号（IVF使用時は近いリストの行のみ）."""
+        if self.ivf_lists and self._ivf_is_stale(self.ivf_lists):
+            self.build_ivf()
+        if self._ivf is not None:
+            return self._ivf.probe(query, self.nprobe, self._count)
+        return np.arange(self._count)
+
+    def _ivf_is_stale(self, nlist: int) -> bool:
+        """IVFを（再）構築すべきか（未構築で十分な件数がある、または構築時から倍増した）."""
+        if self._ivf is None:
+            return len(self) >= nlist * IVF_MIN_POINTS_PER_LIST
+        return len(self) > self._ivf.built_rows * 2
+
+    def _scope_mask(
+        self,
+        rows: npt.NDArray[np.intp],
+        agent_id: str | None,
+        recurring_meeting_ids: Sequence[str] | None,
+    ) -> npt.NDArray[np.bool_] | None:
+        """エージェント/定例MTGによる絞り込みマスク（絞り込みなしの場合はNone）."""
+        if agent_id is None and not recurring_meeting_ids:
+            return None
+        mask = np.zeros(len(rows), dtype=bool)
+        agent_code = self._codes.get(agent_id) if agent_id is not None else None
+        if agent_code is not None:
+            mask |= self._agent_codes[rows] == agent_code
+        meeting_codes = [self._codes[m] for m in recurring_meeting_ids or [] if m in self._codes]
+        if meeting_codes:
+            mask |= np.isin(self._meeting_codes[rows], meeting_codes)
+        return mask
+
+    def _flush_log(self, entries: list[dict[str, Any]]) -> None:
+        """操作ログを追記し、行列をディスクに書き出す."""
+        if self.directory is None or not entries:
+            return
+        self.flush()
+        with (self.directory / LOG_FILENAME).open("a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _load(self, directory: Path) -> None:
+        """ディレクトリの行列とログから状態を復元する."""
+        path = directory / VECTORS_FILENAME
+        log_path = directory / LOG_FILENAME
+
+        existing = np.load(path, mmap_mode="r+")
+        if existing.ndim != 2 or existing.shape[1] != self.dimensions:
+            raise ValueError(f"Vector store at {directory} has shape {existing.shape}")
+        self._matrix = existing
+        capacity = existing.shape[0]
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._user_codes = np.full(capacity, NO_CODE, dtype=np.int32)
+        self._agent_codes = np.full(capacity, NO_CODE, dtype=np.int32)
+        self._meeting_codes = np.full(capacity, NO_CODE, dtype=np.int32)
+
+        with log_path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry["op"] == "delete":
+                    self._remove(entry["key"])
+                    continue
+                row = int(entry["row"])
+                if row >= capacity:
+                    # 行列の書き出し前に中断された追加は捨てる
+                    logger.warning("Skipping vector store log entry beyond capacity: row %d", row)
+                    continue
+                self._remove(entry["key"])
+                self._set_row(row, entry["key"], entry["user_id"], entry["agent_id"], entry["recurring_meeting_id"])
+                if entry.get("payload") is not None:
+                    self._payloads[entry["key"]] = entry["payload"]
+                self._count = max(self._count, row + 1)
@@ -156,6 +156,32 @@ class SlackClient:
             logger.error("Failed to get messages: %s", e)
             raise
 
+    def get_latest_message_ts(self, channel_id: str) -> str | None:
+        """チャンネルの最新メッセージのタイムスタンプを取得する（1件だけ取得する）.
+
+        最新メッセージのスレッドに返信があれば、最新の返信のタイムスタンプを返す。
+        それより前のメッセージへの返信は反映されない。
+
+        Args:
+            channel_id: Slack channel ID.
+
+        Returns:
+            Latest message ts, or None if the channel has no messages.
+
+        Raises:
+            SlackApiError: If API call fails.
+        """
+        try:
+            result = self.client.conversations_history(channel=channel_id, limit=1)
+            raw_messages: list[dict[str, str]] = result.get("messages", [])
+            if not raw_messages:
+                return None
+            latest = raw_messages[0]
+            return max(latest["ts"], latest.get("latest_reply") or latest["ts"], key=float)
+        except SlackApiError as e:
+            logger.error("Failed to get latest message: %s", e)
+            raise
+
     def get_thread_replies(
         self,
         channel_id: str,
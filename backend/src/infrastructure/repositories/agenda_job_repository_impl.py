@@ -0,0 +1,196 @@
+"""AgendaJob repository implementation using Supabase.
+
+Infrastructure layer implementation of AgendaJobRepository interface.
+Following ADR-0001 clean architecture principles.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+from uuid import UUID
+
+from supabase import Client
+
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStage, AgendaJobStatus
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
+
+# エンティティに必要な列のみ取得する
+AGENDA_JOB_COLUMNS = ", ".join(
+    (
+        "id",
+        "user_id",
+        "agent_id",
+        "status",
+        "stage",
+        "attempts",
+        "max_attempts",
+        "run_after",
+        "agenda_id",
+        "result",
+        "error",
+        "created_at",
+        "updated_at",
+        "finished_at",
+        "recurring_meeting_id",
+        "target_date",
+        "input_fingerprint",
+        "force",
+    )
+)
+
+
+def _parse_datetime(value: object) -> datetime:
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+class AgendaJobRepositoryImpl(AgendaJobRepository):
+    """アジェンダ生成ジョブリポジトリのSupabase実装.
+
+    ジョブの取得はclaim_agenda_job関数（FOR UPDATE SKIP LOCKED）で行い、
+    複数のワーカーが同じジョブを実行しないようにする。
+    入力が同じジョブの登録はenqueue_agenda_job関数で1件にまとめる。
+    """
+
+    def __init__(self, client: Client) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            client: Supabaseクライアントインスタンス.
+        """
+        self._client = client
+
+    async def create(self, job: AgendaJob) -> AgendaJob:
+        """ジョブを登録する."""
+        self._client.table("agenda_jobs").insert(self._to_dict(job)).execute()
+        return job
+
+    async def create_or_get_active(self, job: AgendaJob) -> AgendaJob:
+        """ジョブを登録する（入力が同じ実行待ち・実行中のジョブがあれば、実行予定を早めてそれを返す）."""
+        result = self._client.rpc("enqueue_agenda_job", {"p_job": self._to_dict(job)}).execute()
+        rows = cast(list[dict[str, Any]], result.data or [])
+        return self._to_entity(rows[0]) if rows else job
+
+    async def get_by_id(self, job_id: UUID, user_id: UUID) -> AgendaJob | None:
+        """IDでジョブを取得する."""
+        result = (
+            self._client.table("agenda_jobs")
+            .select(AGENDA_JOB_COLUMNS)
+            .eq("id", str(job_id))
+            .eq("user_id", str(user_id))
+            .maybe_single()
+            .execute()
+        )
+
+        if result is None or not result.data:
+            return None
+
+        data: dict[str, Any] = dict(result.data)  # type: ignore[arg-type]
+        return self._to_entity(data)
+
+    async def get_active_recurring_meeting_ids(self, recurring_meeting_ids: list[UUID]) -> set[UUID]:
+        """実行待ち・実行中の事前生成ジョブがある定例MTGのIDを返す."""
+        if not recurring_meeting_ids:
+            return set()
+        result = (
+            self._client.table("agenda_jobs")
+            .select("recurring_meeting_id")
+            .in_("recurring_meeting_id", [str(meeting_id) for meeting_id in recurring_meeting_ids])
+            .in_("status", [AgendaJobStatus.QUEUED.value, AgendaJobStatus.RUNNING.value])
+            .execute()
+        )
+        rows = cast(list[dict[str, Any]], result.data)
+        return {UUID(str(row["recurring_meeting_id"])) for row in rows}
+
+    async def claim_next(self, worker_id: str, stale_after: timedelta) -> AgendaJob | None:
+        """実行できる次のジョブを取得して実行中にする."""
+        params = {"p_worker_id": worker_id, "p_stale_after_seconds": int(stale_after.total_seconds())}
+        result = self._client.rpc("claim_agenda_job", params).execute()
+        rows = cast(list[dict[str, Any]], result.data or [])
+        return self._to_entity(rows[0]) if rows else None
+
+    async def update_stage(self, job_id: UUID, worker_id: str, stage: AgendaJobStage) -> None:
+        """実行中のジョブの段階を記録する."""
+        self._update(job_id, worker_id, {"stage": stage.value})
+
+    async def mark_succeeded(self, job_id: UUID, worker_id: str, agenda_id: UUID, result: dict[str, Any]) -> None:
+        """ジョブを成功にする."""
+        now = datetime.now(UTC).isoformat()
+        self._update(
+            job_id,
+            worker_id,
+            {
+                "status": AgendaJobStatus.SUCCEEDED.value,
+                "agenda_id": str(agenda_id),
+                "result": result,
+                "error": None,
+                "finished_at": now,
+            },
+        )
+
+    async def mark_failed(self, job_id: UUID, worker_id: str, error: str) -> None:
+        """ジョブを失敗にする（リトライしない）."""
+        now = datetime.now(UTC).isoformat()
+        self._update(job_id, worker_id, {"status": AgendaJobStatus.FAILED.value, "error": error, "finished_at": now})
+
+    async def schedule_retry(self, job_id: UUID, worker_id: str, error: str, run_after: datetime) -> None:
+        """失敗したジョブをキューに戻す."""
+        self._update(
+            job_id,
+            worker_id,
+            {
+                "status": AgendaJobStatus.QUEUED.value,
+                "stage": None,
+                "error": error,
+                "run_after": run_after.isoformat(),
+                "locked_by": None,
+            },
+        )
+
+    def _update(self, job_id: UUID, worker_id: str, values: dict[str, Any]) -> None:
+        """ワーカーが取得中のジョブを更新する（updated_atはワーカーの生存確認にも使う）.
+
+        期限切れで別のワーカーに再取得されたジョブは、locked_byが変わっているため更新しない。
+        """
+        values = {**values, "updated_at": datetime.now(UTC).isoformat()}
+        (self._client.table("agenda_jobs").update(values).eq("id", str(job_id)).eq("locked_by", worker_id).execute())
+
+    def _to_dict(self, job: AgendaJob) -> dict[str, Any]:
+        """エンティティをDB用辞書に変換する."""
+        return {
+            "id": str(job.id),
+            "user_id": str(job.user_id),
+            "agent_id": str(job.agent_id),
+            "status": job.status.value,
+            "stage": job.stage.value if job.stage else None,
+            "attempts": job.attempts,
+            "max_attempts": job.max_attempts,
+            "run_after": job.run_after.isoformat(),
+            "created_at": job.created_at.isoformat(),
+            "updated_at": job.updated_at.isoformat(),
+            "recurring_meeting_id": str(job.recurring_meeting_id) if job.recurring_meeting_id else None,
+            "target_date": job.target_date.isoformat() if job.target_date else None,
+            "input_fingerprint": job.input_fingerprint,
+            "force": job.force,
+        }
+
+    def _to_entity(self, data: dict[str, Any]) -> AgendaJob:
+        """DB結果をエンティティに変換する."""
+        return AgendaJob(
+            id=UUID(str(data["id"])),
+            user_id=UUID(str(data["user_id"])),
+            agent_id=UUID(str(data["agent_id"])),
+            status=AgendaJobStatus(str(data["status"])),
+            attempts=int(data["attempts"]),
+            max_attempts=int(data["max_attempts"]),
+            run_after=_parse_datetime(data["run_after"]),
+            created_at=_parse_datetime(data["created_at"]),
+            updated_at=_parse_datetime(data["updated_at"]),
+            stage=AgendaJobStage(data["stage"]) if data.get("stage") else None,
+            agenda_id=UUID(str(data["agenda_id"])) if data.get("agenda_id") else None,
+            result=data.get("result"),
+            error=data.get("error"),
+            finished_at=_parse_datetime(data["finished_at"]) if data.get("finished_at") else None,
+            recurring_meeting_id=UUID(str(data["recurring_meeting_id"])) if data.get("recurring_meeting_id") else None,
+            target_date=_parse_datetime(data["target_date"]) if data.get("target_date") else None,
+            input_fingerprint=data.get("input_fingerprint"),
+            force=bool(data.get("force", False)),
+        )
@@ -11,7 +11,9 @@ from uuid import UUID
 from supabase import Client
 
 from src.domain.entities.agenda import Agenda
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.repositories.agenda_repository import AgendaRepository
+from src.infrastructure.repositories.keyset_pagination import order_by_keyset
 
 
 class AgendaRepositoryImpl(AgendaRepository):
@@ -38,6 +40,7 @@ class AgendaRepositoryImpl(AgendaRepository):
             "source_knowledge_id": str(agenda.source_knowledge_id) if agenda.source_knowledge_id else None,
             "generated_at": agenda.generated_at.isoformat(),
             "created_at": agenda.created_at.isoformat(),
+            "input_fingerprint": agenda.input_fingerprint,
         }
         self._client.table("agendas").insert(data).execute()
         return agenda
@@ -67,18 +70,14 @@ class AgendaRepositoryImpl(AgendaRepository):
         agent_id: UUID,
         user_id: UUID,
         limit: int | None = None,
+        cursor: PageCursor | None = None,
     ) -> list[Agenda]:
         """エージェントのアジェンダ一覧を取得する."""
         if self._client is None:
             return []
 
-        query = (
-            self._client.table("agendas")
-            .select("*")
-            .eq("agent_id", str(agent_id))
-            .eq("user_id", str(user_id))
-            .order("generated_at", desc=True)
-        )
+        query = self._client.table("agendas").select("*").eq("agent_id", str(agent_id)).eq("user_id", str(user_id))
+        query = order_by_keyset(query, "generated_at", cursor)
 
         if limit is not None:
             query = query.limit(limit)
@@ -130,4 +129,5 @@ class AgendaRepositoryImpl(AgendaRepository):
                 if updated_at_str and isinstance(updated_at_str, str)
                 else None
             ),
+            input_fingerprint=data.get("input_fingerprint"),
         )
@@ -1,5 +1,6 @@
 """DictionaryRepository implementation using Supabase."""
 
+import hashlib
 from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
@@ -7,7 +8,9 @@ from uuid import UUID
 from supabase import Client
 
 from src.domain.entities.dictionary_entry import DictionaryEntry
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.repositories.dictionary_repository import DictionaryRepository
+from src.infrastructure.repositories.keyset_pagination import order_by_keyset
 
 
 class DictionaryRepositoryImpl(DictionaryRepository):
@@ -54,17 +57,38 @@ class DictionaryRepositoryImpl(DictionaryRepository):
 
         return self._to_entity(cast(dict[str, Any], result.data))
 
-    async def get_all(self, user_id: UUID) -> list[DictionaryEntry]:
-        """Retrieve all dictionary entries for a user."""
+    async def get_all(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[DictionaryEntry]:
+        """Retrieve all dictionary entries for a user (newest first)."""
+        query = order_by_keyset(
+            self.client.table("dictionary_entries").select("*").eq("user_id", str(user_id)),
+            "created_at",
+            cursor,
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        result = query.execute()
+
+        return [self._to_entity(cast(dict[str, Any], row)) for row in result.data]
+
+    async def get_version(self, user_id: UUID) -> str:
+        """Return a version string that changes whenever the user's dictionary changes."""
         result = (
             self.client.table("dictionary_entries")
-            .select("*")
+            .select("id, created_at, updated_at")
             .eq("user_id", str(user_id))
-            .order("created_at", desc=True)
+            .order("id")
             .execute()
         )
-
-        return [self._to_entity(cast(dict[str, Any], row)) for row in result.data]
+        rows = cast(list[dict[str, Any]], result.data)
+        digest = hashlib.sha256()
+        for row in rows:
+            digest.update(f"{row['id']}:{row['created_at']}:{row.get('updated_at')}\n".encode())
+        return f"{len(rows)}:{digest.hexdigest()}"
 
     async def update(self, entry: DictionaryEntry) -> DictionaryEntry:
         """Update an existing dictionary entry."""
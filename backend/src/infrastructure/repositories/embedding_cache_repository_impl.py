@@ -0,0 +1,72 @@
+"""EmbeddingCacheRepository implementation using Supabase.
+
+Infrastructure layer implementation of EmbeddingCacheRepository interface.
+Following ADR-0001 clean architecture principles.
+"""
+
+from collections.abc import Mapping
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+from supabase import Client
+
+from src.domain.repositories.embedding_cache_repository import EmbeddingCacheRepository
+
+# PostgRESTのURL長制限を避けるためのin句のバッチサイズ
+IN_FILTER_BATCH_SIZE = 200
+
+
+class EmbeddingCacheRepositoryImpl(EmbeddingCacheRepository):
+    """埋め込みキャッシュリポジトリのSupabase実装."""
+
+    def __init__(self, client: Client) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            client: Supabaseクライアントインスタンス
+        """
+        self.client = client
+
+    async def get_many(
+        self,
+        content_hashes: list[str],
+        dimensions: int,
+    ) -> dict[str, npt.NDArray[np.float32]]:
+        """ハッシュに対応するキャッシュ済みベクトルを取得する."""
+        cached: dict[str, npt.NDArray[np.float32]] = {}
+        for start in range(0, len(content_hashes), IN_FILTER_BATCH_SIZE):
+            batch = content_hashes[start : start + IN_FILTER_BATCH_SIZE]
+            result = (
+                self.client.table("embedding_cache")
+                .select("content_hash, embedding")
+                .eq("dimensions", dimensions)
+                .in_("content_hash", batch)
+                .execute()
+            )
+            for row in cast(list[dict[str, Any]], result.data):
+                cached[str(row["content_hash"])] = np.asarray(row["embedding"], dtype=np.float32)
+        return cached
+
+    async def put_many(
+        self,
+        embeddings: Mapping[str, npt.NDArray[np.float32]],
+        dimensions: int,
+    ) -> None:
+        """ベクトルをキャッシュに保存する（既存のハッシュは上書きしない）."""
+        if not embeddings:
+            return
+
+        rows = [
+            {
+                "content_hash": content_hash,
+                "dimensions": dimensions,
+                "embedding": vector.tolist(),
+            }
+            for content_hash, vector in embeddings.items()
+        ]
+        (
+            self.client.table("embedding_cache")
+            .upsert(rows, on_conflict="content_hash,dimensions", ignore_duplicates=True)
+            .execute()
+        )
@@ -0,0 +1,155 @@
+"""EmbeddingRepository implementation using Supabase (pgvector).
+
+Infrastructure layer implementation of EmbeddingRepository interface.
+Following ADR-0001 clean architecture principles.
+"""
+
+from datetime import datetime
+from typing import Any, cast
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+from supabase import Client
+
+from src.domain.entities.embedding_chunk import (
+    ChunkSourceType,
+    EmbeddingChunk,
+    RetrievedChunk,
+)
+from src.domain.repositories.embedding_repository import EmbeddingRepository
+
+# PostgRESTのURL長制限を避けるためのin句のバッチサイズ
+IN_FILTER_BATCH_SIZE = 200
+
+
+class EmbeddingRepositoryImpl(EmbeddingRepository):
+    """埋め込みインデックスリポジトリのSupabase（pgvector）実装."""
+
+    def __init__(self, client: Client) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            client: Supabaseクライアントインスタンス
+        """
+        self.client = client
+
+    async def upsert_chunks(
+        self,
+        chunks: list[EmbeddingChunk],
+        embeddings: npt.NDArray[np.float32],
+    ) -> None:
+        """チャンクと埋め込みベクトルを登録する."""
+        if not chunks:
+            return
+
+        rows = [self._to_row(chunk, embedding) for chunk, embedding in zip(chunks, embeddings, strict=True)]
+        (
+            self.client.table("embedding_chunks")
+            .upsert(rows, on_conflict="user_id,source_type,source_id,chunk_index")
+            .execute()
+        )
+
+    async def delete_by_source(
+        self,
+        user_id: UUID,
+        source_type: ChunkSourceType,
+        source_id: str,
+    ) -> int:
+        """元データに紐づくチャンクを全て削除する."""
+        result = (
+            self.client.table("embedding_chunks")
+            .delete()
+            .eq("user_id", str(user_id))
+            .eq("source_type", source_type.value)
+            .eq("source_id", source_id)
+            .execute()
+        )
+        return len(result.data)
+
+    async def get_indexed_source_ids(
+        self,
+        user_id: UUID,
+        source_type: ChunkSourceType,
+        source_ids: list[str],
+    ) -> set[str]:
+        """指定した元データのうち、既にインデックス済みのIDを取得する."""
+        indexed: set[str] = set()
+        for start in range(0, len(source_ids), IN_FILTER_BATCH_SIZE):
+            batch = source_ids[start : start + IN_FILTER_BATCH_SIZE]
+            result = (
+                self.client.table("embedding_chunks")
+                .select("source_id")
+                .eq("user_id", str(user_id))
+                .eq("source_type", source_type.value)
+                .in_("source_id", batch)
+                .execute()
+            )
+            indexed.update(str(cast(dict[str, Any], row)["source_id"]) for row in result.data)
+        return indexed
+
+    async def search(
+        self,
+        user_id: UUID,
+        query_embedding: npt.NDArray[np.float32],
+        top_k: int,
+        agent_id: UUID | None = None,
+        recurring_meeting_ids: list[UUID] | None = None,
+    ) -> list[RetrievedChunk]:
+        """クエリベクトルに類似するチャンクを検索する（match_embedding_chunks RPC）."""
+        params: dict[str, Any] = {
+            "query_embedding": _to_vector_literal(query_embedding),
+            "p_user_id": str(user_id),
+            "p_agent_id": str(agent_id) if agent_id else None,
+            "p_recurring_meeting_ids": [str(m) for m in recurring_meeting_ids] if recurring_meeting_ids else None,
+            "match_count": top_k,
+        }
+        result = self.client.rpc("match_embedding_chunks", params).execute()
+        rows = cast(list[dict[str, Any]], result.data or [])
+        return [RetrievedChunk(chunk=self._to_entity(row), score=float(row["similarity"])) for row in rows]
+
+    def _to_row(self, chunk: EmbeddingChunk, embedding: npt.NDArray[np.float32]) -> dict[str, Any]:
+        """エンティティをDB用辞書に変換する."""
+        return {
+            "id": str(chunk.id),
+            "user_id": str(chunk.user_id),
+            "agent_id": str(chunk.agent_id) if chunk.agent_id else None,
+            "recurring_meeting_id": str(chunk.recurring_meeting_id) if chunk.recurring_meeting_id else None,
+            "source_type": chunk.source_type.value,
+            "source_id": chunk.source_id,
+            "chunk_index": chunk.chunk_index,
+            "content": chunk.content,
+            "speaker": chunk.speaker,
+            "entry_timestamp": chunk.timestamp,
+            "source_date": chunk.source_date.isoformat() if chunk.source_date else None,
+            "embedding": _to_vector_literal(embedding),
+            "created_at": chunk.created_at.isoformat(),
+        }
+
+    def _to_entity(self, data: dict[str, Any]) -> EmbeddingChunk:
+        """DB結果をエンティティに変換する."""
+        agent_id_raw = data.get("agent_id")
+        recurring_meeting_id_raw = data.get("recurring_meeting_id")
+        source_date_raw = data.get("source_date")
+
+        return EmbeddingChunk(
+            id=UUID(str(data["id"])),
+            user_id=UUID(str(data["user_id"])),
+            source_type=ChunkSourceType(str(data["source_type"])),
+            source_id=str(data["source_id"]),
+            chunk_index=int(data["chunk_index"]),
+            content=str(data["content"]),
+            created_at=datetime.fromisoformat(str(data["created_at"]).replace("Z", "+00:00")),
+            agent_id=UUID(str(agent_id_raw)) if agent_id_raw else None,
+            recurring_meeting_id=UUID(str(recurring_meeting_id_raw)) if recurring_meeting_id_raw else None,
+            source_date=(
+                datetime.fromisoformat(str(source_date_raw).replace("Z", "+00:00")) if source_date_raw else None
+            ),
+            speaker=data.get("speaker"),
+            timestamp=data.get("entry_timestamp"),
+        )
+
+
+def _to_vector_literal(embedding: npt.NDArray[np.float32]) -> str:
+    """埋め込みベクトルをpgvectorのテキスト表現に変換する."""
+    return "[" + ",".join(repr(x) for x in embedding.tolist()) + "]"
@@ -0,0 +1,118 @@
+"""GeneratedAgenda repository implementation using Supabase.
+
+Infrastructure layer implementation of GeneratedAgendaRepository interface.
+Following ADR-0001 clean architecture principles.
+"""
+
+from datetime import UTC, datetime
+from typing import Any, cast
+from uuid import UUID
+
+from supabase import Client
+
+from src.domain.entities.generated_agenda import AgendaSource, AgendaStatus, GeneratedAgenda
+from src.domain.repositories.generated_agenda_repository import GeneratedAgendaRepository
+
+# エンティティに必要な列のみ取得する
+GENERATED_AGENDA_COLUMNS = ", ".join(
+    (
+        "id",
+        "recurring_meeting_id",
+        "target_date",
+        "agenda_content",
+        "sources",
+        "status",
+        "delivered_via",
+        "agenda_id",
+        "input_fingerprint",
+        "created_at",
+        "updated_at",
+    )
+)
+
+
+def _parse_datetime(value: object) -> datetime:
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+class GeneratedAgendaRepositoryImpl(GeneratedAgendaRepository):
+    """事前生成アジェンダリポジトリのSupabase実装.
+
+    事前生成はユーザーコンテキストなしで行うため、サービスキーのクライアントで使う。
+    ユーザーの操作で使う場合は、呼び出し側でユーザーの定例MTGのIDだけを渡す。
+    """
+
+    def __init__(self, client: Client) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            client: Supabaseクライアントインスタンス.
+        """
+        self._client = client
+
+    async def get_upcoming(self, recurring_meeting_ids: list[UUID], since: datetime) -> list[GeneratedAgenda]:
+        """指定日時以降の開催回の事前生成アジェンダを取得する."""
+        if not recurring_meeting_ids:
+            return []
+        result = (
+            self._client.table("generated_agendas")
+            .select(GENERATED_AGENDA_COLUMNS)
+            .in_("recurring_meeting_id", [str(meeting_id) for meeting_id in recurring_meeting_ids])
+            .gte("target_date", since.isoformat())
+            .order("target_date")
+            .execute()
+        )
+        return [self._to_entity(cast(dict[str, Any], row)) for row in result.data]
+
+    async def upsert(self, agenda: GeneratedAgenda) -> GeneratedAgenda:
+        """開催回の事前生成アジェンダを作成または置き換える.
+
+        (recurring_meeting_id, target_date) で突き合わせ、既存の行はIDと作成日時を引き継ぐ。
+        """
+        result = (
+            self._client.table("generated_agendas")
+            .upsert(self._to_dict(agenda), on_conflict="recurring_meeting_id,target_date")
+            .execute()
+        )
+        rows = cast(list[dict[str, Any]], result.data or [])
+        return self._to_entity(rows[0]) if rows else agenda
+
+    def _to_dict(self, agenda: GeneratedAgenda) -> dict[str, Any]:
+        """エンティティをDB用辞書に変換する（IDと作成日時はDBの既定値・既存の値を使う）."""
+        return {
+            "recurring_meeting_id": str(agenda.recurring_meeting_id),
+            "target_date": agenda.target_date.isoformat(),
+            "agenda_content": agenda.agenda_content,
+            "sources": [
+                {"source_type": s.source_type, "source_id": s.source_id, "summary": s.summary} for s in agenda.sources
+            ],
+            "status": agenda.status.value,
+            "delivered_via": agenda.delivered_via,
+            "agenda_id": str(agenda.agenda_id) if agenda.agenda_id else None,
+            "input_fingerprint": agenda.input_fingerprint,
+            "updated_at": (agenda.updated_at or datetime.now(UTC)).isoformat(),
+        }
+
+    def _to_entity(self, data: dict[str, Any]) -> GeneratedAgenda:
+        """DB結果をエンティティに変換する."""
+        return GeneratedAgenda(
+            id=UUID(str(data["id"])),
+            recurring_meeting_id=UUID(str(data["recurring_meeting_id"])),
+            target_date=_parse_datetime(data["target_date"]),
+            agenda_content=dict(data.get("agenda_content") or {}),
+            sources=[
+                AgendaSource(
+                    source_type=str(s.get("source_type", "")),
+                    source_id=str(s.get("source_id", "")),
+                    summary=str(s.get("summary", "")),
+                )
+                for s in (data.get("sources") or [])
+                if isinstance(s, dict)
+            ],
+            status=AgendaStatus(str(data["status"])),
+            delivered_via=data.get("delivered_via"),
+            created_at=_parse_datetime(data["created_at"]),
+            updated_at=_parse_datetime(data["updated_at"]) if data.get("updated_at") else None,
+            agenda_id=UUID(str(data["agenda_id"])) if data.get("agenda_id") else None,
+            input_fingerprint=data.get("input_fingerprint"),
+        )
@@ -122,6 +122,24 @@ class GoogleIntegrationRepositoryImpl(GoogleIntegrationRepository):
         )
         return integration
 
+    async def update_calendar_sync_token(
+        self,
+        integration_id: UUID,
+        user_id: UUID,
+        sync_token: str | None,
+    ) -> None:
+        """Google CalendarのsyncTokenを保存する."""
+        if self._client is None:
+            return
+
+        (
+            self._client.table("google_integrations")
+            .update({"calendar_sync_token": sync_token})
+            .eq("id", str(integration_id))
+            .eq("user_id", str(user_id))
+            .execute()
+        )
+
     async def delete(self, integration_id: UUID, user_id: UUID) -> bool:
         """Google連携を削除する."""
         if self._client is None:
@@ -159,4 +177,5 @@ class GoogleIntegrationRepositoryImpl(GoogleIntegrationRepository):
                 if updated_at_str and isinstance(updated_at_str, str)
                 else None
             ),
+            calendar_sync_token=data.get("calendar_sync_token"),
         )
@@ -0,0 +1,33 @@
+"""Keyset pagination helpers for Supabase (PostgREST) queries.
+
+Following ADR-0001 clean architecture principles.
+"""
+
+from typing import TypeVar
+
+from postgrest import SyncSelectRequestBuilder
+
+from src.domain.entities.page_cursor import PageCursor
+
+_Query = TypeVar("_Query", bound=SyncSelectRequestBuilder)
+
+
+def order_by_keyset(query: _Query, column: str, cursor: PageCursor | None = None) -> _Query:  # noqa: UP047
+    """(column, id) の降順に並べ、カーソルより後ろの行に絞り込む.
+
+    (column, id) < (cursor.sort_value, cursor.id) をORフィルタで表す。
+    (column, id) の複合インデックスがあれば、ページの深さによらず
+    インデックスの範囲走査だけで済む。
+
+    Args:
+        query: select済みのクエリ
+        column: 並び順の列（日付）
+        cursor: 前ページのカーソル（Noneの場合は先頭ページ）
+
+    Returns:
+        並び順・絞り込みを追加したクエリ
+    """
+    if cursor is not None:
+        value = cursor.sort_value.isoformat()
+        query = query.or_(f'{column}.lt."{value}",and({column}.eq."{value}",id.lt.{cursor.id})')
+    return query.order(column, desc=True).order("id", desc=True)
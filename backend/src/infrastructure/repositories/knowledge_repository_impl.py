@@ -11,7 +11,12 @@ from uuid import UUID
 from supabase import Client
 
 from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.repositories.knowledge_repository import KnowledgeRepository
+from src.infrastructure.repositories.keyset_pagination import order_by_keyset
+
+# エンティティに必要な列のみ取得する
+KNOWLEDGE_COLUMNS = "id, agent_id, user_id, original_text, normalized_text, meeting_date, created_at, updated_at"
 
 
 class KnowledgeRepositoryImpl(KnowledgeRepository):
@@ -43,7 +48,7 @@ class KnowledgeRepositoryImpl(KnowledgeRepository):
         """IDでナレッジを取得する."""
         result = (
             self.client.table("knowledge")
-            .select("*")
+            .select(KNOWLEDGE_COLUMNS)
             .eq("id", str(knowledge_id))
             .eq("user_id", str(user_id))
             .maybe_single()
@@ -60,15 +65,16 @@ class KnowledgeRepositoryImpl(KnowledgeRepository):
         agent_id: UUID,
         user_id: UUID,
         limit: int | None = None,
+        cursor: PageCursor | None = None,
     ) -> list[Knowledge]:
         """エージェントのナレッジ一覧を取得する."""
         query = (
             self.client.table("knowledge")
-            .select("*")
+            .select(KNOWLEDGE_COLUMNS)
             .eq("agent_id", str(agent_id))
             .eq("user_id", str(user_id))
-            .order("meeting_date", desc=True)
         )
+        query = order_by_keyset(query, "meeting_date", cursor)
 
         if limit is not None:
             query = query.limit(limit)
@@ -84,7 +90,7 @@ class KnowledgeRepositoryImpl(KnowledgeRepository):
         """エージェントの最新ナレッジを取得する."""
         result = (
             self.client.table("knowledge")
-            .select("*")
+            .select(KNOWLEDGE_COLUMNS)
             .eq("agent_id", str(agent_id))
             .eq("user_id", str(user_id))
             .order("meeting_date", desc=True)
@@ -0,0 +1,174 @@
+"""EmbeddingRepository implementation backed by the local vector store.
+
+Fallback for environments without pgvector (local development, single node, tests).
+Following ADR-0001 clean architecture principles.
+"""
+
+import threading
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+
+from src.config import settings
+from src.domain.entities.embedding_chunk import (
+    ChunkSourceType,
+    EmbeddingChunk,
+    RetrievedChunk,
+)
+from src.domain.repositories.embedding_repository import EmbeddingRepository
+from src.infrastructure.external.local_vector_store import LocalVectorStore, VectorRecord
+
+SourceKey = tuple[str, str, str]
+
+
+class LocalEmbeddingRepository(EmbeddingRepository):
+    """埋め込みインデックスリポジトリのローカルベクトルストア実装.
+
+    チャンクのエンティティはストアのペイロードとして保存し、
+    元データ単位の削除に使うキーの索引はプロセス内に保持する。
+    """
+
+    def __init__(self, store: LocalVectorStore) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            store: ベクトルストア（ディレクトリ指定時は既存データを引き継ぐ）
+        """
+        self.store = store
+        self._lock = threading.Lock()
+        self._source_keys: dict[SourceKey, set[str]] = {}
+        for key, payload in store.items():
+            self._source_keys.setdefault(_source_key_of(payload), set()).add(key)
+
+    async def upsert_chunks(
+        self,
+        chunks: list[EmbeddingChunk],
+        embeddings: npt.NDArray[np.float32],
+    ) -> None:
+        """チャンクと埋め込みベクトルを登録する."""
+        records = [
+            VectorRecord(
+                key=_chunk_key(chunk),
+                vector=embedding,
+                user_id=str(chunk.user_id),
+                agent_id=str(chunk.agent_id) if chunk.agent_id else None,
+                recurring_meeting_id=str(chunk.recurring_meeting_id) if chunk.recurring_meeting_id else None,
+                payload=_to_payload(chunk),
+            )
+            for chunk, embedding in zip(chunks, embeddings, strict=True)
+        ]
+        with self._lock:
+            self.store.add(records)
+            for record in records:
+                if record.payload is not None:
+                    self._source_keys.setdefault(_source_key_of(record.payload), set()).add(record.key)
+
+    async def delete_by_source(
+        self,
+        user_id: UUID,
+        source_type: ChunkSourceType,
+        source_id: str,
+    ) -> int:
+        """元データに紐づくチャンクを全て削除する."""
+        with self._lock:
+            keys = self._source_keys.pop((str(user_id), source_type.value, source_id), set())
+            return self.store.delete(sorted(keys))
+
+    async def get_indexed_source_ids(
+        self,
+        user_id: UUID,
+        source_type: ChunkSourceType,
+        source_ids: list[str],
+    ) -> set[str]:
+        """指定した元データのうち、既にインデックス済みのIDを取得する."""
+        with self._lock:
+            return {s for s in source_ids if self._source_keys.get((str(user_id), source_type.value, s))}
+
+    async def search(
+        self,
+        user_id: UUID,
+        query_embedding: npt.NDArray[np.float32],
+        top_k: int,
+        agent_id: UUID | None = None,
+        recurring_meeting_ids: list[UUID] | None = None,
+    ) -> list[RetrievedChunk]:
+        """クエリベクトルに類似するチャンクを検索する."""
+        hits = self.store.search(
+            query_embedding,
+            top_k,
+            str(user_id),
+            agent_id=str(agent_id) if agent_id else None,
+            recurring_meeting_ids=[str(m) for m in recurring_meeting_ids or []],
+        )
+        return [RetrievedChunk(chunk=_from_payload(hit.payload), score=hit.score) for hit in hits]
+
+
+def _chunk_key(chunk: EmbeddingChunk) -> str:
+    """チャンクの一意キーを返す."""
+    return f"{chunk.user_id}|{chunk.source_type.value}|{chunk.source_id}|{chunk.chunk_index}"
+
+
+def _source_key_of(payload: dict[str, Any]) -> SourceKey:
+    """ペイロードから元データの索引キーを返す."""
+    return (str(payload["user_id"]), str(payload["source_type"]), str(payload["source_id"]))
+
+
+def _to_payload(chunk: EmbeddingChunk) -> dict[str, Any]:
+    """エンティティをストアのペイロードに変換する."""
+    return {
+        "id": str(chunk.id),
+        "user_id": str(chunk.user_id),
+        "agent_id": str(chunk.agent_id) if chunk.agent_id else None,
+        "recurring_meeting_id": str(chunk.recurring_meeting_id) if chunk.recurring_meeting_id else None,
+        "source_type": chunk.source_type.value,
+        "source_id": chunk.source_id,
+        "chunk_index": chunk.chunk_index,
+        "content": chunk.content,
+        "speaker": chunk.speaker,
+        "timestamp": chunk.timestamp,
+        "source_date": chunk.source_date.isoformat() if chunk.source_date else None,
+        "created_at": chunk.created_at.isoformat(),
+    }
+
+
+def _from_payload(payload: dict[str, Any]) -> EmbeddingChunk:
+    """ストアのペイロードをエンティティに変換する."""
+    agent_id_raw = payload.get("agent_id")
+    recurring_meeting_id_raw = payload.get("recurring_meeting_id")
+    source_date_raw = payload.get("source_date")
+
+    return EmbeddingChunk(
+        id=UUID(str(payload["id"])),
+        user_id=UUID(str(payload["user_id"])),
+        source_type=ChunkSourceType(str(payload["source_type"])),
+        source_id=str(payload["source_id"]),
+        chunk_index=int(payload["chunk_index"]),
+        content=str(payload["content"]),
+        created_at=datetime.fromisoformat(str(payload["created_at"])),
+        agent_id=UUID(str(agent_id_raw)) if agent_id_raw else None,
+        recurring_meeting_id=UUID(str(recurring_meeting_id_raw)) if recurring_meeting_id_raw else None,
+        source_date=datetime.fromisoformat(str(source_date_raw)) if source_date_raw else None,
+        speaker=payload.get("speaker"),
+        timestamp=payload.get("timestamp"),
+    )
+
+
+@lru_cache
+def get_local_embedding_repository() -> LocalEmbeddingRepository:
+    """プロセス共有のLocalEmbeddingRepositoryを返す.
+
+    EMBEDDING_INDEX_BACKENDが"local"の場合はEMBEDDING_LOCAL_INDEX_DIRに永続化し、
+    それ以外はメモリのみで保持する。
+    """
+    directory = Path(settings.EMBEDDING_LOCAL_INDEX_DIR) if settings.EMBEDDING_INDEX_BACKEND == "local" else None
+    store = LocalVectorStore(
+        settings.EMBEDDING_DIMENSIONS,
+        directory=directory,
+        ivf_lists=settings.EMBEDDING_LOCAL_IVF_LISTS,
+    )
+    return LocalEmbeddingRepository(store)
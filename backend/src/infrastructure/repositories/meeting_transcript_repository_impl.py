@@ -4,32 +4,102 @@ Infrastructure layer implementation of MeetingTranscriptRepository interface.
 Following ADR-0001 clean architecture principles.
 """
 
+import base64
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
 
 from supabase import Client
 
+from src.config import settings
 from src.domain.entities.meeting_transcript import (
+    MANUAL_CONFIRMATION_THRESHOLD,
     MeetingTranscript,
+    MeetingTranscriptSummary,
     TranscriptEntry,
+    TranscriptEntryTable,
     TranscriptStructuredData,
 )
+from src.domain.entities.page_cursor import PageCursor
 from src.domain.repositories.meeting_transcript_repository import (
     MeetingTranscriptRepository,
 )
+from src.infrastructure.repositories.keyset_pagination import order_by_keyset
+from src.infrastructure.services.transcript_body_codec import (
+    TranscriptBodyCodec,
+    get_transcript_body_codec,
+)
+
+# structured_dataのオフセット形式のバージョン
+STRUCTURED_DATA_OFFSETS_VERSION = 2
+
+# 一覧表示用の列（本文・構造化データを含まない）
+SUMMARY_COLUMNS = ", ".join(
+    (
+        "id",
+        "recurring_meeting_id",
+        "meeting_date",
+        "google_doc_id",
+        "match_confidence",
+        "created_at",
+        "raw_text_size",
+    )
+)
+# 本文（raw_text / raw_text_compressed）を除いた列。本文は参照時に読み込む
+TRANSCRIPT_COLUMNS = f"{SUMMARY_COLUMNS}, structured_data"
+BODY_COLUMNS = "raw_text, raw_text_compressed, raw_text_dictionary_id"
+# 本文を含む列（本文を使う取得はまとめて1回のクエリで読み込む）
+FULL_COLUMNS = f"{TRANSCRIPT_COLUMNS}, {BODY_COLUMNS}"
+
+
+class _BodyCache:
+    """展開済みの本文のLRUキャッシュ（プロセス内で共有）."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._items: OrderedDict[UUID, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: UUID) -> str | None:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: UUID, value: str) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def discard(self, key: UUID) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+
+_body_cache = _BodyCache(settings.TRANSCRIPT_BODY_CACHE_SIZE)
 
 
 class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
     """会議トランスクリプトリポジトリのSupabase実装."""
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, codec: TranscriptBodyCodec | None = None) -> None:
         """リポジトリを初期化する.
 
         Args:
             client: Supabaseクライアントインスタンス
+            codec: 本文の圧縮コーデック（省略時は設定の辞書を使用）
         """
         self.client = client
+        self.codec = codec or get_transcript_body_codec()
 
     async def create(self, transcript: MeetingTranscript) -> MeetingTranscript:
         """トランスクリプトを作成する."""
@@ -38,8 +108,8 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
             "recurring_meeting_id": str(transcript.recurring_meeting_id),
             "meeting_date": transcript.meeting_date.isoformat(),
             "google_doc_id": transcript.google_doc_id,
-            "raw_text": transcript.raw_text,
-            "structured_data": self._serialize_structured_data(transcript.structured_data),
+            **self._serialize_body(transcript.raw_text),
+            "structured_data": self._serialize_structured_data(transcript.structured_data, transcript.raw_text),
             "match_confidence": transcript.match_confidence,
             "created_at": transcript.created_at.isoformat(),
         }
@@ -49,7 +119,11 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
     async def get_by_id(self, transcript_id: UUID) -> MeetingTranscript | None:
         """IDでトランスクリプトを取得する."""
         result = (
-            self.client.table("meeting_transcripts").select("*").eq("id", str(transcript_id)).maybe_single().execute()
+            self.client.table("meeting_transcripts")
+            .select(FULL_COLUMNS)
+            .eq("id", str(transcript_id))
+            .maybe_single()
+            .execute()
         )
 
         if result is None or not result.data:
@@ -61,21 +135,51 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
         self,
         recurring_meeting_id: UUID,
         limit: int | None = None,
+        needs_confirmation_only: bool = False,
+        cursor: PageCursor | None = None,
     ) -> list[MeetingTranscript]:
         """定例MTGのトランスクリプト一覧を取得する."""
         query = (
             self.client.table("meeting_transcripts")
-            .select("*")
+            .select(FULL_COLUMNS)
             .eq("recurring_meeting_id", str(recurring_meeting_id))
-            .order("meeting_date", desc=True)
         )
 
+        if needs_confirmation_only:
+            query = query.lt("match_confidence", MANUAL_CONFIRMATION_THRESHOLD)
+        query = order_by_keyset(query, "meeting_date", cursor)
         if limit is not None:
             query = query.limit(limit)
 
         result = query.execute()
         return [self._to_entity(cast(dict[str, Any], row)) for row in result.data]
 
+    async def get_summaries(
+        self,
+        user_id: UUID,
+        recurring_meeting_id: UUID | None = None,
+        needs_confirmation_only: bool = False,
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[MeetingTranscriptSummary]:
+        """トランスクリプトの概要一覧を取得する（本文・構造化データは取得しない）."""
+        query = (
+            self.client.table("meeting_transcripts")
+            .select(f"{SUMMARY_COLUMNS}, recurring_meetings(title)")
+            .eq("user_id", str(user_id))
+        )
+
+        if recurring_meeting_id is not None:
+            query = query.eq("recurring_meeting_id", str(recurring_meeting_id))
+        if needs_confirmation_only:
+            query = query.lt("match_confidence", MANUAL_CONFIRMATION_THRESHOLD)
+        query = order_by_keyset(query, "meeting_date", cursor)
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = query.execute()
+        return [self._to_summary(cast(dict[str, Any], row)) for row in result.data]
+
     async def get_by_date_range(
         self,
         recurring_meeting_id: UUID,
@@ -85,7 +189,7 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
         """指定期間内のトランスクリプトを取得する."""
         result = (
             self.client.table("meeting_transcripts")
-            .select("*")
+            .select(FULL_COLUMNS)
             .eq("recurring_meeting_id", str(recurring_meeting_id))
             .gte("meeting_date", start_date.isoformat())
             .lte("meeting_date", end_date.isoformat())
@@ -101,15 +205,14 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
     ) -> MeetingTranscript | None:
         """Google Doc IDでトランスクリプトを取得する.
 
-        RLS経由でuser_idフィルタリングが適用されるが、
-        明示的にrecurring_meetingsテーブルをJOINしてuser_idを検証する。
+        user_idは親の定例MTGからトリガーで設定される列で、
+        recurring_meetingsをJOINせずに (user_id, google_doc_id) のインデックスで引ける。
         """
-        # recurring_meetingsを経由してuser_idでフィルタリング
         result = (
             self.client.table("meeting_transcripts")
-            .select("*, recurring_meetings!inner(user_id)")
+            .select(TRANSCRIPT_COLUMNS)
+            .eq("user_id", str(user_id))
             .eq("google_doc_id", google_doc_id)
-            .eq("recurring_meetings.user_id", str(user_id))
             .maybe_single()
             .execute()
         )
@@ -119,39 +222,51 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
 
         return self._to_entity(cast(dict[str, Any], result.data))
 
+    async def exists_by_google_doc_id(self, google_doc_id: str, user_id: UUID) -> bool:
+        """Google Doc IDのトランスクリプトが保存済みかを判定する（IDのみ取得）."""
+        result = (
+            self.client.table("meeting_transcripts")
+            .select("id")
+            .eq("user_id", str(user_id))
+            .eq("google_doc_id", google_doc_id)
+            .limit(1)
+            .execute()
+        )
+        return bool(result.data)
+
     async def update(self, transcript: MeetingTranscript) -> MeetingTranscript:
-        """トランスクリプトを更新する."""
+        """トランスクリプトを更新する.
+
+        本文が未読み込みの場合は本文と構造化データを更新しない（本文を読み込まない）。
+        """
         data: dict[str, Any] = {
             "recurring_meeting_id": str(transcript.recurring_meeting_id),
             "meeting_date": transcript.meeting_date.isoformat(),
-            "raw_text": transcript.raw_text,
-            "structured_data": self._serialize_structured_data(transcript.structured_data),
             "match_confidence": transcript.match_confidence,
         }
+        if transcript.is_raw_text_loaded():
+            data.update(self._serialize_body(transcript.raw_text))
+            data["structured_data"] = self._serialize_structured_data(transcript.structured_data, transcript.raw_text)
+            _body_cache.discard(transcript.id)
         self.client.table("meeting_transcripts").update(data).eq("id", str(transcript.id)).execute()
         return transcript
 
     async def get_needing_confirmation(
         self,
         user_id: UUID,
-    ) -> list[MeetingTranscript]:
-        """手動確認が必要なトランスクリプト一覧を取得する.
+        limit: int | None = None,
+        cursor: PageCursor | None = None,
+    ) -> list[MeetingTranscriptSummary]:
+        """手動確認が必要なトランスクリプトの概要一覧を取得する.
 
-        match_confidenceが0.7未満のトランスクリプトを取得。
+        match_confidenceが0.7未満のトランスクリプトを、本文を含まない列で取得。
         """
-        result = (
-            self.client.table("meeting_transcripts")
-            .select("*, recurring_meetings!inner(user_id)")
-            .eq("recurring_meetings.user_id", str(user_id))
-            .lt("match_confidence", 0.7)
-            .order("meeting_date", desc=True)
-            .execute()
-        )
-        return [self._to_entity(cast(dict[str, Any], row)) for row in result.data]
+        return await self.get_summaries(user_id, needs_confirmation_only=True, limit=limit, cursor=cursor)
 
     async def delete(self, transcript_id: UUID) -> bool:
         """トランスクリプトを削除する."""
         result = self.client.table("meeting_transcripts").delete().eq("id", str(transcript_id)).execute()
+        _body_cache.discard(transcript_id)
         return len(result.data) > 0
 
     def _to_entity(self, data: dict[str, Any]) -> MeetingTranscript:
@@ -163,25 +278,122 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
         created_at = datetime.fromisoformat(str(created_at_str).replace("Z", "+00:00"))
         meeting_date = datetime.fromisoformat(str(meeting_date_str).replace("Z", "+00:00"))
 
-        # Parse structured_data from JSONB
-        structured_data = self._deserialize_structured_data(data.get("structured_data"))
+        transcript_id = UUID(str(data["id"]))
+        # 本文を含まない列で取得した場合は、参照時に読み込む
+        eager = data.get("raw_text") is not None or data.get("raw_text_compressed") is not None
+        raw_text = self._deserialize_body(transcript_id, data) if eager else ""
 
-        return MeetingTranscript(
-            id=UUID(str(data["id"])),
+        transcript = MeetingTranscript(
+            id=transcript_id,
             recurring_meeting_id=UUID(str(data["recurring_meeting_id"])),
             meeting_date=meeting_date,
             google_doc_id=str(data["google_doc_id"]),
-            raw_text=str(data["raw_text"]),
-            structured_data=structured_data,
+            raw_text=raw_text,
+            structured_data=None,
             match_confidence=float(data["match_confidence"]),
             created_at=created_at,
         )
+        if not eager:
+            transcript.defer_raw_text(lambda: self._load_body(transcript_id))
+
+        # Parse structured_data from JSONB
+        transcript.structured_data = self._deserialize_structured_data(
+            data.get("structured_data"),
+            raw_text if eager else lambda: transcript.raw_text,
+        )
+        return transcript
+
+    def _to_summary(self, data: dict[str, Any]) -> MeetingTranscriptSummary:
+        """DB結果を概要に変換する."""
+        meeting = data.get("recurring_meetings")
+        raw_text_size = data.get("raw_text_size")
+        return MeetingTranscriptSummary(
+            id=UUID(str(data["id"])),
+            recurring_meeting_id=UUID(str(data["recurring_meeting_id"])),
+            meeting_date=datetime.fromisoformat(str(data["meeting_date"]).replace("Z", "+00:00")),
+            google_doc_id=str(data["google_doc_id"]),
+            match_confidence=float(data["match_confidence"]),
+            created_at=datetime.fromisoformat(str(data["created_at"]).replace("Z", "+00:00")),
+            raw_text_size=int(raw_text_size) if raw_text_size is not None else None,
+            recurring_meeting_title=str(meeting["title"]) if isinstance(meeting, dict) and "title" in meeting else None,
+        )
+
+    def _serialize_body(self, raw_text: str) -> dict[str, Any]:
+        """本文をzstdで圧縮した列の値に変換する."""
+        body = self.codec.compress(raw_text)
+        return {
+            "raw_text": None,
+            "raw_text_compressed": base64.b64encode(body.data).decode("ascii"),
+            "raw_text_codec": body.codec,
+            "raw_text_dictionary_id": body.dictionary_id,
+            "raw_text_size": body.raw_size,
+        }
 
-    def _serialize_structured_data(self, structured_data: TranscriptStructuredData | None) -> dict[str, Any] | None:
-        """TranscriptStructuredDataをJSONB用の辞書に変換する."""
+    def _deserialize_body(self, transcript_id: UUID, data: dict[str, Any]) -> str:
+        """本文の列から本文を復元する（圧縮前の行はraw_textをそのまま使う）."""
+        compressed = data.get("raw_text_compressed")
+        if compressed is None:
+            return str(data.get("raw_text") or "")
+
+        cached = _body_cache.get(transcript_id)
+        if cached is not None:
+            return cached
+        raw_text = self.codec.decompress(
+            base64.b64decode(str(compressed)),
+            int(data.get("raw_text_dictionary_id") or 0),
+        )
+        _body_cache.put(transcript_id, raw_text)
+        return raw_text
+
+    def _load_body(self, transcript_id: UUID) -> str:
+        """本文を取得して展開する（LRUキャッシュにあればDBを参照しない）."""
+        cached = _body_cache.get(transcript_id)
+        if cached is not None:
+            return cached
+
+        result = (
+            self.client.table("meeting_transcripts")
+            .select(BODY_COLUMNS)
+            .eq("id", str(transcript_id))
+            .maybe_single()
+            .execute()
+        )
+        if result is None or not result.data:
+            return ""
+        return self._deserialize_body(transcript_id, cast(dict[str, Any], result.data))
+
+    def _serialize_structured_data(
+        self,
+        structured_data: TranscriptStructuredData | None,
+        raw_text: str | None = None,
+    ) -> dict[str, Any] | None:
+        """TranscriptStructuredDataをJSONB用の辞書に変換する.
+
+        raw_textを指定し、全ての発話の本文がraw_text上に連続して現れる場合は
+        本文を重複して保存せず、話者の辞書とraw_text上のオフセットの列で保存する。
+        それ以外は発話ごとに本文を含む形式で保存する。
+        """
         if structured_data is None:
             return None
 
+        entries = structured_data.entries
+        table: TranscriptEntryTable | None = None
+        if raw_text is not None:
+            if isinstance(entries, TranscriptEntryTable) and entries.raw_text == raw_text:
+                table = entries
+            else:
+                table = TranscriptEntryTable.from_entries(raw_text, entries)
+
+        if table is not None:
+            return {
+                "version": STRUCTURED_DATA_OFFSETS_VERSION,
+                "speakers": table.speakers,
+                "speaker_ids": table.speaker_ids.tolist(),
+                "minutes": table.minutes.tolist(),
+                "starts": table.starts.tolist(),
+                "ends": table.ends.tolist(),
+            }
+
         return {
             "entries": [
                 {
@@ -189,15 +401,33 @@ class MeetingTranscriptRepositoryImpl(MeetingTranscriptRepository):
                     "timestamp": entry.timestamp,
                     "text": entry.text,
                 }
-                for entry in structured_data.entries
+                for entry in entries
             ]
         }
 
-    def _deserialize_structured_data(self, data: dict[str, Any] | None) -> TranscriptStructuredData | None:
-        """JSONB辞書をTranscriptStructuredDataに変換する."""
+    def _deserialize_structured_data(
+        self,
+        data: dict[str, Any] | None,
+        raw_text: str | Callable[[], str] = "",
+    ) -> TranscriptStructuredData | None:
+        """JSONB辞書をTranscriptStructuredDataに変換する.
+
+        オフセット形式の場合は本文を切り出さず、参照時にraw_textから切り出す。
+        """
         if data is None:
             return None
 
+        if data.get("version") == STRUCTURED_DATA_OFFSETS_VERSION:
+            table = TranscriptEntryTable(
+                raw_text=raw_text,
+                speakers=[str(s) for s in data.get("speakers", [])],
+                speaker_ids=array("H", data.get("speaker_ids", [])),
+                minutes=array("H", data.get("minutes", [])),
+                starts=array("I", data.get("starts", [])),
+                ends=array("I", data.get("ends", [])),
+            )
+            return TranscriptStructuredData(entries=table)
+
         entries_data = data.get("entries", [])
         entries = [
             TranscriptEntry(
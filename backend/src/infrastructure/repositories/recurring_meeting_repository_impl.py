@@ -19,6 +19,26 @@ from src.domain.repositories.recurring_meeting_repository import (
     RecurringMeetingRepository,
 )
 
+# エンティティに必要な列のみ取得する
+RECURRING_MEETING_COLUMNS = ", ".join(
+    (
+        "id",
+        "user_id",
+        "google_event_id",
+        "title",
+        "rrule",
+        "frequency",
+        "attendees",
+        "next_occurrence",
+        "start_datetime",
+        "timezone",
+        "exdates",
+        "agent_id",
+        "created_at",
+        "updated_at",
+    )
+)
+
 
 class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
     """定例MTGリポジトリのSupabase実装."""
@@ -41,7 +61,7 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
         """IDで定例MTGを取得する."""
         result = (
             self._client.table("recurring_meetings")
-            .select("*")
+            .select(RECURRING_MEETING_COLUMNS)
             .eq("id", str(meeting_id))
             .eq("user_id", str(user_id))
             .maybe_single()
@@ -62,7 +82,7 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
         """Google Event IDで定例MTGを取得する."""
         result = (
             self._client.table("recurring_meetings")
-            .select("*")
+            .select(RECURRING_MEETING_COLUMNS)
             .eq("user_id", str(user_id))
             .eq("google_event_id", google_event_id)
             .maybe_single()
@@ -75,11 +95,42 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
         data: dict[str, Any] = dict(result.data)  # type: ignore[arg-type]
         return self._to_entity(data)
 
+    async def get_by_google_event_ids(
+        self,
+        user_id: UUID,
+        google_event_ids: list[str],
+    ) -> list[RecurringMeeting]:
+        """複数のGoogle Event IDの定例MTGをまとめて取得する."""
+        if not google_event_ids:
+            return []
+
+        result = (
+            self._client.table("recurring_meetings")
+            .select(RECURRING_MEETING_COLUMNS)
+            .eq("user_id", str(user_id))
+            .in_("google_event_id", google_event_ids)
+            .execute()
+        )
+
+        return [self._to_entity(dict(row)) for row in result.data]  # type: ignore[arg-type]
+
+    async def get_with_next_occurrence_before(self, user_id: UUID, before: datetime) -> list[RecurringMeeting]:
+        """次回開催日時が指定日時より前の定例MTGを取得する."""
+        result = (
+            self._client.table("recurring_meetings")
+            .select(RECURRING_MEETING_COLUMNS)
+            .eq("user_id", str(user_id))
+            .lt("next_occurrence", before.isoformat())
+            .execute()
+        )
+
+        return [self._to_entity(dict(row)) for row in result.data]  # type: ignore[arg-type]
+
     async def get_all(self, user_id: UUID) -> list[RecurringMeeting]:
         """ユーザーの全定例MTGを取得する."""
         result = (
             self._client.table("recurring_meetings")
-            .select("*")
+            .select(RECURRING_MEETING_COLUMNS)
             .eq("user_id", str(user_id))
             .order("next_occurrence", desc=False)
             .execute()
@@ -95,7 +146,7 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
         """エージェントに紐付けられた定例MTG一覧を取得する."""
         result = (
             self._client.table("recurring_meetings")
-            .select("*")
+            .select(RECURRING_MEETING_COLUMNS)
             .eq("agent_id", str(agent_id))
             .eq("user_id", str(user_id))  # RLS: user_idフィルタ必須
             .order("next_occurrence", desc=False)
@@ -103,6 +154,19 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
         )
         return [self._to_entity(dict(row)) for row in result.data]  # type: ignore[arg-type]
 
+    async def get_linked_occurring_between(self, start: datetime, end: datetime) -> list[RecurringMeeting]:
+        """次回開催日時が期間内のエージェント紐付け済み定例MTGを全ユーザー分取得する."""
+        result = (
+            self._client.table("recurring_meetings")
+            .select(RECURRING_MEETING_COLUMNS)
+            .not_.is_("agent_id", "null")
+            .gte("next_occurrence", start.isoformat())
+            .lt("next_occurrence", end.isoformat())
+            .order("next_occurrence", desc=False)
+            .execute()
+        )
+        return [self._to_entity(dict(row)) for row in result.data]  # type: ignore[arg-type]
+
     async def link_to_agent(
         self,
         recurring_meeting_id: UUID,
@@ -147,7 +211,7 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
         """エージェントに紐付けられていない定例MTGを取得する."""
         result = (
             self._client.table("recurring_meetings")
-            .select("*")
+            .select(RECURRING_MEETING_COLUMNS)
             .eq("user_id", str(user_id))
             .is_("agent_id", "null")
             .order("next_occurrence", desc=False)
@@ -164,6 +228,9 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
             "frequency": meeting.frequency.value,
             "attendees": [{"email": a.email, "name": a.name} for a in meeting.attendees],
             "next_occurrence": meeting.next_occurrence.isoformat(),
+            "start_datetime": meeting.start_datetime.isoformat() if meeting.start_datetime else None,
+            "timezone": meeting.timezone,
+            "exdates": [d.isoformat() for d in meeting.exdates],
             "agent_id": str(meeting.agent_id) if meeting.agent_id else None,
             "updated_at": datetime.now().isoformat(),
         }
@@ -213,9 +280,32 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
             existing.frequency = meeting.frequency
             existing.attendees = meeting.attendees
             existing.next_occurrence = meeting.next_occurrence
+            existing.start_datetime = meeting.start_datetime
+            existing.timezone = meeting.timezone
+            existing.exdates = meeting.exdates
             return await self.update(existing)
         return await self.create(meeting)
 
+    async def upsert_many(self, meetings: list[RecurringMeeting]) -> None:
+        """定例MTGをまとめて作成・更新する（(user_id, google_event_id)で突き合わせ）."""
+        if not meetings:
+            return
+        rows = [self._to_dict(meeting) for meeting in meetings]
+        self._client.table("recurring_meetings").upsert(rows, on_conflict="user_id,google_event_id").execute()
+
+    async def delete_by_ids(self, meeting_ids: list[UUID], user_id: UUID) -> int:
+        """定例MTGをIDでまとめて削除する."""
+        if not meeting_ids:
+            return 0
+        result = (
+            self._client.table("recurring_meetings")
+            .delete()
+            .eq("user_id", str(user_id))
+            .in_("id", [str(meeting_id) for meeting_id in meeting_ids])
+            .execute()
+        )
+        return len(result.data)
+
     def _to_dict(self, meeting: RecurringMeeting) -> dict[str, Any]:
         """エンティティをDB用辞書に変換する."""
         return {
@@ -227,8 +317,12 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
             "frequency": meeting.frequency.value,
             "attendees": [{"email": a.email, "name": a.name} for a in meeting.attendees],
             "next_occurrence": meeting.next_occurrence.isoformat(),
+            "start_datetime": meeting.start_datetime.isoformat() if meeting.start_datetime else None,
+            "timezone": meeting.timezone,
+            "exdates": [d.isoformat() for d in meeting.exdates],
             "agent_id": str(meeting.agent_id) if meeting.agent_id else None,
             "created_at": meeting.created_at.isoformat(),
+            "updated_at": meeting.updated_at.isoformat() if meeting.updated_at else None,
         }
 
     def _to_entity(self, data: dict[str, Any]) -> RecurringMeeting:
@@ -238,6 +332,7 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
         next_occurrence_str = data["next_occurrence"]
         attendees_raw = data.get("attendees", [])
         agent_id_raw = data.get("agent_id")
+        start_datetime_str = data.get("start_datetime")
 
         attendees: list[Attendee] = [
             Attendee(
@@ -270,4 +365,9 @@ class RecurringMeetingRepositoryImpl(RecurringMeetingRepository):
                 if updated_at_str and isinstance(updated_at_str, str)
                 else None
             ),
+            start_datetime=(
+                datetime.fromisoformat(start_datetime_str) if isinstance(start_datetime_str, str) else None
+            ),
+            timezone=data.get("timezone"),
+            exdates=[datetime.fromisoformat(str(d)) for d in (data.get("exdates") or [])],
         )
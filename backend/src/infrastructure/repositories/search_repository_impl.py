@@ -0,0 +1,118 @@
+"""SearchRepository implementation using Supabase (PostgreSQL full-text search).
+
+Infrastructure layer implementation of SearchRepository interface.
+Following ADR-0001 clean architecture principles.
+"""
+
+from datetime import datetime
+from typing import Any, cast
+from uuid import UUID
+
+from supabase import Client
+
+from src.domain.entities.search_entry import SearchEntry, SearchHit, SearchSourceType
+from src.domain.repositories.search_repository import SearchRepository
+from src.domain.services.search_tokenizer import to_search_query, to_search_vector
+
+# 1回のリクエストで登録する行数（長時間の会議でもリクエストサイズを抑える）
+INSERT_BATCH_SIZE = 500
+
+
+class SearchRepositoryImpl(SearchRepository):
+    """全文検索インデックスリポジトリのSupabase実装.
+
+    本文のバイグラムをtsvectorとして保存し、GINインデックスで検索する。
+    """
+
+    def __init__(self, client: Client) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            client: Supabaseクライアントインスタンス
+        """
+        self.client = client
+
+    async def replace_source(
+        self,
+        user_id: UUID,
+        source_type: SearchSourceType,
+        source_id: UUID,
+        entries: list[SearchEntry],
+    ) -> None:
+        """元データのエントリを削除してから新しいエントリを登録する."""
+        (
+            self.client.table("search_entries")
+            .delete()
+            .eq("user_id", str(user_id))
+            .eq("source_type", source_type.value)
+            .eq("source_id", str(source_id))
+            .execute()
+        )
+        rows = [self._to_row(entry) for entry in entries]
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            self.client.table("search_entries").insert(rows[start : start + INSERT_BATCH_SIZE]).execute()
+
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        source_type: SearchSourceType | None = None,
+        agent_id: UUID | None = None,
+        recurring_meeting_id: UUID | None = None,
+    ) -> list[SearchHit]:
+        """クエリの語をすべて含むエントリを関連度の降順で検索する（search_entries_by_query RPC）."""
+        search_query = to_search_query(query)
+        if search_query is None or limit <= 0:
+            return []
+
+        params: dict[str, Any] = {
+            "p_user_id": str(user_id),
+            "p_query": search_query,
+            "p_source_type": source_type.value if source_type else None,
+            "p_agent_id": str(agent_id) if agent_id else None,
+            "p_recurring_meeting_id": str(recurring_meeting_id) if recurring_meeting_id else None,
+            "match_count": limit,
+        }
+        result = self.client.rpc("search_entries_by_query", params).execute()
+        rows = cast(list[dict[str, Any]], result.data or [])
+        return [SearchHit(entry=self._to_entity(row), score=float(row["rank"])) for row in rows]
+
+    def _to_row(self, entry: SearchEntry) -> dict[str, Any]:
+        """エンティティをDB用辞書に変換する."""
+        return {
+            "id": str(entry.id),
+            "user_id": str(entry.user_id),
+            "agent_id": str(entry.agent_id) if entry.agent_id else None,
+            "recurring_meeting_id": str(entry.recurring_meeting_id) if entry.recurring_meeting_id else None,
+            "source_type": entry.source_type.value,
+            "source_id": str(entry.source_id),
+            "entry_index": entry.entry_index,
+            "content": entry.content,
+            "speaker": entry.speaker,
+            "entry_timestamp": entry.timestamp,
+            "source_date": entry.source_date.isoformat() if entry.source_date else None,
+            "search_vector": to_search_vector(entry.content),
+        }
+
+    def _to_entity(self, data: dict[str, Any]) -> SearchEntry:
+        """DB結果をエンティティに変換する."""
+        agent_id_raw = data.get("agent_id")
+        recurring_meeting_id_raw = data.get("recurring_meeting_id")
+        source_date_raw = data.get("source_date")
+
+        return SearchEntry(
+            id=UUID(str(data["id"])),
+            user_id=UUID(str(data["user_id"])),
+            source_type=SearchSourceType(str(data["source_type"])),
+            source_id=UUID(str(data["source_id"])),
+            entry_index=int(data["entry_index"]),
+            content=str(data["content"]),
+            agent_id=UUID(str(agent_id_raw)) if agent_id_raw else None,
+            recurring_meeting_id=UUID(str(recurring_meeting_id_raw)) if recurring_meeting_id_raw else None,
+            source_date=(
+                datetime.fromisoformat(str(source_date_raw).replace("Z", "+00:00")) if source_date_raw else None
+            ),
+            speaker=data.get("speaker"),
+            timestamp=data.get("entry_timestamp"),
+        )
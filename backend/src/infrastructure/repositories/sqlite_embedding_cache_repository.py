@@ -0,0 +1,95 @@
+"""EmbeddingCacheRepository implementation using a local SQLite file.
+
+Persistent cache for environments without Supabase (local development, single node).
+Following ADR-0001 clean architecture principles.
+"""
+
+import asyncio
+import sqlite3
+from collections.abc import Iterator, Mapping
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from src.domain.repositories.embedding_cache_repository import EmbeddingCacheRepository
+
+# SQLiteのバインド変数上限（999）を超えないためのバッチサイズ
+SELECT_BATCH_SIZE = 500
+
+
+class SqliteEmbeddingCacheRepository(EmbeddingCacheRepository):
+    """埋め込みキャッシュリポジトリのSQLite実装.
+
+    ベクトルはfloat32のバイト列として保存する。
+    ブロッキングI/Oはスレッドで実行し、呼び出しごとに接続を開く。
+    """
+
+    def __init__(self, path: Path) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            path: SQLiteファイルのパス（親ディレクトリがなければ作成する）
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                "content_hash TEXT NOT NULL, "
+                "dimensions INTEGER NOT NULL, "
+                "embedding BLOB NOT NULL, "
+                "PRIMARY KEY (content_hash, dimensions))"
+            )
+
+    async def get_many(
+        self,
+        content_hashes: list[str],
+        dimensions: int,
+    ) -> dict[str, npt.NDArray[np.float32]]:
+        """ハッシュに対応するキャッシュ済みベクトルを取得する."""
+        if not content_hashes:
+            return {}
+        return await asyncio.to_thread(self._get_many, content_hashes, dimensions)
+
+    async def put_many(
+        self,
+        embeddings: Mapping[str, npt.NDArray[np.float32]],
+        dimensions: int,
+    ) -> None:
+        """ベクトルをキャッシュに保存する（既存のハッシュは上書きしない）."""
+        if not embeddings:
+            return
+        rows = [
+            (content_hash, dimensions, np.asarray(vector, dtype=np.float32).tobytes())
+            for content_hash, vector in embeddings.items()
+        ]
+        await asyncio.to_thread(self._put_many, rows)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """SQLite接続を開き、トランザクションを確定して閉じる."""
+        with closing(sqlite3.connect(self.path, timeout=30.0)) as conn, conn:
+            yield conn
+
+    def _get_many(self, content_hashes: list[str], dimensions: int) -> dict[str, npt.NDArray[np.float32]]:
+        cached: dict[str, npt.NDArray[np.float32]] = {}
+        with self._connect() as conn:
+            for start in range(0, len(content_hashes), SELECT_BATCH_SIZE):
+                batch = content_hashes[start : start + SELECT_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                query = (
+                    "SELECT content_hash, embedding FROM embedding_cache "  # noqa: S608
+                    f"WHERE dimensions = ? AND content_hash IN ({placeholders})"
+                )
+                for content_hash, blob in conn.execute(query, (dimensions, *batch)):
+                    cached[content_hash] = np.frombuffer(blob, dtype=np.float32).copy()
+        return cached
+
+    def _put_many(self, rows: list[tuple[str, int, bytes]]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (content_hash, dimensions, embedding) VALUES (?, ?, ?)",
+                rows,
+            )
@@ -0,0 +1,136 @@
+"""WatchChannel repository implementation using Supabase.
+
+Infrastructure layer implementation of WatchChannelRepository interface.
+Following ADR-0001 clean architecture principles.
+"""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from supabase import Client
+
+from src.domain.entities.watch_channel import WatchChannel, WatchResourceType
+from src.domain.repositories.watch_channel_repository import WatchChannelRepository
+
+# エンティティに必要な列のみ取得する
+WATCH_CHANNEL_COLUMNS = ", ".join(
+    (
+        "id",
+        "user_id",
+        "integration_id",
+        "resource_type",
+        "resource_id",
+        "token",
+        "expiration",
+        "page_token",
+        "created_at",
+    )
+)
+
+
+class WatchChannelRepositoryImpl(WatchChannelRepository):
+    """プッシュ通知チャネルリポジトリのSupabase実装.
+
+    通知の受信はユーザーコンテキストなしで行うため、サービスキーのクライアントで使う。
+    """
+
+    def __init__(self, client: Client) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            client: Supabaseクライアントインスタンス.
+        """
+        self._client = client
+
+    async def create(self, channel: WatchChannel) -> WatchChannel:
+        """チャネルを作成する."""
+        self._client.table("google_watch_channels").insert(self._to_dict(channel)).execute()
+        return channel
+
+    async def get_by_id(self, channel_id: UUID) -> WatchChannel | None:
+        """チャネルIDでチャネルを取得する."""
+        result = (
+            self._client.table("google_watch_channels")
+            .select(WATCH_CHANNEL_COLUMNS)
+            .eq("id", str(channel_id))
+            .maybe_single()
+            .execute()
+        )
+
+        if result is None or not result.data:
+            return None
+
+        data: dict[str, Any] = dict(result.data)  # type: ignore[arg-type]
+        return self._to_entity(data)
+
+    async def get_by_integration(
+        self,
+        integration_id: UUID,
+        resource_type: WatchResourceType,
+    ) -> list[WatchChannel]:
+        """Google連携のチャネルを新しい順に取得する."""
+        result = (
+            self._client.table("google_watch_channels")
+            .select(WATCH_CHANNEL_COLUMNS)
+            .eq("integration_id", str(integration_id))
+            .eq("resource_type", resource_type.value)
+            .order("expiration", desc=True)
+            .execute()
+        )
+
+        return [self._to_entity(dict(row)) for row in result.data]  # type: ignore[arg-type]
+
+    async def get_expiring(self, before: datetime) -> list[WatchChannel]:
+        """指定日時までに有効期限が切れるチャネルを取得する."""
+        result = (
+            self._client.table("google_watch_channels")
+            .select(WATCH_CHANNEL_COLUMNS)
+            .lt("expiration", before.isoformat())
+            .order("expiration")
+            .execute()
+        )
+
+        return [self._to_entity(dict(row)) for row in result.data]  # type: ignore[arg-type]
+
+    async def update_page_token(self, channel_id: UUID, page_token: str) -> None:
+        """Drive変更一覧のページトークンを保存する."""
+        (
+            self._client.table("google_watch_channels")
+            .update({"page_token": page_token})
+            .eq("id", str(channel_id))
+            .execute()
+        )
+
+    async def delete(self, channel_id: UUID) -> bool:
+        """チャネルを削除する."""
+        result = self._client.table("google_watch_channels").delete().eq("id", str(channel_id)).execute()
+        return len(result.data) > 0
+
+    def _to_dict(self, channel: WatchChannel) -> dict[str, Any]:
+        """エンティティをDB用辞書に変換する."""
+        return {
+            "id": str(channel.id),
+            "user_id": str(channel.user_id),
+            "integration_id": str(channel.integration_id),
+            "resource_type": channel.resource_type.value,
+            "resource_id": channel.resource_id,
+            "token": channel.token,
+            "expiration": channel.expiration.isoformat(),
+            "page_token": channel.page_token,
+            "created_at": channel.created_at.isoformat(),
+        }
+
+    def _to_entity(self, data: dict[str, Any]) -> WatchChannel:
+        """DB結果をエンティティに変換する."""
+        return WatchChannel(
+            id=UUID(str(data["id"])),
+            user_id=UUID(str(data["user_id"])),
+            integration_id=UUID(str(data["integration_id"])),
+            resource_type=WatchResourceType(str(data["resource_type"])),
+            resource_id=str(data["resource_id"]),
+            token=str(data["token"]),
+            expiration=datetime.fromisoformat(str(data["expiration"]).replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(str(data["created_at"]).replace("Z", "+00:00")),
+            page_token=data.get("page_token"),
+        )
@@ -3,12 +3,16 @@
 Infrastructure service for generating meeting agendas.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
+from datetime import datetime
 
 from src.domain.entities.dictionary_entry import DictionaryEntry
+from src.domain.entities.embedding_chunk import ChunkSourceType, RetrievedChunk
 from src.domain.entities.knowledge import Knowledge
 from src.domain.entities.meeting_transcript import MeetingTranscript
+from src.domain.services.agenda_patch import DELETE_MARKER, NO_CHANGES, apply_agenda_patch
 from src.infrastructure.external.bedrock_client import invoke_claude
 from src.infrastructure.external.slack_client import SlackMessageData
 
@@ -23,10 +27,45 @@ class AgendaGenerationInput:
     slack_messages: list[SlackMessageData]
     dictionary: list[DictionaryEntry]
     transcripts: list[MeetingTranscript] = field(default_factory=list)
+    retrieved_chunks: list[RetrievedChunk] = field(default_factory=list)
+
+
+@dataclass
+class AgendaUpdateInput:
+    """前回のアジェンダの差分更新の入力.
+
+    Attributes:
+        previous_content: 前回のアジェンダ（マークダウン）
+        previous_generated_at: 前回のアジェンダの生成日時
+        slack_messages: 前回の生成以降のSlackメッセージ
+        transcripts: 前回の生成以降に追加されたトランスクリプト
+        dictionary: ユビキタス言語辞書
+    """
+
+    previous_content: str
+    previous_generated_at: datetime
+    slack_messages: list[SlackMessageData]
+    transcripts: list[MeetingTranscript]
+    dictionary: list[DictionaryEntry] = field(default_factory=list)
+
+
+# 関連チャンクのソース種別ごとの表示名
+CHUNK_SOURCE_LABELS = {
+    ChunkSourceType.KNOWLEDGE: "ナレッジ",
+    ChunkSourceType.TRANSCRIPT: "トランスクリプト",
+    ChunkSourceType.SLACK: "Slack",
+}
 
 
 class AgendaGenerationService:
-    """アジェンダ生成サービス."""
+    """アジェンダ生成サービス.
+
+    LLMの呼び出しは同期APIのため、イベントループを止めないよう別スレッドで実行する。
+    """
+
+    MAX_TOKENS = 8192
+    # 差分更新では変更するブロックだけを出力させる
+    UPDATE_MAX_TOKENS = 2048
 
     async def generate(self, input_data: AgendaGenerationInput) -> str:
         """アジェンダを生成する.
@@ -43,7 +82,7 @@ class AgendaGenerationService:
         prompt = self._build_prompt(input_data)
 
         try:
-            result = invoke_claude(prompt, max_tokens=8192)
+            result = await asyncio.to_thread(invoke_claude, prompt, max_tokens=self.MAX_TOKENS)
             if result is None:
                 raise RuntimeError("LLM returned None")
             return result
@@ -51,6 +90,109 @@ class AgendaGenerationService:
             logger.error("Agenda generation failed: %s", e)
             raise
 
+    async def generate_update(self, input_data: AgendaUpdateInput) -> str:
+        """前回のアジェンダを差分だけで更新する.
+
+        前回のアジェンダと前回の生成以降の差分だけを渡し、変更する見出しブロックを
+        パッチとして出力させて前回のアジェンダに適用する。
+
+        Args:
+            input_data: 差分更新の入力
+
+        Returns:
+            更新後のアジェンダのマークダウンテキスト
+
+        Raises:
+            ValueError: LLMの出力がパッチの形式でない場合
+            Exception: LLM呼び出しに失敗した場合
+        """
+        prompt = self._build_update_prompt(input_data)
+
+        try:
+            result = await asyncio.to_thread(invoke_claude, prompt, max_tokens=self.UPDATE_MAX_TOKENS)
+            if result is None:
+                raise RuntimeError("LLM returned None")
+        except Exception as e:
+            logger.error("Agenda update failed: %s", e)
+            raise
+        return apply_agenda_patch(input_data.previous_content, result)
+
+    def _format_chunk(self, retrieved: RetrievedChunk) -> str:
+        """関連チャンクをプロンプト用の文字列に整形する.
+
+        Args:
+            retrieved: 類似検索で取得されたチャンク
+
+        Returns:
+            出典ラベル付きのチャンク文字列
+        """
+        chunk = retrieved.chunk
+        label = CHUNK_SOURCE_LABELS[chunk.source_type]
+        if chunk.source_date:
+            label += f" {chunk.source_date.strftime('%Y/%m/%d')}"
+        if chunk.timestamp:
+            label += f" {chunk.timestamp}"
+        return f"### [{label}]\n{chunk.content}"
+
+    def _format_slack_messages(self, messages: list[SlackMessageData]) -> str:
+        """Slackメッセージをプロンプト用の文字列に整形する（最大50件）."""
+        return "\n".join(f"[{m.posted_at.strftime('%m/%d %H:%M')}] {m.user_name}: {m.text}" for m in messages[:50])
+
+    def _format_transcript(self, transcript: MeetingTranscript) -> str:
+        """トランスクリプトをプロンプト用の文字列に整形する（最初の2000文字）."""
+        meeting_title = transcript.recurring_meeting_title or "不明な定例"
+        meeting_date = transcript.meeting_date.strftime("%Y/%m/%d")
+        return f"### {meeting_title} ({meeting_date})\n{transcript.raw_text[:2000]}"
+
+    def _build_update_prompt(self, input_data: AgendaUpdateInput) -> str:
+        """差分更新用のプロンプトを構築する.
+
+        Args:
+            input_data: 差分更新の入力
+
+        Returns:
+            構築されたプロンプト文字列
+        """
+        parts: list[str] = []
+        if input_data.dictionary:
+            dict_info = "\n".join(f"- {e.canonical_name}" for e in input_data.dictionary)
+            parts.append(f"## 参考: ユビキタス言語辞書\n{dict_info}")
+        if input_data.slack_messages:
+            parts.append(f"## 前回の生成以降のSlack履歴\n{self._format_slack_messages(input_data.slack_messages)}")
+        if input_data.transcripts:
+            entries = "\n\n".join(self._format_transcript(t) for t in input_data.transcripts)
+            parts.append(f"## 前回の生成以降に追加されたMTGトランスクリプト\n{entries}")
+        delta = "\n\n".join(parts)
+        generated_at = input_data.previous_generated_at.strftime("%Y/%m/%d %H:%M")
+
+        return f"""あなたはMTGのアジェンダを更新するアシスタントです。
+前回作成したアジェンダを、その後に追加された情報だけを踏まえて更新します。
+
+<previous_agenda generated_at="{generated_at}">
+{input_data.previous_content}
+</previous_agenda>
+
+<delta>
+{delta}
+</delta>
+
+<output_format>
+変更が必要な見出しブロックだけを出力してください。見出しブロックは見出し行（#で始まる行）から
+次の見出し行の直前までです。
+- 既存のブロックを変更する場合: 前回と一字一句同じ見出し行に続けて、変更後の本文全体を出力
+- 新しい議題などを追加する場合: 新しい見出し行と本文を出力（直前に出力したブロックの後ろに入ります）
+- ブロックを削除する場合: 見出し行に続けて本文に {DELETE_MARKER} とだけ出力
+- 変更が不要な場合: {NO_CHANGES} とだけ出力
+変更しないブロックや説明文は出力しないでください。
+</output_format>
+
+<guidelines>
+- 追加された情報で解決した未決事項・準備タスクは削除または更新する
+- 新しく判明した未決事項は、準備タスク（Part 1）と議題（Part 2）の両方に反映する
+- 辞書にある用語は正式名称を使用
+</guidelines>
+"""
+
     def _build_prompt(self, input_data: AgendaGenerationInput) -> str:
         """アジェンダ生成用のプロンプトを構築する.
 
@@ -73,25 +215,20 @@ class AgendaGenerationService:
 
         # Slackメッセージ
         if input_data.slack_messages:
-            messages = "\n".join(
-                [
-                    f"[{m.posted_at.strftime('%m/%d %H:%M')}] {m.user_name}: {m.text}"
-                    for m in input_data.slack_messages[:50]  # 最大50件
-                ]
-            )
-            parts.append(f"## 前回MTG以降のSlack履歴\n{messages}")
+            parts.append(f"## 前回MTG以降のSlack履歴\n{self._format_slack_messages(input_data.slack_messages)}")
 
         # トランスクリプト情報
-        if input_data.transcripts:
-            transcript_entries: list[str] = []
-            for transcript in input_data.transcripts:
-                meeting_title = transcript.recurring_meeting_title or "不明な定例"
-                meeting_date = transcript.meeting_date.strftime("%Y/%m/%d")
-                # 内容が長い場合は最初の2000文字に切り詰め
-                content = transcript.raw_text[:2000] if len(transcript.raw_text) > 2000 else transcript.raw_text
-                transcript_entries.append(f"### {meeting_title} ({meeting_date})\n{content}")
+        # 関連チャンクを検索できた場合は最新のトランスクリプトのみ全文を含める
+        transcripts = input_data.transcripts[:1] if input_data.retrieved_chunks else input_data.transcripts
+        if transcripts:
+            transcript_entries = [self._format_transcript(t) for t in transcripts]
             parts.append("## 過去のMTGトランスクリプト\n" + "\n\n".join(transcript_entries))
 
+        # 未決事項に関連する過去の議論
+        if input_data.retrieved_chunks:
+            chunk_entries = [self._format_chunk(r) for r in input_data.retrieved_chunks]
+            parts.append("## 未決事項に関連する過去の議論\n" + "\n\n".join(chunk_entries))
+
         context = "\n\n".join(parts)
 
         # データソースの状況を判定
@@ -0,0 +1,107 @@
+"""Worker pool for agenda generation jobs.
+
+Polls the agenda job queue and runs claimed jobs with bounded concurrency.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from uuid import uuid4
+
+from src.domain.entities.agenda_job import AgendaJob
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
+
+logger = logging.getLogger(__name__)
+
+# 取得したジョブとワーカーIDを受け取ってジョブを実行する処理
+JobRunner = Callable[[AgendaJob, str], Awaitable[None]]
+
+
+class AgendaJobWorkerPool:
+    """アジェンダ生成ジョブを実行する非同期ワーカーのプール.
+
+    concurrency 個のワーカーがそれぞれキューからジョブを1件ずつ取得して実行する。
+    キューが空の間は poll_seconds ごとに確認する。ジョブの取得は
+    リポジトリ側で排他されるため、複数のプロセスで同じキューを処理できる。
+    """
+
+    def __init__(
+        self,
+        repository: AgendaJobRepository,
+        run_job: JobRunner,
+        concurrency: int,
+        poll_seconds: float,
+        stale_after: timedelta,
+    ) -> None:
+        """初期化する.
+
+        Args:
+            repository: ジョブキューのリポジトリ
+            run_job: 取得したジョブを実行する処理
+            concurrency: 同時に実行するジョブの数
+            poll_seconds: キューが空の場合に次に確認するまでの待ち時間（秒）
+            stale_after: 実行中のまま更新が止まったジョブを再取得するまでの時間
+        """
+        self._repository = repository
+        self._run_job = run_job
+        self._concurrency = concurrency
+        self._poll_seconds = poll_seconds
+        self._stale_after = stale_after
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def is_running(self) -> bool:
+        """ワーカーが起動しているか."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """ワーカーを起動する."""
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._work(f"{self._worker_prefix}:{index}")) for index in range(self._concurrency)
+        ]
+        logger.info("Started %d agenda job workers", self._concurrency)
+
+    async def stop(self) -> None:
+        """ワーカーを停止する（実行中のジョブは取り消され、期限切れ後に再取得される）."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self, worker_id: str) -> bool:
+        """キューから1件取得して実行する.
+
+        Args:
+            worker_id: ワーカーID
+
+        Returns:
+            ジョブを実行した場合はTrue、実行できるジョブがなかった場合はFalse
+        """
+        job = await self._repository.claim_next(worker_id, self._stale_after)
+        if job is None:
+            return False
+
+        logger.info("Worker %s running agenda job %s (attempt %d)", worker_id, job.id, job.attempts)
+        try:
+            await self._run_job(job, worker_id)
+        except Exception:
+            logger.exception("Agenda job %s crashed", job.id)
+        return True
+
+    async def _work(self, worker_id: str) -> None:
+        """ジョブがある間は続けて実行し、なければ待つ."""
+        while True:
+            try:
+                ran = await self.run_once(worker_id)
+            except Exception:
+                logger.exception("Failed to claim agenda job")
+                ran = False
+            if not ran:
+                await asyncio.sleep(self._poll_seconds)
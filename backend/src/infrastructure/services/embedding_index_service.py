@@ -0,0 +1,293 @@
+"""Embedding index service using Titan Embeddings.
+
+Infrastructure service for indexing knowledge, transcripts and Slack messages
+and retrieving relevant chunks for agenda generation.
+"""
+
+import logging
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from supabase import Client
+
+from src.config import settings
+from src.domain.entities.embedding_chunk import (
+    ChunkSourceType,
+    EmbeddingChunk,
+    RetrievedChunk,
+)
+from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.meeting_transcript import MeetingTranscript
+from src.domain.repositories.embedding_repository import EmbeddingRepository
+from src.domain.services.text_chunker import chunk_lines, chunk_text
+from src.infrastructure.external.bedrock_client import is_bedrock_configured
+from src.infrastructure.external.slack_client import SlackMessageData
+from src.infrastructure.repositories.embedding_repository_impl import EmbeddingRepositoryImpl
+from src.infrastructure.repositories.local_embedding_repository import (
+    get_local_embedding_repository,
+)
+from src.infrastructure.services.embedding_service import EmbeddingService, create_embedding_service
+
+logger = logging.getLogger(__name__)
+
+# インデックス対象とするSlackメッセージの最小文字数（相槌などを除外）
+MIN_SLACK_MESSAGE_CHARS = 10
+
+
+class EmbeddingIndexService:
+    """埋め込みインデックスサービス.
+
+    取り込み時にテキストをチャンク分割して埋め込み、リポジトリへ登録する。
+    アジェンダ生成時はクエリを埋め込み、類似チャンクを取得する。
+    """
+
+    def __init__(self, repository: EmbeddingRepository, embedding_service: EmbeddingService) -> None:
+        """サービスを初期化する.
+
+        Args:
+            repository: 埋め込みインデックスリポジトリ
+            embedding_service: 埋め込み計算サービス
+        """
+        self.repository = repository
+        self.embedding_service = embedding_service
+
+    async def index_knowledge(self, knowledge: Knowledge) -> int:
+        """ナレッジをインデックスに登録する.
+
+        Args:
+            knowledge: 登録するナレッジ
+
+        Returns:
+            登録したチャンク数
+        """
+        now = datetime.now(UTC)
+        chunks = [
+            EmbeddingChunk(
+                id=uuid4(),
+                user_id=knowledge.user_id,
+                source_type=ChunkSourceType.KNOWLEDGE,
+                source_id=str(knowledge.id),
+                chunk_index=index,
+                content=content,
+                created_at=now,
+                agent_id=knowledge.agent_id,
+                source_date=knowledge.meeting_date,
+            )
+            for index, content in enumerate(chunk_text(knowledge.normalized_text))
+        ]
+        return await self._replace_source(knowledge.user_id, ChunkSourceType.KNOWLEDGE, str(knowledge.id), chunks)
+
+    async def index_transcript(
+        self,
+        transcript: MeetingTranscript,
+        user_id: UUID,
+        agent_id: UUID | None = None,
+    ) -> int:
+        """トランスクリプトをインデックスに登録する.
+
+        構造化データがある場合は発話単位でまとめ、ない場合は生テキストを分割する。
+
+        Args:
+            transcript: 登録するトランスクリプト
+            user_id: 所有ユーザーのID
+            agent_id: 定例MTGに紐付けられたエージェントID
+
+        Returns:
+            登録したチャンク数
+        """
+        now = datetime.now(UTC)
+        chunks: list[EmbeddingChunk] = []
+
+        def build(index: int, content: str, speaker: str | None, timestamp: str | None) -> EmbeddingChunk:
+            return EmbeddingChunk(
+                id=uuid4(),
+                user_id=user_id,
+                source_type=ChunkSourceType.TRANSCRIPT,
+                source_id=str(transcript.id),
+                chunk_index=index,
+                content=content,
+                created_at=now,
+                agent_id=agent_id,
+                recurring_meeting_id=transcript.recurring_meeting_id,
+                source_date=transcript.meeting_date,
+                speaker=speaker,
+                timestamp=timestamp,
+            )
+
+        if transcript.structured_data is not None and transcript.structured_data.entries:
+            entries = transcript.structured_data.entries
+            lines = [f"{e.speaker} ({e.timestamp}): {e.text}" for e in entries]
+            for index, line_chunk in enumerate(chunk_lines(lines)):
+                first = entries[line_chunk.start]
+                chunks.append(build(index, line_chunk.text, first.speaker, first.timestamp))
+        else:
+            for index, content in enumerate(chunk_text(transcript.raw_text)):
+                chunks.append(build(index, content, None, None))
+
+        return await self._replace_source(user_id, ChunkSourceType.TRANSCRIPT, str(transcript.id), chunks)
+
+    async def index_slack_messages(
+        self,
+        messages: list[SlackMessageData],
+        user_id: UUID,
+        agent_id: UUID,
+        channel_id: str,
+    ) -> int:
+        """Slackメッセージをインデックスに登録する.
+
+        インデックス済みのメッセージと短すぎるメッセージはスキップする。
+
+        Args:
+            messages: 登録するSlackメッセージ
+            user_id: 所有ユーザーのID
+            agent_id: チャンネルが紐付けられたエージェントID
+            channel_id: SlackチャンネルID
+
+        Returns:
+            登録したチャンク数
+        """
+        candidates = {f"{channel_id}:{m.ts}": m for m in messages if len(m.text.strip()) >= MIN_SLACK_MESSAGE_CHARS}
+        if not candidates:
+            return 0
+
+        indexed = await self.repository.get_indexed_source_ids(user_id, ChunkSourceType.SLACK, list(candidates))
+        now = datetime.now(UTC)
+        chunks = [
+            EmbeddingChunk(
+                id=uuid4(),
+                user_id=user_id,
+                source_type=ChunkSourceType.SLACK,
+                source_id=source_id,
+                chunk_index=index,
+                content=f"{message.user_name}: {content}",
+                created_at=now,
+                agent_id=agent_id,
+                source_date=message.posted_at,
+                speaker=message.user_name,
+            )
+            for source_id, message in candidates.items()
+            if source_id not in indexed
+            for index, content in enumerate(chunk_text(message.text))
+        ]
+        return await self._store(chunks)
+
+    async def remove_source(self, user_id: UUID, source_type: ChunkSourceType, source_id: str) -> int:
+        """元データのチャンクをインデックスから削除する.
+
+        Args:
+            user_id: 所有ユーザーのID
+            source_type: 元データ種別
+            source_id: 元データのID
+
+        Returns:
+            削除したチャンク数
+        """
+        return await self.repository.delete_by_source(user_id, source_type, source_id)
+
+    async def retrieve(
+        self,
+        user_id: UUID,
+        queries: list[str],
+        top_k: int,
+        agent_id: UUID | None = None,
+        recurring_meeting_ids: list[UUID] | None = None,
+        exclude_source_ids: set[str] | None = None,
+    ) -> list[RetrievedChunk]:
+        """クエリ群に類似するチャンクを取得する.
+
+        クエリごとに検索し、同じチャンクは最大スコアでまとめる。
+
+        Args:
+            user_id: 所有ユーザーのID
+            queries: 検索クエリ（未決事項など）
+            top_k: 取得件数
+            agent_id: 絞り込み対象のエージェントID
+            recurring_meeting_ids: 絞り込み対象の定例MTG IDリスト
+            exclude_source_ids: 結果から除外する元データID（プロンプトに全文を含めるものなど）
+
+        Returns:
+            RetrievedChunkのリスト（類似度の降順、最大top_k件）
+        """
+        queries = [q for q in queries if q.strip()]
+        if not queries or top_k <= 0:
+            return []
+
+        embeddings = await self.embedding_service.embed(queries)
+        if embeddings is None:
+            return []
+
+        exclude = exclude_source_ids or set()
+        best: dict[tuple[str, str, int], RetrievedChunk] = {}
+        for embedding in embeddings:
+            results = await self.repository.search(
+                user_id,
+                embedding,
+                top_k + len(exclude),
+                agent_id=agent_id,
+                recurring_meeting_ids=recurring_meeting_ids,
+            )
+            for result in results:
+                chunk = result.chunk
+                if chunk.source_id in exclude:
+                    continue
+                key = (chunk.source_type.value, chunk.source_id, chunk.chunk_index)
+                if key not in best or best[key].score < result.score:
+                    best[key] = result
+
+        return sorted(best.values(), key=lambda r: r.score, reverse=True)[:top_k]
+
+    async def _replace_source(
+        self,
+        user_id: UUID,
+        source_type: ChunkSourceType,
+        source_id: str,
+        chunks: list[EmbeddingChunk],
+    ) -> int:
+        """元データの既存チャンクを削除してから新しいチャンクを登録する."""
+        if not chunks:
+            return 0
+        # 埋め込みに失敗した場合は既存のチャンクを残す
+        embeddings = await self.embedding_service.embed([c.content for c in chunks])
+        if embeddings is None:
+            return 0
+        await self.repository.delete_by_source(user_id, source_type, source_id)
+        await self.repository.upsert_chunks(chunks, embeddings)
+        return len(chunks)
+
+    async def _store(self, chunks: list[EmbeddingChunk]) -> int:
+        """チャンクを埋め込んで登録する."""
+        if not chunks:
+            return 0
+        embeddings = await self.embedding_service.embed([c.content for c in chunks])
+        if embeddings is None:
+            return 0
+        await self.repository.upsert_chunks(chunks, embeddings)
+        return len(chunks)
+
+
+def create_embedding_index_service(client: Client | None) -> EmbeddingIndexService | None:
+    """設定に応じたEmbeddingIndexServiceを作成する.
+
+    EMBEDDING_INDEX_BACKENDが"pgvector"の場合はSupabaseに、
+    "local"の場合はディスクに永続化するローカルベクトルストアに、
+    "memory"の場合はプロセス内のみのローカルベクトルストアに保存する。
+
+    Args:
+        client: Supabaseクライアント（pgvector使用時に必要）
+
+    Returns:
+        EmbeddingIndexService。Bedrock未設定または無効化されている場合はNone。
+    """
+    if not is_bedrock_configured():
+        return None
+
+    backend = settings.EMBEDDING_INDEX_BACKEND
+    repository: EmbeddingRepository
+    if backend == "pgvector" and client is not None:
+        repository = EmbeddingRepositoryImpl(client)
+    elif backend in ("pgvector", "local", "memory"):
+        repository = get_local_embedding_repository()
+    else:
+        return None
+
+    return EmbeddingIndexService(repository, create_embedding_service())
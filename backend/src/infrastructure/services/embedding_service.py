@@ -0,0 +1,238 @@
+"""Embedding service with content-hash dedupe, persistent cache and adaptive concurrency.
+
+Infrastructure service wrapping Titan Embeddings for bulk use (ingest, backfill, retrieval).
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import unicodedata
+from collections.abc import Sequence
+from pathlib import Path
+
+import httpx
+import numpy as np
+import numpy.typing as npt
+
+from src.config import settings
+from src.domain.repositories.embedding_cache_repository import EmbeddingCacheRepository
+from src.infrastructure.external.bedrock_client import (
+    TITAN_EMBEDDINGS_MODEL_ID,
+    BedrockThrottledError,
+    invoke_embeddings_async,
+)
+from src.infrastructure.external.supabase_client import get_supabase_client
+from src.infrastructure.repositories.embedding_cache_repository_impl import EmbeddingCacheRepositoryImpl
+from src.infrastructure.repositories.sqlite_embedding_cache_repository import (
+    SqliteEmbeddingCacheRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# スロットリング時の再試行回数と初回待機秒数（指数バックオフ）
+MAX_THROTTLE_RETRIES = 5
+INITIAL_BACKOFF_SECONDS = 0.5
+
+
+def normalize_for_embedding(text: str) -> str:
+    """埋め込み用にテキストを正規化する（NFKC、空白の畳み込み）."""
+    return WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def content_hash(normalized_text: str, dimensions: int) -> str:
+    """正規化済みテキストのキャッシュキーを返す.
+
+    モデルIDと次元数を含めるため、モデル変更時に古いベクトルを誤って返さない。
+    """
+    key = f"{TITAN_EMBEDDINGS_MODEL_ID}:{dimensions}:{normalized_text}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD方式の同時実行数リミッター.
+
+    成功するたびに上限を緩やかに増やし（加算増加）、
+    スロットリングされたら上限を半分にする（乗算減少）。
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16) -> None:
+        """リミッターを初期化する.
+
+        Args:
+            initial: 初期の同時実行数
+            minimum: 同時実行数の下限
+            maximum: 同時実行数の上限
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """現在の同時実行数の上限."""
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        """実行枠が空くまで待機して確保する."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        """実行枠を解放する."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def on_success(self) -> None:
+        """成功を記録する（上限1回分の成功ごとに上限を1増やす）."""
+        async with self._condition:
+            self._limit = min(float(self.maximum), self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+    async def on_throttle(self) -> None:
+        """スロットリングを記録する（上限を半分にする）."""
+        async with self._condition:
+            self._limit = max(float(self.minimum), self._limit / 2)
+
+
+class EmbeddingService:
+    """埋め込み計算サービス.
+
+    入力を正規化テキストのハッシュで重複排除し、キャッシュ済みのものは
+    モデルを呼び出さずに返す。キャッシュにないものは適応的な同時実行数で
+    並行に計算し、結果をキャッシュに保存する。
+    """
+
+    def __init__(
+        self,
+        cache: EmbeddingCacheRepository | None,
+        dimensions: int = 1024,
+        max_concurrency: int = 16,
+    ) -> None:
+        """サービスを初期化する.
+
+        Args:
+            cache: 埋め込みキャッシュリポジトリ（Noneの場合はキャッシュしない）
+            dimensions: 埋め込みベクトルの次元数（256, 512, 1024）
+            max_concurrency: Bedrockへの同時リクエスト数の上限
+        """
+        self.cache = cache
+        self.dimensions = dimensions
+        self.limiter = AdaptiveConcurrencyLimiter(maximum=max_concurrency)
+
+    async def embed(self, texts: Sequence[str]) -> npt.NDArray[np.float32] | None:
+        """テキスト群を埋め込む.
+
+        Args:
+            texts: 埋め込むテキストのリスト
+
+        Returns:
+            shape (len(texts), dimensions) のfloat32配列。
+            1件でも計算に失敗した場合はNone（成功分はキャッシュに保存済み）。
+        """
+        normalized = [normalize_for_embedding(t) for t in texts]
+        keys = [content_hash(n, self.dimensions) for n in normalized]
+        unique = {k: n for k, n in zip(keys, normalized, strict=True) if n}
+
+        vectors = await self._get_cached(list(unique))
+        misses = {k: n for k, n in unique.items() if k not in vectors}
+        if misses:
+            computed = await self._compute(misses)
+            await self._put_cached(computed)
+            vectors.update(computed)
+            if len(computed) < len(misses):
+                logger.warning("Embedding failed for %d of %d texts", len(misses) - len(computed), len(misses))
+                return None
+
+        # 空文字列はモデルが受け付けないためゼロベクトルとする
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, key in enumerate(keys):
+            if key in vectors:
+                matrix[row] = vectors[key]
+        return matrix
+
+    async def embed_one(self, text: str) -> npt.NDArray[np.float32] | None:
+        """1件のテキストを埋め込む."""
+        matrix = await self.embed([text])
+        return None if matrix is None else matrix[0]
+
+    async def _compute(self, texts: dict[str, str]) -> dict[str, npt.NDArray[np.float32]]:
+        """キャッシュにないテキストを並行に埋め込む."""
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            results = await asyncio.gather(*(self._invoke_with_retry(client, text) for text in texts.values()))
+        return {key: vector for key, vector in zip(texts, results, strict=True) if vector is not None}
+
+    async def _invoke_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        text: str,
+    ) -> npt.NDArray[np.float32] | None:
+        """リミッターの枠内でBedrockを呼び出し、スロットリング時はバックオフして再試行する."""
+        backoff = INITIAL_BACKOFF_SECONDS
+        for _ in range(MAX_THROTTLE_RETRIES + 1):
+            await self.limiter.acquire()
+            try:
+                embedding = await invoke_embeddings_async(text, self.dimensions, client)
+            except BedrockThrottledError:
+                await self.limiter.on_throttle()
+            else:
+                if embedding is None:
+                    return None
+                await self.limiter.on_success()
+                return np.asarray(embedding, dtype=np.float32)
+            finally:
+                await self.limiter.release()
+            await asyncio.sleep(backoff)
+            backoff *= 2
+        logger.warning("Embedding request throttled %d times; giving up", MAX_THROTTLE_RETRIES + 1)
+        return None
+
+    async def _get_cached(self, keys: list[str]) -> dict[str, npt.NDArray[np.float32]]:
+        """キャッシュからベクトルを取得する（失敗時は全てミス扱い）."""
+        if self.cache is None or not keys:
+            return {}
+        try:
+            return await self.cache.get_many(keys, self.dimensions)
+        except Exception as e:
+            logger.warning("Failed to read embedding cache: %s", e)
+            return {}
+
+    async def _put_cached(self, vectors: dict[str, npt.NDArray[np.float32]]) -> None:
+        """ベクトルをキャッシュに保存する（失敗は警告のみ）."""
+        if self.cache is None or not vectors:
+            return
+        try:
+            await self.cache.put_many(vectors, self.dimensions)
+        except Exception as e:
+            logger.warning("Failed to write embedding cache: %s", e)
+
+
+def create_embedding_service() -> EmbeddingService:
+    """設定に応じたEmbeddingServiceを作成する.
+
+    pgvector使用時にサービスキーのSupabaseクライアントを作成できる場合はembedding_cacheテーブルに、
+    それ以外はEMBEDDING_CACHE_PATHのSQLiteファイルにキャッシュする。
+    embedding_cacheはユーザーに紐づかない共有のテーブルでRLSのポリシーを持たないため、
+    リクエストのユーザーのクライアントではなく、常にサービスキーのクライアントで読み書きする。
+
+    Returns:
+        EmbeddingService
+    """
+    client = get_supabase_client() if settings.EMBEDDING_INDEX_BACKEND == "pgvector" else None
+    cache: EmbeddingCacheRepository
+    if client is not None:
+        cache = EmbeddingCacheRepositoryImpl(client)
+    else:
+        cache = SqliteEmbeddingCacheRepository(Path(settings.EMBEDDING_CACHE_PATH))
+
+    return EmbeddingService(
+        cache,
+        dimensions=settings.EMBEDDING_DIMENSIONS,
+        max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+    )
@@ -0,0 +1,117 @@
+"""Full-text search index service.
+
+Infrastructure service for registering knowledge and transcripts
+in the full-text search index.
+"""
+
+from uuid import UUID, uuid4
+
+from supabase import Client
+
+from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.meeting_transcript import MeetingTranscript
+from src.domain.entities.search_entry import SearchEntry, SearchSourceType
+from src.domain.repositories.search_repository import SearchRepository
+from src.domain.services.text_chunker import chunk_text
+from src.infrastructure.repositories.search_repository_impl import SearchRepositoryImpl
+
+
+class SearchIndexService:
+    """全文検索インデックスサービス.
+
+    トランスクリプトは発話単位で登録し、ヒットした発話の話者・タイムスタンプを返せるようにする。
+    構造化データがない場合とナレッジはチャンク単位で登録する。
+    """
+
+    def __init__(self, repository: SearchRepository) -> None:
+        """サービスを初期化する.
+
+        Args:
+            repository: 全文検索インデックスリポジトリ
+        """
+        self.repository = repository
+
+    async def index_knowledge(self, knowledge: Knowledge) -> int:
+        """ナレッジをインデックスに登録する.
+
+        Args:
+            knowledge: 登録するナレッジ
+
+        Returns:
+            登録したエントリ数
+        """
+        entries = [
+            SearchEntry(
+                id=uuid4(),
+                user_id=knowledge.user_id,
+                source_type=SearchSourceType.KNOWLEDGE,
+                source_id=knowledge.id,
+                entry_index=index,
+                content=content,
+                agent_id=knowledge.agent_id,
+                source_date=knowledge.meeting_date,
+            )
+            for index, content in enumerate(chunk_text(knowledge.normalized_text))
+        ]
+        await self.repository.replace_source(knowledge.user_id, SearchSourceType.KNOWLEDGE, knowledge.id, entries)
+        return len(entries)
+
+    async def index_transcript(
+        self,
+        transcript: MeetingTranscript,
+        user_id: UUID,
+        agent_id: UUID | None = None,
+    ) -> int:
+        """トランスクリプトをインデックスに登録する.
+
+        Args:
+            transcript: 登録するトランスクリプト
+            user_id: 所有ユーザーのID
+            agent_id: 定例MTGに紐付けられたエージェントID
+
+        Returns:
+            登録したエントリ数
+        """
+
+        def build(index: int, content: str, speaker: str | None, timestamp: str | None) -> SearchEntry:
+            return SearchEntry(
+                id=uuid4(),
+                user_id=user_id,
+                source_type=SearchSourceType.TRANSCRIPT,
+                source_id=transcript.id,
+                entry_index=index,
+                content=content,
+                agent_id=agent_id,
+                recurring_meeting_id=transcript.recurring_meeting_id,
+                source_date=transcript.meeting_date,
+                speaker=speaker,
+                timestamp=timestamp,
+            )
+
+        if transcript.structured_data is not None and transcript.structured_data.entries:
+            entries = [
+                build(index, entry.text, entry.speaker, entry.timestamp)
+                for index, entry in enumerate(transcript.structured_data.entries)
+                if entry.text.strip()
+            ]
+        else:
+            entries = [
+                build(index, content, None, None) for index, content in enumerate(chunk_text(transcript.raw_text))
+            ]
+
+        await self.repository.replace_source(user_id, SearchSourceType.TRANSCRIPT, transcript.id, entries)
+        return len(entries)
+
+
+def create_search_index_service(client: Client | None) -> SearchIndexService | None:
+    """SearchIndexServiceを作成する.
+
+    Args:
+        client: Supabaseクライアント
+
+    Returns:
+        SearchIndexService。クライアントがない場合はNone。
+    """
+    if client is None:
+        return None
+    return SearchIndexService(SearchRepositoryImpl(client))
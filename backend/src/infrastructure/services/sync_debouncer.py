@@ -0,0 +1,77 @@
+"""Debounced background sync runner.
+
+Coalesces bursts of push notifications into a single sync per key.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+SyncJob = Callable[[], Awaitable[None]]
+
+
+class SyncDebouncer:
+    """キー（同期種別×Google連携）ごとに同期をまとめて実行する.
+
+    最初の通知から delay_seconds 待ってから1回だけ同期する。待機中に届いた
+    同じキーの通知はその同期にまとめる。同期の実行中に届いた通知は
+    次の同期として予約するため、実行中の変更を取りこぼさない（同じキーの同期は
+    並行して実行しない）。通知が途切れなくても delay_seconds ごとに同期が進む
+    （タイマーは延長しない）。
+    """
+
+    def __init__(self, delay_seconds: float) -> None:
+        """初期化する.
+
+        Args:
+            delay_seconds: 最初の通知から同期を始めるまでの待ち時間（秒）
+        """
+        self._delay_seconds = delay_seconds
+        self._pending: dict[str, asyncio.Task[None]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._running: set[asyncio.Task[None]] = set()
+
+    def schedule(self, key: str, job: SyncJob) -> bool:
+        """同期を予約する.
+
+        Args:
+            key: まとめる単位のキー
+            job: 実行する同期処理
+
+        Returns:
+            新しく予約した場合はTrue、待機中の同期にまとめた場合はFalse
+        """
+        if key in self._pending:
+            return False
+
+        task = asyncio.get_running_loop().create_task(self._run(key, job))
+        self._pending[key] = task
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        return True
+
+    def is_pending(self, key: str) -> bool:
+        """待機中の同期があるか確認する."""
+        return key in self._pending
+
+    async def drain(self) -> None:
+        """予約済み・実行中の同期がすべて終わるまで待つ."""
+        while self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def _run(self, key: str, job: SyncJob) -> None:
+        """待ち時間の後に同期を実行する."""
+        try:
+            await asyncio.sleep(self._delay_seconds)
+        finally:
+            # 実行開始以降の通知は次の同期として予約できるようにする
+            self._pending.pop(key, None)
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            try:
+                await job()
+            except Exception:
+                logger.exception("Debounced sync failed: %s", key)
@@ -0,0 +1,123 @@
+"""Compression codec for transcript bodies.
+
+Transcripts are stored zstd-compressed, optionally with a dictionary trained
+on past transcripts (speaker lines and timestamps repeat heavily, so a shared
+dictionary helps even for short documents).
+Following ADR-0001 clean architecture principles.
+"""
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import zstandard
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+CODEC_ZSTD = "zstd"
+COMPRESSION_LEVEL = 12
+
+# zstdの推奨サイズ（110KB）
+DEFAULT_DICTIONARY_SIZE = 112_640
+
+
+@dataclass(frozen=True)
+class CompressedBody:
+    """圧縮済みの本文.
+
+    Attributes:
+        codec: 圧縮方式
+        dictionary_id: 圧縮に使った辞書のID（辞書なしは0）
+        data: 圧縮データ
+        raw_size: 圧縮前のUTF-8バイト数
+    """
+
+    codec: str
+    dictionary_id: int
+    data: bytes
+    raw_size: int
+
+
+class TranscriptBodyCodec:
+    """トランスクリプト本文のzstd圧縮・展開.
+
+    圧縮には最後に渡した辞書を使い、展開には辞書IDが一致する辞書を使う。
+    辞書を再学習しても、古い辞書を残しておけば過去の本文を展開できる。
+    """
+
+    def __init__(self, dictionaries: Sequence[bytes] = (), level: int = COMPRESSION_LEVEL) -> None:
+        """コーデックを初期化する.
+
+        Args:
+            dictionaries: 学習済みのzstd辞書（古い順、空の場合は辞書なし）
+            level: 圧縮レベル
+        """
+        self._dictionaries: dict[int, zstandard.ZstdCompressionDict] = {}
+        self._dictionary: zstandard.ZstdCompressionDict | None = None
+        for data in dictionaries:
+            self._dictionary = zstandard.ZstdCompressionDict(data)
+            self._dictionaries[self._dictionary.dict_id()] = self._dictionary
+        self.dictionary_id = self._dictionary.dict_id() if self._dictionary is not None else 0
+        self._level = level
+
+    def compress(self, text: str) -> CompressedBody:
+        """本文を圧縮する."""
+        raw = text.encode("utf-8")
+        compressor = zstandard.ZstdCompressor(level=self._level, dict_data=self._dictionary)
+        return CompressedBody(
+            codec=CODEC_ZSTD,
+            dictionary_id=self.dictionary_id,
+            data=compressor.compress(raw),
+            raw_size=len(raw),
+        )
+
+    def decompress(self, data: bytes, dictionary_id: int = 0) -> str:
+        """圧縮データを本文に戻す.
+
+        Args:
+            data: 圧縮データ
+            dictionary_id: 圧縮時の辞書ID
+
+        Returns:
+            本文
+
+        Raises:
+            ValueError: 圧縮時の辞書が読み込まれていない場合
+        """
+        dictionary = self._dictionaries.get(dictionary_id) if dictionary_id else None
+        if dictionary_id and dictionary is None:
+            raise ValueError(f"zstd dictionary {dictionary_id} is not loaded")
+        decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+        return decompressor.decompress(data).decode("utf-8")
+
+
+def train_dictionary(samples: Sequence[str], size: int = DEFAULT_DICTIONARY_SIZE) -> bytes:
+    """過去のトランスクリプトからzstd辞書を学習する.
+
+    Args:
+        samples: 学習に使う本文
+        size: 辞書の最大バイト数
+
+    Returns:
+        辞書データ
+    """
+    dictionary = zstandard.train_dictionary(size, [s.encode("utf-8") for s in samples])
+    return dictionary.as_bytes()
+
+
+@lru_cache
+def get_transcript_body_codec() -> TranscriptBodyCodec:
+    """TRANSCRIPT_ZSTD_DICTIONARY_DIRの辞書（*.zdict、名前順で最後を圧縮に使用）を読み込んだコーデックを返す.
+
+    辞書がない場合は辞書なしで圧縮する。
+    """
+    directory = Path(settings.TRANSCRIPT_ZSTD_DICTIONARY_DIR) if settings.TRANSCRIPT_ZSTD_DICTIONARY_DIR else None
+    paths = sorted(directory.glob("*.zdict")) if directory is not None and directory.is_dir() else []
+    codec = TranscriptBodyCodec([p.read_bytes() for p in paths])
+    if paths:
+        logger.info("Loaded %d transcript zstd dictionaries (current id=%d)", len(paths), codec.dictionary_id)
+    return codec
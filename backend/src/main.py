@@ -1,16 +1,38 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import settings
+from src.infrastructure.external.supabase_client import get_supabase_client
+from src.presentation.api.v1.endpoints.agendas import create_agenda_job_worker_pool
+from src.presentation.api.v1.endpoints.calendar import SYNC_COUNT_HEADERS
+from src.presentation.api.v1.pagination import NEXT_CURSOR_HEADER
 from src.presentation.api.v1.router import api_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the agenda job workers while the application is running."""
+    client = get_supabase_client() if settings.AGENDA_JOB_WORKERS > 0 else None
+    pool = create_agenda_job_worker_pool(client, settings.AGENDA_JOB_WORKERS) if client is not None else None
+    if pool is not None:
+        pool.start()
+    try:
+        yield
+    finally:
+        if pool is not None:
+            await pool.stop()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     app = FastAPI(
         title=settings.PROJECT_NAME,
         version=settings.VERSION,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        lifespan=lifespan,
     )
 
     # CORS設定
@@ -20,6 +42,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, *SYNC_COUNT_HEADERS.values(), "Location"],
     )
 
     # ルーター登録
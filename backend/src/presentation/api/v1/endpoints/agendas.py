@@ -1,24 +1,52 @@
 """Agenda API endpoints.
 
 REST API endpoints for agenda management.
+Agenda generation runs as a job on a worker pool; POST /agendas/generate
+either waits for the job or, with "Prefer: respond-async", returns it at once.
+When the inputs are unchanged since the last agenda, it is returned without a job;
+concurrent requests with the same inputs share one job.
 """
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from supabase import Client
 
+from src.application.use_cases.agenda_job_use_cases import (
+    EnqueueAgendaJobUseCase,
+    GetAgendaJobUseCase,
+    RunAgendaJobUseCase,
+    data_sources_of,
+)
+from src.application.use_cases.agenda_pregeneration_use_cases import GetAgendaDraftUseCase
 from src.application.use_cases.agenda_use_cases import (
+    GENERATION_TIMEOUT_MESSAGE,
+    AgendaSourceWatermarkReader,
+    CheckAgendaInputsUseCase,
     DeleteAgendaUseCase,
     GenerateAgendaUseCase,
+    GenerateResult,
     GetAgendasUseCase,
     GetAgendaUseCase,
+    IncrementalLimits,
     UpdateAgendaUseCase,
 )
+from src.config import settings
 from src.domain.entities.agenda import Agenda
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStatus
+from src.domain.entities.page_cursor import PageCursor
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
 from src.infrastructure.external.supabase_client import get_supabase_client
+from src.infrastructure.repositories.agenda_job_repository_impl import AgendaJobRepositoryImpl
 from src.infrastructure.repositories.agenda_repository_impl import AgendaRepositoryImpl
 from src.infrastructure.repositories.agent_repository_impl import AgentRepositoryImpl
 from src.infrastructure.repositories.dictionary_repository_impl import DictionaryRepositoryImpl
+from src.infrastructure.repositories.generated_agenda_repository_impl import GeneratedAgendaRepositoryImpl
 from src.infrastructure.repositories.knowledge_repository_impl import KnowledgeRepositoryImpl
 from src.infrastructure.repositories.meeting_transcript_repository_impl import (
     MeetingTranscriptRepositoryImpl,
@@ -30,10 +58,15 @@ from src.infrastructure.repositories.slack_integration_repository_impl import (
     SlackIntegrationRepositoryImpl,
 )
 from src.infrastructure.services.agenda_generation_service import AgendaGenerationService
+from src.infrastructure.services.agenda_job_worker import AgendaJobWorkerPool
+from src.infrastructure.services.embedding_index_service import create_embedding_index_service
 from src.presentation.api.v1.dependencies import get_current_user_id
+from src.presentation.api.v1.pagination import fetch_limit, get_page_cursor, paginate
 from src.presentation.schemas.agenda import (
+    AgendaDraftResponse,
     AgendaGenerateRequest,
     AgendaGenerateResponse,
+    AgendaJobResponse,
     AgendaResponse,
     AgendaUpdate,
     DataSourcesInfo,
@@ -55,69 +88,255 @@ def _to_response(agenda: Agenda) -> AgendaResponse:
     )
 
 
-@router.post("/generate", response_model=AgendaGenerateResponse, status_code=status.HTTP_201_CREATED)
-async def generate_agenda(
-    data: AgendaGenerateRequest,
-    user_id: UUID = Depends(get_current_user_id),
-) -> AgendaGenerateResponse:
-    """アジェンダを生成する."""
+def get_service_client() -> Client:
+    """サービスキーのSupabaseクライアントを取得する."""
     client = get_supabase_client()
     if client is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database connection not available",
         )
+    return client
+
+
+def get_agenda_job_repository(client: Client = Depends(get_service_client)) -> AgendaJobRepository:
+    """アジェンダ生成ジョブのリポジトリを取得する."""
+    return AgendaJobRepositoryImpl(client)
+
+
+def _build_watermark_reader(client: Client) -> AgendaSourceWatermarkReader:
+    """アジェンダ生成の入力のウォーターマークの読み取りを組み立てる."""
+    return AgendaSourceWatermarkReader(
+        KnowledgeRepositoryImpl(client),
+        DictionaryRepositoryImpl(client),
+        RecurringMeetingRepositoryImpl(client),
+        MeetingTranscriptRepositoryImpl(client),
+        slack_repository=SlackIntegrationRepositoryImpl(client),
+    )
+
+
+def _build_generate_use_case(client: Client) -> GenerateAgendaUseCase:
+    """アジェンダ生成ユースケースを組み立てる."""
+    return GenerateAgendaUseCase(
+        agenda_repository=AgendaRepositoryImpl(client),
+        agent_repository=AgentRepositoryImpl(client),
+        knowledge_repository=KnowledgeRepositoryImpl(client),
+        dictionary_repository=DictionaryRepositoryImpl(client),
+        slack_repository=SlackIntegrationRepositoryImpl(client),
+        generation_service=AgendaGenerationService(),
+        recurring_meeting_repository=RecurringMeetingRepositoryImpl(client),
+        meeting_transcript_repository=MeetingTranscriptRepositoryImpl(client),
+        embedding_index_service=create_embedding_index_service(client),
+        watermark_reader=_build_watermark_reader(client),
+        incremental_limits=IncrementalLimits(
+            max_slack_messages=settings.AGENDA_INCREMENTAL_MAX_SLACK_MESSAGES,
+            max_transcripts=settings.AGENDA_INCREMENTAL_MAX_TRANSCRIPTS,
+        ),
+    )
+
+
+def create_agenda_job_worker_pool(client: Client, concurrency: int) -> AgendaJobWorkerPool:
+    """アジェンダ生成ジョブのワーカープールを作成する.
+
+    Args:
+        client: サービスキーのSupabaseクライアント
+        concurrency: 同時に実行するジョブの数
+
+    Returns:
+        起動前のワーカープール
+    """
+    repository = AgendaJobRepositoryImpl(client)
+
+    async def run_job(job: AgendaJob, worker_id: str) -> None:
+        use_case = RunAgendaJobUseCase(
+            repository,
+            _build_generate_use_case(client),
+            settings.AGENDA_JOB_RETRY_BASE_SECONDS,
+            generated_agenda_repository=GeneratedAgendaRepositoryImpl(client),
+        )
+        await use_case.execute(job, worker_id)
+
+    return AgendaJobWorkerPool(
+        repository,
+        run_job,
+        concurrency=concurrency,
+        poll_seconds=settings.AGENDA_JOB_POLL_SECONDS,
+        stale_after=timedelta(seconds=settings.AGENDA_JOB_STALE_SECONDS),
+    )
+
 
-    agenda_repository = AgendaRepositoryImpl(client)
-    agent_repository = AgentRepositoryImpl(client)
-    knowledge_repository = KnowledgeRepositoryImpl(client)
-    dictionary_repository = DictionaryRepositoryImpl(client)
-    slack_repository = SlackIntegrationRepositoryImpl(client)
-    recurring_meeting_repository = RecurringMeetingRepositoryImpl(client)
-    meeting_transcript_repository = MeetingTranscriptRepositoryImpl(client)
-    generation_service = AgendaGenerationService()
-
-    use_case = GenerateAgendaUseCase(
-        agenda_repository=agenda_repository,
-        agent_repository=agent_repository,
-        knowledge_repository=knowledge_repository,
-        dictionary_repository=dictionary_repository,
-        slack_repository=slack_repository,
-        generation_service=generation_service,
-        recurring_meeting_repository=recurring_meeting_repository,
-        meeting_transcript_repository=meeting_transcript_repository,
+def _to_generate_response(result: GenerateResult) -> AgendaGenerateResponse:
+    """生成結果をレスポンスに変換."""
+    return AgendaGenerateResponse(
+        agenda=_to_response(result.agenda),
+        data_sources=DataSourcesInfo(**data_sources_of(result)),
     )
 
+
+def _to_job_response(job: AgendaJob) -> AgendaJobResponse:
+    """ジョブをレスポンスに変換."""
+    return AgendaJobResponse(
+        id=job.id,
+        agent_id=job.agent_id,
+        status=job.status.value,
+        stage=job.stage.value if job.stage else None,
+        attempts=job.attempts,
+        agenda_id=job.agenda_id,
+        data_sources=DataSourcesInfo(**job.result) if job.result else None,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        finished_at=job.finished_at,
+    )
+
+
+async def _wait_for_job(
+    repository: AgendaJobRepository, job_id: UUID, user_id: UUID, timeout: float
+) -> AgendaJob | None:
+    """ジョブの完了を待つ（タイムアウトした場合は最後に取得した状態を返す）."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        job = await repository.get_by_id(job_id, user_id)
+        if job is None or job.is_finished or loop.time() >= deadline:
+            return job
+        await asyncio.sleep(settings.AGENDA_JOB_EVENTS_POLL_SECONDS)
+
+
+@router.post(
+    "/generate",
+    response_model=AgendaGenerateResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": AgendaJobResponse, "description": "Prefer: respond-async"}},
+)
+async def generate_agenda(
+    data: AgendaGenerateRequest,
+    prefer: str | None = Header(None),
+    user_id: UUID = Depends(get_current_user_id),
+    client: Client = Depends(get_service_client),
+    job_repository: AgendaJobRepository = Depends(get_agenda_job_repository),
+) -> AgendaGenerateResponse | JSONResponse:
+    """アジェンダを生成する.
+
+    生成はジョブとしてワーカーが実行する。"Prefer: respond-async" ヘッダーを付けた場合は
+    ジョブを登録してすぐに202を返す（進捗は /agendas/jobs/{job_id} で取得する）。
+    付けない場合はジョブの完了を待ってアジェンダを返す（呼び出し元が待っているためリトライしない）。
+    forceを指定しない場合、入力（ナレッジ・議事録・Slack・辞書）が前回の生成から変わっていなければ
+    ジョブを登録せずに前回のアジェンダを200で返す（data_sources.reusedがtrue）。
+    入力が同じ実行待ち・実行中のジョブがあれば、新しく登録せずにそのジョブを返す・待つ。
+    """
+    check = await CheckAgendaInputsUseCase(
+        AgentRepositoryImpl(client), AgendaRepositoryImpl(client), _build_watermark_reader(client)
+    ).execute(user_id, data.agent_id)
+    if check is not None and check.reusable is not None and not data.force:
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=_to_generate_response(check.reusable).model_dump(mode="json"),
+        )
+
+    respond_async = prefer is not None and "respond-async" in prefer.lower()
+    use_case = EnqueueAgendaJobUseCase(
+        job_repository,
+        AgentRepositoryImpl(client),
+        max_attempts=settings.AGENDA_JOB_MAX_ATTEMPTS if respond_async else 1,
+    )
     try:
-        result = await use_case.execute(user_id, data.agent_id)
-        return AgendaGenerateResponse(
-            agenda=_to_response(result.agenda),
-            data_sources=DataSourcesInfo(
-                has_knowledge=result.has_knowledge,
-                has_slack_messages=result.has_slack_messages,
-                slack_message_count=result.slack_message_count,
-                dictionary_entry_count=result.dictionary_entry_count,
-                has_transcripts=result.has_transcripts,
-                transcript_count=result.transcript_count,
-                slack_error=result.slack_error,
-            ),
+        job = await use_case.execute(
+            user_id, data.agent_id, force=data.force, input_fingerprint=check.fingerprint if check else None
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
-    except TimeoutError as e:
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Agenda generation timed out",
-        ) from e
+
+    if respond_async:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=_to_job_response(job).model_dump(mode="json"),
+            headers={
+                "Location": f"{settings.API_V1_STR}/agendas/jobs/{job.id}",
+                "Preference-Applied": "respond-async",
+            },
+        )
+
+    finished = await _wait_for_job(job_repository, job.id, user_id, settings.AGENDA_JOB_WAIT_SECONDS)
+    if finished is None or not finished.is_finished or finished.error == GENERATION_TIMEOUT_MESSAGE:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=GENERATION_TIMEOUT_MESSAGE)
+    if finished.status == AgendaJobStatus.FAILED:
+        if finished.error == "Agent not found":
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=finished.error)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Agenda generation failed")
+
+    agenda = await AgendaRepositoryImpl(client).get_by_id(finished.agenda_id, user_id) if finished.agenda_id else None
+    if agenda is None:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Agenda generation failed")
+    return AgendaGenerateResponse(
+        agenda=_to_response(agenda),
+        data_sources=DataSourcesInfo(**(finished.result or {})),
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=AgendaJobResponse)
+async def get_agenda_job(
+    job_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    job_repository: AgendaJobRepository = Depends(get_agenda_job_repository),
+) -> AgendaJobResponse:
+    """アジェンダ生成ジョブの状態を取得する."""
+    job = await GetAgendaJobUseCase(job_repository).execute(job_id, user_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Agenda job not found")
+    return _to_job_response(job)
+
+
+def _job_event(job: AgendaJob) -> str:
+    """ジョブの状態をSSEのイベントに変換する（イベント名は段階、完了後はステータス）."""
+    name = job.status.value if job.is_finished or job.stage is None else job.stage.value
+    payload = json.dumps(_to_job_response(job).model_dump(mode="json"), ensure_ascii=False)
+    return f"event: {name}\ndata: {payload}\n\n"
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_agenda_job_events(
+    job_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    job_repository: AgendaJobRepository = Depends(get_agenda_job_repository),
+) -> StreamingResponse:
+    """アジェンダ生成ジョブの進捗をServer-Sent Eventsで送る.
+
+    段階（gathering / slack / llm / persist）が進むたびにイベントを送り、
+    succeeded / failed のイベントを送ったら終了する。
+    """
+    job = await job_repository.get_by_id(job_id, user_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Agenda job not found")
+
+    async def events(current: AgendaJob | None) -> AsyncIterator[str]:
+        last_state: tuple[object, ...] | None = None
+        while current is not None:
+            state = (current.status, current.stage, current.attempts)
+            if state != last_state:
+                yield _job_event(current)
+                last_state = state
+            if current.is_finished:
+                return
+            await asyncio.sleep(settings.AGENDA_JOB_EVENTS_POLL_SECONDS)
+            current = await job_repository.get_by_id(job_id, user_id)
+
+    return StreamingResponse(
+        events(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("", response_model=list[AgendaResponse])
 async def get_agendas(
     agent_id: UUID,
+    response: Response,
     limit: int | None = Query(None, ge=1, le=100),
+    cursor: PageCursor | None = Depends(get_page_cursor),
     user_id: UUID = Depends(get_current_user_id),
 ) -> list[AgendaResponse]:
-    """アジェンダ一覧を取得する."""
+    """アジェンダ一覧を取得する（生成日時の降順、続きはX-Next-Cursorヘッダーのカーソルで取得）."""
     client = get_supabase_client()
     if client is None:
         raise HTTPException(
@@ -126,8 +345,35 @@ async def get_agendas(
         )
     repository = AgendaRepositoryImpl(client)
     use_case = GetAgendasUseCase(repository)
-    agendas = await use_case.execute(agent_id, user_id, limit)
-    return [_to_response(a) for a in agendas]
+    agendas = await use_case.execute(agent_id, user_id, fetch_limit(limit), cursor)
+    page = paginate(agendas, limit, response, lambda a: PageCursor(a.generated_at, a.id))
+    return [_to_response(a) for a in page]
+
+
+@router.get("/draft", response_model=AgendaDraftResponse | None)
+async def get_agenda_draft(
+    agent_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    client: Client = Depends(get_service_client),
+) -> AgendaDraftResponse | None:
+    """次回開催に向けて事前生成したアジェンダの下書きを取得する（ない場合はnull）."""
+    use_case = GetAgendaDraftUseCase(
+        RecurringMeetingRepositoryImpl(client),
+        GeneratedAgendaRepositoryImpl(client),
+        AgendaRepositoryImpl(client),
+    )
+    draft = await use_case.execute(agent_id, user_id)
+    if draft is None:
+        return None
+    generated_agenda = draft.generated_agenda
+    data_sources = generated_agenda.agenda_content.get("data_sources")
+    return AgendaDraftResponse(
+        recurring_meeting_id=generated_agenda.recurring_meeting_id,
+        target_date=generated_agenda.target_date,
+        agenda=_to_response(draft.agenda),
+        data_sources=DataSourcesInfo(**data_sources) if data_sources else None,
+        generated_at=generated_agenda.updated_at or generated_agenda.created_at,
+    )
 
 
 @router.get("/{agenda_id}", response_model=AgendaResponse)
@@ -6,7 +6,7 @@ REST API endpoints for recurring meeting management.
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from supabase import Client
 
 from src.application.use_cases.calendar_use_cases import (
@@ -34,6 +34,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
 
+# 同期の内訳はレスポンスボディ（定例MTGの配列）を変えずにヘッダーで返す
+SYNC_COUNT_HEADERS = {
+    "created": "X-Sync-Created",
+    "updated": "X-Sync-Updated",
+    "unchanged": "X-Sync-Unchanged",
+    "deleted": "X-Sync-Deleted",
+}
+
 
 def get_google_integration_repository(
     client: Client = Depends(get_user_supabase_client),
@@ -89,18 +97,24 @@ async def get_unlinked_meetings(
 
 @router.post("/sync", response_model=list[RecurringMeetingResponse])
 async def sync_recurring_meetings(
+    response: Response,
     user_id: UUID = Depends(get_current_user_id),
     google_integration_repo: GoogleIntegrationRepositoryImpl = Depends(get_google_integration_repository),
     recurring_meeting_repo: RecurringMeetingRepositoryImpl = Depends(get_recurring_meeting_repository),
 ) -> list[RecurringMeetingResponse]:
-    """Google Calendarから定例MTGを同期する."""
+    """Google Calendarから定例MTGを同期する（作成・更新・変更なし・削除の件数はX-Sync-*ヘッダー）."""
     use_case = SyncRecurringMeetingsUseCase(google_integration_repo, recurring_meeting_repo)
     try:
-        meetings = await use_case.execute(user_id)
-        return [_to_response(m) for m in meetings]
+        result = await use_case.execute(user_id)
     except ValueError as e:
         logger.warning(f"Sync failed for user {user_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         ) from None
+
+    response.headers[SYNC_COUNT_HEADERS["created"]] = str(result.created_count)
+    response.headers[SYNC_COUNT_HEADERS["updated"]] = str(result.updated_count)
+    response.headers[SYNC_COUNT_HEADERS["unchanged"]] = str(result.unchanged_count)
+    response.headers[SYNC_COUNT_HEADERS["deleted"]] = str(result.deleted_count)
+    return [_to_response(m) for m in result.meetings]
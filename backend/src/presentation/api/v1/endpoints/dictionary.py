@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from src.application.use_cases.dictionary_use_cases import (
     CreateDictionaryEntryUseCase,
@@ -12,11 +12,13 @@ from src.application.use_cases.dictionary_use_cases import (
     UpdateDictionaryEntryUseCase,
 )
 from src.domain.entities.dictionary_entry import DictionaryCategory, DictionaryEntry
+from src.domain.entities.page_cursor import PageCursor
 from src.infrastructure.external.supabase_client import get_supabase_client
 from src.infrastructure.repositories.dictionary_repository_impl import (
     DictionaryRepositoryImpl,
 )
 from src.presentation.api.v1.dependencies import get_current_user_id
+from src.presentation.api.v1.pagination import fetch_limit, get_page_cursor, paginate
 from src.presentation.schemas.dictionary import (
     DictionaryCategoryEnum,
     DictionaryEntryCreate,
@@ -80,13 +82,20 @@ async def create_dictionary_entry(
 
 @router.get("", response_model=list[DictionaryEntryResponse])
 async def get_dictionary_entries(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=100),
+    cursor: PageCursor | None = Depends(get_page_cursor),
     user_id: UUID = Depends(get_current_user_id),
     repository: DictionaryRepositoryImpl = Depends(get_repository),
 ) -> list[DictionaryEntryResponse]:
-    """Get all dictionary entries for the authenticated user."""
+    """Get dictionary entries for the authenticated user, newest first.
+
+    With `limit`, the cursor for the next page is returned in the X-Next-Cursor header.
+    """
     use_case = GetDictionaryEntriesUseCase(repository)
-    entries = await use_case.execute(user_id)
-    return [_entry_to_response(e) for e in entries]
+    entries = await use_case.execute(user_id, fetch_limit(limit), cursor)
+    page = paginate(entries, limit, response, lambda e: PageCursor(e.created_at, e.id))
+    return [_entry_to_response(e) for e in page]
 
 
 @router.get("/{entry_id}", response_model=DictionaryEntryResponse)
@@ -5,7 +5,7 @@ REST API endpoints for knowledge management.
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from src.application.use_cases.knowledge_use_cases import (
     DeleteKnowledgeUseCase,
@@ -14,12 +14,16 @@ from src.application.use_cases.knowledge_use_cases import (
     UploadKnowledgeUseCase,
 )
 from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.page_cursor import PageCursor
 from src.infrastructure.external.supabase_client import get_supabase_client
 from src.infrastructure.repositories.agent_repository_impl import AgentRepositoryImpl
 from src.infrastructure.repositories.dictionary_repository_impl import DictionaryRepositoryImpl
 from src.infrastructure.repositories.knowledge_repository_impl import KnowledgeRepositoryImpl
+from src.infrastructure.services.embedding_index_service import create_embedding_index_service
 from src.infrastructure.services.normalization_service_impl import NormalizationServiceImpl
+from src.infrastructure.services.search_index_service import create_search_index_service
 from src.presentation.api.v1.dependencies import get_current_user_id
+from src.presentation.api.v1.pagination import fetch_limit, get_page_cursor, paginate
 from src.presentation.schemas.knowledge import (
     KnowledgeCreate,
     KnowledgeResponse,
@@ -65,6 +69,8 @@ async def upload_knowledge(
         dictionary_repository=dictionary_repository,
         agent_repository=agent_repository,
         normalization_service=normalization_service,
+        embedding_index_service=create_embedding_index_service(client),
+        search_index_service=create_search_index_service(client),
     )
 
     try:
@@ -87,10 +93,12 @@ async def upload_knowledge(
 @router.get("", response_model=list[KnowledgeResponse])
 async def get_knowledge_list(
     agent_id: UUID,
+    response: Response,
     limit: int | None = Query(None, ge=1, le=100),
+    cursor: PageCursor | None = Depends(get_page_cursor),
     user_id: UUID = Depends(get_current_user_id),
 ) -> list[KnowledgeResponse]:
-    """ナレッジ一覧を取得する."""
+    """ナレッジ一覧を取得する（MTG開催日時の降順、続きはX-Next-Cursorヘッダーのカーソルで取得）."""
     client = get_supabase_client()
     if client is None:
         raise HTTPException(
@@ -100,8 +108,9 @@ async def get_knowledge_list(
 
     repository = KnowledgeRepositoryImpl(client)
     use_case = GetKnowledgeListUseCase(repository)
-    knowledge_list = await use_case.execute(agent_id, user_id, limit)
-    return [_to_response(k) for k in knowledge_list]
+    knowledge_list = await use_case.execute(agent_id, user_id, fetch_limit(limit), cursor)
+    page = paginate(knowledge_list, limit, response, lambda k: PageCursor(k.meeting_date, k.id))
+    return [_to_response(k) for k in page]
 
 
 @router.get("/{knowledge_id}", response_model=KnowledgeResponse)
@@ -139,7 +148,7 @@ async def delete_knowledge(
         )
 
     repository = KnowledgeRepositoryImpl(client)
-    use_case = DeleteKnowledgeUseCase(repository)
+    use_case = DeleteKnowledgeUseCase(repository, create_embedding_index_service(client))
     deleted = await use_case.execute(knowledge_id, user_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Knowledge not found")
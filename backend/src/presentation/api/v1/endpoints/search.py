@@ -0,0 +1,66 @@
+"""Search API endpoints.
+
+REST API endpoints for full-text search over transcripts and knowledge.
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from supabase import Client
+
+from src.application.use_cases.search_use_cases import SearchUseCase
+from src.domain.entities.search_entry import SearchHit, SearchSourceType
+from src.infrastructure.repositories.search_repository_impl import SearchRepositoryImpl
+from src.presentation.api.v1.dependencies import (
+    get_current_user_id,
+    get_user_supabase_client,
+)
+from src.presentation.schemas.search import SearchHitResponse
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def get_repository(
+    client: Client = Depends(get_user_supabase_client),
+) -> SearchRepositoryImpl:
+    """リポジトリのDI（ユーザーコンテキスト付きクライアント使用）."""
+    return SearchRepositoryImpl(client)
+
+
+def _to_response(hit: SearchHit) -> SearchHitResponse:
+    """ヒットをレスポンスに変換."""
+    entry = hit.entry
+    return SearchHitResponse(
+        source_type=entry.source_type.value,
+        source_id=entry.source_id,
+        agent_id=entry.agent_id,
+        recurring_meeting_id=entry.recurring_meeting_id,
+        source_date=entry.source_date,
+        speaker=entry.speaker,
+        timestamp=entry.timestamp,
+        snippet=hit.snippet,
+        score=hit.score,
+    )
+
+
+@router.get("", response_model=list[SearchHitResponse])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="検索語（空白区切りで全ての語を含むものを検索）"),
+    source_type: SearchSourceType | None = Query(None, description="元データ種別で絞り込む"),
+    agent_id: UUID | None = Query(None, description="エージェントで絞り込む"),
+    recurring_meeting_id: UUID | None = Query(None, description="定例MTGで絞り込む"),
+    limit: int = Query(20, ge=1, le=100),
+    user_id: UUID = Depends(get_current_user_id),
+    repository: SearchRepositoryImpl = Depends(get_repository),
+) -> list[SearchHitResponse]:
+    """トランスクリプトの発話とナレッジを全文検索する（関連度の降順）."""
+    use_case = SearchUseCase(repository)
+    hits = await use_case.execute(
+        user_id,
+        q,
+        limit,
+        source_type=source_type,
+        agent_id=agent_id,
+        recurring_meeting_id=recurring_meeting_id,
+    )
+    return [_to_response(hit) for hit in hits]
@@ -6,7 +6,7 @@ REST API endpoints for meeting transcript management.
 import logging
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from supabase import Client
 
 from src.application.use_cases.transcript_use_cases import (
@@ -14,15 +14,18 @@ from src.application.use_cases.transcript_use_cases import (
     DeleteTranscriptUseCase,
     GetPendingTranscriptsUseCase,
     GetTranscriptsByRecurringMeetingUseCase,
+    GetTranscriptSummariesUseCase,
     GetTranscriptUseCase,
     LinkTranscriptUseCase,
     SyncTranscriptsUseCase,
 )
 from src.domain.entities.meeting_transcript import (
     MeetingTranscript,
+    MeetingTranscriptSummary,
     TranscriptEntry,
     TranscriptStructuredData,
 )
+from src.domain.entities.page_cursor import PageCursor
 from src.infrastructure.external.encryption import decrypt_google_token
 from src.infrastructure.external.google_docs_client import GoogleDocsClient
 from src.infrastructure.external.google_drive_client import GoogleDriveClient
@@ -36,10 +39,13 @@ from src.infrastructure.repositories.meeting_transcript_repository_impl import (
 from src.infrastructure.repositories.recurring_meeting_repository_impl import (
     RecurringMeetingRepositoryImpl,
 )
+from src.infrastructure.services.embedding_index_service import create_embedding_index_service
+from src.infrastructure.services.search_index_service import create_search_index_service
 from src.presentation.api.v1.dependencies import (
     get_current_user_id,
     get_user_supabase_client,
 )
+from src.presentation.api.v1.pagination import fetch_limit, get_page_cursor, paginate
 from src.presentation.schemas.transcript import (
     LinkTranscriptRequest,
     SyncResultResponse,
@@ -47,6 +53,7 @@ from src.presentation.schemas.transcript import (
     TranscriptEntrySchema,
     TranscriptResponse,
     TranscriptStructuredDataSchema,
+    TranscriptSummaryResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -104,6 +111,27 @@ def _to_response(transcript: MeetingTranscript) -> TranscriptResponse:
     )
 
 
+def _to_summary_response(summary: MeetingTranscriptSummary) -> TranscriptSummaryResponse:
+    """概要をレスポンスに変換."""
+    return TranscriptSummaryResponse(
+        id=summary.id,
+        recurring_meeting_id=summary.recurring_meeting_id,
+        recurring_meeting_title=summary.recurring_meeting_title,
+        meeting_date=summary.meeting_date,
+        google_doc_id=summary.google_doc_id,
+        match_confidence=summary.match_confidence,
+        raw_text_size=summary.raw_text_size,
+        is_auto_linked=summary.is_auto_linked(),
+        needs_manual_confirmation=summary.needs_manual_confirmation(),
+        created_at=summary.created_at,
+    )
+
+
+def _transcript_cursor(transcript: MeetingTranscript | MeetingTranscriptSummary) -> PageCursor:
+    """一覧の並び順 (meeting_date, id) のカーソルを作る."""
+    return PageCursor(transcript.meeting_date, transcript.id)
+
+
 def _to_entity(data: TranscriptCreate, transcript_id: UUID) -> MeetingTranscript:
     """リクエストをエンティティに変換."""
     from datetime import UTC, datetime
@@ -148,14 +176,55 @@ async def create_transcript(
 
 @router.get("", response_model=list[TranscriptResponse])
 async def get_transcripts(
+    response: Response,
     recurring_meeting_id: UUID = Query(..., description="定例MTG ID"),
     limit: int | None = Query(None, ge=1, le=100, description="取得件数上限"),
+    cursor: PageCursor | None = Depends(get_page_cursor),
     repository: MeetingTranscriptRepositoryImpl = Depends(get_repository),
 ) -> list[TranscriptResponse]:
-    """定例MTGのトランスクリプト一覧を取得する."""
+    """定例MTGのトランスクリプト一覧を取得する（続きはX-Next-Cursorヘッダーのカーソルで取得）."""
     use_case = GetTranscriptsByRecurringMeetingUseCase(repository)
-    transcripts = await use_case.execute(recurring_meeting_id, limit)
-    return [_to_response(t) for t in transcripts]
+    transcripts = await use_case.execute(recurring_meeting_id, fetch_limit(limit), cursor)
+    page = paginate(transcripts, limit, response, _transcript_cursor)
+    return [_to_response(t) for t in page]
+
+
+@router.get("/summaries", response_model=list[TranscriptSummaryResponse])
+async def get_transcript_summaries(
+    response: Response,
+    recurring_meeting_id: UUID | None = Query(None, description="定例MTG ID（省略時は全定例MTG）"),
+    needs_confirmation: bool = Query(False, description="手動確認が必要なもののみ取得するか"),
+    limit: int | None = Query(None, ge=1, le=100, description="取得件数上限"),
+    cursor: PageCursor | None = Depends(get_page_cursor),
+    user_id: UUID = Depends(get_current_user_id),
+    repository: MeetingTranscriptRepositoryImpl = Depends(get_repository),
+) -> list[TranscriptSummaryResponse]:
+    """トランスクリプトの概要一覧を取得する.
+
+    本文・構造化データを含まないため、一覧表示にはこちらを使う。
+    """
+    use_case = GetTranscriptSummariesUseCase(repository)
+    summaries = await use_case.execute(user_id, recurring_meeting_id, needs_confirmation, fetch_limit(limit), cursor)
+    page = paginate(summaries, limit, response, _transcript_cursor)
+    return [_to_summary_response(s) for s in page]
+
+
+@router.get("/pending", response_model=list[TranscriptSummaryResponse])
+async def get_pending_transcripts(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=100, description="取得件数上限"),
+    cursor: PageCursor | None = Depends(get_page_cursor),
+    user_id: UUID = Depends(get_current_user_id),
+    repository: MeetingTranscriptRepositoryImpl = Depends(get_repository),
+) -> list[TranscriptSummaryResponse]:
+    """手動確認が必要なトランスクリプトの概要一覧を取得する.
+
+    信頼度が0.7未満のトランスクリプトを返す。本文・構造化データは含まない。
+    """
+    use_case = GetPendingTranscriptsUseCase(repository)
+    summaries = await use_case.execute(user_id, fetch_limit(limit), cursor)
+    page = paginate(summaries, limit, response, _transcript_cursor)
+    return [_to_summary_response(s) for s in page]
 
 
 @router.get("/{transcript_id}", response_model=TranscriptResponse)
@@ -250,6 +319,8 @@ async def sync_transcripts(
         recurring_meeting_repository=recurring_meeting_repo,
         drive_client=drive_client,
         docs_client=docs_client,
+        embedding_index_service=create_embedding_index_service(transcript_repo.client),
+        search_index_service=create_search_index_service(transcript_repo.client),
     )
 
     try:
@@ -282,7 +353,12 @@ async def link_transcript(
     信頼度が低かったトランスクリプトを手動で定例MTGに紐付ける。
     紐付け後の信頼度は1.0に設定される。
     """
-    use_case = LinkTranscriptUseCase(transcript_repo, recurring_meeting_repo)
+    use_case = LinkTranscriptUseCase(
+        transcript_repo,
+        recurring_meeting_repo,
+        embedding_index_service=create_embedding_index_service(transcript_repo.client),
+        search_index_service=create_search_index_service(transcript_repo.client),
+    )
 
     try:
         transcript = await use_case.execute(
@@ -297,17 +373,3 @@ async def link_transcript(
         ) from None
 
     return _to_response(transcript)
-
-
-@router.get("/pending", response_model=list[TranscriptResponse])
-async def get_pending_transcripts(
-    user_id: UUID = Depends(get_current_user_id),
-    repository: MeetingTranscriptRepositoryImpl = Depends(get_repository),
-) -> list[TranscriptResponse]:
-    """手動確認が必要なトランスクリプト一覧を取得する.
-
-    信頼度が0.7未満のトランスクリプトを返す。
-    """
-    use_case = GetPendingTranscriptsUseCase(repository)
-    transcripts = await use_case.execute(user_id)
-    return [_to_response(t) for t in transcripts]
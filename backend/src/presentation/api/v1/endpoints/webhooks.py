@@ -0,0 +1,185 @@
+"""Webhook API endpoints.
+
+Receives Google Calendar / Drive push notifications and schedules
+debounced incremental syncs for the notified integration only.
+"""
+
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from supabase import Client
+
+from src.application.use_cases.calendar_use_cases import SyncRecurringMeetingsUseCase
+from src.application.use_cases.watch_use_cases import (
+    HandleWatchNotificationUseCase,
+    SyncDriveChangesUseCase,
+    WatchGoogleChangesUseCase,
+)
+from src.config import settings
+from src.domain.entities.watch_channel import WatchChannel, WatchResourceType
+from src.infrastructure.external.supabase_client import get_supabase_client
+from src.infrastructure.repositories.google_integration_repository_impl import (
+    GoogleIntegrationRepositoryImpl,
+)
+from src.infrastructure.repositories.meeting_transcript_repository_impl import (
+    MeetingTranscriptRepositoryImpl,
+)
+from src.infrastructure.repositories.recurring_meeting_repository_impl import (
+    RecurringMeetingRepositoryImpl,
+)
+from src.infrastructure.repositories.watch_channel_repository_impl import WatchChannelRepositoryImpl
+from src.infrastructure.services.embedding_index_service import create_embedding_index_service
+from src.infrastructure.services.search_index_service import create_search_index_service
+from src.infrastructure.services.sync_debouncer import SyncDebouncer, SyncJob
+from src.presentation.api.v1.dependencies import (
+    get_current_user_id,
+    get_user_supabase_client,
+)
+from src.presentation.schemas.webhook import WatchChannelResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+_sync_debouncer = SyncDebouncer(settings.GOOGLE_WEBHOOK_DEBOUNCE_SECONDS)
+
+
+def get_notification_channel_repository() -> WatchChannelRepositoryImpl:
+    """通知受信用のチャネルリポジトリ（サービスロール、ユーザーコンテキストなし）.
+
+    通知はGoogleから届くため、認証済みユーザーのコンテキストがない。
+    """
+    client = get_supabase_client()
+    if client is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database service unavailable",
+        )
+    return WatchChannelRepositoryImpl(client)
+
+
+def get_watch_channel_repository(
+    client: Client = Depends(get_user_supabase_client),
+) -> WatchChannelRepositoryImpl:
+    """チャネルリポジトリのDI（ユーザーコンテキスト付きクライアント使用）."""
+    return WatchChannelRepositoryImpl(client)
+
+
+def get_google_integration_repository(
+    client: Client = Depends(get_user_supabase_client),
+) -> GoogleIntegrationRepositoryImpl:
+    """Google連携リポジトリのDI."""
+    return GoogleIntegrationRepositoryImpl(client)
+
+
+def get_sync_debouncer() -> SyncDebouncer:
+    """通知による同期をまとめるデバウンサーのDI."""
+    return _sync_debouncer
+
+
+def _sync_key(channel: WatchChannel) -> str:
+    """同期をまとめる単位（同期種別×Google連携）."""
+    return f"{channel.resource_type.value}:{channel.integration_id}"
+
+
+def _build_sync_job(channel: WatchChannel) -> SyncJob:
+    """通知を受けた連携だけを差分同期するジョブを作る（サービスロールで実行）."""
+
+    async def run() -> None:
+        client = get_supabase_client()
+        if client is None:
+            logger.error("Supabase is not configured; skipping %s", _sync_key(channel))
+            return
+
+        google_integration_repo = GoogleIntegrationRepositoryImpl(client)
+        recurring_meeting_repo = RecurringMeetingRepositoryImpl(client)
+        if channel.resource_type is WatchResourceType.CALENDAR:
+            # 保存済みのsyncTokenで変更分だけを同期する
+            await SyncRecurringMeetingsUseCase(google_integration_repo, recurring_meeting_repo).execute(channel.user_id)
+            return
+
+        await SyncDriveChangesUseCase(
+            google_integration_repo,
+            WatchChannelRepositoryImpl(client),
+            MeetingTranscriptRepositoryImpl(client),
+            recurring_meeting_repo,
+            embedding_index_service=create_embedding_index_service(client),
+            search_index_service=create_search_index_service(client),
+        ).execute(channel.id)
+
+    return run
+
+
+@router.post("/google", status_code=status.HTTP_204_NO_CONTENT)
+async def receive_google_notification(
+    x_goog_channel_id: str = Header(...),
+    x_goog_resource_state: str = Header(...),
+    x_goog_channel_token: str | None = Header(None),
+    x_goog_resource_id: str | None = Header(None),
+    channel_repo: WatchChannelRepositoryImpl = Depends(get_notification_channel_repository),
+    debouncer: SyncDebouncer = Depends(get_sync_debouncer),
+) -> None:
+    """Google Calendar / Driveのプッシュ通知を受信する.
+
+    チャネルID・トークン・リソースIDを保存済みのチャネルと照合し、
+    通知を受けた連携の差分同期を予約する。同期はバックグラウンドで
+    まとめて実行するため、通知にはすぐに応答する。
+    """
+    use_case = HandleWatchNotificationUseCase(channel_repo)
+    try:
+        channel = await use_case.execute(
+            channel_id=x_goog_channel_id,
+            token=x_goog_channel_token,
+            resource_id=x_goog_resource_id,
+            resource_state=x_goog_resource_state,
+        )
+    except ValueError:
+        logger.warning("Rejected notification for unknown channel %s", x_goog_channel_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unknown watch channel",
+        ) from None
+
+    if channel is None:
+        return
+
+    debouncer.schedule(_sync_key(channel), _build_sync_job(channel))
+
+
+@router.post("/google/watch", response_model=list[WatchChannelResponse])
+async def watch_google_changes(
+    user_id: UUID = Depends(get_current_user_id),
+    google_integration_repo: GoogleIntegrationRepositoryImpl = Depends(get_google_integration_repository),
+    channel_repo: WatchChannelRepositoryImpl = Depends(get_watch_channel_repository),
+) -> list[WatchChannelResponse]:
+    """Google Calendar / Driveのプッシュ通知チャネルを登録する.
+
+    有効なチャネルがあればそのまま返し、有効期限が近いものは作り直す。
+    """
+    if settings.GOOGLE_WEBHOOK_URL is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Push notifications are not configured",
+        )
+
+    use_case = WatchGoogleChangesUseCase(
+        google_integration_repo,
+        channel_repo,
+        address=settings.GOOGLE_WEBHOOK_URL,
+        ttl_seconds=settings.GOOGLE_WATCH_CHANNEL_TTL_SECONDS,
+        renew_before=timedelta(seconds=settings.GOOGLE_WATCH_RENEW_BEFORE_SECONDS),
+    )
+    try:
+        channels = await use_case.execute(user_id)
+    except ValueError as e:
+        logger.warning(f"Watch failed for user {user_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from None
+
+    return [
+        WatchChannelResponse(id=c.id, resource_type=c.resource_type.value, expiration=c.expiration) for c in channels
+    ]
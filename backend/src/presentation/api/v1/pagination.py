@@ -0,0 +1,62 @@
+"""Cursor pagination helpers for list endpoints.
+
+一覧APIは `limit` と `cursor` クエリパラメータを受け取り、続きがある場合は
+次ページのカーソルを `X-Next-Cursor` レスポンスヘッダーで返す。
+レスポンスボディは従来どおり配列のまま。
+"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from fastapi import HTTPException, Query, Response, status
+
+from src.domain.entities.page_cursor import PageCursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+def get_page_cursor(
+    cursor: str | None = Query(None, description="前ページのX-Next-Cursorヘッダーの値"),
+) -> PageCursor | None:
+    """cursorクエリパラメータをデコードする（Depends用）.
+
+    Raises:
+        HTTPException: 不正なカーソルの場合は400
+    """
+    if cursor is None:
+        return None
+    try:
+        return PageCursor.decode(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+def fetch_limit(limit: int | None) -> int | None:
+    """続きの有無を判定するため、1件多く取得する件数を返す."""
+    return limit + 1 if limit is not None else None
+
+
+def paginate(  # noqa: UP047
+    items: list[T],
+    limit: int | None,
+    response: Response,
+    key: Callable[[T], PageCursor],
+) -> list[T]:
+    """fetch_limitで取得した結果をlimit件に切り詰め、続きがあればカーソルをヘッダーに設定する.
+
+    Args:
+        items: fetch_limit件まで取得した結果
+        limit: ページサイズ（Noneの場合は全件取得済み）
+        response: カーソルを設定するレスポンス
+        key: 要素からカーソルを作る関数
+
+    Returns:
+        ページの要素
+    """
+    if limit is None or len(items) <= limit:
+        return items
+    page = items[:limit]
+    response.headers[NEXT_CURSOR_HEADER] = key(page[-1]).encode()
+    return page
@@ -9,8 +9,10 @@ from src.presentation.api.v1.endpoints import (
     google,
     health,
     knowledge,
+    search,
     slack,
     transcripts,
+    webhooks,
 )
 
 api_router = APIRouter()
@@ -24,3 +26,5 @@ api_router.include_router(calendar.router)
 api_router.include_router(knowledge.router)
 api_router.include_router(agendas.router)
 api_router.include_router(transcripts.router)
+api_router.include_router(search.router)
+api_router.include_router(webhooks.router)
@@ -13,6 +13,7 @@ class AgendaGenerateRequest(BaseModel):
     """アジェンダ生成リクエスト."""
 
     agent_id: UUID = Field(..., description="アジェンダを生成するエージェントのID")
+    force: bool = Field(False, description="入力が前回の生成から変わっていなくても生成し直す")
 
 
 class AgendaUpdate(BaseModel):
@@ -45,6 +46,9 @@ class DataSourcesInfo(BaseModel):
     has_transcripts: bool = False
     transcript_count: int = 0
     slack_error: str | None = None
+    retrieved_chunk_count: int = 0
+    reused: bool = False
+    incremental: bool = False
 
 
 class AgendaGenerateResponse(BaseModel):
@@ -52,3 +56,29 @@ class AgendaGenerateResponse(BaseModel):
 
     agenda: AgendaResponse
     data_sources: DataSourcesInfo
+
+
+class AgendaJobResponse(BaseModel):
+    """アジェンダ生成ジョブレスポンス."""
+
+    id: UUID
+    agent_id: UUID
+    status: str = Field(..., description="queued / running / succeeded / failed")
+    stage: str | None = Field(None, description="実行中の段階（gathering / slack / llm / persist）")
+    attempts: int
+    agenda_id: UUID | None = None
+    data_sources: DataSourcesInfo | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None = None
+
+
+class AgendaDraftResponse(BaseModel):
+    """事前生成したアジェンダの下書きレスポンス."""
+
+    recurring_meeting_id: UUID
+    target_date: datetime = Field(..., description="下書きの対象の開催日時")
+    agenda: AgendaResponse
+    data_sources: DataSourcesInfo | None = None
+    generated_at: datetime = Field(..., description="下書きを生成した日時")
@@ -0,0 +1,23 @@
+"""Pydantic schemas for Search API.
+
+Request/Response schemas for search endpoints.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SearchHitResponse(BaseModel):
+    """全文検索のヒットレスポンス."""
+
+    source_type: str = Field(..., description="元データ種別（transcript, knowledge）")
+    source_id: UUID = Field(..., description="トランスクリプトまたはナレッジのID")
+    agent_id: UUID | None = Field(None, description="紐付けられたエージェントID")
+    recurring_meeting_id: UUID | None = Field(None, description="定例MTG ID（トランスクリプトのみ）")
+    source_date: datetime | None = Field(None, description="MTG日時")
+    speaker: str | None = Field(None, description="発話の話者名（トランスクリプトのみ）")
+    timestamp: str | None = Field(None, description="発話のタイムスタンプ（HH:MM形式、トランスクリプトのみ）")
+    snippet: str = Field(..., description="一致箇所の前後を切り出した本文")
+    score: float = Field(..., description="関連度")
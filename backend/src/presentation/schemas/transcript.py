@@ -51,6 +51,23 @@ class TranscriptResponse(BaseModel):
     created_at: datetime
 
 
+class TranscriptSummaryResponse(BaseModel):
+    """トランスクリプト概要レスポンス（一覧表示用、本文を含まない）."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    recurring_meeting_id: UUID
+    recurring_meeting_title: str | None = Field(None, description="紐付けられた定例MTGの名称")
+    meeting_date: datetime
+    google_doc_id: str
+    match_confidence: float
+    raw_text_size: int | None = Field(None, description="本文のバイト数")
+    is_auto_linked: bool = Field(..., description="自動紐付けされたか（信頼度0.7以上）")
+    needs_manual_confirmation: bool = Field(..., description="手動確認が必要か（信頼度0.7未満）")
+    created_at: datetime
+
+
 class LinkTranscriptRequest(BaseModel):
     """トランスクリプト手動紐付けリクエスト."""
 
@@ -0,0 +1,17 @@
+"""Pydantic schemas for Webhook API.
+
+Response schemas for Google push-notification channel endpoints.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class WatchChannelResponse(BaseModel):
+    """プッシュ通知チャネルのレスポンス."""
+
+    id: UUID = Field(..., description="チャネルID")
+    resource_type: str = Field(..., description="監視対象（calendar, drive）")
+    expiration: datetime = Field(..., description="チャネルの有効期限")
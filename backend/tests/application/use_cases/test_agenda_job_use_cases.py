@@ -0,0 +1,250 @@
+"""Unit tests for agenda job use cases."""
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.application.use_cases.agenda_job_use_cases import (
+    ABANDONED_JOB_ERROR,
+    EnqueueAgendaJobUseCase,
+    RunAgendaJobUseCase,
+)
+from src.application.use_cases.agenda_use_cases import AgentNotFoundError, GenerateResult, ProgressCallback
+from src.domain.entities.agenda import Agenda
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStage, AgendaJobStatus
+from src.domain.entities.generated_agenda import AgendaStatus
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
+from src.domain.repositories.generated_agenda_repository import GeneratedAgendaRepository
+
+WORKER_ID = "host:1:abcd1234:0"
+
+
+def _create_job(attempts: int = 1, max_attempts: int = 3) -> AgendaJob:
+    now = datetime.now(UTC)
+    return AgendaJob(
+        id=uuid4(),
+        user_id=uuid4(),
+        agent_id=uuid4(),
+        status=AgendaJobStatus.RUNNING,
+        attempts=attempts,
+        max_attempts=max_attempts,
+        run_after=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _create_result(user_id: UUID, agent_id: UUID) -> GenerateResult:
+    now = datetime.now(UTC)
+    agenda = Agenda(
+        id=uuid4(),
+        agent_id=agent_id,
+        user_id=user_id,
+        content="# アジェンダ",
+        generated_at=now,
+        created_at=now,
+    )
+    return GenerateResult(
+        agenda=agenda,
+        has_knowledge=True,
+        has_slack_messages=True,
+        slack_message_count=2,
+        dictionary_entry_count=0,
+    )
+
+
+@pytest.fixture
+def job_repository() -> AsyncMock:
+    return AsyncMock(spec=AgendaJobRepository)
+
+
+class TestEnqueueAgendaJobUseCase:
+    """EnqueueAgendaJobUseCaseのテスト."""
+
+    async def test_enqueues_queued_job(self, job_repository: AsyncMock) -> None:
+        """実行待ちのジョブを登録すること."""
+        job_repository.create_or_get_active.side_effect = lambda job: job
+        agent_repository = MagicMock()
+        use_case = EnqueueAgendaJobUseCase(job_repository, agent_repository, max_attempts=3)
+        user_id, agent_id = uuid4(), uuid4()
+
+        job = await use_case.execute(user_id, agent_id, input_fingerprint="fingerprint")
+
+        assert job.status == AgendaJobStatus.QUEUED
+        assert job.attempts == 0
+        assert job.max_attempts == 3
+        assert (job.user_id, job.agent_id) == (user_id, agent_id)
+        assert job.input_fingerprint == "fingerprint"
+        job_repository.create_or_get_active.assert_awaited_once_with(job)
+
+    async def test_returns_running_job_with_same_inputs(self, job_repository: AsyncMock) -> None:
+        """入力が同じ実行中のジョブがある場合はそのジョブを返すこと."""
+        running = _create_job()
+        job_repository.create_or_get_active.return_value = running
+        use_case = EnqueueAgendaJobUseCase(job_repository, MagicMock(), max_attempts=3)
+
+        job = await use_case.execute(running.user_id, running.agent_id, input_fingerprint="fingerprint")
+
+        assert job is running
+
+    async def test_unknown_agent_is_rejected(self, job_repository: AsyncMock) -> None:
+        """エージェントが見つからない場合はジョブを登録しないこと."""
+        agent_repository = MagicMock()
+        agent_repository.get_by_id.return_value = None
+        use_case = EnqueueAgendaJobUseCase(job_repository, agent_repository, max_attempts=3)
+
+        with pytest.raises(AgentNotFoundError, match="Agent not found"):
+            await use_case.execute(uuid4(), uuid4())
+
+        job_repository.create_or_get_active.assert_not_awaited()
+
+
+class TestRunAgendaJobUseCase:
+    """RunAgendaJobUseCaseのテスト."""
+
+    async def test_success_records_stages_and_result(self, job_repository: AsyncMock) -> None:
+        """各段階を記録し、生成したアジェンダとデータソースを保存すること."""
+        job = _create_job()
+        result = _create_result(job.user_id, job.agent_id)
+
+        async def generate(
+            user_id: UUID, agent_id: UUID, progress: ProgressCallback, force: bool = False
+        ) -> GenerateResult:
+            for stage in AgendaJobStage:
+                await progress(stage)
+            return result
+
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock(side_effect=generate)
+        use_case = RunAgendaJobUseCase(job_repository, generate_use_case, retry_base_seconds=10)
+
+        await use_case.execute(job, WORKER_ID)
+
+        stages = [call.args[2] for call in job_repository.update_stage.await_args_list]
+        assert stages == list(AgendaJobStage)
+        job_repository.mark_succeeded.assert_awaited_once()
+        job_id, worker_id, agenda_id, data_sources = job_repository.mark_succeeded.await_args.args
+        assert (job_id, worker_id, agenda_id) == (job.id, WORKER_ID, result.agenda.id)
+        assert data_sources["slack_message_count"] == 2
+        assert data_sources["has_knowledge"] is True
+
+    async def test_pregeneration_job_saves_draft(self, job_repository: AsyncMock) -> None:
+        """事前生成ジョブは生成したアジェンダを開催回の下書きとして保存すること."""
+        job = replace(
+            _create_job(),
+            recurring_meeting_id=uuid4(),
+            target_date=datetime.now(UTC) + timedelta(hours=2),
+            input_fingerprint="fingerprint",
+        )
+        result = _create_result(job.user_id, job.agent_id)
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock(return_value=result)
+        generated_agenda_repository = AsyncMock(spec=GeneratedAgendaRepository)
+        use_case = RunAgendaJobUseCase(
+            job_repository,
+            generate_use_case,
+            retry_base_seconds=10,
+            generated_agenda_repository=generated_agenda_repository,
+        )
+
+        await use_case.execute(job, WORKER_ID)
+
+        draft = generated_agenda_repository.upsert.await_args.args[0]
+        assert (draft.recurring_meeting_id, draft.target_date) == (job.recurring_meeting_id, job.target_date)
+        assert draft.status == AgendaStatus.DRAFT
+        assert draft.agenda_id == result.agenda.id
+        assert draft.input_fingerprint == "fingerprint"
+        assert draft.agenda_content["content"] == result.agenda.content
+        assert draft.agenda_content["data_sources"]["slack_message_count"] == 2
+        job_repository.mark_succeeded.assert_awaited_once()
+
+    async def test_on_demand_job_saves_no_draft(self, job_repository: AsyncMock) -> None:
+        """ユーザーの操作による生成ジョブは下書きを保存しないこと."""
+        job = _create_job()
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock(return_value=_create_result(job.user_id, job.agent_id))
+        generated_agenda_repository = AsyncMock(spec=GeneratedAgendaRepository)
+        use_case = RunAgendaJobUseCase(
+            job_repository,
+            generate_use_case,
+            retry_base_seconds=10,
+            generated_agenda_repository=generated_agenda_repository,
+        )
+
+        await use_case.execute(job, WORKER_ID)
+
+        generated_agenda_repository.upsert.assert_not_awaited()
+
+    async def test_agent_not_found_fails_without_retry(self, job_repository: AsyncMock) -> None:
+        """エージェントが見つからない場合はリトライせずに失敗にすること."""
+        job = _create_job()
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock(side_effect=AgentNotFoundError("Agent not found"))
+        use_case = RunAgendaJobUseCase(job_repository, generate_use_case, retry_base_seconds=10)
+
+        await use_case.execute(job, WORKER_ID)
+
+        job_repository.mark_failed.assert_awaited_once_with(job.id, WORKER_ID, "Agent not found")
+        job_repository.schedule_retry.assert_not_awaited()
+
+    async def test_other_value_error_is_retried(self, job_repository: AsyncMock) -> None:
+        """エージェントが見つからない場合以外のValueError（下書きの保存の失敗など）はリトライすること."""
+        job = replace(_create_job(), recurring_meeting_id=uuid4(), target_date=datetime.now(UTC))
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock(return_value=_create_result(job.user_id, job.agent_id))
+        generated_agenda_repository = AsyncMock(spec=GeneratedAgendaRepository)
+        generated_agenda_repository.upsert.side_effect = ValueError("invalid response")
+        use_case = RunAgendaJobUseCase(
+            job_repository,
+            generate_use_case,
+            retry_base_seconds=10,
+            generated_agenda_repository=generated_agenda_repository,
+        )
+
+        await use_case.execute(job, WORKER_ID)
+
+        job_repository.schedule_retry.assert_awaited_once()
+        job_repository.mark_failed.assert_not_awaited()
+        job_repository.mark_succeeded.assert_not_awaited()
+
+    async def test_transient_error_is_retried_with_backoff(self, job_repository: AsyncMock) -> None:
+        """一時的なエラーは指数バックオフ後に再実行するようキューに戻すこと."""
+        job = _create_job(attempts=2, max_attempts=3)
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock(side_effect=RuntimeError("LLM unavailable"))
+        use_case = RunAgendaJobUseCase(job_repository, generate_use_case, retry_base_seconds=10)
+        before = datetime.now(UTC)
+
+        await use_case.execute(job, WORKER_ID)
+
+        job_id, worker_id, error, run_after = job_repository.schedule_retry.await_args.args
+        assert (job_id, worker_id, error) == (job.id, WORKER_ID, "LLM unavailable")
+        assert before + timedelta(seconds=20) <= run_after <= datetime.now(UTC) + timedelta(seconds=20)
+        job_repository.mark_failed.assert_not_awaited()
+
+    async def test_last_attempt_fails(self, job_repository: AsyncMock) -> None:
+        """最大実行回数に達したジョブは失敗にすること."""
+        job = _create_job(attempts=3, max_attempts=3)
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock(side_effect=TimeoutError())
+        use_case = RunAgendaJobUseCase(job_repository, generate_use_case, retry_base_seconds=10)
+
+        await use_case.execute(job, WORKER_ID)
+
+        job_repository.mark_failed.assert_awaited_once_with(job.id, WORKER_ID, "TimeoutError")
+        job_repository.schedule_retry.assert_not_awaited()
+
+    async def test_abandoned_job_is_not_run_again(self, job_repository: AsyncMock) -> None:
+        """実行中に止まり最大実行回数を超えて再取得されたジョブは実行しないこと."""
+        job = _create_job(attempts=4, max_attempts=3)
+        generate_use_case = MagicMock()
+        generate_use_case.execute = AsyncMock()
+        use_case = RunAgendaJobUseCase(job_repository, generate_use_case, retry_base_seconds=10)
+
+        await use_case.execute(job, WORKER_ID)
+
+        generate_use_case.execute.assert_not_awaited()
+        job_repository.mark_failed.assert_awaited_once_with(job.id, WORKER_ID, ABANDONED_JOB_ERROR)
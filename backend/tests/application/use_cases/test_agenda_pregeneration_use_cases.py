@@ -0,0 +1,346 @@
+"""Unit tests for agenda pre-generation use cases."""
+
+import random
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.application.use_cases.agenda_pregeneration_use_cases import (
+    GetAgendaDraftUseCase,
+    PregenerateAgendasUseCase,
+    interleave_by_user,
+)
+from src.application.use_cases.agenda_use_cases import AgendaSourceWatermarkReader
+from src.domain.entities.agenda import Agenda
+from src.domain.entities.agent import Agent
+from src.domain.entities.generated_agenda import AgendaStatus, GeneratedAgenda
+from src.domain.entities.meeting_transcript import MeetingTranscriptSummary
+from src.domain.entities.recurring_meeting import MeetingFrequency, RecurringMeeting
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
+from src.domain.repositories.generated_agenda_repository import GeneratedAgendaRepository
+from src.domain.services.agenda_fingerprint import AgendaSourceWatermarks
+
+NOW = datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+WATERMARKS = AgendaSourceWatermarks(knowledge_id=None, transcript_ids=(), dictionary_version="0:")
+
+
+def _create_meeting(user_id: UUID, starts_in: timedelta = timedelta(hours=2)) -> RecurringMeeting:
+    return RecurringMeeting(
+        id=uuid4(),
+        user_id=user_id,
+        google_event_id=f"event-{uuid4().hex[:8]}",
+        title="週次定例",
+        rrule="RRULE:FREQ=WEEKLY",
+        frequency=MeetingFrequency.WEEKLY,
+        next_occurrence=NOW + starts_in,
+        created_at=NOW,
+        agent_id=uuid4(),
+    )
+
+
+def _create_draft(
+    meeting: RecurringMeeting,
+    fingerprint: str | None,
+    status: AgendaStatus = AgendaStatus.DRAFT,
+    agenda_id: UUID | None = None,
+) -> GeneratedAgenda:
+    return GeneratedAgenda(
+        id=uuid4(),
+        recurring_meeting_id=meeting.id,
+        target_date=meeting.next_occurrence,
+        agenda_content={"content": "# 下書き"},
+        sources=[],
+        status=status,
+        delivered_via=None,
+        created_at=NOW,
+        updated_at=None,
+        agenda_id=agenda_id,
+        input_fingerprint=fingerprint,
+    )
+
+
+class TestPregenerateAgendasUseCase:
+    """PregenerateAgendasUseCaseのテスト."""
+
+    @pytest.fixture
+    def recurring_meeting_repository(self) -> MagicMock:
+        repository = MagicMock()
+        repository.get_linked_occurring_between = AsyncMock(return_value=[])
+        return repository
+
+    @pytest.fixture
+    def generated_agenda_repository(self) -> AsyncMock:
+        repository = AsyncMock(spec=GeneratedAgendaRepository)
+        repository.get_upcoming.return_value = []
+        return repository
+
+    @pytest.fixture
+    def job_repository(self) -> AsyncMock:
+        repository = AsyncMock(spec=AgendaJobRepository)
+        repository.get_active_recurring_meeting_ids.return_value = set()
+        repository.create_or_get_active.side_effect = lambda job: job
+        return repository
+
+    @pytest.fixture
+    def use_case(
+        self,
+        recurring_meeting_repository: MagicMock,
+        generated_agenda_repository: AsyncMock,
+        job_repository: AsyncMock,
+    ) -> PregenerateAgendasUseCase:
+        agent_repository = MagicMock()
+        agent_repository.get_by_id.side_effect = lambda agent_id, user_id: Agent(
+            id=agent_id, user_id=user_id, name="Test Agent", created_at=NOW
+        )
+        watermark_reader = MagicMock()
+        watermark_reader.read = AsyncMock(return_value=WATERMARKS)
+        return PregenerateAgendasUseCase(
+            recurring_meeting_repository,
+            agent_repository,
+            generated_agenda_repository,
+            job_repository,
+            watermark_reader,
+            lead_time=timedelta(hours=3),
+            jitter=timedelta(minutes=10),
+            max_per_user=2,
+            max_attempts=3,
+            rng=random.Random(0),  # noqa: S311
+        )
+
+    async def test_enqueues_job_for_upcoming_occurrence(
+        self,
+        use_case: PregenerateAgendasUseCase,
+        recurring_meeting_repository: MagicMock,
+        job_repository: AsyncMock,
+    ) -> None:
+        """次回開催が近い定例MTGの開催回について生成ジョブを登録すること."""
+        meeting = _create_meeting(uuid4())
+        recurring_meeting_repository.get_linked_occurring_between.return_value = [meeting]
+
+        summary = await use_case.execute(NOW)
+
+        recurring_meeting_repository.get_linked_occurring_between.assert_awaited_once_with(
+            NOW, NOW + timedelta(hours=3)
+        )
+        assert summary.enqueued == 1
+        job = job_repository.create_or_get_active.await_args.args[0]
+        assert (job.user_id, job.agent_id) == (meeting.user_id, meeting.agent_id)
+        assert (job.recurring_meeting_id, job.target_date) == (meeting.id, meeting.next_occurrence)
+        assert job.input_fingerprint == WATERMARKS.fingerprint()
+        assert job.max_attempts == 3
+        assert NOW <= job.run_after <= NOW + timedelta(minutes=10)
+
+    async def test_jitter_finishes_well_before_meeting(
+        self,
+        use_case: PregenerateAgendasUseCase,
+        recurring_meeting_repository: MagicMock,
+        job_repository: AsyncMock,
+    ) -> None:
+        """開催直前の定例MTGは開催までの時間の半分以内に実行を始めること."""
+        recurring_meeting_repository.get_linked_occurring_between.return_value = [
+            _create_meeting(uuid4(), starts_in=timedelta(minutes=4))
+        ]
+
+        await use_case.execute(NOW)
+
+        assert job_repository.create_or_get_active.await_args.args[0].run_after <= NOW + timedelta(minutes=2)
+
+    async def test_skips_draft_with_unchanged_inputs(
+        self,
+        use_case: PregenerateAgendasUseCase,
+        recurring_meeting_repository: MagicMock,
+        generated_agenda_repository: AsyncMock,
+        job_repository: AsyncMock,
+    ) -> None:
+        """入力が変わっていない下書きは生成し直さず、変わった下書きは生成し直すこと."""
+        unchanged, changed = _create_meeting(uuid4()), _create_meeting(uuid4())
+        recurring_meeting_repository.get_linked_occurring_between.return_value = [unchanged, changed]
+        generated_agenda_repository.get_upcoming.return_value = [
+            _create_draft(unchanged, WATERMARKS.fingerprint()),
+            _create_draft(changed, "stale-fingerprint"),
+        ]
+
+        summary = await use_case.execute(NOW)
+
+        assert (summary.enqueued, summary.unchanged) == (1, 1)
+        assert job_repository.create_or_get_active.await_args.args[0].recurring_meeting_id == changed.id
+
+    async def test_skips_reviewed_and_in_progress_occurrences(
+        self,
+        use_case: PregenerateAgendasUseCase,
+        recurring_meeting_repository: MagicMock,
+        generated_agenda_repository: AsyncMock,
+        job_repository: AsyncMock,
+    ) -> None:
+        """確認済みの下書きと、生成ジョブが実行待ち・実行中の開催回は登録しないこと."""
+        reviewed, in_progress = _create_meeting(uuid4()), _create_meeting(uuid4())
+        recurring_meeting_repository.get_linked_occurring_between.return_value = [reviewed, in_progress]
+        generated_agenda_repository.get_upcoming.return_value = [
+            _create_draft(reviewed, "stale-fingerprint", status=AgendaStatus.REVIEWED)
+        ]
+        job_repository.get_active_recurring_meeting_ids.return_value = {in_progress.id}
+
+        summary = await use_case.execute(NOW)
+
+        assert (summary.enqueued, summary.unchanged, summary.in_progress) == (0, 1, 1)
+        job_repository.create_or_get_active.assert_not_awaited()
+
+    async def test_joins_running_job_with_same_inputs(
+        self,
+        use_case: PregenerateAgendasUseCase,
+        recurring_meeting_repository: MagicMock,
+        job_repository: AsyncMock,
+    ) -> None:
+        """ユーザーの操作による同じ入力の生成ジョブが実行中の場合は、登録せずに実行中として数えること."""
+        recurring_meeting_repository.get_linked_occurring_between.return_value = [_create_meeting(uuid4())]
+        job_repository.create_or_get_active.side_effect = lambda job: replace(
+            job, id=uuid4(), recurring_meeting_id=None
+        )
+
+        summary = await use_case.execute(NOW)
+
+        assert (summary.enqueued, summary.in_progress) == (0, 1)
+
+    async def test_limits_jobs_per_user(
+        self,
+        use_case: PregenerateAgendasUseCase,
+        recurring_meeting_repository: MagicMock,
+        job_repository: AsyncMock,
+    ) -> None:
+        """ユーザーごとの上限を超えた分は次回に回し、他のユーザーの登録を妨げないこと."""
+        busy_user, other_user = uuid4(), uuid4()
+        busy = [_create_meeting(busy_user, timedelta(minutes=30 + i)) for i in range(4)]
+        other = _create_meeting(other_user, timedelta(hours=2))
+        recurring_meeting_repository.get_linked_occurring_between.return_value = [*busy, other]
+
+        summary = await use_case.execute(NOW)
+
+        assert (summary.enqueued, summary.deferred) == (3, 2)
+        enqueued = [call.args[0].recurring_meeting_id for call in job_repository.create_or_get_active.await_args_list]
+        assert enqueued == [busy[0].id, other.id, busy[1].id]
+
+
+def test_interleave_by_user_round_robins() -> None:
+    """ユーザーごとの順序を保ったまま1件ずつ交互に並べること."""
+    a, b = uuid4(), uuid4()
+    a1, a2, a3 = (_create_meeting(a) for _ in range(3))
+    b1 = _create_meeting(b)
+
+    assert interleave_by_user([a1, a2, a3, b1]) == [a1, b1, a2, a3]
+
+
+class TestAgendaSourceWatermarkReader:
+    """AgendaSourceWatermarkReaderのテスト."""
+
+    async def test_reads_ids_without_bodies(self) -> None:
+        """最新のナレッジ・定例MTGごとの直近の議事録・辞書のバージョンを読み取ること."""
+        user_id = uuid4()
+        agent = Agent(id=uuid4(), user_id=user_id, name="Test Agent", created_at=NOW, transcript_count=2)
+        meetings = [_create_meeting(user_id), _create_meeting(user_id)]
+        knowledge = MagicMock(id=uuid4())
+        transcript_ids = {meeting.id: [uuid4(), uuid4()] for meeting in meetings}
+
+        knowledge_repository = AsyncMock()
+        knowledge_repository.get_latest_by_agent.return_value = knowledge
+        dictionary_repository = AsyncMock()
+        dictionary_repository.get_version.return_value = "2:abc"
+        recurring_meeting_repository = AsyncMock()
+        recurring_meeting_repository.get_list_by_agent_id.return_value = meetings
+        transcript_repository = AsyncMock()
+        transcript_repository.get_summaries.side_effect = lambda user_id, recurring_meeting_id, limit: [
+            MeetingTranscriptSummary(
+                id=transcript_id,
+                recurring_meeting_id=recurring_meeting_id,
+                meeting_date=NOW,
+                google_doc_id="doc",
+                match_confidence=1.0,
+                created_at=NOW,
+            )
+            for transcript_id in transcript_ids[recurring_meeting_id][:limit]
+        ]
+        reader = AgendaSourceWatermarkReader(
+            knowledge_repository, dictionary_repository, recurring_meeting_repository, transcript_repository
+        )
+
+        watermarks = await reader.read(agent)
+
+        assert watermarks.knowledge_id == knowledge.id
+        assert set(watermarks.transcript_ids) == {t for ids in transcript_ids.values() for t in ids}
+        assert watermarks.dictionary_version == "2:abc"
+        assert watermarks.slack_latest_ts is None
+        transcript_repository.get_by_recurring_meeting.assert_not_called()
+
+    async def test_reads_latest_slack_ts(self) -> None:
+        """Slackチャンネルが設定されている場合は最新メッセージのtsだけを取得し、失敗した場合はNoneとすること."""
+        agent = Agent(
+            id=uuid4(), user_id=uuid4(), name="Test Agent", created_at=NOW, transcript_count=0, slack_channel_id="C001"
+        )
+        dictionary_repository = AsyncMock()
+        dictionary_repository.get_version.return_value = "0:"
+        knowledge_repository = AsyncMock()
+        knowledge_repository.get_latest_by_agent.return_value = None
+        slack_repository = AsyncMock()
+        slack_repository.get_all.return_value = [MagicMock(encrypted_access_token="encrypted")]
+        reader = AgendaSourceWatermarkReader(
+            knowledge_repository, dictionary_repository, AsyncMock(), AsyncMock(), slack_repository=slack_repository
+        )
+
+        with (
+            patch("src.application.use_cases.agenda_use_cases.decrypt_token", return_value="token"),
+            patch("src.application.use_cases.agenda_use_cases.SlackClient") as slack_client_class,
+        ):
+            slack_client_class.return_value.get_latest_message_ts.return_value = "1700000000.000100"
+            latest = await reader.read(agent)
+            slack_client_class.return_value.get_latest_message_ts.side_effect = RuntimeError("boom")
+            failed = await reader.read(agent)
+
+        slack_client_class.return_value.get_latest_message_ts.assert_called_with("C001")
+        slack_client_class.return_value.get_messages.assert_not_called()
+        assert latest.slack_latest_ts == "1700000000.000100"
+        assert failed.slack_latest_ts is None
+
+
+class TestGetAgendaDraftUseCase:
+    """GetAgendaDraftUseCaseのテスト."""
+
+    async def test_returns_nearest_draft(self) -> None:
+        """最も近い開催回の下書きを、確認済みのものと削除済みのアジェンダを飛ばして返すこと."""
+        user_id, agent_id = uuid4(), uuid4()
+        meeting = _create_meeting(user_id)
+        deleted_agenda_id = uuid4()
+        agenda = Agenda(
+            id=uuid4(), agent_id=agent_id, user_id=user_id, content="# 下書き", generated_at=NOW, created_at=NOW
+        )
+        drafts = [
+            _create_draft(meeting, None, status=AgendaStatus.REVIEWED, agenda_id=uuid4()),
+            _create_draft(meeting, None, agenda_id=deleted_agenda_id),
+            _create_draft(meeting, None, agenda_id=agenda.id),
+        ]
+        recurring_meeting_repository = AsyncMock()
+        recurring_meeting_repository.get_list_by_agent_id.return_value = [meeting]
+        generated_agenda_repository = AsyncMock(spec=GeneratedAgendaRepository)
+        generated_agenda_repository.get_upcoming.return_value = drafts
+        agenda_repository = AsyncMock()
+        agenda_repository.get_by_id.side_effect = lambda agenda_id, user_id: agenda if agenda_id == agenda.id else None
+        use_case = GetAgendaDraftUseCase(recurring_meeting_repository, generated_agenda_repository, agenda_repository)
+
+        draft = await use_case.execute(agent_id, user_id, NOW)
+
+        assert draft is not None
+        assert draft.generated_agenda is drafts[2]
+        assert draft.agenda is agenda
+        recurring_meeting_repository.get_list_by_agent_id.assert_awaited_once_with(agent_id, user_id)
+        generated_agenda_repository.get_upcoming.assert_awaited_once_with([meeting.id], NOW)
+
+    async def test_returns_none_without_draft(self) -> None:
+        """下書きがない場合はNoneを返すこと."""
+        recurring_meeting_repository = AsyncMock()
+        recurring_meeting_repository.get_list_by_agent_id.return_value = []
+        generated_agenda_repository = AsyncMock(spec=GeneratedAgendaRepository)
+        generated_agenda_repository.get_upcoming.return_value = []
+        use_case = GetAgendaDraftUseCase(recurring_meeting_repository, generated_agenda_repository, AsyncMock())
+
+        assert await use_case.execute(uuid4(), uuid4(), NOW) is None
@@ -9,9 +9,16 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from src.application.use_cases.agenda_use_cases import GenerateAgendaUseCase
+from src.application.use_cases.agenda_use_cases import (
+    AgendaSourceWatermarkReader,
+    GenerateAgendaUseCase,
+    IncrementalLimits,
+)
 from src.domain.entities.agenda import Agenda
+from src.domain.entities.agenda_job import AgendaJobStage
 from src.domain.entities.agent import Agent
+from src.domain.entities.embedding_chunk import ChunkSourceType, EmbeddingChunk, RetrievedChunk
+from src.domain.entities.knowledge import Knowledge
 from src.domain.entities.meeting_transcript import (
     MeetingTranscript,
     TranscriptStructuredData,
@@ -27,7 +34,9 @@ from src.domain.repositories.knowledge_repository import KnowledgeRepository
 from src.domain.repositories.meeting_transcript_repository import MeetingTranscriptRepository
 from src.domain.repositories.recurring_meeting_repository import RecurringMeetingRepository
 from src.domain.repositories.slack_integration_repository import SlackIntegrationRepository
+from src.domain.services.agenda_fingerprint import AgendaSourceWatermarks
 from src.infrastructure.services.agenda_generation_service import AgendaGenerationService
+from src.infrastructure.services.embedding_index_service import EmbeddingIndexService
 
 
 class TestGenerateAgendaUseCaseTranscriptCollection:
@@ -557,3 +566,432 @@ class TestGenerateAgendaUseCaseTranscriptCollection:
         transcript_titles = [t.recurring_meeting_title for t in transcripts]
         assert "Weekly Standup" in transcript_titles
         assert "Sprint Review" in transcript_titles
+
+    @pytest.mark.asyncio
+    async def test_retrieved_chunks_passed_to_generation(
+        self,
+        user_id: UUID,
+        agent_id: UUID,
+        mock_agenda_repository: AsyncMock,
+        mock_agent_repository: MagicMock,
+        mock_knowledge_repository: AsyncMock,
+        mock_dictionary_repository: AsyncMock,
+        mock_slack_repository: AsyncMock,
+        mock_recurring_meeting_repository: AsyncMock,
+        mock_transcript_repository: AsyncMock,
+        mock_generation_service: AsyncMock,
+    ) -> None:
+        """未決事項をクエリに関連チャンクを検索し、生成に渡すこと."""
+        # Arrange
+        agent = self._create_agent(agent_id, user_id, transcript_count=2)
+        mock_agent_repository.get_by_id.return_value = agent
+
+        meeting_id = uuid4()
+        mock_recurring_meeting_repository.get_list_by_agent_id.return_value = [
+            self._create_recurring_meeting(meeting_id, agent_id, user_id, "Weekly Standup"),
+        ]
+        latest = self._create_transcript(uuid4(), meeting_id, datetime.now())
+        latest.raw_text = "田中: 予算の件は要確認\n佐藤: 了解"
+        mock_transcript_repository.get_by_recurring_meeting.return_value = [latest]
+
+        chunk = EmbeddingChunk(
+            id=uuid4(),
+            user_id=user_id,
+            source_type=ChunkSourceType.TRANSCRIPT,
+            source_id=str(uuid4()),
+            chunk_index=0,
+            content="予算は来月確定予定",
+            created_at=datetime.now(),
+        )
+        mock_index_service = AsyncMock(spec=EmbeddingIndexService)
+        mock_index_service.retrieve.return_value = [RetrievedChunk(chunk=chunk, score=0.9)]
+
+        # Act
+        use_case = GenerateAgendaUseCase(
+            agenda_repository=mock_agenda_repository,
+            agent_repository=mock_agent_repository,
+            knowledge_repository=mock_knowledge_repository,
+            dictionary_repository=mock_dictionary_repository,
+            slack_repository=mock_slack_repository,
+            recurring_meeting_repository=mock_recurring_meeting_repository,
+            meeting_transcript_repository=mock_transcript_repository,
+            generation_service=mock_generation_service,
+            embedding_index_service=mock_index_service,
+        )
+
+        result = await use_case.execute(user_id, agent_id)
+
+        # Assert: 未決事項がクエリとなり、最新トランスクリプトは除外されること
+        call_args = mock_index_service.retrieve.call_args
+        assert call_args.args[1] == ["田中: 予算の件は要確認"]
+        assert call_args.kwargs["agent_id"] == agent_id
+        assert call_args.kwargs["recurring_meeting_ids"] == [meeting_id]
+        assert call_args.kwargs["exclude_source_ids"] == {str(latest.id)}
+
+        input_data = mock_generation_service.generate.call_args[0][0]
+        assert input_data.retrieved_chunks[0].chunk.content == "予算は来月確定予定"
+        assert result.retrieved_chunk_count == 1
+
+    @pytest.mark.asyncio
+    async def test_continue_when_retrieval_fails(
+        self,
+        user_id: UUID,
+        agent_id: UUID,
+        mock_agenda_repository: AsyncMock,
+        mock_agent_repository: MagicMock,
+        mock_knowledge_repository: AsyncMock,
+        mock_dictionary_repository: AsyncMock,
+        mock_slack_repository: AsyncMock,
+        mock_recurring_meeting_repository: AsyncMock,
+        mock_transcript_repository: AsyncMock,
+        mock_generation_service: AsyncMock,
+    ) -> None:
+        """関連チャンクの検索に失敗しても生成を続行すること."""
+        # Arrange
+        mock_agent_repository.get_by_id.return_value = self._create_agent(agent_id, user_id)
+        mock_recurring_meeting_repository.get_list_by_agent_id.return_value = []
+        mock_index_service = AsyncMock(spec=EmbeddingIndexService)
+        mock_index_service.retrieve.side_effect = RuntimeError("index unavailable")
+
+        # Act
+        use_case = GenerateAgendaUseCase(
+            agenda_repository=mock_agenda_repository,
+            agent_repository=mock_agent_repository,
+            knowledge_repository=mock_knowledge_repository,
+            dictionary_repository=mock_dictionary_repository,
+            slack_repository=mock_slack_repository,
+            recurring_meeting_repository=mock_recurring_meeting_repository,
+            meeting_transcript_repository=mock_transcript_repository,
+            generation_service=mock_generation_service,
+            embedding_index_service=mock_index_service,
+        )
+
+        result = await use_case.execute(user_id, agent_id)
+
+        # Assert
+        input_data = mock_generation_service.generate.call_args[0][0]
+        assert input_data.retrieved_chunks == []
+        assert result.retrieved_chunk_count == 0
+
+    @pytest.mark.asyncio
+    async def test_reports_progress_for_each_stage(
+        self,
+        user_id: UUID,
+        agent_id: UUID,
+        mock_agenda_repository: AsyncMock,
+        mock_agent_repository: MagicMock,
+        mock_knowledge_repository: AsyncMock,
+        mock_dictionary_repository: AsyncMock,
+        mock_slack_repository: AsyncMock,
+        mock_generation_service: AsyncMock,
+    ) -> None:
+        """データ収集・Slack取得・LLM生成・保存の開始を順に通知すること."""
+        # Arrange
+        mock_agent_repository.get_by_id.return_value = self._create_agent(agent_id, user_id)
+        stages: list[AgendaJobStage] = []
+
+        async def progress(stage: AgendaJobStage) -> None:
+            # 保存より前にLLM生成が終わっていること
+            if stage == AgendaJobStage.PERSIST:
+                mock_generation_service.generate.assert_awaited_once()
+            stages.append(stage)
+
+        use_case = GenerateAgendaUseCase(
+            agenda_repository=mock_agenda_repository,
+            agent_repository=mock_agent_repository,
+            knowledge_repository=mock_knowledge_repository,
+            dictionary_repository=mock_dictionary_repository,
+            slack_repository=mock_slack_repository,
+            generation_service=mock_generation_service,
+        )
+
+        # Act
+        await use_case.execute(user_id, agent_id, progress=progress)
+
+        # Assert
+        assert stages == [
+            AgendaJobStage.GATHERING,
+            AgendaJobStage.SLACK,
+            AgendaJobStage.LLM,
+            AgendaJobStage.PERSIST,
+        ]
+
+
+class TestGenerateAgendaUseCaseReuse:
+    """入力が変わっていない場合の再利用のテスト."""
+
+    WATERMARKS = AgendaSourceWatermarks(knowledge_id=uuid4(), transcript_ids=(uuid4(),), dictionary_version="1:abc")
+
+    @pytest.fixture
+    def agent(self) -> Agent:
+        """テスト用エージェント."""
+        return Agent(id=uuid4(), user_id=uuid4(), name="Test Agent", created_at=datetime.now())
+
+    @pytest.fixture
+    def mock_agenda_repository(self) -> AsyncMock:
+        """AgendaRepository モック（createは受け取ったアジェンダを返す）."""
+        mock = AsyncMock(spec=AgendaRepository)
+        mock.create.side_effect = lambda agenda: agenda
+        mock.get_by_agent.return_value = []
+        return mock
+
+    @pytest.fixture
+    def mock_generation_service(self) -> AsyncMock:
+        """AgendaGenerationService モック."""
+        mock = AsyncMock(spec=AgendaGenerationService)
+        mock.generate.return_value = "# Generated Agenda"
+        return mock
+
+    @pytest.fixture
+    def use_case(
+        self, agent: Agent, mock_agenda_repository: AsyncMock, mock_generation_service: AsyncMock
+    ) -> GenerateAgendaUseCase:
+        """ウォーターマークの読み取りを持つGenerateAgendaUseCase."""
+        agent_repository = MagicMock(spec=AgentRepository)
+        agent_repository.get_by_id.return_value = agent
+        knowledge_repository = AsyncMock(spec=KnowledgeRepository)
+        knowledge_repository.get_latest_by_agent.return_value = None
+        dictionary_repository = AsyncMock(spec=DictionaryRepository)
+        dictionary_repository.get_all.return_value = []
+        watermark_reader = AsyncMock(spec=AgendaSourceWatermarkReader)
+        watermark_reader.read.return_value = self.WATERMARKS
+        return GenerateAgendaUseCase(
+            agenda_repository=mock_agenda_repository,
+            agent_repository=agent_repository,
+            knowledge_repository=knowledge_repository,
+            dictionary_repository=dictionary_repository,
+            slack_repository=AsyncMock(spec=SlackIntegrationRepository),
+            generation_service=mock_generation_service,
+            watermark_reader=watermark_reader,
+        )
+
+    def _previous_agenda(self, agent: Agent, input_fingerprint: str | None) -> Agenda:
+        return Agenda(
+            id=uuid4(),
+            agent_id=agent.id,
+            user_id=agent.user_id,
+            content="# Previous",
+            generated_at=datetime.now(),
+            created_at=datetime.now(),
+            input_fingerprint=input_fingerprint,
+        )
+
+    @pytest.mark.asyncio
+    async def test_returns_previous_agenda_when_inputs_unchanged(
+        self,
+        use_case: GenerateAgendaUseCase,
+        agent: Agent,
+        mock_agenda_repository: AsyncMock,
+        mock_generation_service: AsyncMock,
+    ) -> None:
+        """前回のアジェンダと入力のフィンガープリントが同じ場合はLLMを呼ばずに前回のアジェンダを返すこと."""
+        previous = self._previous_agenda(agent, self.WATERMARKS.fingerprint())
+        mock_agenda_repository.get_by_agent.return_value = [previous]
+
+        result = await use_case.execute(agent.user_id, agent.id)
+
+        assert result.reused is True
+        assert result.agenda is previous
+        assert result.transcript_count == 1
+        mock_generation_service.generate.assert_not_called()
+        mock_agenda_repository.create.assert_not_called()
+        mock_agenda_repository.get_by_agent.assert_awaited_once_with(agent.id, agent.user_id, limit=1)
+
+    @pytest.mark.asyncio
+    async def test_generates_and_stores_fingerprint_when_inputs_changed(
+        self,
+        use_case: GenerateAgendaUseCase,
+        agent: Agent,
+        mock_agenda_repository: AsyncMock,
+        mock_generation_service: AsyncMock,
+    ) -> None:
+        """入力が変わっている場合は生成し、新しいアジェンダに入力のフィンガープリントを保存すること."""
+        mock_agenda_repository.get_by_agent.return_value = [self._previous_agenda(agent, "stale")]
+
+        result = await use_case.execute(agent.user_id, agent.id)
+
+        assert result.reused is False
+        mock_generation_service.generate.assert_awaited_once()
+        assert result.agenda.input_fingerprint == self.WATERMARKS.fingerprint()
+
+    @pytest.mark.asyncio
+    async def test_force_regenerates_unchanged_inputs(
+        self,
+        use_case: GenerateAgendaUseCase,
+        agent: Agent,
+        mock_agenda_repository: AsyncMock,
+        mock_generation_service: AsyncMock,
+    ) -> None:
+        """forceを指定した場合は入力が変わっていなくても生成し直すこと."""
+        previous = self._previous_agenda(agent, self.WATERMARKS.fingerprint())
+        mock_agenda_repository.get_by_agent.return_value = [previous]
+
+        result = await use_case.execute(agent.user_id, agent.id, force=True)
+
+        assert result.reused is False
+        assert result.agenda.id != previous.id
+        mock_generation_service.generate.assert_awaited_once()
+
+
+class TestGenerateAgendaUseCaseIncremental:
+    """前回のアジェンダの差分更新のテスト."""
+
+    @pytest.fixture
+    def agent(self) -> Agent:
+        """テスト用エージェント."""
+        return Agent(id=uuid4(), user_id=uuid4(), name="Test Agent", created_at=datetime.now())
+
+    @pytest.fixture
+    def previous(self, agent: Agent) -> Agenda:
+        """1時間前に生成した前回のアジェンダ."""
+        generated_at = datetime.now() - timedelta(hours=1)
+        return Agenda(
+            id=uuid4(),
+            agent_id=agent.id,
+            user_id=agent.user_id,
+            content="### 議題（10分）\n前回の内容\n",
+            generated_at=generated_at,
+            created_at=generated_at,
+        )
+
+    @pytest.fixture
+    def mock_generation_service(self) -> AsyncMock:
+        """AgendaGenerationService モック."""
+        mock = AsyncMock(spec=AgendaGenerationService)
+        mock.generate.return_value = "# Full Agenda"
+        mock.generate_update.return_value = "### 議題（10分）\n更新後の内容\n"
+        return mock
+
+    @pytest.fixture
+    def mock_knowledge_repository(self) -> AsyncMock:
+        """KnowledgeRepository モック（ナレッジなし）."""
+        mock = AsyncMock(spec=KnowledgeRepository)
+        mock.get_latest_by_agent.return_value = None
+        return mock
+
+    def _transcript(self, created_at: datetime) -> MeetingTranscript:
+        return MeetingTranscript(
+            id=uuid4(),
+            recurring_meeting_id=uuid4(),
+            meeting_date=created_at,
+            google_doc_id="doc",
+            raw_text="新しい議事録",
+            structured_data=TranscriptStructuredData(entries=[]),
+            match_confidence=0.9,
+            created_at=created_at,
+        )
+
+    def _use_case(
+        self,
+        agent: Agent,
+        previous: Agenda,
+        transcripts: list[MeetingTranscript],
+        mock_generation_service: AsyncMock,
+        mock_knowledge_repository: AsyncMock,
+    ) -> GenerateAgendaUseCase:
+        agenda_repository = AsyncMock(spec=AgendaRepository)
+        agenda_repository.get_by_agent.return_value = [previous]
+        agenda_repository.create.side_effect = lambda agenda: agenda
+        agent_repository = MagicMock(spec=AgentRepository)
+        agent_repository.get_by_id.return_value = agent
+        dictionary_repository = AsyncMock(spec=DictionaryRepository)
+        dictionary_repository.get_all.return_value = []
+        recurring_meeting_repository = AsyncMock(spec=RecurringMeetingRepository)
+        recurring_meeting_repository.get_list_by_agent_id.return_value = [MagicMock(id=uuid4(), title="週次定例")]
+        transcript_repository = AsyncMock(spec=MeetingTranscriptRepository)
+        transcript_repository.get_by_recurring_meeting.return_value = transcripts
+        return GenerateAgendaUseCase(
+            agenda_repository=agenda_repository,
+            agent_repository=agent_repository,
+            knowledge_repository=mock_knowledge_repository,
+            dictionary_repository=dictionary_repository,
+            slack_repository=AsyncMock(spec=SlackIntegrationRepository),
+            generation_service=mock_generation_service,
+            recurring_meeting_repository=recurring_meeting_repository,
+            meeting_transcript_repository=transcript_repository,
+            incremental_limits=IncrementalLimits(max_slack_messages=30, max_transcripts=1),
+        )
+
+    @pytest.mark.asyncio
+    async def test_updates_previous_agenda_with_delta(
+        self,
+        agent: Agent,
+        previous: Agenda,
+        mock_generation_service: AsyncMock,
+        mock_knowledge_repository: AsyncMock,
+    ) -> None:
+        """前回の生成以降の差分が上限以内なら、前回のアジェンダと差分だけで更新すること."""
+        old = self._transcript(datetime.now() - timedelta(days=7))
+        new = self._transcript(datetime.now())
+        use_case = self._use_case(agent, previous, [new, old], mock_generation_service, mock_knowledge_repository)
+
+        result = await use_case.execute(agent.user_id, agent.id)
+
+        mock_generation_service.generate.assert_not_called()
+        update_input = mock_generation_service.generate_update.call_args[0][0]
+        assert update_input.previous_content == previous.content
+        assert update_input.transcripts == [new]
+        assert result.incremental is True
+        assert result.agenda.content == "### 議題（10分）\n更新後の内容\n"
+        assert result.agenda.id != previous.id
+
+    @pytest.mark.asyncio
+    async def test_regenerates_when_delta_exceeds_limits(
+        self,
+        agent: Agent,
+        previous: Agenda,
+        mock_generation_service: AsyncMock,
+        mock_knowledge_repository: AsyncMock,
+    ) -> None:
+        """追加されたトランスクリプトが上限を超える場合は全体を生成し直すこと."""
+        transcripts = [self._transcript(datetime.now()), self._transcript(datetime.now())]
+        use_case = self._use_case(agent, previous, transcripts, mock_generation_service, mock_knowledge_repository)
+
+        result = await use_case.execute(agent.user_id, agent.id)
+
+        mock_generation_service.generate_update.assert_not_called()
+        mock_generation_service.generate.assert_awaited_once()
+        assert result.incremental is False
+
+    @pytest.mark.asyncio
+    async def test_regenerates_when_knowledge_changed(
+        self,
+        agent: Agent,
+        previous: Agenda,
+        mock_generation_service: AsyncMock,
+        mock_knowledge_repository: AsyncMock,
+    ) -> None:
+        """前回の生成以降に新しいナレッジがある場合は全体を生成し直すこと."""
+        knowledge = MagicMock(spec=Knowledge)
+        knowledge.id = uuid4()
+        knowledge.meeting_date = datetime.now()
+        knowledge.normalized_text = "新しいナレッジ"
+        mock_knowledge_repository.get_latest_by_agent.return_value = knowledge
+        use_case = self._use_case(
+            agent, previous, [self._transcript(datetime.now())], mock_generation_service, mock_knowledge_repository
+        )
+
+        await use_case.execute(agent.user_id, agent.id)
+
+        mock_generation_service.generate_update.assert_not_called()
+        mock_generation_service.generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_full_generation_on_invalid_patch(
+        self,
+        agent: Agent,
+        previous: Agenda,
+        mock_generation_service: AsyncMock,
+        mock_knowledge_repository: AsyncMock,
+    ) -> None:
+        """差分更新の出力がパッチの形式でない場合は全体を生成し直すこと."""
+        mock_generation_service.generate_update.side_effect = ValueError("Agenda patch has no heading blocks")
+        use_case = self._use_case(
+            agent, previous, [self._transcript(datetime.now())], mock_generation_service, mock_knowledge_repository
+        )
+
+        result = await use_case.execute(agent.user_id, agent.id)
+
+        mock_generation_service.generate.assert_awaited_once()
+        assert result.agenda.content == "# Full Agenda"
+        assert result.incremental is False
@@ -1,21 +1,29 @@
 """CalendarUseCases tests.
 
-Tests for SyncRecurringMeetingsUseCase including stale record deletion.
+Tests for SyncRecurringMeetingsUseCase including diff-based writes, stale record deletion
+and incremental sync with Calendar sync tokens.
 All external dependencies are mocked.
 """
 
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
 from src.application.use_cases import calendar_use_cases
 from src.application.use_cases.calendar_use_cases import SyncRecurringMeetingsUseCase
 from src.domain.entities.google_integration import GoogleIntegration
+from src.domain.entities.recurring_meeting import (
+    Attendee,
+    MeetingFrequency,
+    RecurringMeeting,
+)
 from src.infrastructure.external.google_calendar_client import (
     CalendarAttendee,
     CalendarEvent,
+    CalendarEventChanges,
+    CalendarSyncTokenExpiredError,
 )
 from src.infrastructure.external.google_oauth_client import GoogleTokenResponse
 
@@ -42,7 +50,7 @@ class TestSyncRecurringMeetingsUseCase:
             status=status,
         )
 
-    def _make_integration(self) -> GoogleIntegration:
+    def _make_integration(self, calendar_sync_token: str | None = None) -> GoogleIntegration:
         """テスト用GoogleIntegrationを作成するヘルパー"""
         return GoogleIntegration(
             id=uuid4(),
@@ -52,6 +60,58 @@ class TestSyncRecurringMeetingsUseCase:
             granted_scopes=["https://www.googleapis.com/auth/calendar.readonly"],
             created_at=datetime.now(UTC),
             updated_at=None,
+            calendar_sync_token=calendar_sync_token,
+        )
+
+    def _full_sync(self, events: list[CalendarEvent]) -> CalendarEventChanges:
+        """フル同期の結果を作成するヘルパー"""
+        return CalendarEventChanges(
+            events=events,
+            removed_event_ids=[],
+            next_sync_token="sync_token_1",
+            full_sync=True,
+        )
+
+    async def _execute_with_calendar(
+        self,
+        user_id: UUID,
+        integration: GoogleIntegration,
+        mock_google_repo: AsyncMock,
+        mock_meeting_repo: AsyncMock,
+        mock_calendar_instance: AsyncMock,
+        next_occurrence: datetime = datetime(2026, 2, 10, 9, 0, tzinfo=UTC),
+    ) -> calendar_use_cases.CalendarSyncResult:
+        """Google API呼び出しをモックして同期を実行するヘルパー"""
+        mock_google_repo.get_all.return_value = [integration]
+        mock_token_response = MagicMock(spec=GoogleTokenResponse)
+        mock_token_response.access_token = "fake_access_token"
+
+        with (
+            patch.object(calendar_use_cases, "decrypt_google_token", return_value="decrypted_refresh_token"),
+            patch.object(calendar_use_cases, "GoogleOAuthClient") as mock_oauth_cls,
+            patch.object(calendar_use_cases, "GoogleCalendarClient") as mock_calendar_cls,
+        ):
+            mock_oauth_instance = AsyncMock()
+            mock_oauth_instance.refresh_access_token.return_value = mock_token_response
+            mock_oauth_cls.return_value = mock_oauth_instance
+            mock_calendar_cls.return_value = mock_calendar_instance
+            mock_calendar_cls.parse_frequency_from_rrule.return_value = "weekly"
+            mock_calendar_cls.calculate_next_occurrence.return_value = next_occurrence
+
+            use_case = SyncRecurringMeetingsUseCase(mock_google_repo, mock_meeting_repo)
+            return await use_case.execute(user_id)
+
+    def _make_meeting(self, user_id: UUID, google_event_id: str) -> RecurringMeeting:
+        """テスト用RecurringMeetingを作成するヘルパー"""
+        return RecurringMeeting(
+            id=uuid4(),
+            user_id=user_id,
+            google_event_id=google_event_id,
+            title="Old Title",
+            rrule="RRULE:FREQ=WEEKLY;BYDAY=MO",
+            frequency=MeetingFrequency.WEEKLY,
+            next_occurrence=datetime(2026, 2, 10, 9, 0, tzinfo=UTC),
+            created_at=datetime.now(UTC),
         )
 
     @pytest.mark.asyncio
@@ -65,10 +125,10 @@ class TestSyncRecurringMeetingsUseCase:
         mock_google_repo = AsyncMock()
         mock_google_repo.get_all.return_value = [integration]
 
+        stale_meetings = [self._make_meeting(user_id, "event_stale_1"), self._make_meeting(user_id, "event_stale_2")]
         mock_meeting_repo = AsyncMock()
-        mock_meeting_repo.get_by_google_event_id.return_value = None
-        mock_meeting_repo.upsert.side_effect = lambda m: m
-        mock_meeting_repo.delete_by_user_except_google_event_ids.return_value = 2
+        mock_meeting_repo.get_all.return_value = stale_meetings
+        mock_meeting_repo.delete_by_ids.return_value = 2
 
         mock_token_response = MagicMock(spec=GoogleTokenResponse)
         mock_token_response.access_token = "fake_access_token"
@@ -93,7 +153,7 @@ class TestSyncRecurringMeetingsUseCase:
             mock_oauth_cls.return_value = mock_oauth_instance
 
             mock_calendar_instance = AsyncMock()
-            mock_calendar_instance.get_recurring_events.return_value = events
+            mock_calendar_instance.sync_recurring_events.return_value = self._full_sync(events)
             mock_calendar_cls.return_value = mock_calendar_instance
 
             use_case = SyncRecurringMeetingsUseCase(mock_google_repo, mock_meeting_repo)
@@ -102,8 +162,9 @@ class TestSyncRecurringMeetingsUseCase:
             result = await use_case.execute(user_id)
 
         # Assert
-        assert len(result) == 1
-        mock_meeting_repo.delete_by_user_except_google_event_ids.assert_called_once_with(user_id, ["event_active"])
+        assert len(result.meetings) == 1
+        assert (result.created_count, result.deleted_count) == (1, 2)
+        mock_meeting_repo.delete_by_ids.assert_called_once_with([m.id for m in stale_meetings], user_id)
 
     @pytest.mark.asyncio
     async def test_execute_passes_empty_list_when_no_events(self) -> None:
@@ -115,8 +176,10 @@ class TestSyncRecurringMeetingsUseCase:
         mock_google_repo = AsyncMock()
         mock_google_repo.get_all.return_value = [integration]
 
+        existing_meetings = [self._make_meeting(user_id, f"event_{i}") for i in range(5)]
         mock_meeting_repo = AsyncMock()
-        mock_meeting_repo.delete_by_user_except_google_event_ids.return_value = 5
+        mock_meeting_repo.get_all.return_value = existing_meetings
+        mock_meeting_repo.delete_by_ids.return_value = 5
 
         mock_token_response = MagicMock(spec=GoogleTokenResponse)
         mock_token_response.access_token = "fake_access_token"
@@ -141,7 +204,7 @@ class TestSyncRecurringMeetingsUseCase:
             mock_oauth_cls.return_value = mock_oauth_instance
 
             mock_calendar_instance = AsyncMock()
-            mock_calendar_instance.get_recurring_events.return_value = []
+            mock_calendar_instance.sync_recurring_events.return_value = self._full_sync([])
             mock_calendar_cls.return_value = mock_calendar_instance
 
             use_case = SyncRecurringMeetingsUseCase(mock_google_repo, mock_meeting_repo)
@@ -150,19 +213,15 @@ class TestSyncRecurringMeetingsUseCase:
             result = await use_case.execute(user_id)
 
         # Assert
-        assert len(result) == 0
-        mock_meeting_repo.delete_by_user_except_google_event_ids.assert_called_once_with(user_id, [])
+        assert len(result.meetings) == 0
+        assert result.deleted_count == 5
+        mock_meeting_repo.upsert_many.assert_called_once_with([])
+        mock_meeting_repo.delete_by_ids.assert_called_once_with([m.id for m in existing_meetings], user_id)
 
     @pytest.mark.asyncio
     async def test_execute_preserves_existing_agent_link_on_upsert(self) -> None:
         """既存レコードのagent_id紐付けがupsert時に保持されること"""
         # Arrange
-        from src.domain.entities.recurring_meeting import (
-            Attendee,
-            MeetingFrequency,
-            RecurringMeeting,
-        )
-
         user_id = uuid4()
         agent_id = uuid4()
         meeting_id = uuid4()
@@ -186,9 +245,8 @@ class TestSyncRecurringMeetingsUseCase:
         mock_google_repo.get_all.return_value = [integration]
 
         mock_meeting_repo = AsyncMock()
-        mock_meeting_repo.get_by_google_event_id.return_value = existing_meeting
-        mock_meeting_repo.upsert.side_effect = lambda m: m
-        mock_meeting_repo.delete_by_user_except_google_event_ids.return_value = 0
+        mock_meeting_repo.get_all.return_value = [existing_meeting]
+        mock_meeting_repo.delete_by_ids.return_value = 0
 
         mock_token_response = MagicMock(spec=GoogleTokenResponse)
         mock_token_response.access_token = "fake_access_token"
@@ -213,7 +271,7 @@ class TestSyncRecurringMeetingsUseCase:
             mock_oauth_cls.return_value = mock_oauth_instance
 
             mock_calendar_instance = AsyncMock()
-            mock_calendar_instance.get_recurring_events.return_value = events
+            mock_calendar_instance.sync_recurring_events.return_value = self._full_sync(events)
             mock_calendar_cls.return_value = mock_calendar_instance
 
             use_case = SyncRecurringMeetingsUseCase(mock_google_repo, mock_meeting_repo)
@@ -222,7 +280,146 @@ class TestSyncRecurringMeetingsUseCase:
             result = await use_case.execute(user_id)
 
         # Assert
-        assert len(result) == 1
-        upserted_meeting = mock_meeting_repo.upsert.call_args[0][0]
+        assert len(result.meetings) == 1
+        assert result.updated_count == 1
+        upserted_meeting = mock_meeting_repo.upsert_many.call_args[0][0][0]
         assert upserted_meeting.agent_id == agent_id
         assert upserted_meeting.id == meeting_id
+        assert upserted_meeting.title == "Weekly Standup"
+
+    @pytest.mark.asyncio
+    async def test_execute_full_sync_stores_next_sync_token(self) -> None:
+        """トークンがない場合はフル同期し、次回のsyncTokenを保存すること"""
+        # Arrange
+        user_id = uuid4()
+        integration = self._make_integration()
+        mock_google_repo = AsyncMock()
+        mock_meeting_repo = AsyncMock()
+        mock_meeting_repo.get_all.return_value = []
+        mock_meeting_repo.delete_by_ids.return_value = 0
+        mock_calendar_instance = AsyncMock()
+        mock_calendar_instance.sync_recurring_events.return_value = self._full_sync([self._make_calendar_event()])
+
+        # Act
+        result = await self._execute_with_calendar(
+            user_id, integration, mock_google_repo, mock_meeting_repo, mock_calendar_instance
+        )
+
+        # Assert
+        assert result.full_sync is True
+        assert result.created_count == 1
+        mock_calendar_instance.sync_recurring_events.assert_called_once_with(
+            sync_token=None, min_attendees=1, months_back=3
+        )
+        mock_google_repo.update_calendar_sync_token.assert_called_once_with(integration.id, user_id, "sync_token_1")
+
+    @pytest.mark.asyncio
+    async def test_execute_incremental_sync_applies_only_changes(self) -> None:
+        """保存済みのトークンで変更分だけを取得し、対象の定例MTGだけを読み書きすること"""
+        # Arrange
+        user_id = uuid4()
+        integration = self._make_integration(calendar_sync_token="sync_token_1")
+        changed = self._make_meeting(user_id, "event_changed")
+        removed = self._make_meeting(user_id, "event_removed")
+        mock_google_repo = AsyncMock()
+        mock_meeting_repo = AsyncMock()
+        mock_meeting_repo.get_by_google_event_ids.return_value = [changed, removed]
+        mock_meeting_repo.delete_by_ids.return_value = 1
+        mock_meeting_repo.get_all.return_value = [changed]
+        mock_calendar_instance = AsyncMock()
+        mock_calendar_instance.sync_recurring_events.return_value = CalendarEventChanges(
+            events=[self._make_calendar_event(event_id="event_changed")],
+            removed_event_ids=["event_removed"],
+            next_sync_token="sync_token_2",
+            full_sync=False,
+        )
+
+        # Act
+        result = await self._execute_with_calendar(
+            user_id, integration, mock_google_repo, mock_meeting_repo, mock_calendar_instance
+        )
+
+        # Assert
+        assert result.full_sync is False
+        assert (result.updated_count, result.deleted_count) == (1, 1)
+        assert result.meetings == [changed]
+        mock_calendar_instance.sync_recurring_events.assert_called_once_with(
+            sync_token="sync_token_1", min_attendees=1, months_back=3
+        )
+        mock_meeting_repo.get_by_google_event_ids.assert_called_once_with(user_id, ["event_changed", "event_removed"])
+        upserted = mock_meeting_repo.upsert_many.call_args[0][0]
+        assert [m.id for m in upserted] == [changed.id]
+        mock_meeting_repo.delete_by_ids.assert_called_once_with([removed.id], user_id)
+        mock_google_repo.update_calendar_sync_token.assert_called_once_with(integration.id, user_id, "sync_token_2")
+
+    @pytest.mark.asyncio
+    async def test_execute_incremental_sync_refreshes_passed_occurrences(self) -> None:
+        """変更がなくても、次回開催日時が過ぎた定例MTGは次回開催日時を再計算して書き込むこと"""
+        # Arrange
+        user_id = uuid4()
+        agent_id = uuid4()
+        integration = self._make_integration(calendar_sync_token="sync_token_1")
+        passed = self._make_meeting(user_id, "event_passed")
+        passed.start_datetime = datetime(2026, 1, 5, 9, 0, tzinfo=UTC)
+        passed.agent_id = agent_id
+        legacy = self._make_meeting(user_id, "event_legacy")
+        mock_google_repo = AsyncMock()
+        mock_meeting_repo = AsyncMock()
+        mock_meeting_repo.get_by_google_event_ids.return_value = []
+        mock_meeting_repo.get_with_next_occurrence_before.return_value = [passed, legacy]
+        mock_meeting_repo.delete_by_ids.return_value = 0
+        mock_meeting_repo.get_all.return_value = [passed, legacy]
+        mock_calendar_instance = AsyncMock()
+        mock_calendar_instance.sync_recurring_events.return_value = CalendarEventChanges(
+            events=[],
+            removed_event_ids=[],
+            next_sync_token="sync_token_1",
+            full_sync=False,
+        )
+        next_occurrence = datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+
+        # Act
+        result = await self._execute_with_calendar(
+            user_id, integration, mock_google_repo, mock_meeting_repo, mock_calendar_instance, next_occurrence
+        )
+
+        # Assert
+        assert result.full_sync is False
+        assert result.updated_count == 1
+        user_arg, before = mock_meeting_repo.get_with_next_occurrence_before.call_args[0]
+        assert user_arg == user_id
+        assert before.tzinfo is not None
+        upserted = mock_meeting_repo.upsert_many.call_args[0][0]
+        assert [(m.id, m.agent_id, m.next_occurrence) for m in upserted] == [(passed.id, agent_id, next_occurrence)]
+        assert upserted[0].updated_at is not None
+        mock_google_repo.update_calendar_sync_token.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_falls_back_to_full_sync_when_token_expired(self) -> None:
+        """syncTokenが失効（410 Gone）した場合はフル同期にフォールバックすること"""
+        # Arrange
+        user_id = uuid4()
+        integration = self._make_integration(calendar_sync_token="expired_token")
+        stale = self._make_meeting(user_id, "event_stale")
+        mock_google_repo = AsyncMock()
+        mock_meeting_repo = AsyncMock()
+        mock_meeting_repo.get_all.return_value = [stale]
+        mock_meeting_repo.delete_by_ids.return_value = 1
+        mock_calendar_instance = AsyncMock()
+        mock_calendar_instance.sync_recurring_events.side_effect = [
+            CalendarSyncTokenExpiredError("Google Calendar sync token expired"),
+            self._full_sync([self._make_calendar_event()]),
+        ]
+
+        # Act
+        result = await self._execute_with_calendar(
+            user_id, integration, mock_google_repo, mock_meeting_repo, mock_calendar_instance
+        )
+
+        # Assert
+        assert result.full_sync is True
+        assert mock_calendar_instance.sync_recurring_events.call_count == 2
+        assert mock_calendar_instance.sync_recurring_events.call_args.kwargs == {"min_attendees": 1, "months_back": 3}
+        mock_meeting_repo.get_by_google_event_ids.assert_not_called()
+        mock_meeting_repo.delete_by_ids.assert_called_once_with([stale.id], user_id)
+        mock_google_repo.update_calendar_sync_token.assert_called_once_with(integration.id, user_id, "sync_token_1")
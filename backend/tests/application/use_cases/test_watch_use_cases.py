@@ -0,0 +1,314 @@
+"""WatchUseCases tests.
+
+Tests for push-notification channel registration, renewal, notification
+validation and the Drive changes resync.
+All external dependencies are mocked.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.application.use_cases import watch_use_cases
+from src.application.use_cases.transcript_use_cases import SyncResult
+from src.application.use_cases.watch_use_cases import (
+    CALENDAR_SCOPE,
+    DOCS_SCOPE,
+    DRIVE_SCOPE,
+    HandleWatchNotificationUseCase,
+    RenewWatchChannelsUseCase,
+    SyncDriveChangesUseCase,
+    WatchGoogleChangesUseCase,
+)
+from src.domain.entities.google_integration import GoogleIntegration
+from src.domain.entities.watch_channel import WatchChannel, WatchResourceType
+from src.infrastructure.external.google_drive_client import DriveChanges, DriveFile
+from src.infrastructure.external.google_push_channel import WatchRegistration
+
+ADDRESS = "https://example.com/api/v1/webhooks/google"
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+
+def _integration(scopes: list[str]) -> GoogleIntegration:
+    return GoogleIntegration(
+        id=uuid4(),
+        user_id=uuid4(),
+        email="test@example.com",
+        encrypted_refresh_token="encrypted_token",
+        granted_scopes=scopes,
+        created_at=NOW,
+        updated_at=None,
+    )
+
+
+def _channel(
+    integration: GoogleIntegration,
+    resource_type: WatchResourceType,
+    expiration: datetime,
+    page_token: str | None = None,
+) -> WatchChannel:
+    return WatchChannel(
+        id=uuid4(),
+        user_id=integration.user_id,
+        integration_id=integration.id,
+        resource_type=resource_type,
+        resource_id=f"resource-{resource_type.value}",
+        token="channel-token",
+        expiration=expiration,
+        created_at=NOW,
+        page_token=page_token,
+    )
+
+
+def _channel_repository() -> AsyncMock:
+    repository = AsyncMock()
+    repository.create.side_effect = lambda channel: channel
+    repository.get_by_integration.return_value = []
+    return repository
+
+
+class TestWatchGoogleChangesUseCase:
+    """WatchGoogleChangesUseCaseのテスト"""
+
+    async def test_registers_channel_per_granted_resource(self) -> None:
+        """許可済みスコープの監視対象ごとにチャネルを登録すること"""
+        integration = _integration([CALENDAR_SCOPE, DRIVE_SCOPE, DOCS_SCOPE])
+        integration_repo = AsyncMock()
+        integration_repo.get_all.return_value = [integration]
+        channel_repo = _channel_repository()
+        registration = WatchRegistration(resource_id="resource-1", expiration=NOW + timedelta(days=7))
+
+        with (
+            patch.object(watch_use_cases, "_get_access_token", AsyncMock(return_value="access_token")),
+            patch.object(watch_use_cases, "GoogleCalendarClient") as calendar_cls,
+            patch.object(watch_use_cases, "GoogleDriveClient") as drive_cls,
+        ):
+            calendar_cls.return_value.watch_events = AsyncMock(return_value=registration)
+            drive_cls.return_value.get_start_page_token = AsyncMock(return_value="start_token")
+            drive_cls.return_value.watch_changes = AsyncMock(return_value=registration)
+
+            use_case = WatchGoogleChangesUseCase(integration_repo, channel_repo, ADDRESS, 604800, timedelta(days=1))
+            channels = await use_case.execute(integration.user_id)
+
+        assert [c.resource_type for c in channels] == [WatchResourceType.CALENDAR, WatchResourceType.DRIVE]
+        drive_channel = channels[1]
+        assert drive_channel.page_token == "start_token"
+        assert drive_channel.integration_id == integration.id
+        calendar_cls.return_value.watch_events.assert_awaited_once()
+        args = calendar_cls.return_value.watch_events.call_args.args
+        assert args[1:] == (channels[0].token, ADDRESS, 604800)
+
+    async def test_keeps_channel_that_is_not_expiring(self) -> None:
+        """有効期限まで余裕のあるチャネルはそのまま使うこと"""
+        integration = _integration([CALENDAR_SCOPE])
+        integration_repo = AsyncMock()
+        integration_repo.get_all.return_value = [integration]
+        current = _channel(integration, WatchResourceType.CALENDAR, datetime.now(UTC) + timedelta(days=5))
+        channel_repo = _channel_repository()
+        channel_repo.get_by_integration.return_value = [current]
+
+        with (
+            patch.object(watch_use_cases, "_get_access_token", AsyncMock(return_value="access_token")),
+            patch.object(watch_use_cases, "GoogleCalendarClient") as calendar_cls,
+        ):
+            use_case = WatchGoogleChangesUseCase(integration_repo, channel_repo, ADDRESS, 604800, timedelta(days=1))
+            channels = await use_case.execute(integration.user_id)
+
+        assert channels == [current]
+        calendar_cls.assert_not_called()
+        channel_repo.create.assert_not_called()
+
+    async def test_raises_when_no_integration(self) -> None:
+        """Google連携がない場合はValueErrorを送出すること"""
+        integration_repo = AsyncMock()
+        integration_repo.get_all.return_value = []
+
+        use_case = WatchGoogleChangesUseCase(
+            integration_repo, _channel_repository(), ADDRESS, 604800, timedelta(days=1)
+        )
+        with pytest.raises(ValueError, match="No Google integration"):
+            await use_case.execute(uuid4())
+
+
+class TestRenewWatchChannelsUseCase:
+    """RenewWatchChannelsUseCaseのテスト"""
+
+    async def test_replaces_expiring_channel_and_keeps_page_token(self) -> None:
+        """有効期限が近いチャネルを作り直し、古いチャネルを停止・削除すること"""
+        integration = _integration([DRIVE_SCOPE, DOCS_SCOPE])
+        old = _channel(integration, WatchResourceType.DRIVE, NOW + timedelta(hours=2), page_token="page_42")
+        integration_repo = AsyncMock()
+        integration_repo.get_by_id.return_value = integration
+        channel_repo = _channel_repository()
+        channel_repo.get_expiring.return_value = [old]
+        registration = WatchRegistration(resource_id="resource-new", expiration=NOW + timedelta(days=7))
+
+        with (
+            patch.object(watch_use_cases, "_get_access_token", AsyncMock(return_value="access_token")),
+            patch.object(watch_use_cases, "GoogleDriveClient") as drive_cls,
+        ):
+            drive_cls.return_value.watch_changes = AsyncMock(return_value=registration)
+            drive_cls.return_value.stop_channel = AsyncMock()
+
+            use_case = RenewWatchChannelsUseCase(integration_repo, channel_repo, ADDRESS, 604800, timedelta(days=1))
+            renewed = await use_case.execute(NOW)
+
+        assert renewed == 1
+        channel_repo.get_expiring.assert_awaited_once_with(NOW + timedelta(days=1))
+        created = channel_repo.create.call_args.args[0]
+        assert created.page_token == "page_42"
+        assert created.resource_id == "resource-new"
+        drive_cls.return_value.get_start_page_token.assert_not_called()
+        drive_cls.return_value.stop_channel.assert_awaited_once_with(str(old.id), old.resource_id)
+        channel_repo.delete.assert_awaited_once_with(old.id)
+
+    async def test_continues_when_one_integration_fails(self) -> None:
+        """1つの連携で失敗しても他の連携の更新を続けること"""
+        broken = _integration([CALENDAR_SCOPE])
+        healthy = _integration([CALENDAR_SCOPE])
+        channels = [
+            _channel(broken, WatchResourceType.CALENDAR, NOW),
+            _channel(healthy, WatchResourceType.CALENDAR, NOW),
+        ]
+        integration_repo = AsyncMock()
+        integration_repo.get_by_id.side_effect = lambda integration_id, user_id: (
+            broken if integration_id == broken.id else healthy
+        )
+        channel_repo = _channel_repository()
+        channel_repo.get_expiring.return_value = channels
+        registration = WatchRegistration(resource_id="resource-new", expiration=NOW + timedelta(days=7))
+
+        async def access_token(integration: GoogleIntegration) -> str:
+            if integration is broken:
+                raise ValueError("Failed to refresh Google token. Please reconnect.")
+            return "access_token"
+
+        with (
+            patch.object(watch_use_cases, "_get_access_token", side_effect=access_token),
+            patch.object(watch_use_cases, "GoogleCalendarClient") as calendar_cls,
+        ):
+            calendar_cls.return_value.watch_events = AsyncMock(return_value=registration)
+            calendar_cls.return_value.stop_channel = AsyncMock()
+
+            use_case = RenewWatchChannelsUseCase(integration_repo, channel_repo, ADDRESS, 604800, timedelta(days=1))
+            renewed = await use_case.execute(NOW)
+
+        assert renewed == 1
+        assert channel_repo.create.call_args.args[0].integration_id == healthy.id
+
+
+class TestHandleWatchNotificationUseCase:
+    """HandleWatchNotificationUseCaseのテスト"""
+
+    def _setup(self) -> tuple[HandleWatchNotificationUseCase, WatchChannel]:
+        integration = _integration([CALENDAR_SCOPE])
+        channel = _channel(integration, WatchResourceType.CALENDAR, NOW + timedelta(days=7))
+        repository = AsyncMock()
+        repository.get_by_id.side_effect = lambda channel_id: channel if channel_id == channel.id else None
+        return HandleWatchNotificationUseCase(repository), channel
+
+    async def test_returns_channel_for_change_notification(self) -> None:
+        """トークンとリソースIDが一致する変更通知はチャネルを返すこと"""
+        use_case, channel = self._setup()
+
+        result = await use_case.execute(str(channel.id), channel.token, channel.resource_id, "exists")
+
+        assert result == channel
+
+    async def test_sync_notification_needs_no_sync(self) -> None:
+        """登録直後の確認通知（sync）は同期しないこと"""
+        use_case, channel = self._setup()
+
+        result = await use_case.execute(str(channel.id), channel.token, channel.resource_id, "sync")
+
+        assert result is None
+
+    @pytest.mark.parametrize(
+        ("channel_id", "token", "resource_id"),
+        [
+            ("not-a-uuid", "channel-token", "resource-calendar"),
+            (str(UUID(int=0)), "channel-token", "resource-calendar"),
+            (None, "wrong-token", "resource-calendar"),
+            (None, None, "resource-calendar"),
+            (None, "channel-token", "other-resource"),
+        ],
+    )
+    async def test_rejects_notification_that_does_not_match(
+        self,
+        channel_id: str | None,
+        token: str | None,
+        resource_id: str,
+    ) -> None:
+        """チャネルID・トークン・リソースIDのいずれかが一致しない通知は拒否すること"""
+        use_case, channel = self._setup()
+
+        with pytest.raises(ValueError, match="Unknown watch channel"):
+            await use_case.execute(channel_id or str(channel.id), token, resource_id, "exists")
+
+
+class TestSyncDriveChangesUseCase:
+    """SyncDriveChangesUseCaseのテスト"""
+
+    async def test_syncs_only_changed_files_and_advances_page_token(self) -> None:
+        """変更されたファイルだけを同期し、ページトークンを進めること"""
+        integration = _integration([DRIVE_SCOPE, DOCS_SCOPE])
+        channel = _channel(integration, WatchResourceType.DRIVE, NOW + timedelta(days=7), page_token="page_1")
+        integration_repo = AsyncMock()
+        integration_repo.get_by_id.return_value = integration
+        channel_repo = _channel_repository()
+        channel_repo.get_by_id.return_value = channel
+        changed = DriveFile(
+            id="doc_1",
+            name="Weekly Standup - Transcript",
+            mime_type="application/vnd.google-apps.document",
+            created_time=NOW,
+            modified_time=NOW,
+            web_view_link=None,
+        )
+        sync_result = SyncResult(synced_count=1, skipped_count=0, error_count=0, synced_transcripts=[])
+
+        with (
+            patch.object(watch_use_cases, "_get_access_token", AsyncMock(return_value="access_token")),
+            patch.object(watch_use_cases, "GoogleDriveClient") as drive_cls,
+            patch.object(watch_use_cases, "GoogleDocsClient"),
+            patch.object(watch_use_cases, "SyncTranscriptsUseCase") as sync_cls,
+        ):
+            drive_cls.return_value.find_folder_id = AsyncMock(return_value="folder_1")
+            drive_cls.return_value.list_changed_transcript_files = AsyncMock(
+                return_value=DriveChanges(files=[changed], new_start_page_token="page_2")
+            )
+            sync_cls.return_value.execute = AsyncMock(return_value=sync_result)
+
+            use_case = SyncDriveChangesUseCase(integration_repo, channel_repo, AsyncMock(), AsyncMock())
+            result = await use_case.execute(channel.id)
+
+        assert result == sync_result
+        drive_cls.return_value.list_changed_transcript_files.assert_awaited_once_with("page_1", "folder_1")
+        sync_cls.return_value.execute.assert_awaited_once_with(integration.user_id, drive_files=[changed])
+        channel_repo.update_page_token.assert_awaited_once_with(channel.id, "page_2")
+
+    async def test_does_not_advance_page_token_when_sync_fails(self) -> None:
+        """同期に失敗した場合はページトークンを進めないこと"""
+        integration = _integration([DRIVE_SCOPE, DOCS_SCOPE])
+        channel = _channel(integration, WatchResourceType.DRIVE, NOW + timedelta(days=7), page_token="page_1")
+        integration_repo = AsyncMock()
+        integration_repo.get_by_id.return_value = integration
+        channel_repo = _channel_repository()
+        channel_repo.get_by_id.return_value = channel
+
+        with (
+            patch.object(watch_use_cases, "_get_access_token", AsyncMock(return_value="access_token")),
+            patch.object(watch_use_cases, "GoogleDriveClient") as drive_cls,
+        ):
+            drive_cls.return_value.find_folder_id = AsyncMock(return_value="folder_1")
+            drive_cls.return_value.list_changed_transcript_files = AsyncMock(
+                side_effect=ValueError("Google Drive API error: Backend Error")
+            )
+
+            use_case = SyncDriveChangesUseCase(integration_repo, channel_repo, MagicMock(), MagicMock())
+            with pytest.raises(ValueError):
+                await use_case.execute(channel.id)
+
+        channel_repo.update_page_token.assert_not_called()
@@ -0,0 +1,114 @@
+"""Tests for MeetingTranscript entities."""
+
+from array import array
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.meeting_transcript import (
+    MeetingTranscript,
+    TranscriptEntry,
+    TranscriptEntryTable,
+    TranscriptStructuredData,
+    format_timestamp_minutes,
+    parse_timestamp_minutes,
+)
+
+RAW_TEXT = "田中 (10:00)\n予算の確認です。\n\n鈴木 (10:02)\n了解しました。\n\n田中 (10:05)\n次回までに対応します。"
+ENTRIES = [
+    TranscriptEntry(speaker="田中", timestamp="10:00", text="予算の確認です。"),
+    TranscriptEntry(speaker="鈴木", timestamp="10:02", text="了解しました。"),
+    TranscriptEntry(speaker="田中", timestamp="10:05", text="次回までに対応します。"),
+]
+
+
+class TestTranscriptEntryTable:
+    """TranscriptEntryTableのテスト."""
+
+    def test_from_entries_keeps_offsets_and_speaker_dictionary(self) -> None:
+        """本文をオフセットで保持し、話者名を辞書で共有すること."""
+        table = TranscriptEntryTable.from_entries(RAW_TEXT, ENTRIES)
+
+        assert table is not None
+        assert table.speakers == ["田中", "鈴木"]
+        assert table.speaker_ids.tolist() == [0, 1, 0]
+        assert table.minutes.tolist() == [600, 602, 605]
+        assert table.text_at(2) == "次回までに対応します。"
+        assert table == ENTRIES
+        assert table[1:] == ENTRIES[1:]
+
+    def test_from_entries_returns_none_when_not_representable(self) -> None:
+        """本文がraw_textにない、またはタイムスタンプが変換できない場合はNoneを返すこと."""
+        assert TranscriptEntryTable.from_entries(RAW_TEXT, [TranscriptEntry("田中", "10:00", "別の発言")]) is None
+        assert TranscriptEntryTable.from_entries(RAW_TEXT, [TranscriptEntry("田中", "9:00", "了解しました。")]) is None
+
+    def test_text_is_sliced_lazily(self) -> None:
+        """本文は参照時にraw_textから切り出すこと."""
+        table = TranscriptEntryTable(
+            RAW_TEXT, ["田中"], array("H", [0]), array("H", [600]), array("I", [11]), array("I", [19])
+        )
+
+        assert table[0] == TranscriptEntry(speaker="田中", timestamp="10:00", text="予算の確認です。")
+
+    def test_structured_data_speakers_from_table(self) -> None:
+        """話者名を辞書から取得すること."""
+        table = TranscriptEntryTable.from_entries(RAW_TEXT, ENTRIES)
+        assert table is not None
+
+        assert TranscriptStructuredData(entries=table).get_speakers() == ["田中", "鈴木"]
+
+
+@pytest.mark.parametrize(("timestamp", "minutes"), [("00:00", 0), ("10:05", 605), ("23:59", 1439)])
+def test_timestamp_minutes_round_trip(timestamp: str, minutes: int) -> None:
+    """HH:MM形式と分数を相互に変換できること."""
+    assert parse_timestamp_minutes(timestamp) == minutes
+    assert format_timestamp_minutes(minutes) == timestamp
+
+
+@pytest.mark.parametrize("timestamp", ["9:05", "10:5", "１０:００", "10-00", ""])
+def test_parse_timestamp_minutes_rejects_non_canonical(timestamp: str) -> None:
+    """ゼロ埋めのHH:MM形式以外はNoneを返すこと."""
+    assert parse_timestamp_minutes(timestamp) is None
+
+
+class TestMeetingTranscriptLazyRawText:
+    """MeetingTranscript.raw_textの遅延読み込みのテスト."""
+
+    def _transcript(self) -> MeetingTranscript:
+        return MeetingTranscript(
+            id=uuid4(),
+            recurring_meeting_id=uuid4(),
+            meeting_date=datetime(2024, 1, 15, 10, tzinfo=UTC),
+            google_doc_id="doc_123",
+            raw_text="",
+            structured_data=None,
+            match_confidence=0.9,
+            created_at=datetime(2024, 1, 15, 12, tzinfo=UTC),
+        )
+
+    def test_loader_is_called_once_on_first_access(self) -> None:
+        """初回参照時に1回だけ読み込むこと."""
+        transcript = self._transcript()
+        calls: list[int] = []
+
+        def load() -> str:
+            calls.append(1)
+            return RAW_TEXT
+
+        transcript.defer_raw_text(load)
+
+        assert not transcript.is_raw_text_loaded()
+        assert transcript.raw_text == RAW_TEXT
+        assert transcript.raw_text == RAW_TEXT
+        assert calls == [1]
+        assert transcript.is_raw_text_loaded()
+
+    def test_assignment_discards_loader(self) -> None:
+        """代入した値は遅延読み込みより優先されること."""
+        transcript = self._transcript()
+        transcript.defer_raw_text(lambda: RAW_TEXT)
+
+        transcript.raw_text = "更新後"
+
+        assert transcript.raw_text == "更新後"
@@ -0,0 +1,27 @@
+"""Tests for PageCursor value object."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.page_cursor import PageCursor
+
+
+class TestPageCursor:
+    """PageCursorのテスト."""
+
+    def test_encode_decode_round_trip(self) -> None:
+        """encodeした文字列から同じカーソルを復元できること."""
+        cursor = PageCursor(datetime(2026, 10, 19, 10, 30, tzinfo=UTC), uuid4())
+
+        token = cursor.encode()
+
+        assert "=" not in token
+        assert PageCursor.decode(token) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", PageCursor.__name__, "MjAyNnxub3QtYS11dWlk"])
+    def test_decode_rejects_invalid_token(self, token: str) -> None:
+        """不正な文字列はValueErrorになること."""
+        with pytest.raises(ValueError, match="Invalid page cursor"):
+            PageCursor.decode(token)
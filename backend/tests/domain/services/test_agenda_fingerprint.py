@@ -0,0 +1,34 @@
+"""Unit tests for agenda input fingerprints."""
+
+from uuid import uuid4
+
+from src.domain.services.agenda_fingerprint import AgendaSourceWatermarks
+
+
+class TestAgendaSourceWatermarks:
+    """AgendaSourceWatermarksのテスト."""
+
+    def test_same_inputs_give_same_fingerprint(self) -> None:
+        """トランスクリプトの順序が違っても同じ入力なら同じフィンガープリントになること."""
+        knowledge_id, first, second = uuid4(), uuid4(), uuid4()
+
+        a = AgendaSourceWatermarks(knowledge_id, (first, second), "3:abc")
+        b = AgendaSourceWatermarks(knowledge_id, (second, first), "3:abc")
+
+        assert a.fingerprint() == b.fingerprint()
+
+    def test_any_changed_input_changes_fingerprint(self) -> None:
+        """ナレッジ・トランスクリプト・辞書・Slackのいずれかが変わるとフィンガープリントが変わること."""
+        knowledge_id, transcript_id = uuid4(), uuid4()
+        base = AgendaSourceWatermarks(knowledge_id, (transcript_id,), "3:abc")
+
+        changed = [
+            AgendaSourceWatermarks(uuid4(), (transcript_id,), "3:abc"),
+            AgendaSourceWatermarks(None, (transcript_id,), "3:abc"),
+            AgendaSourceWatermarks(knowledge_id, (transcript_id, uuid4()), "3:abc"),
+            AgendaSourceWatermarks(knowledge_id, (transcript_id,), "4:def"),
+            AgendaSourceWatermarks(knowledge_id, (transcript_id,), "3:abc", slack_latest_ts="1700000000.000100"),
+        ]
+
+        fingerprints = {base.fingerprint(), *(w.fingerprint() for w in changed)}
+        assert len(fingerprints) == len(changed) + 1
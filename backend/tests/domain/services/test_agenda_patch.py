@@ -0,0 +1,63 @@
+"""Unit tests for applying agenda patches."""
+
+import pytest
+
+from src.domain.services.agenda_patch import DELETE_MARKER, NO_CHANGES, apply_agenda_patch
+
+PREVIOUS = """## Part 1: 事前準備タスク
+
+| 担当 | 準備内容 |
+|------|---------|
+| 田中 | 見積もり |
+
+## Part 2: アジェンダ
+
+### 予算確認（10分）
+見積もりを確認する
+
+### 採用計画（20分）
+採用人数を決める
+"""
+
+
+class TestApplyAgendaPatch:
+    """apply_agenda_patchのテスト."""
+
+    def test_replaces_matching_block_and_keeps_others(self) -> None:
+        """同じ見出しのブロックだけを置き換え、他のブロックはそのまま残すこと."""
+        patched = apply_agenda_patch(PREVIOUS, "### 予算確認（10分）\n承認済みの予算を報告する\n")
+
+        assert "承認済みの予算を報告する" in patched
+        assert "見積もりを確認する" not in patched
+        assert "| 田中 | 見積もり |" in patched
+        assert patched.index("### 予算確認（10分）") < patched.index("### 採用計画（20分）")
+
+    def test_inserts_new_block_after_preceding_patch_block(self) -> None:
+        """新しい見出しのブロックは、パッチ内で直前のブロックの後ろに追加すること."""
+        patch = "### 予算確認（10分）\n見積もりを確認する\n\n### 契約更新（5分）\n更新するか決める\n"
+
+        patched = apply_agenda_patch(PREVIOUS, patch)
+
+        assert patched.index("### 予算確認") < patched.index("### 契約更新") < patched.index("### 採用計画")
+
+    def test_appends_new_block_without_anchor(self) -> None:
+        """直前のブロックがない新しい見出しは末尾に追加すること."""
+        patched = apply_agenda_patch(PREVIOUS, "### 契約更新（5分）\n更新するか決める")
+
+        assert patched.rstrip().endswith("更新するか決める")
+
+    def test_deletes_block(self) -> None:
+        """本文が削除マーカーのブロックを削除すること."""
+        patched = apply_agenda_patch(PREVIOUS, f"### 採用計画（20分）\n{DELETE_MARKER}\n")
+
+        assert "採用計画" not in patched
+        assert "### 予算確認（10分）" in patched
+
+    def test_no_changes_returns_previous(self) -> None:
+        """変更なしの応答では前回のアジェンダをそのまま返すこと."""
+        assert apply_agenda_patch(PREVIOUS, f"  {NO_CHANGES}\n") == PREVIOUS
+
+    def test_rejects_patch_without_headings(self) -> None:
+        """見出しブロックのないパッチはValueErrorにすること."""
+        with pytest.raises(ValueError):
+            apply_agenda_patch(PREVIOUS, "予算確認の議題を更新しました")
@@ -0,0 +1,153 @@
+"""Tests for RRULE expansion domain service."""
+
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.domain.services.recurrence_expander import (
+    OccurrenceIndex,
+    build_occurrence_index,
+    parse_exdates,
+    parse_rrule,
+)
+
+TOKYO = ZoneInfo("Asia/Tokyo")
+NEW_YORK = ZoneInfo("America/New_York")
+NOW = datetime(2026, 10, 19, tzinfo=UTC)
+
+
+class TestParseRrule:
+    """parse_rruleのテスト."""
+
+    def test_parses_parts(self) -> None:
+        """各パートをパースすること."""
+        rule = parse_rrule("RRULE:FREQ=MONTHLY;INTERVAL=2;BYDAY=2TU,-1FR;COUNT=5;UNTIL=20261231T000000Z")
+
+        assert rule.frequency == "MONTHLY"
+        assert rule.interval == 2
+        assert rule.by_day == ((2, 1), (-1, 4))
+        assert rule.count == 5
+        assert rule.until == datetime(2026, 12, 31, tzinfo=UTC)
+
+    @pytest.mark.parametrize("rrule", ["RRULE:INTERVAL=2", "RRULE:FREQ=HOURLY", "RRULE:FREQ=WEEKLY;BYDAY=XX"])
+    def test_rejects_unsupported_rules(self, rrule: str) -> None:
+        """FREQがない・未対応・不正なBYDAYはValueErrorになること."""
+        with pytest.raises(ValueError):
+            parse_rrule(rrule)
+
+
+class TestBuildOccurrenceIndex:
+    """build_occurrence_indexのテスト."""
+
+    def test_biweekly_multiple_days(self) -> None:
+        """隔週・複数曜日を展開すること."""
+        index = build_occurrence_index(
+            "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE", datetime(2026, 9, 7, 10, tzinfo=TOKYO), "Asia/Tokyo", now=NOW
+        )
+
+        assert [o.day for o in index.occurrences[:4]] == [7, 9, 21, 23]
+        assert index.occurrences[-1] < datetime(2028, 1, 1, tzinfo=TOKYO)
+
+    def test_monthly_last_friday_with_count(self) -> None:
+        """序数付きBYDAYとCOUNTを扱うこと."""
+        index = build_occurrence_index(
+            "RRULE:FREQ=MONTHLY;BYDAY=-1FR;COUNT=4", datetime(2026, 1, 30, 10, tzinfo=TOKYO), now=NOW
+        )
+
+        assert [o.date().isoformat() for o in index.occurrences] == [
+            "2026-01-30",
+            "2026-02-27",
+            "2026-03-27",
+            "2026-04-24",
+        ]
+
+    def test_monthly_day_skips_short_months_until(self) -> None:
+        """存在しない日付の月は飛ばし、UNTILで終了すること."""
+        index = build_occurrence_index(
+            "RRULE:FREQ=MONTHLY;BYMONTHDAY=31;UNTIL=20261001T000000Z", datetime(2026, 1, 31, 10, tzinfo=TOKYO), now=NOW
+        )
+
+        assert [o.month for o in index.occurrences] == [1, 3, 5, 7, 8]
+
+    def test_keeps_wall_clock_time_across_dst(self) -> None:
+        """夏時間をまたいでも現地時刻が変わらないこと."""
+        index = build_occurrence_index(
+            "RRULE:FREQ=WEEKLY;BYDAY=MO", datetime(2026, 3, 2, 10, tzinfo=NEW_YORK), "America/New_York", now=NOW
+        )
+
+        assert [o.astimezone(UTC).hour for o in index.occurrences[:2]] == [15, 14]
+        assert {o.hour for o in index.occurrences} == {10}
+
+    def test_exdates_are_removed(self) -> None:
+        """EXDATEの開催を除外すること."""
+        start = datetime(2026, 10, 5, 10, tzinfo=TOKYO)
+        exdates = parse_exdates(
+            [
+                "RRULE:FREQ=WEEKLY",
+                "EXDATE;TZID=Asia/Tokyo:20261012T100000",
+                "EXDATE;VALUE=DATE:20261019",
+                "EXDATE:20261026T010000Z",
+            ],
+            start,
+            "Asia/Tokyo",
+        )
+
+        index = build_occurrence_index("RRULE:FREQ=WEEKLY", start, "Asia/Tokyo", exdates, now=NOW)
+
+        assert [o.day for o in index.occurrences[:2]] == [5, 2]
+
+    def test_long_running_daily_series_reaches_now(self) -> None:
+        """DTSTARTが開催回数の上限より前の毎日開催でも、現在付近の開催を展開すること."""
+        start = datetime(2000, 1, 3, 10, tzinfo=TOKYO)
+
+        index = build_occurrence_index("RRULE:FREQ=DAILY", start, "Asia/Tokyo", now=NOW)
+
+        assert index.next_after(NOW) == datetime(2026, 10, 19, 10, tzinfo=TOKYO)
+        assert index.occurrences[0] == datetime(2024, 12, 31, 10, tzinfo=TOKYO)
+        assert index.occurrences[1] == datetime(2025, 1, 1, 10, tzinfo=TOKYO)
+        assert index.occurrences[-1] == datetime(2027, 12, 31, 10, tzinfo=TOKYO)
+
+    def test_long_running_daily_series_with_count(self) -> None:
+        """COUNT付きの長期シリーズも開始日時から数えて現在付近まで展開すること."""
+        start = datetime(2000, 1, 1, 10, tzinfo=TOKYO)
+
+        index = build_occurrence_index("RRULE:FREQ=DAILY;INTERVAL=2;COUNT=20000", start, "Asia/Tokyo", now=NOW)
+
+        assert index.next_after(NOW) == datetime(2026, 10, 19, 10, tzinfo=TOKYO)
+
+    def test_ended_series_keeps_last_occurrence(self) -> None:
+        """展開範囲より前に終了したシリーズは最後の開催を返すこと."""
+        start = datetime(2010, 1, 4, 10, tzinfo=TOKYO)
+
+        index = build_occurrence_index(
+            "RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20200101T000000Z", start, "Asia/Tokyo", now=NOW
+        )
+
+        assert index.occurrences == (datetime(2019, 12, 30, 10, tzinfo=TOKYO),)
+
+    def test_expansion_is_cached(self) -> None:
+        """同じルール・開始日時の展開結果を再利用すること."""
+        start = datetime(2026, 1, 5, 10, tzinfo=TOKYO)
+
+        first = build_occurrence_index("RRULE:FREQ=WEEKLY;BYDAY=MO", start, "Asia/Tokyo", now=NOW)
+        second = build_occurrence_index("rrule:freq=weekly;byday=mo", start, "Asia/Tokyo", now=NOW)
+
+        assert first is second
+
+
+class TestOccurrenceIndex:
+    """OccurrenceIndexのテスト."""
+
+    def test_nearest_and_next_after(self) -> None:
+        """最も近い開催日時と次の開催日時を返すこと."""
+        start = datetime(2026, 10, 5, 10, tzinfo=UTC)
+        index = OccurrenceIndex(tuple(start + timedelta(weeks=i) for i in range(4)))
+
+        assert index.nearest(start - timedelta(days=30)) == start
+        assert index.nearest(start + timedelta(days=3)) == start
+        assert index.nearest(start + timedelta(days=4)) == start + timedelta(weeks=1)
+        assert index.nearest(start + timedelta(days=60)) == start + timedelta(weeks=3)
+        assert index.next_after(start) == start + timedelta(weeks=1)
+        assert index.next_after(start + timedelta(weeks=3)) is None
+        assert OccurrenceIndex().nearest(start) is None
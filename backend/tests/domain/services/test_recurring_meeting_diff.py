@@ -0,0 +1,75 @@
+"""Tests for recurring meeting diff domain service."""
+
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from src.domain.entities.recurring_meeting import MeetingFrequency, RecurringMeeting
+from src.domain.services.recurring_meeting_diff import diff_recurring_meetings
+
+USER_ID = uuid4()
+CREATED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+NOW = datetime(2026, 2, 1, tzinfo=UTC)
+
+
+def make_meeting(google_event_id: str, title: str = "Weekly Standup", agent_id: UUID | None = None) -> RecurringMeeting:
+    """テスト用RecurringMeetingを作成するヘルパー."""
+    return RecurringMeeting(
+        id=uuid4(),
+        user_id=USER_ID,
+        google_event_id=google_event_id,
+        title=title,
+        rrule="RRULE:FREQ=WEEKLY;BYDAY=MO",
+        frequency=MeetingFrequency.WEEKLY,
+        next_occurrence=datetime(2026, 2, 9, 9, 0, tzinfo=UTC),
+        created_at=CREATED_AT,
+        agent_id=agent_id,
+    )
+
+
+class TestDiffRecurringMeetings:
+    """diff_recurring_meetingsのテスト."""
+
+    def test_classifies_created_updated_unchanged_deleted(self) -> None:
+        """作成・更新・変更なし・削除に振り分けること."""
+        unchanged = make_meeting("event_same")
+        renamed = make_meeting("event_renamed", title="Old Title")
+        stale = make_meeting("event_stale")
+        incoming = [make_meeting("event_new"), make_meeting("event_same"), make_meeting("event_renamed")]
+
+        diff = diff_recurring_meetings([unchanged, renamed, stale], incoming, NOW)
+
+        assert [m.google_event_id for m in diff.created] == ["event_new"]
+        assert [m.google_event_id for m in diff.updated] == ["event_renamed"]
+        assert diff.unchanged == [unchanged]
+        assert diff.deleted == [stale]
+        assert [m.google_event_id for m in diff.changed] == ["event_new", "event_renamed"]
+        assert len(diff.synced) == 3
+
+    def test_updated_meeting_keeps_identity_and_agent_link(self) -> None:
+        """更新時は既存のID・エージェント紐付け・作成日時を引き継ぐこと."""
+        agent_id = uuid4()
+        current = make_meeting("event_1", title="Old Title", agent_id=agent_id)
+
+        diff = diff_recurring_meetings([current], [make_meeting("event_1")], NOW)
+
+        updated = diff.updated[0]
+        assert updated.id == current.id
+        assert updated.agent_id == agent_id
+        assert updated.created_at == CREATED_AT
+        assert updated.updated_at == NOW
+        assert updated.title == "Weekly Standup"
+
+    def test_agent_link_alone_does_not_count_as_change(self) -> None:
+        """カレンダー由来の列が同じならエージェント紐付けの有無は差分にしないこと."""
+        current = make_meeting("event_1", agent_id=uuid4())
+
+        diff = diff_recurring_meetings([current], [make_meeting("event_1")], NOW)
+
+        assert diff.unchanged == [current]
+        assert diff.changed == []
+
+    def test_duplicate_incoming_events_are_written_once(self) -> None:
+        """同じイベントが重複していても1件として扱うこと."""
+        diff = diff_recurring_meetings([], [make_meeting("event_1"), make_meeting("event_1")], NOW)
+
+        assert len(diff.created) == 1
@@ -0,0 +1,71 @@
+"""Tests for search tokenizer domain service."""
+
+from src.domain.services.search_tokenizer import (
+    make_snippet,
+    to_search_query,
+    to_search_vector,
+)
+
+
+class TestToSearchVector:
+    """to_search_vectorのテスト."""
+
+    def test_japanese_text_is_split_into_bigrams(self) -> None:
+        """日本語は文字バイグラムの語彙素になること."""
+        assert to_search_vector("予算案") == "'予算':1 '算案':2"
+
+    def test_positions_are_not_contiguous_across_runs(self) -> None:
+        """記号・空白で区切った語の間は位置を1つ空けること."""
+        assert to_search_vector("予算、決定") == "'予算':1 '決定':3"
+
+    def test_normalizes_width_and_case(self) -> None:
+        """全角英数と大文字は正規化されること."""
+        assert to_search_vector("ＡＩ") == to_search_vector("ai")
+
+    def test_repeated_bigram_has_all_positions(self) -> None:
+        """同じバイグラムは位置をまとめること."""
+        assert to_search_vector("ああああ") == "'ああ':1,2,3"
+
+    def test_empty_text(self) -> None:
+        """語がない場合は空文字列になること."""
+        assert to_search_vector("、。 ") == ""
+
+
+class TestToSearchQuery:
+    """to_search_queryのテスト."""
+
+    def test_term_becomes_bigram_phrase(self) -> None:
+        """語はバイグラムのフレーズ検索になること."""
+        assert to_search_query("予算案") == "('予算' <-> '算案')"
+
+    def test_terms_are_anded(self) -> None:
+        """空白区切りの語は全て含むこと."""
+        assert to_search_query("予算　リリース") == "('予算') & ('リリ' <-> 'リー' <-> 'ース')"
+
+    def test_single_character_is_prefix_match(self) -> None:
+        """1文字の語は前方一致になること."""
+        assert to_search_query("株") == "'株':*"
+
+    def test_no_terms(self) -> None:
+        """語がない場合はNoneになること."""
+        assert to_search_query(" 、") is None
+
+
+class TestMakeSnippet:
+    """make_snippetのテスト."""
+
+    def test_centers_on_first_match(self) -> None:
+        """最初の一致箇所の前後を切り出すこと."""
+        text = "あ" * 50 + "予算の話" + "い" * 100
+
+        snippet = make_snippet(text, "予算", context=5)
+
+        assert snippet == "…あああああ予算の話いいいいいい…"
+
+    def test_short_text_is_returned_as_is(self) -> None:
+        """短いテキストは省略しないこと."""
+        assert make_snippet("予算を確認する", "予算") == "予算を確認する"
+
+    def test_matches_after_normalization(self) -> None:
+        """正規化後に一致する語も見つけること."""
+        assert make_snippet("x" * 30 + "ABC", "abc", context=2) == "…xxABC"
@@ -0,0 +1,91 @@
+"""Tests for text chunker domain service."""
+
+import pytest
+
+from src.domain.services.text_chunker import (
+    chunk_lines,
+    chunk_text,
+    extract_open_items,
+)
+
+
+class TestChunkText:
+    """chunk_textのテスト."""
+
+    def test_short_text_is_single_chunk(self) -> None:
+        """max_chars以下のテキストは1チャンクになること."""
+        assert chunk_text("短い文です。") == ["短い文です。"]
+
+    def test_splits_on_sentence_boundary(self) -> None:
+        """文の途中で分割しないこと."""
+        text = "一つ目の文です。二つ目の文です。三つ目の文です。"
+
+        chunks = chunk_text(text, max_chars=16)
+
+        assert chunks == ["一つ目の文です。二つ目の文です。", "三つ目の文です。"]
+
+    def test_long_sentence_is_split_with_overlap(self) -> None:
+        """max_charsを超える1文はoverlap付きで強制分割されること."""
+        text = "あ" * 25
+
+        chunks = chunk_text(text, max_chars=10, overlap=2)
+
+        assert all(len(c) <= 10 for c in chunks)
+        assert len(chunks) == 3
+        assert sum(len(c) for c in chunks) == 25 + 2 * 2
+
+    def test_blank_text_returns_empty(self) -> None:
+        """空白のみのテキストはチャンクを返さないこと."""
+        assert chunk_text("  \n\n ") == []
+
+    def test_invalid_max_chars_raises(self) -> None:
+        """max_charsが0以下の場合はValueErrorになること."""
+        with pytest.raises(ValueError, match="max_chars"):
+            chunk_text("テキスト", max_chars=0)
+
+
+class TestChunkLines:
+    """chunk_linesのテスト."""
+
+    def test_groups_lines_within_limit(self) -> None:
+        """行を分割せずにmax_chars以内でまとめること."""
+        lines = ["aaaa", "bbbb", "cccc"]
+
+        chunks = chunk_lines(lines, max_chars=10)
+
+        assert [(c.start, c.end, c.text) for c in chunks] == [
+            (0, 2, "aaaa\nbbbb"),
+            (2, 3, "cccc"),
+        ]
+
+    def test_oversized_line_is_own_chunk(self) -> None:
+        """max_charsを超える行は単独のチャンクになること."""
+        chunks = chunk_lines(["a" * 20, "b"], max_chars=10)
+
+        assert [(c.start, c.end) for c in chunks] == [(0, 1), (1, 2)]
+
+
+class TestExtractOpenItems:
+    """extract_open_itemsのテスト."""
+
+    def test_extracts_keyword_and_checkbox_lines(self) -> None:
+        """キーワードを含む行と未完了チェックボックスを抽出すること."""
+        text = "\n".join(
+            [
+                "- 進捗は順調",
+                "- 予算の件は要確認",
+                "- [ ] デザインレビュー日程",
+                "- [x] 仕様書の共有",
+                "- 次回までにリリース日を決める",
+            ]
+        )
+
+        items = extract_open_items(text)
+
+        assert items == ["予算の件は要確認", "デザインレビュー日程", "次回までにリリース日を決める"]
+
+    def test_deduplicates_and_limits(self) -> None:
+        """重複を除外し、limit件までに制限すること."""
+        text = "\n".join(["・検討事項A", "・検討事項A", "・検討事項B", "・検討事項C"])
+
+        assert extract_open_items(text, limit=2) == ["検討事項A", "検討事項B"]
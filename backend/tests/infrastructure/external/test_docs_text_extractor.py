@@ -0,0 +1,93 @@
+"""Google Docs本文テキスト抽出のテスト."""
+
+import json
+
+import pytest
+
+from src.infrastructure.external.docs_text_extractor import DocsBodyTextStream, extract_body_text
+
+
+def _paragraph(*texts: str) -> dict[str, object]:
+    return {"paragraph": {"elements": [{"startIndex": 1, "textRun": {"content": t, "textStyle": {}}} for t in texts]}}
+
+
+def _table(*rows: list[list[dict[str, object]]]) -> dict[str, object]:
+    return {"table": {"rows": len(rows), "tableRows": [{"tableCells": [{"content": c} for c in row]} for row in rows]}}
+
+
+DOCUMENT: dict[str, object] = {
+    "documentId": "doc_001",
+    "title": "定例会議",
+    "headers": {"h1": {"content": [_paragraph("ヘッダー\n")]}},
+    "body": {
+        "content": [
+            {"sectionBreak": {"sectionStyle": {"columnSeparatorStyle": "NONE"}}},
+            _paragraph("田中: 進捗を共有します\n", '引用 "quoted" \\ tab\t\n'),
+            _table(
+                [[_paragraph("A1\n")], [_paragraph("B1\n"), _table([[_paragraph("入れ子\n")]])]],
+                [[_paragraph("A2\n")], []],
+            ),
+            {"tableOfContents": {"content": [_paragraph("目次\n")]}},
+            _paragraph("絵文字 🎉 end\n"),
+        ]
+    },
+    "footnotes": {"f1": {"content": [_paragraph("脚注\n")]}},
+    "revisionId": "rev",
+    "suggestionsViewMode": "SUGGESTIONS_INLINE",
+    "documentStyle": {"pageSize": {"height": {"magnitude": 841.8, "unit": "PT"}}, "useEvenPageHeaderFooter": False},
+}
+
+EXPECTED = '田中: 進捗を共有します\n引用 "quoted" \\ tab\t\nA1\nB1\n入れ子\nA2\n絵文字 🎉 end\n'
+
+
+def _stream(data: bytes, chunk_size: int) -> str:
+    extractor = DocsBodyTextStream()
+    for i in range(0, len(data), chunk_size):
+        extractor.feed(data[i : i + chunk_size])
+    return extractor.close()
+
+
+class TestExtractBodyText:
+    """extract_body_textのテスト"""
+
+    def test_extracts_paragraphs_and_nested_tables_in_order(self) -> None:
+        """段落と入れ子のテーブルのテキストを文書順に抽出する"""
+        assert extract_body_text(DOCUMENT["body"]) == EXPECTED
+
+    def test_deeply_nested_tables_do_not_recurse(self) -> None:
+        """深く入れ子になったテーブルでも再帰の上限に達しない"""
+        element: dict[str, object] = _paragraph("最深部\n")
+        for _ in range(5000):
+            element = _table([[element]])
+
+        assert extract_body_text({"content": [element]}) == "最深部\n"
+
+    def test_ignores_malformed_elements(self) -> None:
+        """想定外の型の要素は無視する"""
+        body = {"content": [None, "text", {"paragraph": {"elements": [None, {"textRun": {"content": 1}}]}}]}
+
+        assert extract_body_text(body) == ""
+
+
+class TestDocsBodyTextStream:
+    """DocsBodyTextStreamのテスト"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+    def test_matches_tree_extraction_for_any_chunking(self, chunk_size: int) -> None:
+        """チャンクの区切り位置によらず、ツリーからの抽出と同じテキストを返す"""
+        data = json.dumps(DOCUMENT).encode()
+
+        assert _stream(data, chunk_size) == EXPECTED
+
+    def test_handles_non_ascii_json_and_whitespace(self) -> None:
+        """エスケープされていない日本語や整形済みのJSONも読める"""
+        data = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode()
+
+        assert _stream(data, 5) == EXPECTED
+
+    def test_incomplete_response_raises(self) -> None:
+        """途中で切れたレスポンスはValueErrorになる"""
+        data = json.dumps(DOCUMENT).encode()
+
+        with pytest.raises(ValueError, match="Incomplete"):
+            _stream(data[: len(data) // 2], 100)
@@ -0,0 +1,92 @@
+"""Google APIバッチリクエストのテスト."""
+
+import json
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.external.google_batch import BatchRequest, execute_batch
+
+BATCH_URL = "https://docs.googleapis.com/batch"
+
+
+def _batch_response(request_body: bytes, statuses: dict[int, int]) -> MagicMock:
+    """リクエストの各呼び出しに応答するmultipartレスポンス（順不同）を作る."""
+    items = [int(i) for i in re.findall(rb"Content-ID: <item(\d+)>", request_body)]
+    parts = []
+    for index in reversed(items):
+        status = statuses.get(index, 200)
+        body = json.dumps({"index": index, "text": "a\r\n\r\nb"}) if status == 200 else json.dumps({"error": {}})
+        parts.append(
+            "--batch_resp\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <response-item{index}>\r\n"
+            "\r\n"
+            f"HTTP/1.1 {status} STATUS\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n"
+            "\r\n"
+            f"{body}\r\n"
+        )
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"Content-Type": "multipart/mixed; boundary=batch_resp"}
+    response.content = ("".join(parts) + "--batch_resp--\r\n").encode()
+    return response
+
+
+def _mock_client(statuses: dict[int, int] | None = None) -> AsyncMock:
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = lambda url, headers, content: _batch_response(content, statuses or {})
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.__aexit__.return_value = None
+    return mock_client
+
+
+class TestExecuteBatch:
+    """execute_batchのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_returns_responses_in_request_order(self) -> None:
+        """順不同のレスポンスをリクエストの順に並べて返す"""
+        requests = [BatchRequest(path=f"/v1/documents/doc_{i}", params={"fields": "title"}) for i in range(3)]
+        mock_client = _mock_client({1: 404})
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            responses = await execute_batch(BATCH_URL, "token", requests)
+
+        assert [r.status_code for r in responses] == [200, 404, 200]
+        assert responses[2].json() == {"index": 2, "text": "a\r\n\r\nb"}
+        body = mock_client.post.call_args.kwargs["content"].decode()
+        assert "GET /v1/documents/doc_0?fields=title HTTP/1.1" in body
+        headers = mock_client.post.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer token"
+        assert headers["Content-Type"].startswith("multipart/mixed; boundary=batch_")
+
+    @pytest.mark.asyncio
+    async def test_splits_into_requests_of_at_most_100_calls(self) -> None:
+        """100件を超える呼び出しは複数のバッチリクエストに分ける"""
+        requests = [BatchRequest(path=f"/v1/documents/doc_{i}") for i in range(250)]
+        mock_client = _mock_client()
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            responses = await execute_batch(BATCH_URL, "token", requests, batch_size=500)
+
+        assert mock_client.post.call_count == 3
+        assert [r.json()["index"] for r in responses] == [i % 100 for i in range(250)]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_request_raises(self) -> None:
+        """バッチリクエスト自体が失敗した場合はValueErrorを送出する"""
+        response = MagicMock()
+        response.status_code = 401
+        mock_client = AsyncMock()
+        mock_client.post.return_value = response
+        mock_client.__aenter__.return_value = mock_client
+        mock_client.__aexit__.return_value = None
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client),
+            pytest.raises(ValueError, match="Google API batch error"),
+        ):
+            await execute_batch(BATCH_URL, "token", [BatchRequest(path="/v1/documents/doc_0")])
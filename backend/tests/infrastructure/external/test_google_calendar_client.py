@@ -1,16 +1,18 @@
 """GoogleCalendarClient tests.
 
-Tests for cancelled event filtering and status parsing.
+Tests for cancelled event filtering, status parsing and incremental sync.
 All external dependencies (httpx) are mocked.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.infrastructure.external.google_calendar_client import (
     CalendarEvent,
+    CalendarEventChanges,
+    CalendarSyncTokenExpiredError,
     GoogleCalendarClient,
 )
 
@@ -90,6 +92,51 @@ class TestParseEventStatus:
         assert event.status == "confirmed"
 
 
+class TestParseEventRecurrence:
+    """_parse_eventの繰り返し情報取得テスト"""
+
+    def test_parse_event_extracts_timezone_and_exdates(self) -> None:
+        """タイムゾーンとEXDATEをパースできること"""
+        client = GoogleCalendarClient("fake_token")
+        item = {
+            "id": "event_exdate",
+            "summary": "Weekly Standup",
+            "recurrence": ["RRULE:FREQ=WEEKLY;BYDAY=MO", "EXDATE;TZID=Asia/Tokyo:20260126T090000"],
+            "start": {"dateTime": "2026-01-19T09:00:00+09:00", "timeZone": "Asia/Tokyo"},
+            "attendees": [],
+        }
+        event = client._parse_event(item)
+        assert event is not None
+        assert event.timezone == "Asia/Tokyo"
+        assert event.exdates == [datetime(2026, 1, 26, 0, tzinfo=UTC)]
+
+
+class TestCalculateNextOccurrence:
+    """calculate_next_occurrenceのテスト"""
+
+    def test_skips_exdate_and_keeps_weekday(self) -> None:
+        """曜日指定を守り、除外日を飛ばして次回を返すこと"""
+        now = datetime.now(UTC)
+        start = datetime(2025, 1, 6, 9, tzinfo=UTC)  # Monday
+        next_monday = (now + timedelta(days=-now.weekday() % 7)).replace(hour=9, minute=0, second=0, microsecond=0)
+        if next_monday <= now:
+            next_monday += timedelta(days=7)
+
+        result = GoogleCalendarClient.calculate_next_occurrence(
+            "RRULE:FREQ=WEEKLY;BYDAY=MO", start, "UTC", [next_monday]
+        )
+
+        assert result == next_monday + timedelta(days=7)
+
+    def test_returns_last_occurrence_when_series_ended(self) -> None:
+        """終了済みのシリーズは最後の開催日時を返すこと"""
+        start = datetime(2025, 1, 6, 9, tzinfo=UTC)
+
+        result = GoogleCalendarClient.calculate_next_occurrence("RRULE:FREQ=WEEKLY;COUNT=3", start)
+
+        assert result == datetime(2025, 1, 20, 9, tzinfo=UTC)
+
+
 class TestGetRecurringEventsFiltersExceptionInstances:
     """get_recurring_eventsの例外インスタンスフィルタリングテスト"""
 
@@ -297,3 +344,122 @@ class TestGetRecurringEventsFiltersCancelled:
         # Assert
         assert len(events) == 1
         assert events[0].status == "tentative"
+
+
+def _make_response(status_code: int, payload: dict[str, object] | None = None) -> MagicMock:
+    """Calendar APIレスポンスのモックを作成するヘルパー"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload or {}
+    return response
+
+
+def _weekly_item(event_id: str, rrule: str = "RRULE:FREQ=WEEKLY;BYDAY=MO") -> dict[str, object]:
+    """2人参加の定例イベントを作成するヘルパー"""
+    start = (datetime.now(UTC) - timedelta(days=7)).strftime("%Y-%m-%dT09:00:00+00:00")
+    return {
+        "id": event_id,
+        "summary": "Weekly Standup",
+        "status": "confirmed",
+        "recurrence": [rrule],
+        "start": {"dateTime": start},
+        "attendees": [{"email": "a@test.com"}, {"email": "b@test.com"}],
+    }
+
+
+class TestSyncRecurringEvents:
+    """sync_recurring_eventsのテスト"""
+
+    async def _sync(
+        self, responses: list[MagicMock], sync_token: str | None = None
+    ) -> tuple[CalendarEventChanges, AsyncMock]:
+        """HTTPクライアントをモックしてsync_recurring_eventsを実行するヘルパー"""
+        mock_http_client = AsyncMock()
+        mock_http_client.get = AsyncMock(side_effect=responses)
+        client = GoogleCalendarClient("fake_token")
+
+        with patch("src.infrastructure.external.google_calendar_client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http_client)
+            mock_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+            result = await client.sync_recurring_events(sync_token=sync_token, min_attendees=2)
+        return result, mock_http_client
+
+    @pytest.mark.asyncio
+    async def test_full_sync_returns_next_sync_token_from_last_page(self) -> None:
+        """フル同期では全ページを取得し、最後のページのnextSyncTokenを返すこと"""
+        responses = [
+            _make_response(200, {"items": [_weekly_item("event_1")], "nextPageToken": "page_2"}),
+            _make_response(200, {"items": [_weekly_item("event_2")], "nextSyncToken": "sync_token_1"}),
+        ]
+
+        changes, mock_http_client = await self._sync(responses)
+
+        assert changes.full_sync is True
+        assert [e.event_id for e in changes.events] == ["event_1", "event_2"]
+        assert changes.next_sync_token == "sync_token_1"
+        params = mock_http_client.get.call_args_list[0].kwargs["params"]
+        assert "syncToken" not in params
+        assert "timeMin" not in params
+
+    @pytest.mark.asyncio
+    async def test_every_page_requests_only_used_fields(self) -> None:
+        """各ページのリクエストでCalendarEventに使うフィールドだけを指定すること"""
+        responses = [
+            _make_response(200, {"items": [_weekly_item("event_1")], "nextPageToken": "page_2"}),
+            _make_response(200, {"items": [], "nextSyncToken": "sync_token_1"}),
+        ]
+
+        _, mock_http_client = await self._sync(responses)
+
+        for call in mock_http_client.get.call_args_list:
+            fields = call.kwargs["params"]["fields"]
+            assert fields.startswith("nextPageToken,nextSyncToken,items(")
+            assert "attendees(email,displayName,responseStatus)" in fields
+            assert "start(dateTime,date,timeZone)" in fields
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_reports_removed_events(self) -> None:
+        """差分同期ではキャンセル・条件外になったイベントを削除対象として返すこと"""
+        too_few_attendees = {**_weekly_item("event_solo"), "attendees": [{"email": "a@test.com"}]}
+        responses = [
+            _make_response(
+                200,
+                {
+                    "items": [
+                        _weekly_item("event_changed"),
+                        {"id": "event_cancelled", "status": "cancelled"},
+                        too_few_attendees,
+                        {**_weekly_item("event_changed_R20260101"), "recurringEventId": "event_changed"},
+                    ],
+                    "nextSyncToken": "sync_token_2",
+                },
+            )
+        ]
+
+        changes, mock_http_client = await self._sync(responses, sync_token="sync_token_1")
+
+        assert changes.full_sync is False
+        assert [e.event_id for e in changes.events] == ["event_changed"]
+        assert changes.removed_event_ids == ["event_cancelled", "event_solo"]
+        assert changes.next_sync_token == "sync_token_2"
+        assert mock_http_client.get.call_args.kwargs["params"]["syncToken"] == "sync_token_1"
+
+    @pytest.mark.asyncio
+    async def test_ended_series_is_excluded(self) -> None:
+        """期間内に開催のない終了済みシリーズは除外すること"""
+        ended = {
+            **_weekly_item("event_ended", "RRULE:FREQ=WEEKLY;UNTIL=20200101T000000Z"),
+            "start": {"dateTime": "2019-12-02T09:00:00+00:00"},
+        }
+        responses = [_make_response(200, {"items": [ended, _weekly_item("event_active")]})]
+
+        changes, _ = await self._sync(responses, sync_token="sync_token_1")
+
+        assert [e.event_id for e in changes.events] == ["event_active"]
+        assert changes.removed_event_ids == ["event_ended"]
+
+    @pytest.mark.asyncio
+    async def test_expired_sync_token_raises(self) -> None:
+        """410 Goneの場合はCalendarSyncTokenExpiredErrorを送出すること"""
+        with pytest.raises(CalendarSyncTokenExpiredError):
+            await self._sync([_make_response(410)], sync_token="expired_token")
@@ -1,9 +1,13 @@
 """GoogleDocsClient tests with mocked HTTP responses."""
 
+import json
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.infrastructure.external import google_docs_client
+from src.infrastructure.external.google_batch import BatchResponse
 from src.infrastructure.external.google_docs_client import (
     DocsDocument,
     GoogleDocsClient,
@@ -123,40 +127,54 @@ class TestGoogleDocsClient:
 
     @pytest.mark.asyncio
     async def test_get_document_text_success(self, client: GoogleDocsClient) -> None:
-        """テキストコンテンツのみを取得できる"""
+        """Drive APIのエクスポートでテキストコンテンツを取得できる"""
         # Arrange
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "documentId": "doc_001",
-            "title": "定例会議",
-            "body": {"content": [{"paragraph": {"elements": [{"textRun": {"content": "テストテキスト\n"}}]}}]},
-        }
+        exported = "\ufeff定例会議\r\nテストテキスト\r\n".encode()
+        mock_client = _mock_export_client(200, [exported[:7], exported[7:]])
 
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            # Act
+            text = await client.get_document_text("doc_001")
+
+        # Assert
+        assert text == "定例会議\nテストテキスト\n"
+        args, kwargs = mock_client.stream.call_args
+        assert args == ("GET", "https://www.googleapis.com/drive/v3/files/doc_001/export")
+        assert kwargs["params"] == {"mimeType": "text/plain"}
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_document_text_falls_back_to_docs_api(self, client: GoogleDocsClient) -> None:
+        """エクスポートできない場合はDocs APIのドキュメントをストリームで読んでテキストを抽出する"""
+        # Arrange
+        document = json.dumps(
+            {
+                "documentId": "doc_001",
+                "title": "定例会議",
+                "body": {"content": [{"paragraph": {"elements": [{"textRun": {"content": "テストテキスト\n"}}]}}]},
+            }
+        ).encode()
+        export_stream = _mock_stream(403, [])
+        docs_stream = _mock_stream(200, [document[:10], document[10:]])
+        mock_client = _mock_export_client(403, [])
+        mock_client.stream.side_effect = [export_stream, docs_stream]
 
         with patch("httpx.AsyncClient", return_value=mock_client):
             # Act
             text = await client.get_document_text("doc_001")
 
         # Assert
-        assert text is not None
-        assert "テストテキスト" in text
+        assert text == "テストテキスト\n"
+        assert mock_client.stream.call_args_list[1].args == (
+            "GET",
+            "https://docs.googleapis.com/v1/documents/doc_001",
+        )
 
     @pytest.mark.asyncio
     async def test_get_document_text_not_found(self, client: GoogleDocsClient) -> None:
         """ドキュメントが見つからない場合はNoneを返す"""
         # Arrange
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+        mock_client = _mock_export_client(404, [])
 
         with patch("httpx.AsyncClient", return_value=mock_client):
             # Act
@@ -164,6 +182,58 @@ class TestGoogleDocsClient:
 
         # Assert
         assert text is None
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_documents_text_uses_batch_request(self, client: GoogleDocsClient) -> None:
+        """複数ドキュメントのテキストをバッチリクエストで取得し、失敗分だけ個別に取得する"""
+        # Arrange
+        body = {"content": [{"paragraph": {"elements": [{"textRun": {"content": "本文\n"}}]}}]}
+        responses = [
+            BatchResponse(200, json.dumps({"documentId": "doc_1", "title": "定例", "body": body}).encode()),
+            BatchResponse(404, b"{}"),
+            BatchResponse(500, b"{}"),
+        ]
+
+        with (
+            patch.object(google_docs_client, "execute_batch", AsyncMock(return_value=responses)) as execute_batch,
+            patch.object(client, "get_document_text", AsyncMock(return_value="個別取得\n")) as get_document_text,
+        ):
+            # Act
+            texts = await client.get_documents_text(["doc_1", "doc_2", "doc_3"])
+
+        # Assert
+        assert texts == {"doc_1": "本文\n", "doc_2": None, "doc_3": "個別取得\n"}
+        requests = execute_batch.call_args.args[2]
+        assert [r.path for r in requests] == ["/v1/documents/doc_1", "/v1/documents/doc_2", "/v1/documents/doc_3"]
+        assert requests[0].params == {"fields": google_docs_client.DOCS_DOCUMENT_FIELDS}
+        get_document_text.assert_awaited_once_with("doc_3")
+
+
+def _mock_stream(status_code: int, chunks: list[bytes]) -> AsyncMock:
+    """ストリームレスポンスを返すコンテキストマネージャのモック."""
+
+    async def aiter_bytes() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    response = MagicMock()
+    response.status_code = status_code
+    response.aiter_bytes = aiter_bytes
+
+    stream = AsyncMock()
+    stream.__aenter__.return_value = response
+    stream.__aexit__.return_value = None
+    return stream
+
+
+def _mock_export_client(status_code: int, chunks: list[bytes]) -> AsyncMock:
+    """エクスポートのストリームレスポンスを返すHTTPクライアントのモック."""
+    mock_client = AsyncMock()
+    mock_client.stream = MagicMock(return_value=_mock_stream(status_code, chunks))
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.__aexit__.return_value = None
+    return mock_client
 
 
 class TestExtractText:
@@ -178,6 +178,82 @@ class TestGoogleDriveClient:
         ):
             await client.get_file_by_id("doc_001")
 
+    @pytest.mark.asyncio
+    async def test_list_changed_transcript_files_filters_changes(self, client: GoogleDriveClient) -> None:
+        """変更一覧からフォルダ直下のGoogle Docsだけを返し、次回のページトークンを返す"""
+
+        def change(file_id: str, **overrides: object) -> dict[str, object]:
+            file = {
+                "id": file_id,
+                "name": f"{file_id} - Transcript",
+                "mimeType": "application/vnd.google-apps.document",
+                "createdTime": "2024-01-15T10:00:00Z",
+                "modifiedTime": "2024-01-15T11:00:00Z",
+                "parents": ["folder_123"],
+                "trashed": False,
+            }
+            return {"removed": False, "file": {**file, **overrides}}
+
+        # Arrange
+        page1 = MagicMock()
+        page1.status_code = 200
+        page1.json.return_value = {
+            "changes": [change("doc_001"), change("sheet", mimeType="application/vnd.google-apps.spreadsheet")],
+            "nextPageToken": "page_2",
+        }
+        page2 = MagicMock()
+        page2.status_code = 200
+        page2.json.return_value = {
+            "changes": [
+                change("other_folder", parents=["folder_999"]),
+                change("trashed", trashed=True),
+                {"removed": True, "fileId": "deleted"},
+                change("doc_002"),
+            ],
+            "newStartPageToken": "page_3",
+        }
+
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = [page1, page2]
+        mock_client.__aenter__.return_value = mock_client
+        mock_client.__aexit__.return_value = None
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            # Act
+            changes = await client.list_changed_transcript_files("page_1", "folder_123")
+
+        # Assert
+        assert [f.id for f in changes.files] == ["doc_001", "doc_002"]
+        assert changes.new_start_page_token == "page_3"
+        assert mock_client.get.call_args_list[0].kwargs["params"]["pageToken"] == "page_1"
+        assert mock_client.get.call_args_list[1].kwargs["params"]["pageToken"] == "page_2"
+
+    @pytest.mark.asyncio
+    async def test_watch_changes_returns_registration(self, client: GoogleDriveClient) -> None:
+        """changes.watchでチャネルを登録し、リソースIDと有効期限を返す"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"resourceId": "resource_1", "expiration": "1793404800000"}
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        mock_client.__aenter__.return_value = mock_client
+        mock_client.__aexit__.return_value = None
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            # Act
+            registration = await client.watch_changes(
+                "page_1", "channel_1", "secret", "https://example.com/api/v1/webhooks/google", 3600
+            )
+
+        # Assert
+        assert registration.resource_id == "resource_1"
+        assert registration.expiration == datetime.fromtimestamp(1793404800, tz=UTC)
+        body = mock_client.post.call_args.kwargs["json"]
+        assert (body["id"], body["type"], body["token"]) == ("channel_1", "web_hook", "secret")
+        assert mock_client.post.call_args.kwargs["params"] == {"pageToken": "page_1"}
+
 
 class TestDriveFile:
     """DriveFileデータクラスのテスト"""
@@ -0,0 +1,147 @@
+"""Tests for LocalVectorStore."""
+
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from src.infrastructure.external.local_vector_store import LocalVectorStore, VectorRecord
+
+
+def _normalized(rng: np.random.Generator, n: int, d: int) -> npt.NDArray[np.float32]:
+    vectors = rng.standard_normal((n, d)).astype(np.float32)
+    normalized: npt.NDArray[np.float32] = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return normalized
+
+
+def _records(vectors: npt.NDArray[np.float32], user_id: str = "u1", agent_id: str | None = None) -> list[VectorRecord]:
+    return [
+        VectorRecord(key=f"k{i}", vector=v, user_id=user_id, agent_id=agent_id, payload={"i": i})
+        for i, v in enumerate(vectors)
+    ]
+
+
+class TestLocalVectorStore:
+    """LocalVectorStoreのテスト."""
+
+    def test_exact_top_k_matches_brute_force(self) -> None:
+        """全件検索の結果が素朴な内積ソートと一致すること."""
+        rng = np.random.default_rng(0)
+        vectors = _normalized(rng, 500, 16)
+        store = LocalVectorStore(dimensions=16, initial_capacity=8)
+        store.add(_records(vectors))
+        query = vectors[3]
+
+        hits = store.search(query, 10, "u1")
+
+        expected = np.argsort(-(vectors @ query), kind="stable")[:10]
+        assert [h.key for h in hits] == [f"k{i}" for i in expected]
+        assert hits[0].payload == {"i": 3}
+
+    def test_filters_by_user_agent_and_meeting(self) -> None:
+        """ユーザー・エージェント・定例MTGで絞り込むこと."""
+        store = LocalVectorStore(dimensions=2)
+        vector = np.array([1.0, 0.0], dtype=np.float32)
+        store.add(
+            [
+                VectorRecord(key="agent", vector=vector, user_id="u1", agent_id="a1"),
+                VectorRecord(key="meeting", vector=vector, user_id="u1", recurring_meeting_id="m1"),
+                VectorRecord(key="other-agent", vector=vector, user_id="u1", agent_id="a2"),
+                VectorRecord(key="other-user", vector=vector, user_id="u2", agent_id="a1"),
+            ]
+        )
+
+        scoped = store.search(vector, 10, "u1", agent_id="a1", recurring_meeting_ids=["m1"])
+        unscoped = store.search(vector, 10, "u1")
+        unknown_user = store.search(vector, 10, "u3")
+
+        assert {h.key for h in scoped} == {"agent", "meeting"}
+        assert {h.key for h in unscoped} == {"agent", "meeting", "other-agent"}
+        assert unknown_user == []
+
+    def test_replace_and_delete(self) -> None:
+        """同じキーの追加は置き換え、削除したキーは返さないこと."""
+        store = LocalVectorStore(dimensions=2)
+        store.add([VectorRecord(key="a", vector=np.array([1.0, 0.0], dtype=np.float32), user_id="u1")])
+        store.add([VectorRecord(key="a", vector=np.array([0.0, 1.0], dtype=np.float32), user_id="u1")])
+
+        hits = store.search(np.array([0.0, 1.0], dtype=np.float32), 5, "u1")
+        assert [(h.key, h.score) for h in hits] == [("a", 1.0)]
+
+        assert store.delete(["a", "missing"]) == 1
+        assert store.search(np.array([0.0, 1.0], dtype=np.float32), 5, "u1") == []
+        assert len(store) == 0
+
+    def test_rejects_wrong_dimensions(self) -> None:
+        """次元数の異なるベクトルはValueErrorになること."""
+        store = LocalVectorStore(dimensions=4)
+
+        with pytest.raises(ValueError, match="shape"):
+            store.add([VectorRecord(key="a", vector=np.zeros(3, dtype=np.float32), user_id="u1")])
+
+    def test_persists_and_grows_memory_mapped_matrix(self, tmp_path: Path) -> None:
+        """容量を超えて追加した行列とログを再読み込みできること."""
+        rng = np.random.default_rng(1)
+        vectors = _normalized(rng, 50, 8)
+        store = LocalVectorStore(dimensions=8, directory=tmp_path, initial_capacity=4)
+        store.add(_records(vectors[:30]))
+        store.add([VectorRecord(key=f"k{i}", vector=vectors[i], user_id="u1", payload={"i": i}) for i in range(30, 50)])
+        store.delete(["k0"])
+
+        reloaded = LocalVectorStore(dimensions=8, directory=tmp_path)
+        hits = reloaded.search(vectors[42], 1, "u1")
+
+        assert len(reloaded) == 49
+        assert hits[0].key == "k42"
+        assert hits[0].payload == {"i": 42}
+        assert reloaded.search(vectors[0], 1, "u1")[0].key != "k0"
+
+    def test_compact_keeps_live_rows(self, tmp_path: Path) -> None:
+        """詰め直し後も有効な行を検索できること."""
+        rng = np.random.default_rng(2)
+        vectors = _normalized(rng, 20, 4)
+        store = LocalVectorStore(dimensions=4, directory=tmp_path)
+        store.add(_records(vectors))
+        store.delete([f"k{i}" for i in range(10)])
+
+        store.compact()
+        reloaded = LocalVectorStore(dimensions=4, directory=tmp_path)
+
+        assert len(reloaded) == 10
+        assert reloaded.search(vectors[15], 1, "u1")[0].key == "k15"
+
+    def test_ivf_recall_on_clustered_data(self) -> None:
+        """IVF検索がクラスタ構造のあるデータで全件検索とほぼ同じ結果を返すこと."""
+        rng = np.random.default_rng(3)
+        centers = _normalized(rng, 16, 32)
+        labels = rng.integers(0, 16, size=4000)
+        vectors = centers[labels] + 0.05 * rng.standard_normal((4000, 32)).astype(np.float32)
+        vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+        exact = LocalVectorStore(dimensions=32)
+        approximate = LocalVectorStore(dimensions=32, ivf_lists=16, nprobe=4)
+        exact.add(_records(vectors))
+        approximate.add(_records(vectors))
+
+        recall = []
+        for query in vectors[:20]:
+            expected = {h.key for h in exact.search(query, 10, "u1")}
+            actual = {h.key for h in approximate.search(query, 10, "u1")}
+            recall.append(len(expected & actual) / 10)
+
+        assert approximate.build_ivf() is True
+        assert float(np.mean(recall)) >= 0.9
+
+    def test_ivf_assigns_incremental_adds(self) -> None:
+        """IVF構築後に追加したベクトルも検索できること."""
+        rng = np.random.default_rng(4)
+        vectors = _normalized(rng, 400, 8)
+        store = LocalVectorStore(dimensions=8, ivf_lists=4, nprobe=1)
+        store.add(_records(vectors))
+        assert store.build_ivf() is True
+
+        new_vector = _normalized(rng, 1, 8)[0]
+        store.add([VectorRecord(key="new", vector=new_vector, user_id="u1")])
+
+        assert store.search(new_vector, 1, "u1")[0].key == "new"
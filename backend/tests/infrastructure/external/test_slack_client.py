@@ -98,6 +98,22 @@ class TestSlackClient:
         call_kwargs = mock_web_client.conversations_history.call_args[1]
         assert "latest" in call_kwargs
 
+    def test_get_latest_message_ts(self, slack_client: SlackClient, mock_web_client: MagicMock) -> None:
+        """最新メッセージ1件だけを取得し、スレッドの最新の返信があればそのtsを返す"""
+        mock_web_client.conversations_history.return_value = {
+            "ok": True,
+            "messages": [{"type": "message", "ts": "1704067200.000100", "latest_reply": "1704070800.000200"}],
+        }
+
+        assert slack_client.get_latest_message_ts("C001") == "1704070800.000200"
+        mock_web_client.conversations_history.assert_called_once_with(channel="C001", limit=1)
+
+    def test_get_latest_message_ts_empty_channel(self, slack_client: SlackClient, mock_web_client: MagicMock) -> None:
+        """メッセージがないチャンネルではNoneを返す"""
+        mock_web_client.conversations_history.return_value = {"ok": True, "messages": []}
+
+        assert slack_client.get_latest_message_ts("C001") is None
+
     def test_verify_token_success(self, slack_client: SlackClient, mock_web_client: MagicMock) -> None:
         """トークン検証が成功する"""
         mock_web_client.auth_test.return_value = {"ok": True}
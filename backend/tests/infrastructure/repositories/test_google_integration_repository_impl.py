@@ -257,6 +257,27 @@ class TestGoogleIntegrationRepositoryImpl:
         mock_supabase_client.table.assert_called_once_with("google_integrations")
         mock_table.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_calendar_sync_token(
+        self,
+        repository: GoogleIntegrationRepositoryImpl,
+        mock_supabase_client: MagicMock,
+        sample_integration: GoogleIntegration,
+    ) -> None:
+        """syncTokenだけを更新できる"""
+        # Arrange
+        mock_table = MagicMock()
+        mock_supabase_client.table.return_value = mock_table
+        mock_table.update.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+
+        # Act
+        await repository.update_calendar_sync_token(sample_integration.id, sample_integration.user_id, "sync_token_1")
+
+        # Assert
+        mock_table.update.assert_called_once_with({"calendar_sync_token": "sync_token_1"})
+        mock_table.execute.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_delete_success(
         self,
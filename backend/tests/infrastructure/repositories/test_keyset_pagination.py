@@ -0,0 +1,37 @@
+"""Tests for keyset pagination helpers."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from src.domain.entities.page_cursor import PageCursor
+from src.infrastructure.repositories.keyset_pagination import order_by_keyset
+
+
+class TestOrderByKeyset:
+    """order_by_keysetのテスト."""
+
+    def test_first_page_only_orders(self) -> None:
+        """カーソルがない場合は (列, id) の降順に並べるだけであること."""
+        query = MagicMock()
+        query.order.return_value = query
+
+        order_by_keyset(query, "meeting_date")
+
+        query.or_.assert_not_called()
+        assert [c.args for c in query.order.call_args_list] == [("meeting_date",), ("id",)]
+        assert all(c.kwargs == {"desc": True} for c in query.order.call_args_list)
+
+    def test_cursor_filters_rows_after_previous_page(self) -> None:
+        """カーソルより後ろの行だけに絞り込むこと."""
+        query = MagicMock()
+        query.or_.return_value = query
+        query.order.return_value = query
+        cursor = PageCursor(datetime(2026, 10, 19, 10, tzinfo=UTC), UUID("33333333-3333-3333-3333-333333333333"))
+
+        order_by_keyset(query, "meeting_date", cursor)
+
+        query.or_.assert_called_once_with(
+            'meeting_date.lt."2026-10-19T10:00:00+00:00",'
+            'and(meeting_date.eq."2026-10-19T10:00:00+00:00",id.lt.33333333-3333-3333-3333-333333333333)'
+        )
@@ -0,0 +1,120 @@
+"""Tests for LocalEmbeddingRepository."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import numpy as np
+
+from src.domain.entities.embedding_chunk import ChunkSourceType, EmbeddingChunk
+from src.infrastructure.external.local_vector_store import LocalVectorStore
+from src.infrastructure.repositories.local_embedding_repository import LocalEmbeddingRepository
+
+
+def _chunk(
+    user_id: UUID,
+    source_id: str,
+    chunk_index: int = 0,
+    agent_id: UUID | None = None,
+    recurring_meeting_id: UUID | None = None,
+    source_type: ChunkSourceType = ChunkSourceType.KNOWLEDGE,
+) -> EmbeddingChunk:
+    return EmbeddingChunk(
+        id=uuid4(),
+        user_id=user_id,
+        source_type=source_type,
+        source_id=source_id,
+        chunk_index=chunk_index,
+        content=f"{source_id}-{chunk_index}",
+        created_at=datetime.now(UTC),
+        agent_id=agent_id,
+        recurring_meeting_id=recurring_meeting_id,
+    )
+
+
+class TestLocalEmbeddingRepository:
+    """LocalEmbeddingRepositoryのテスト."""
+
+    async def test_search_returns_top_k_by_score(self) -> None:
+        """内積の降順で上位k件を返すこと."""
+        repository = LocalEmbeddingRepository(LocalVectorStore(dimensions=2))
+        user_id = uuid4()
+        await repository.upsert_chunks(
+            [_chunk(user_id, "a"), _chunk(user_id, "b"), _chunk(user_id, "c")],
+            np.array([[1.0, 0.0], [0.6, 0.8], [0.0, 1.0]], dtype=np.float32),
+        )
+
+        results = await repository.search(user_id, np.array([1.0, 0.0], dtype=np.float32), top_k=2)
+
+        assert [r.chunk.source_id for r in results] == ["a", "b"]
+        assert results[0].score == 1.0
+
+    async def test_search_filters_by_user_and_scope(self) -> None:
+        """他ユーザーと対象外のエージェント/定例MTGのチャンクを除外すること."""
+        repository = LocalEmbeddingRepository(LocalVectorStore(dimensions=2))
+        user_id = uuid4()
+        agent_id = uuid4()
+        meeting_id = uuid4()
+        await repository.upsert_chunks(
+            [
+                _chunk(user_id, "agent", agent_id=agent_id),
+                _chunk(user_id, "meeting", recurring_meeting_id=meeting_id),
+                _chunk(user_id, "other", agent_id=uuid4()),
+                _chunk(uuid4(), "other-user", agent_id=agent_id),
+            ],
+            np.ones((4, 2), dtype=np.float32),
+        )
+
+        results = await repository.search(
+            user_id,
+            np.array([1.0, 0.0], dtype=np.float32),
+            top_k=10,
+            agent_id=agent_id,
+            recurring_meeting_ids=[meeting_id],
+        )
+
+        assert {r.chunk.source_id for r in results} == {"agent", "meeting"}
+
+    async def test_upsert_overwrites_same_key(self) -> None:
+        """同じキーのチャンクは上書きされること."""
+        repository = LocalEmbeddingRepository(LocalVectorStore(dimensions=2))
+        user_id = uuid4()
+        await repository.upsert_chunks([_chunk(user_id, "a")], np.array([[1.0, 0.0]], dtype=np.float32))
+        await repository.upsert_chunks([_chunk(user_id, "a")], np.array([[0.0, 1.0]], dtype=np.float32))
+
+        results = await repository.search(user_id, np.array([0.0, 1.0], dtype=np.float32), top_k=5)
+
+        assert len(results) == 1
+        assert results[0].score == 1.0
+
+    async def test_delete_and_indexed_source_ids(self) -> None:
+        """元データ単位で削除でき、インデックス済みIDを返すこと."""
+        repository = LocalEmbeddingRepository(LocalVectorStore(dimensions=2))
+        user_id = uuid4()
+        await repository.upsert_chunks(
+            [_chunk(user_id, "a", 0), _chunk(user_id, "a", 1), _chunk(user_id, "b")],
+            np.ones((3, 2), dtype=np.float32),
+        )
+
+        deleted = await repository.delete_by_source(user_id, ChunkSourceType.KNOWLEDGE, "a")
+        indexed = await repository.get_indexed_source_ids(user_id, ChunkSourceType.KNOWLEDGE, ["a", "b", "c"])
+
+        assert deleted == 2
+        assert indexed == {"b"}
+
+    async def test_reload_from_directory(self, tmp_path: Path) -> None:
+        """ディスクに永続化したチャンクを再読み込みして検索・削除できること."""
+        user_id = uuid4()
+        repository = LocalEmbeddingRepository(LocalVectorStore(dimensions=2, directory=tmp_path))
+        await repository.upsert_chunks(
+            [_chunk(user_id, "a"), _chunk(user_id, "b")],
+            np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32),
+        )
+
+        reloaded = LocalEmbeddingRepository(LocalVectorStore(dimensions=2, directory=tmp_path))
+        results = await reloaded.search(user_id, np.array([1.0, 0.0], dtype=np.float32), top_k=1)
+        deleted = await reloaded.delete_by_source(user_id, ChunkSourceType.KNOWLEDGE, "b")
+
+        assert [r.chunk.source_id for r in results] == ["a"]
+        assert results[0].chunk.content == "a-0"
+        assert deleted == 1
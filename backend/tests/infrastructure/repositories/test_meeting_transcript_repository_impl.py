@@ -1,6 +1,7 @@
 """MeetingTranscriptRepositoryImpl tests with mocked Supabase client."""
 
 from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -8,12 +9,15 @@ import pytest
 
 from src.domain.entities.meeting_transcript import (
     MeetingTranscript,
+    MeetingTranscriptSummary,
     TranscriptEntry,
     TranscriptStructuredData,
 )
 from src.infrastructure.repositories.meeting_transcript_repository_impl import (
+    BODY_COLUMNS,
     MeetingTranscriptRepositoryImpl,
 )
+from src.infrastructure.services.transcript_body_codec import TranscriptBodyCodec
 
 
 class TestMeetingTranscriptRepositoryImpl:
@@ -72,7 +76,10 @@ class TestMeetingTranscriptRepositoryImpl:
         insert_data = mock_table.insert.call_args[0][0]
         assert insert_data["google_doc_id"] == "doc_123456"
         assert insert_data["match_confidence"] == 0.85
-        assert insert_data["structured_data"]["entries"][0]["speaker"] == "田中"
+        # 本文はraw_text上のオフセットとして保存される
+        assert insert_data["structured_data"]["speakers"] == ["田中", "鈴木"]
+        assert insert_data["structured_data"]["starts"] == [4, 19]
+        assert "entries" not in insert_data["structured_data"]
 
     @pytest.mark.asyncio
     async def test_create_with_none_structured_data(
@@ -250,6 +257,147 @@ class TestMeetingTranscriptRepositoryImpl:
         assert len(result) == 1
         mock_table.limit.assert_called_once_with(1)
 
+    @pytest.mark.asyncio
+    async def test_get_by_recurring_meeting_needs_confirmation_only(
+        self,
+        repository: MeetingTranscriptRepositoryImpl,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """手動確認が必要なものへの絞り込みはDB側で行う"""
+        # Arrange
+        mock_table = MagicMock()
+        mock_supabase_client.table.return_value = mock_table
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.order.return_value = mock_table
+        mock_table.lt.return_value = mock_table
+        mock_table.execute.return_value = MagicMock(data=[])
+
+        # Act
+        await repository.get_by_recurring_meeting(uuid4(), needs_confirmation_only=True)
+
+        # Assert
+        mock_table.lt.assert_called_once_with("match_confidence", 0.7)
+
+    @pytest.mark.asyncio
+    async def test_get_summaries(
+        self,
+        repository: MeetingTranscriptRepositoryImpl,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """本文を含まない列だけで概要一覧を取得できる"""
+        # Arrange
+        user_id = uuid4()
+        recurring_meeting_id = uuid4()
+        mock_table = MagicMock()
+        mock_supabase_client.table.return_value = mock_table
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.lt.return_value = mock_table
+        mock_table.order.return_value = mock_table
+        mock_table.limit.return_value = mock_table
+        mock_table.execute.return_value = MagicMock(
+            data=[
+                {
+                    "id": str(uuid4()),
+                    "recurring_meeting_id": str(recurring_meeting_id),
+                    "meeting_date": "2024-01-22T10:00:00+00:00",
+                    "google_doc_id": "doc_1",
+                    "match_confidence": 0.5,
+                    "created_at": "2024-01-22T12:00:00+00:00",
+                    "raw_text_size": 1234,
+                    "recurring_meetings": {"title": "定例MTG"},
+                },
+            ]
+        )
+
+        # Act
+        result = await repository.get_summaries(user_id, recurring_meeting_id, needs_confirmation_only=True, limit=10)
+
+        # Assert
+        selected = mock_table.select.call_args[0][0]
+        assert "raw_text," not in selected
+        assert "structured_data" not in selected
+        mock_table.eq.assert_any_call("user_id", str(user_id))
+        mock_table.eq.assert_any_call("recurring_meeting_id", str(recurring_meeting_id))
+        mock_table.lt.assert_called_once_with("match_confidence", 0.7)
+        mock_table.limit.assert_called_once_with(10)
+        assert len(result) == 1
+        assert result[0].raw_text_size == 1234
+        assert result[0].recurring_meeting_title == "定例MTG"
+        assert result[0].needs_manual_confirmation() is True
+
+    @pytest.mark.asyncio
+    async def test_get_needing_confirmation_returns_summaries(
+        self,
+        repository: MeetingTranscriptRepositoryImpl,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """手動確認待ちの一覧は本文を含まない列で概要として取得する"""
+        # Arrange
+        user_id = uuid4()
+        mock_table = MagicMock()
+        mock_supabase_client.table.return_value = mock_table
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.lt.return_value = mock_table
+        mock_table.order.return_value = mock_table
+        mock_table.limit.return_value = mock_table
+        mock_table.execute.return_value = MagicMock(
+            data=[
+                {
+                    "id": str(uuid4()),
+                    "recurring_meeting_id": str(uuid4()),
+                    "meeting_date": "2024-01-22T10:00:00+00:00",
+                    "google_doc_id": "doc_1",
+                    "match_confidence": 0.3,
+                    "created_at": "2024-01-22T12:00:00+00:00",
+                    "raw_text_size": 1234,
+                    "recurring_meetings": {"title": "定例MTG"},
+                },
+            ]
+        )
+
+        # Act
+        result = await repository.get_needing_confirmation(user_id, limit=21)
+
+        # Assert
+        selected = mock_table.select.call_args[0][0]
+        assert "raw_text," not in selected
+        assert "raw_text_compressed" not in selected
+        assert "structured_data" not in selected
+        mock_table.eq.assert_called_once_with("user_id", str(user_id))
+        mock_table.lt.assert_called_once_with("match_confidence", 0.7)
+        mock_table.limit.assert_called_once_with(21)
+        assert len(result) == 1
+        assert isinstance(result[0], MeetingTranscriptSummary)
+        assert result[0].raw_text_size == 1234
+        assert result[0].needs_manual_confirmation() is True
+
+    @pytest.mark.asyncio
+    async def test_exists_by_google_doc_id(
+        self,
+        repository: MeetingTranscriptRepositoryImpl,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """重複チェックはIDのみをuser_idとgoogle_doc_idで取得する"""
+        # Arrange
+        mock_table = MagicMock()
+        mock_supabase_client.table.return_value = mock_table
+        mock_table.select.return_value = mock_table
+        mock_table.eq.return_value = mock_table
+        mock_table.limit.return_value = mock_table
+        mock_table.execute.side_effect = [MagicMock(data=[{"id": str(uuid4())}]), MagicMock(data=[])]
+
+        user_id = uuid4()
+
+        # Act / Assert
+        assert await repository.exists_by_google_doc_id("doc_1", user_id) is True
+        assert await repository.exists_by_google_doc_id("doc_2", user_id) is False
+        mock_table.select.assert_called_with("id")
+        mock_table.eq.assert_any_call("user_id", str(user_id))
+        mock_table.eq.assert_any_call("google_doc_id", "doc_2")
+
     @pytest.mark.asyncio
     async def test_get_by_recurring_meeting_empty(
         self,
@@ -495,6 +643,39 @@ class TestSerializeStructuredData:
         assert len(result["entries"]) == 1
         assert result["entries"][0]["speaker"] == "田中"
 
+    def test_serialize_round_trip_with_offsets(self, repository: MeetingTranscriptRepositoryImpl) -> None:
+        """raw_text上に本文がある場合はオフセット形式で保存し、同じ内容に復元できる"""
+        raw_text = "田中 (10:00)\n発言1\n\n鈴木 (10:01)\n発言2"
+        entries = [
+            TranscriptEntry(speaker="田中", timestamp="10:00", text="発言1"),
+            TranscriptEntry(speaker="鈴木", timestamp="10:01", text="発言2"),
+        ]
+
+        result = repository._serialize_structured_data(TranscriptStructuredData(entries=entries), raw_text)
+        restored = repository._deserialize_structured_data(result, raw_text)
+
+        assert result == {
+            "version": 2,
+            "speakers": ["田中", "鈴木"],
+            "speaker_ids": [0, 1],
+            "minutes": [600, 601],
+            "starts": [11, 27],
+            "ends": [14, 30],
+        }
+        assert restored is not None
+        assert list(restored.entries) == entries
+
+    def test_serialize_falls_back_when_text_not_in_raw_text(self, repository: MeetingTranscriptRepositoryImpl) -> None:
+        """本文がraw_textに含まれない場合は本文を含む形式で保存する"""
+        structured_data = TranscriptStructuredData(
+            entries=[TranscriptEntry(speaker="田中", timestamp="10:00", text="要約された発言")]
+        )
+
+        result = repository._serialize_structured_data(structured_data, "田中 (10:00)\n元の発言")
+
+        assert result is not None
+        assert result["entries"][0]["text"] == "要約された発言"
+
     def test_serialize_with_none(self, repository: MeetingTranscriptRepositoryImpl) -> None:
         """Noneの場合はNoneを返す"""
         # Act
@@ -502,3 +683,118 @@ class TestSerializeStructuredData:
 
         # Assert
         assert result is None
+
+
+class TestTranscriptBody:
+    """本文の圧縮保存と遅延読み込みのテスト"""
+
+    @pytest.fixture
+    def mock_supabase_client(self) -> MagicMock:
+        """モック化されたSupabaseクライアントを返す"""
+        client = MagicMock()
+        client.table.return_value.select.return_value.eq.return_value.maybe_single.return_value = (
+            client.table.return_value
+        )
+        return client
+
+    @pytest.fixture
+    def repository(self, mock_supabase_client: MagicMock) -> MeetingTranscriptRepositoryImpl:
+        """リポジトリインスタンスを返す"""
+        return MeetingTranscriptRepositoryImpl(client=mock_supabase_client, codec=TranscriptBodyCodec())
+
+    def _row(self, transcript_id: str, **columns: Any) -> dict[str, Any]:
+        return {
+            "id": transcript_id,
+            "recurring_meeting_id": str(uuid4()),
+            "meeting_date": "2024-01-15T10:00:00+00:00",
+            "google_doc_id": "doc_123",
+            "structured_data": None,
+            "match_confidence": 0.9,
+            "created_at": "2024-01-15T12:00:00+00:00",
+            **columns,
+        }
+
+    def test_serialize_body_compresses(self, repository: MeetingTranscriptRepositoryImpl) -> None:
+        """本文はzstdで圧縮し、raw_textには保存しない"""
+        result = repository._serialize_body("田中 (10:00)\n発言1")
+
+        assert result["raw_text"] is None
+        assert result["raw_text_codec"] == "zstd"
+        assert result["raw_text_size"] == len("田中 (10:00)\n発言1".encode())
+        assert repository._deserialize_body(uuid4(), result) == "田中 (10:00)\n発言1"
+
+    def test_body_is_loaded_on_first_access(
+        self,
+        repository: MeetingTranscriptRepositoryImpl,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """本文を含まない行から作ったエンティティは、raw_textの参照時に1回だけ本文を取得する"""
+        transcript_id = str(uuid4())
+        raw_text = "田中 (10:00)\n発言1"
+        mock_supabase_client.table.return_value.execute.return_value = MagicMock(
+            data=repository._serialize_body(raw_text)
+        )
+        row = self._row(
+            transcript_id,
+            structured_data={
+                "version": 2,
+                "speakers": ["田中"],
+                "speaker_ids": [0],
+                "minutes": [600],
+                "starts": [11],
+                "ends": [14],
+            },
+        )
+
+        transcript = repository._to_entity(row)
+
+        assert not transcript.is_raw_text_loaded()
+        mock_supabase_client.table.return_value.select.assert_not_called()
+        assert transcript.structured_data is not None
+        assert transcript.structured_data.entries[0].text == "発言1"
+        assert transcript.raw_text == raw_text
+        mock_supabase_client.table.return_value.select.assert_called_once_with(BODY_COLUMNS)
+
+        # 展開済みの本文はキャッシュから返す
+        assert repository._to_entity(row).raw_text == raw_text
+        mock_supabase_client.table.return_value.select.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_deferred_transcript_does_not_load_body(
+        self,
+        repository: MeetingTranscriptRepositoryImpl,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """本文が未読み込みのエンティティを更新しても本文を読み込まず、本文と構造化データを書き換えない"""
+        transcript = repository._to_entity(
+            self._row(
+                str(uuid4()),
+                structured_data={
+                    "version": 2,
+                    "speakers": ["田中"],
+                    "speaker_ids": [0],
+                    "minutes": [600],
+                    "starts": [11],
+                    "ends": [14],
+                },
+            )
+        )
+        loader = MagicMock(return_value="田中 (10:00)\n発言1")
+        transcript.defer_raw_text(loader)
+        transcript.match_confidence = 1.0
+
+        await repository.update(transcript)
+
+        loader.assert_not_called()
+        assert not transcript.is_raw_text_loaded()
+        data = mock_supabase_client.table.return_value.update.call_args.args[0]
+        assert data["match_confidence"] == 1.0
+        assert "raw_text_compressed" not in data
+        assert "structured_data" not in data
+
+    def test_uncompressed_row_is_loaded_eagerly(self, repository: MeetingTranscriptRepositoryImpl) -> None:
+        """圧縮前の行はraw_textをそのまま使う"""
+        transcript = repository._to_entity(self._row(str(uuid4()), raw_text="テキスト", raw_text_compressed=None))
+
+        assert transcript.is_raw_text_loaded()
+        assert transcript.raw_text == "テキスト"
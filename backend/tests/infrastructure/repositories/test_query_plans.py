@@ -0,0 +1,233 @@
+"""Query plan regression tests for repository queries.
+
+各 *RepositoryImpl が発行するクエリと同じ形のSQLを EXPLAIN し、
+対象テーブルがシーケンシャルスキャンにならないことを検証する。
+
+ローカルのSupabase（`supabase start`、マイグレーション適用済み）に
+SUPABASE_DATABASE_URL で接続できる場合のみ実行する。
+投入したデータはトランザクションごとロールバックする。
+"""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import urlparse
+
+import pytest
+
+from src.config import settings
+
+psycopg = pytest.importorskip("psycopg")
+sql = pytest.importorskip("psycopg.sql")
+
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+pytestmark = pytest.mark.skipif(
+    not settings.SUPABASE_DATABASE_URL or urlparse(settings.SUPABASE_DATABASE_URL).hostname not in LOCAL_HOSTS,
+    reason="requires a local Supabase database (SUPABASE_DATABASE_URL)",
+)
+
+# 200ユーザー分。インデックスが効かないとシーケンシャルスキャンを選ぶ程度の行数にする
+SEED_SQL = """
+SET LOCAL session_replication_role = replica;
+
+INSERT INTO public.agents (id, user_id, name, created_at)
+SELECT md5('agent' || a)::uuid, md5('user' || (a % 200))::uuid, 'agent ' || a,
+       now() - a * interval '1 minute'
+FROM generate_series(0, 3999) AS a;
+
+INSERT INTO public.recurring_meetings (
+    id, user_id, google_event_id, title, rrule, frequency, next_occurrence, agent_id
+)
+SELECT md5('meeting' || m)::uuid, md5('user' || (m % 200))::uuid, 'event-' || m, 'meeting ' || m,
+       'RRULE:FREQ=WEEKLY', 'weekly', now() + (m % 97) * interval '1 day',
+       CASE WHEN m % 2 = 0 THEN md5('agent' || (m % 4000))::uuid END
+FROM generate_series(0, 4999) AS m;
+
+-- replicaではトリガーが動かないため、user_id は親と同じ値を直接入れる
+INSERT INTO public.meeting_transcripts (
+    recurring_meeting_id, user_id, meeting_date, google_doc_id, raw_text, match_confidence
+)
+SELECT md5('meeting' || (t % 5000))::uuid, md5('user' || (t % 5000 % 200))::uuid,
+       now() - t * interval '1 hour', 'doc-' || t, 'body',
+       CASE WHEN t % 20 = 0 THEN 0.5 ELSE 0.9 END
+FROM generate_series(0, 49999) AS t;
+
+INSERT INTO public.knowledge (agent_id, user_id, original_text, normalized_text, meeting_date)
+SELECT md5('agent' || (k % 4000))::uuid, md5('user' || (k % 200))::uuid, 'text', 'text',
+       now() - k * interval '1 hour'
+FROM generate_series(0, 39999) AS k;
+
+INSERT INTO public.agendas (agent_id, user_id, content, generated_at)
+SELECT md5('agent' || (g % 4000))::uuid, md5('user' || (g % 200))::uuid, 'agenda',
+       now() - g * interval '1 hour'
+FROM generate_series(0, 39999) AS g;
+
+INSERT INTO public.dictionary_entries (user_id, agent_id, canonical_name, created_at)
+SELECT md5('user' || (d % 200))::uuid, CASE WHEN d % 2 = 0 THEN md5('agent' || (d % 4000))::uuid END,
+       'term-' || d, now() - d * interval '1 minute'
+FROM generate_series(0, 19999) AS d;
+
+INSERT INTO public.slack_messages (integration_id, channel_id, message_ts, user_name, text, posted_at)
+SELECT md5('integration' || (s % 200))::uuid, 'C' || (s % 10), s::text, 'user', 'message',
+       now() - s * interval '1 minute'
+FROM generate_series(0, 39999) AS s;
+
+INSERT INTO public.search_entries (
+    user_id, source_type, source_id, entry_index, content, source_date, search_vector
+)
+SELECT md5('user' || (e % 200))::uuid, 'transcript', md5('transcript' || (e / 50))::uuid, e % 50,
+       'entry ' || e, now() - e * interval '1 minute',
+       ('''w' || (e % 1000) || ''':1 ''common'':2')::tsvector
+FROM generate_series(0, 99999) AS e;
+
+ANALYZE public.search_entries, public.agents, public.recurring_meetings, public.meeting_transcripts, public.knowledge,
+    public.agendas, public.dictionary_entries, public.slack_messages;
+"""
+
+HOT_QUERIES: list[tuple[str, str, set[str]]] = [
+    (
+        "transcripts_by_recurring_meeting",
+        """SELECT id FROM public.meeting_transcripts WHERE recurring_meeting_id = md5('meeting1')::uuid
+            ORDER BY meeting_date DESC, id DESC LIMIT 21""",
+        {"meeting_transcripts"},
+    ),
+    (
+        "transcripts_by_recurring_meeting_after_cursor",
+        """SELECT id FROM public.meeting_transcripts WHERE recurring_meeting_id = md5('meeting1')::uuid
+            AND (meeting_date < now() - interval '30 days'
+                 OR (meeting_date = now() - interval '30 days' AND id < md5('x')::uuid))
+            ORDER BY meeting_date DESC, id DESC LIMIT 21""",
+        {"meeting_transcripts"},
+    ),
+    (
+        "transcripts_by_date_range",
+        """SELECT id FROM public.meeting_transcripts WHERE recurring_meeting_id = md5('meeting1')::uuid
+            AND meeting_date >= now() - interval '90 days' AND meeting_date <= now()
+            ORDER BY meeting_date""",
+        {"meeting_transcripts"},
+    ),
+    (
+        "transcripts_by_google_doc_id",
+        """SELECT id FROM public.meeting_transcripts
+            WHERE user_id = md5('user1')::uuid AND google_doc_id = 'doc-1' LIMIT 1""",
+        {"meeting_transcripts"},
+    ),
+    (
+        "transcripts_needing_confirmation",
+        """SELECT id FROM public.meeting_transcripts
+            WHERE user_id = md5('user1')::uuid AND match_confidence < 0.7
+            ORDER BY meeting_date DESC, id DESC LIMIT 21""",
+        {"meeting_transcripts"},
+    ),
+    (
+        "transcript_summaries_by_user",
+        """SELECT t.id, rm.title FROM public.meeting_transcripts t
+            LEFT JOIN public.recurring_meetings rm ON rm.id = t.recurring_meeting_id
+            WHERE t.user_id = md5('user1')::uuid
+            ORDER BY t.meeting_date DESC, t.id DESC LIMIT 21""",
+        {"meeting_transcripts", "recurring_meetings"},
+    ),
+    (
+        "knowledge_by_agent",
+        """SELECT id FROM public.knowledge
+            WHERE agent_id = md5('agent1')::uuid AND user_id = md5('user1')::uuid
+            ORDER BY meeting_date DESC, id DESC LIMIT 21""",
+        {"knowledge"},
+    ),
+    (
+        "agendas_by_agent",
+        """SELECT id FROM public.agendas
+            WHERE agent_id = md5('agent1')::uuid AND user_id = md5('user1')::uuid
+            ORDER BY generated_at DESC, id DESC LIMIT 21""",
+        {"agendas"},
+    ),
+    (
+        "dictionary_by_user",
+        """SELECT id FROM public.dictionary_entries WHERE user_id = md5('user1')::uuid
+            ORDER BY created_at DESC, id DESC LIMIT 21""",
+        {"dictionary_entries"},
+    ),
+    (
+        "dictionary_by_agent",
+        """SELECT id FROM public.dictionary_entries
+            WHERE agent_id = md5('agent1')::uuid AND user_id = md5('user1')::uuid
+            ORDER BY created_at DESC""",
+        {"dictionary_entries"},
+    ),
+    (
+        "recurring_meetings_by_user",
+        "SELECT id FROM public.recurring_meetings WHERE user_id = md5('user1')::uuid ORDER BY next_occurrence",
+        {"recurring_meetings"},
+    ),
+    (
+        "recurring_meetings_by_agent",
+        """SELECT id FROM public.recurring_meetings
+            WHERE agent_id = md5('agent1')::uuid AND user_id = md5('user1')::uuid
+            ORDER BY next_occurrence""",
+        {"recurring_meetings"},
+    ),
+    (
+        "recurring_meetings_unlinked",
+        """SELECT id FROM public.recurring_meetings WHERE user_id = md5('user1')::uuid AND agent_id IS NULL
+            ORDER BY next_occurrence""",
+        {"recurring_meetings"},
+    ),
+    (
+        "agents_by_user",
+        "SELECT id FROM public.agents WHERE user_id = md5('user1')::uuid ORDER BY created_at DESC",
+        {"agents"},
+    ),
+    (
+        "slack_messages_by_channel",
+        """SELECT id FROM public.slack_messages
+            WHERE integration_id = md5('integration1')::uuid AND channel_id = 'C1'
+            AND posted_at >= now() - interval '7 days' ORDER BY posted_at""",
+        {"slack_messages"},
+    ),
+    (
+        "search_entries_by_query",
+        """SELECT id FROM public.search_entries
+            WHERE user_id = md5('user1')::uuid AND search_vector @@ '''w1'''::tsquery
+            ORDER BY ts_rank_cd(search_vector, '''w1'''::tsquery) DESC LIMIT 20""",
+        {"search_entries"},
+    ),
+]
+
+
+def _plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+@pytest.fixture(scope="module")
+def seeded_cursor() -> Iterator[Any]:
+    """データを投入した接続のカーソル（終了時にロールバック）."""
+    with psycopg.connect(settings.SUPABASE_DATABASE_URL) as conn:
+        try:
+            with conn.cursor() as cur:
+                cur.execute(SEED_SQL)
+                yield cur
+        finally:
+            conn.rollback()
+
+
+@pytest.mark.parametrize(
+    ("name", "query", "relations"),
+    HOT_QUERIES,
+    ids=[name for name, _, _ in HOT_QUERIES],
+)
+def test_hot_query_does_not_seq_scan(seeded_cursor: Any, name: str, query: str, relations: set[str]) -> None:
+    """リポジトリのクエリが対象テーブルをシーケンシャルスキャンしないこと."""
+    seeded_cursor.execute(sql.SQL("EXPLAIN (FORMAT JSON) {}").format(sql.SQL(query)))
+    (raw,) = seeded_cursor.fetchone()
+    plan = raw if isinstance(raw, list) else json.loads(raw)
+
+    seq_scans: set[str] = {
+        node["Relation Name"]
+        for node in _plan_nodes(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in relations
+    }
+
+    assert not seq_scans, f"{name}: Seq Scan on {sorted(seq_scans)}\n{json.dumps(plan, indent=2)}"
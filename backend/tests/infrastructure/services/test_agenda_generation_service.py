@@ -4,17 +4,20 @@ Tests for agenda generation prompt building and service behavior.
 """
 
 from datetime import datetime
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
 from src.domain.entities.dictionary_entry import DictionaryEntry
+from src.domain.entities.embedding_chunk import ChunkSourceType, EmbeddingChunk, RetrievedChunk
 from src.domain.entities.knowledge import Knowledge
 from src.domain.entities.meeting_transcript import MeetingTranscript, TranscriptStructuredData
 from src.infrastructure.external.slack_client import SlackMessageData
 from src.infrastructure.services.agenda_generation_service import (
     AgendaGenerationInput,
     AgendaGenerationService,
+    AgendaUpdateInput,
 )
 
 
@@ -301,6 +304,54 @@ class TestAgendaGenerationServicePromptBuilding:
         # Assert
         assert "過去のMTGトランスクリプト" not in prompt
 
+    def test_build_prompt_with_retrieved_chunks(self) -> None:
+        """関連チャンクがある場合は最新トランスクリプトのみ全文を含め、関連セクションを追加する"""
+        # Arrange
+        service = AgendaGenerationService()
+
+        transcripts = [
+            MeetingTranscript(
+                id=uuid4(),
+                recurring_meeting_id=uuid4(),
+                meeting_date=datetime(2025, 1, day, 10, 0, 0),
+                google_doc_id=f"doc_{day}",
+                raw_text=f"DAY{day}の議事内容",
+                structured_data=None,
+                match_confidence=0.9,
+                created_at=datetime.now(),
+                recurring_meeting_title="Weekly",
+            )
+            for day in (20, 13)
+        ]
+        chunk = EmbeddingChunk(
+            id=uuid4(),
+            user_id=uuid4(),
+            source_type=ChunkSourceType.TRANSCRIPT,
+            source_id=str(transcripts[1].id),
+            chunk_index=0,
+            content="田中 (00:05): 予算の件は次回までに確認します",
+            created_at=datetime.now(),
+            source_date=datetime(2025, 1, 6, 10, 0, 0),
+        )
+
+        input_data = AgendaGenerationInput(
+            latest_knowledge=None,
+            slack_messages=[],
+            dictionary=[],
+            transcripts=transcripts,
+            retrieved_chunks=[RetrievedChunk(chunk=chunk, score=0.82)],
+        )
+
+        # Act
+        prompt = service._build_prompt(input_data)
+
+        # Assert
+        assert "DAY20の議事内容" in prompt
+        assert "DAY13の議事内容" not in prompt
+        assert "未決事項に関連する過去の議論" in prompt
+        assert "2025/01/06" in prompt
+        assert "予算の件は次回までに確認します" in prompt
+
 
 class TestAgendaGenerationServiceGenerate:
     """Test AgendaGenerationService.generate method."""
@@ -316,3 +367,53 @@ class TestAgendaGenerationServiceGenerate:
         """LLM呼び出し失敗時に例外が発生する"""
         # This test requires mocking invoke_claude
         pass
+
+
+class TestAgendaGenerationServiceUpdate:
+    """Test AgendaGenerationService.generate_update method."""
+
+    PREVIOUS = "## Part 2: アジェンダ\n\n### 予算確認（10分）\n前回の内容\n\n### 採用計画（20分）\n変わらない内容\n"
+
+    def _update_input(self) -> AgendaUpdateInput:
+        return AgendaUpdateInput(
+            previous_content=self.PREVIOUS,
+            previous_generated_at=datetime(2025, 1, 6, 9, 0),
+            slack_messages=[
+                SlackMessageData(
+                    ts="1736150400.000100",
+                    user_name="田中太郎",
+                    text="予算は承認されました",
+                    posted_at=datetime(2025, 1, 6, 10, 0),
+                )
+            ],
+            transcripts=[],
+        )
+
+    async def test_sends_previous_agenda_and_delta_only(self) -> None:
+        """前回のアジェンダと差分だけを少ない出力トークン数で送り、返されたパッチを適用する"""
+        service = AgendaGenerationService()
+        patch_text = "### 予算確認（10分）\n予算は承認済みのため報告のみ"
+
+        with patch(
+            "src.infrastructure.services.agenda_generation_service.invoke_claude", return_value=patch_text
+        ) as invoke:
+            content = await service.generate_update(self._update_input())
+
+        prompt = invoke.call_args[0][0]
+        assert self.PREVIOUS in prompt
+        assert "予算は承認されました" in prompt
+        assert "過去のナレッジ" not in prompt
+        assert invoke.call_args[1]["max_tokens"] == AgendaGenerationService.UPDATE_MAX_TOKENS
+        assert "予算は承認済みのため報告のみ" in content
+        assert "前回の内容" not in content
+        assert "変わらない内容" in content
+
+    async def test_invalid_patch_raises_value_error(self) -> None:
+        """見出しブロックのない出力はValueErrorにする"""
+        service = AgendaGenerationService()
+
+        with (
+            patch("src.infrastructure.services.agenda_generation_service.invoke_claude", return_value="了解しました"),
+            pytest.raises(ValueError),
+        ):
+            await service.generate_update(self._update_input())
@@ -0,0 +1,118 @@
+"""Unit tests for AgendaJobWorkerPool."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStatus
+from src.domain.repositories.agenda_job_repository import AgendaJobRepository
+from src.infrastructure.services.agenda_generation_service import AgendaGenerationInput, AgendaGenerationService
+from src.infrastructure.services.agenda_job_worker import AgendaJobWorkerPool
+
+
+def _create_job() -> AgendaJob:
+    now = datetime.now(UTC)
+    return AgendaJob(
+        id=uuid4(),
+        user_id=uuid4(),
+        agent_id=uuid4(),
+        status=AgendaJobStatus.RUNNING,
+        attempts=1,
+        max_attempts=3,
+        run_after=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _queue_repository(jobs: list[AgendaJob]) -> AsyncMock:
+    """claim_nextで先頭から1件ずつ返すリポジトリ."""
+    repository = AsyncMock(spec=AgendaJobRepository)
+    queue = list(jobs)
+
+    async def claim_next(worker_id: str, stale_after: timedelta) -> AgendaJob | None:
+        return queue.pop(0) if queue else None
+
+    repository.claim_next.side_effect = claim_next
+    return repository
+
+
+class TestAgendaJobWorkerPool:
+    """AgendaJobWorkerPoolのテスト."""
+
+    async def test_run_once_without_job(self) -> None:
+        """実行できるジョブがない場合はFalseを返すこと."""
+        run_job = AsyncMock()
+        pool = AgendaJobWorkerPool(_queue_repository([]), run_job, 1, 0, timedelta(minutes=5))
+
+        assert await pool.run_once("worker") is False
+        run_job.assert_not_awaited()
+
+    async def test_crashing_job_does_not_stop_worker(self) -> None:
+        """ジョブの実行で例外が起きても次のジョブを実行すること."""
+        jobs = [_create_job(), _create_job()]
+        run_job = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        pool = AgendaJobWorkerPool(_queue_repository(jobs), run_job, 1, 0, timedelta(minutes=5))
+
+        assert await pool.run_once("worker") is True
+        assert await pool.run_once("worker") is True
+
+        assert [call.args for call in run_job.await_args_list] == [(job, "worker") for job in jobs]
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """同時に実行するジョブの数がconcurrencyを超えないこと."""
+        jobs = [_create_job() for _ in range(6)]
+        running = 0
+        peak = 0
+        finished: list[AgendaJob] = []
+
+        async def run_job(job: AgendaJob, worker_id: str) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            finished.append(job)
+
+        pool = AgendaJobWorkerPool(_queue_repository(jobs), run_job, 2, 0.001, timedelta(minutes=5))
+        pool.start()
+        assert pool.is_running
+        for _ in range(100):
+            if len(finished) == len(jobs):
+                break
+            await asyncio.sleep(0.01)
+        await pool.stop()
+
+        assert sorted(job.id for job in finished) == sorted(job.id for job in jobs)
+        assert peak == 2
+        assert not pool.is_running
+
+    async def test_blocking_llm_calls_overlap(self) -> None:
+        """同期APIのLLM呼び出しがイベントループを止めず、2件のジョブが並行して実行されること."""
+        jobs = [_create_job(), _create_job()]
+        # 2件の呼び出しが同時に待たない限り通過できない（直列に実行されるとタイムアウトする）
+        barrier = threading.Barrier(2, timeout=5)
+
+        def invoke_claude(prompt: str, max_tokens: int) -> str:
+            barrier.wait()
+            return "# アジェンダ"
+
+        service = AgendaGenerationService()
+        finished: list[AgendaJob] = []
+
+        async def run_job(job: AgendaJob, worker_id: str) -> None:
+            await service.generate(AgendaGenerationInput(latest_knowledge=None, slack_messages=[], dictionary=[]))
+            finished.append(job)
+
+        pool = AgendaJobWorkerPool(_queue_repository(jobs), run_job, 2, 0.001, timedelta(minutes=5))
+        with patch("src.infrastructure.services.agenda_generation_service.invoke_claude", side_effect=invoke_claude):
+            pool.start()
+            for _ in range(500):
+                if len(finished) == len(jobs):
+                    break
+                await asyncio.sleep(0.01)
+            await pool.stop()
+
+        assert sorted(job.id for job in finished) == sorted(job.id for job in jobs)
@@ -0,0 +1,158 @@
+"""Unit tests for EmbeddingIndexService."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+from src.domain.entities.embedding_chunk import ChunkSourceType
+from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.meeting_transcript import (
+    MeetingTranscript,
+    TranscriptEntry,
+    TranscriptStructuredData,
+)
+from src.infrastructure.external.local_vector_store import LocalVectorStore
+from src.infrastructure.external.slack_client import SlackMessageData
+from src.infrastructure.repositories.local_embedding_repository import LocalEmbeddingRepository
+from src.infrastructure.services.embedding_index_service import EmbeddingIndexService
+from src.infrastructure.services.embedding_service import EmbeddingService
+
+INVOKE_EMBEDDINGS = "src.infrastructure.services.embedding_service.invoke_embeddings_async"
+
+
+async def _fake_embedding(text: str, dimensions: int, client: object) -> list[float]:
+    """キーワードの有無で決まる2次元ベクトルを返す."""
+    return [1.0, 0.0] if "予算" in text else [0.0, 1.0]
+
+
+def _service(repository: LocalEmbeddingRepository | None = None) -> EmbeddingIndexService:
+    repository = repository or LocalEmbeddingRepository(LocalVectorStore(dimensions=2))
+    return EmbeddingIndexService(repository, EmbeddingService(None, dimensions=2))
+
+
+def _knowledge(text: str) -> Knowledge:
+    now = datetime.now(UTC)
+    return Knowledge(
+        id=uuid4(),
+        agent_id=uuid4(),
+        user_id=uuid4(),
+        original_text=text,
+        normalized_text=text,
+        meeting_date=now,
+        created_at=now,
+    )
+
+
+class TestEmbeddingIndexService:
+    """EmbeddingIndexServiceのテスト."""
+
+    async def test_index_knowledge_and_retrieve(self) -> None:
+        """ナレッジを登録し、クエリに類似するチャンクを取得できること."""
+        service = _service()
+        knowledge = _knowledge("予算の件は要確認。" + "雑談です。" * 200)
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding):
+            count = await service.index_knowledge(knowledge)
+            results = await service.retrieve(
+                knowledge.user_id, ["予算はどうなった？"], top_k=1, agent_id=knowledge.agent_id
+            )
+
+        assert count >= 2
+        assert len(results) == 1
+        assert "予算の件は要確認" in results[0].chunk.content
+        assert results[0].chunk.source_type == ChunkSourceType.KNOWLEDGE
+
+    async def test_reindex_replaces_existing_chunks(self) -> None:
+        """再登録時は既存チャンクを置き換えること."""
+        repository = LocalEmbeddingRepository(LocalVectorStore(dimensions=2))
+        service = _service(repository)
+        knowledge = _knowledge("予算の件。" * 300)
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding):
+            await service.index_knowledge(knowledge)
+            knowledge.normalized_text = "予算の件。"
+            await service.index_knowledge(knowledge)
+            results = await service.retrieve(knowledge.user_id, ["予算"], top_k=10)
+
+        assert len(results) == 1
+
+    async def test_embedding_failure_keeps_existing_chunks(self) -> None:
+        """埋め込みに失敗した場合は既存チャンクを残すこと."""
+        service = _service()
+        knowledge = _knowledge("予算の件。")
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding):
+            await service.index_knowledge(knowledge)
+        with patch(INVOKE_EMBEDDINGS, return_value=None):
+            count = await service.index_knowledge(knowledge)
+            results = await service.retrieve(knowledge.user_id, ["予算"], top_k=10)
+
+        assert count == 0
+        assert results == []
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding):
+            results = await service.retrieve(knowledge.user_id, ["予算"], top_k=10)
+        assert len(results) == 1
+
+    async def test_index_transcript_uses_structured_entries(self) -> None:
+        """構造化データの発話単位でチャンク化し、話者とタイムスタンプを保持すること."""
+        service = _service()
+        user_id = uuid4()
+        agent_id = uuid4()
+        transcript = MeetingTranscript(
+            id=uuid4(),
+            recurring_meeting_id=uuid4(),
+            meeting_date=datetime(2025, 1, 15, 10, 0, tzinfo=UTC),
+            google_doc_id="doc_1",
+            raw_text="raw",
+            structured_data=TranscriptStructuredData(
+                entries=[TranscriptEntry(speaker="田中", timestamp="00:05", text="予算は次回確認します")]
+            ),
+            match_confidence=0.9,
+            created_at=datetime.now(UTC),
+        )
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding):
+            await service.index_transcript(transcript, user_id, agent_id)
+            results = await service.retrieve(
+                user_id, ["予算"], top_k=1, recurring_meeting_ids=[transcript.recurring_meeting_id]
+            )
+
+        chunk = results[0].chunk
+        assert chunk.content == "田中 (00:05): 予算は次回確認します"
+        assert chunk.speaker == "田中"
+        assert chunk.timestamp == "00:05"
+        assert chunk.agent_id == agent_id
+
+    async def test_index_slack_messages_skips_short_and_indexed(self) -> None:
+        """短いメッセージとインデックス済みメッセージをスキップすること."""
+        service = _service()
+        user_id = uuid4()
+        agent_id = uuid4()
+        messages = [
+            SlackMessageData(ts="1.0", user_name="田中", text="了解です", posted_at=datetime.now(UTC)),
+            SlackMessageData(
+                ts="2.0", user_name="佐藤", text="予算の見積もりを共有しました", posted_at=datetime.now(UTC)
+            ),
+        ]
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding) as mock_embed:
+            first = await service.index_slack_messages(messages, user_id, agent_id, "C123")
+            second = await service.index_slack_messages(messages, user_id, agent_id, "C123")
+
+        assert first == 1
+        assert second == 0
+        assert mock_embed.call_count == 1
+
+    async def test_retrieve_excludes_sources(self) -> None:
+        """除外指定した元データのチャンクを返さないこと."""
+        service = _service()
+        knowledge = _knowledge("予算の件。")
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding):
+            await service.index_knowledge(knowledge)
+            results = await service.retrieve(
+                knowledge.user_id, ["予算"], top_k=5, exclude_source_ids={str(knowledge.id)}
+            )
+
+        assert results == []
@@ -0,0 +1,145 @@
+"""Unit tests for EmbeddingService."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from src.infrastructure.external.bedrock_client import BedrockThrottledError
+from src.infrastructure.repositories.sqlite_embedding_cache_repository import (
+    SqliteEmbeddingCacheRepository,
+)
+from src.infrastructure.services.embedding_service import (
+    AdaptiveConcurrencyLimiter,
+    EmbeddingService,
+    normalize_for_embedding,
+)
+
+INVOKE_EMBEDDINGS = "src.infrastructure.services.embedding_service.invoke_embeddings_async"
+
+
+async def _fake_embedding(text: str, dimensions: int, client: object) -> list[float]:
+    """テキスト長から決まるベクトルを返す."""
+    return [float(len(text)), 1.0]
+
+
+class TestNormalizeForEmbedding:
+    """normalize_for_embeddingのテスト."""
+
+    def test_nfkc_and_whitespace(self) -> None:
+        """全角英数字と連続空白を正規化すること."""
+        assert normalize_for_embedding("  ＡＢＣ\n\n１２３　テスト ") == "ABC 123 テスト"
+
+
+class TestEmbeddingService:
+    """EmbeddingServiceのテスト."""
+
+    async def test_embed_returns_float32_matrix(self) -> None:
+        """入力順のfloat32行列を返すこと."""
+        service = EmbeddingService(None, dimensions=2)
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding):
+            matrix = await service.embed(["abc", "de"])
+
+        assert matrix is not None
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (2, 2)
+        assert matrix[:, 0].tolist() == [3.0, 2.0]
+
+    async def test_embed_deduplicates_normalized_text(self) -> None:
+        """正規化後に同じテキストは1回だけ計算すること."""
+        service = EmbeddingService(None, dimensions=2)
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding) as mock_invoke:
+            matrix = await service.embed(["予算 確認", "予算　確認", " 予算\n確認 "])
+
+        assert matrix is not None
+        assert mock_invoke.call_count == 1
+        assert np.array_equal(matrix[0], matrix[2])
+
+    async def test_embed_serves_repeats_from_persistent_cache(self, tmp_path: Path) -> None:
+        """キャッシュ済みのテキストはモデルを呼び出さないこと."""
+        cache_path = tmp_path / "cache" / "embeddings.sqlite3"
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding) as mock_invoke:
+            first = await EmbeddingService(SqliteEmbeddingCacheRepository(cache_path), dimensions=2).embed(["abc"])
+            second = await EmbeddingService(SqliteEmbeddingCacheRepository(cache_path), dimensions=2).embed(["abc"])
+
+        assert mock_invoke.call_count == 1
+        assert first is not None
+        assert second is not None
+        assert np.array_equal(first, second)
+
+    async def test_embed_failure_returns_none_and_caches_successes(self, tmp_path: Path) -> None:
+        """1件でも失敗した場合はNoneを返し、成功分はキャッシュすること."""
+        cache = SqliteEmbeddingCacheRepository(tmp_path / "embeddings.sqlite3")
+        service = EmbeddingService(cache, dimensions=2)
+
+        async def fail_on_b(text: str, dimensions: int, client: object) -> list[float] | None:
+            return None if text == "b" else [1.0, 0.0]
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=fail_on_b):
+            result = await service.embed(["a", "b"])
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding) as mock_invoke:
+            retried = await service.embed(["a", "b"])
+
+        assert result is None
+        assert retried is not None
+        assert mock_invoke.call_count == 1
+
+    async def test_embed_retries_when_throttled(self) -> None:
+        """スロットリングされた場合は同時実行数を下げて再試行すること."""
+        service = EmbeddingService(None, dimensions=2)
+        initial_limit = service.limiter.limit
+        mock_invoke = AsyncMock(side_effect=[BedrockThrottledError("429"), [1.0, 0.0]])
+
+        with (
+            patch(INVOKE_EMBEDDINGS, mock_invoke),
+            patch("src.infrastructure.services.embedding_service.INITIAL_BACKOFF_SECONDS", 0.0),
+        ):
+            matrix = await service.embed(["abc"])
+
+        assert matrix is not None
+        assert mock_invoke.call_count == 2
+        assert service.limiter.limit < initial_limit
+
+    async def test_blank_text_is_zero_vector_without_call(self) -> None:
+        """空白のみのテキストはモデルを呼び出さずゼロベクトルとすること."""
+        service = EmbeddingService(None, dimensions=2)
+
+        with patch(INVOKE_EMBEDDINGS, side_effect=_fake_embedding) as mock_invoke:
+            matrix = await service.embed(["  "])
+
+        assert matrix is not None
+        assert matrix.tolist() == [[0.0, 0.0]]
+        mock_invoke.assert_not_called()
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AdaptiveConcurrencyLimiterのテスト."""
+
+    async def test_additive_increase_multiplicative_decrease(self) -> None:
+        """成功で緩やかに増加し、スロットリングで半減すること."""
+        limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=8)
+
+        # 1回の成功で1/limitずつ増えるため、4回ではまだ+1に届かない
+        for _ in range(4):
+            await limiter.on_success()
+        assert limiter.limit == 4
+        for _ in range(8):
+            await limiter.on_success()
+        assert limiter.limit == 6
+
+        await limiter.on_throttle()
+        assert limiter.limit == 3
+
+    @pytest.mark.parametrize("throttles", [1, 5, 10])
+    async def test_limit_never_below_minimum(self, throttles: int) -> None:
+        """上限は下限を下回らないこと."""
+        limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=8)
+
+        for _ in range(throttles):
+            await limiter.on_throttle()
+
+        assert limiter.limit >= 1
@@ -0,0 +1,121 @@
+"""Unit tests for SearchIndexService and SearchUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.use_cases.search_use_cases import SearchUseCase
+from src.domain.entities.knowledge import Knowledge
+from src.domain.entities.meeting_transcript import (
+    MeetingTranscript,
+    TranscriptEntry,
+    TranscriptStructuredData,
+)
+from src.domain.entities.search_entry import SearchEntry, SearchHit, SearchSourceType
+from src.infrastructure.services.search_index_service import SearchIndexService
+
+
+def _transcript(structured_data: TranscriptStructuredData | None, raw_text: str = "") -> MeetingTranscript:
+    now = datetime.now(UTC)
+    return MeetingTranscript(
+        id=uuid4(),
+        recurring_meeting_id=uuid4(),
+        meeting_date=now,
+        google_doc_id="doc",
+        raw_text=raw_text,
+        structured_data=structured_data,
+        match_confidence=0.9,
+        created_at=now,
+    )
+
+
+class TestSearchIndexService:
+    """SearchIndexServiceのテスト."""
+
+    async def test_index_transcript_registers_each_utterance(self) -> None:
+        """構造化データは発話ごとに話者・タイムスタンプ付きで登録すること."""
+        repository = AsyncMock()
+        service = SearchIndexService(repository)
+        user_id = uuid4()
+        agent_id = uuid4()
+        transcript = _transcript(
+            TranscriptStructuredData(
+                entries=[
+                    TranscriptEntry(speaker="田中", timestamp="10:00", text="予算の確認です"),
+                    TranscriptEntry(speaker="佐藤", timestamp="10:01", text=" "),
+                    TranscriptEntry(speaker="佐藤", timestamp="10:02", text="承知しました"),
+                ]
+            )
+        )
+
+        count = await service.index_transcript(transcript, user_id, agent_id)
+
+        assert count == 2
+        args = repository.replace_source.await_args.args
+        assert args[:3] == (user_id, SearchSourceType.TRANSCRIPT, transcript.id)
+        entries: list[SearchEntry] = args[3]
+        assert [(e.entry_index, e.speaker, e.timestamp, e.content) for e in entries] == [
+            (0, "田中", "10:00", "予算の確認です"),
+            (2, "佐藤", "10:02", "承知しました"),
+        ]
+        assert all(e.agent_id == agent_id for e in entries)
+        assert all(e.recurring_meeting_id == transcript.recurring_meeting_id for e in entries)
+
+    async def test_index_transcript_without_structured_data_uses_chunks(self) -> None:
+        """構造化データがない場合は本文をチャンク単位で登録すること."""
+        repository = AsyncMock()
+        service = SearchIndexService(repository)
+
+        count = await service.index_transcript(_transcript(None, "予算を確認する。"), uuid4())
+
+        assert count == 1
+        entry = repository.replace_source.await_args.args[3][0]
+        assert entry.content == "予算を確認する。"
+        assert entry.speaker is None
+
+    async def test_index_knowledge(self) -> None:
+        """ナレッジは正規化済みテキストを登録すること."""
+        repository = AsyncMock()
+        service = SearchIndexService(repository)
+        now = datetime.now(UTC)
+        knowledge = Knowledge(
+            id=uuid4(),
+            agent_id=uuid4(),
+            user_id=uuid4(),
+            original_text="よさん",
+            normalized_text="予算",
+            meeting_date=now,
+            created_at=now,
+        )
+
+        await service.index_knowledge(knowledge)
+
+        args = repository.replace_source.await_args.args
+        assert args[:3] == (knowledge.user_id, SearchSourceType.KNOWLEDGE, knowledge.id)
+        assert [e.content for e in args[3]] == ["予算"]
+
+
+class TestSearchUseCase:
+    """SearchUseCaseのテスト."""
+
+    async def test_adds_snippets(self) -> None:
+        """ヒットにスニペットを付けること."""
+        user_id = uuid4()
+        entry = SearchEntry(
+            id=uuid4(),
+            user_id=user_id,
+            source_type=SearchSourceType.TRANSCRIPT,
+            source_id=uuid4(),
+            entry_index=0,
+            content="来期の予算について",
+        )
+        repository = AsyncMock()
+        repository.search.return_value = [SearchHit(entry=entry, score=0.5)]
+
+        hits = await SearchUseCase(repository).execute(user_id, "予算", 10)
+
+        repository.search.assert_awaited_once_with(
+            user_id, "予算", 10, source_type=None, agent_id=None, recurring_meeting_id=None
+        )
+        assert hits[0].snippet == "来期の予算について"
+        assert hits[0].score == 0.5
@@ -0,0 +1,87 @@
+"""Unit tests for SyncDebouncer."""
+
+import asyncio
+
+from src.infrastructure.services.sync_debouncer import SyncDebouncer, SyncJob
+
+
+class TestSyncDebouncer:
+    """SyncDebouncerのテスト."""
+
+    async def test_burst_of_notifications_runs_one_sync(self) -> None:
+        """待機中に届いた同じキーの通知は1回の同期にまとめること."""
+        debouncer = SyncDebouncer(delay_seconds=0.01)
+        runs: list[str] = []
+
+        async def job() -> None:
+            runs.append("calendar")
+
+        scheduled = [debouncer.schedule("calendar:1", job) for _ in range(5)]
+        await debouncer.drain()
+
+        assert scheduled == [True, False, False, False, False]
+        assert runs == ["calendar"]
+
+    async def test_keys_are_synced_independently(self) -> None:
+        """キー（連携）が違う通知はそれぞれ同期すること."""
+        debouncer = SyncDebouncer(delay_seconds=0)
+        runs: list[str] = []
+
+        def job_for(key: str) -> SyncJob:
+            async def job() -> None:
+                runs.append(key)
+
+            return job
+
+        debouncer.schedule("calendar:1", job_for("calendar:1"))
+        debouncer.schedule("drive:1", job_for("drive:1"))
+        await debouncer.drain()
+
+        assert sorted(runs) == ["calendar:1", "drive:1"]
+
+    async def test_notification_during_run_schedules_next_sync_without_overlap(self) -> None:
+        """同期中に届いた通知は次の同期として予約し、同じキーの同期を並行させないこと."""
+        debouncer = SyncDebouncer(delay_seconds=0)
+        started = asyncio.Event()
+        release = asyncio.Event()
+        active = 0
+        max_active = 0
+        runs = 0
+
+        async def job() -> None:
+            nonlocal active, max_active, runs
+            active += 1
+            max_active = max(max_active, active)
+            runs += 1
+            started.set()
+            await release.wait()
+            active -= 1
+
+        debouncer.schedule("drive:1", job)
+        await started.wait()
+        assert debouncer.schedule("drive:1", job) is True
+        release.set()
+        await debouncer.drain()
+
+        assert runs == 2
+        assert max_active == 1
+
+    async def test_failed_sync_does_not_block_later_syncs(self) -> None:
+        """同期が失敗しても次の通知で同期できること."""
+        debouncer = SyncDebouncer(delay_seconds=0)
+        runs = 0
+
+        async def failing_job() -> None:
+            raise ValueError("Google Calendar API error: 500")
+
+        async def job() -> None:
+            nonlocal runs
+            runs += 1
+
+        debouncer.schedule("calendar:1", failing_job)
+        await debouncer.drain()
+        debouncer.schedule("calendar:1", job)
+        await debouncer.drain()
+
+        assert runs == 1
+        assert not debouncer.is_pending("calendar:1")
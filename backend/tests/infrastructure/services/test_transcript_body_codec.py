@@ -0,0 +1,62 @@
+"""Tests for TranscriptBodyCodec."""
+
+import pytest
+
+from src.infrastructure.services.transcript_body_codec import (
+    CODEC_ZSTD,
+    TranscriptBodyCodec,
+    train_dictionary,
+)
+
+SAMPLES = [
+    (
+        f"田中 ({hour:02d}:{minute:02d})\n議題{hour}-{minute}について確認します。\n\n"
+        f"鈴木 ({hour:02d}:{minute + 1:02d})\n了解しました。対応します。\n"
+    )
+    for hour in range(9, 18)
+    for minute in range(0, 58, 3)
+]
+
+
+class TestTranscriptBodyCodec:
+    """TranscriptBodyCodecのテスト."""
+
+    def test_round_trip_without_dictionary(self) -> None:
+        """辞書なしで圧縮・展開できること."""
+        codec = TranscriptBodyCodec()
+        text = "".join(SAMPLES[:10])
+
+        body = codec.compress(text)
+
+        assert body.codec == CODEC_ZSTD
+        assert body.dictionary_id == 0
+        assert body.raw_size == len(text.encode("utf-8"))
+        assert codec.decompress(body.data) == text
+
+    def test_round_trip_with_dictionary(self) -> None:
+        """学習した辞書で圧縮・展開でき、辞書なしより小さくなること."""
+        codec = TranscriptBodyCodec([train_dictionary(SAMPLES, size=4096)])
+
+        body = codec.compress(SAMPLES[0])
+
+        assert body.dictionary_id == codec.dictionary_id != 0
+        assert len(body.data) < len(TranscriptBodyCodec().compress(SAMPLES[0]).data)
+        assert codec.decompress(body.data, body.dictionary_id) == SAMPLES[0]
+
+    def test_old_dictionary_still_decompresses(self) -> None:
+        """辞書を追加しても、古い辞書で圧縮した本文を展開できること."""
+        old = train_dictionary(SAMPLES, size=4096)
+        new = train_dictionary(SAMPLES[::-1], size=2048)
+        body = TranscriptBodyCodec([old]).compress(SAMPLES[1])
+
+        codec = TranscriptBodyCodec([old, new])
+
+        assert codec.dictionary_id != body.dictionary_id
+        assert codec.decompress(body.data, body.dictionary_id) == SAMPLES[1]
+
+    def test_unknown_dictionary_raises(self) -> None:
+        """圧縮時の辞書がない場合はValueErrorになること."""
+        body = TranscriptBodyCodec([train_dictionary(SAMPLES, size=4096)]).compress(SAMPLES[0])
+
+        with pytest.raises(ValueError, match="not loaded"):
+            TranscriptBodyCodec().decompress(body.data, body.dictionary_id)
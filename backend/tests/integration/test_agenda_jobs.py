@@ -0,0 +1,355 @@
+"""
+アジェンダ生成ジョブAPIの統合テスト
+
+テスト対象: アジェンダ生成のジョブ化
+- POST /agendas/generate（Prefer: respond-async で202、指定なしで完了まで待つ、入力が変わっていなければ200、
+  入力が同じ実行中のジョブがあればそのジョブを返す）
+- GET /agendas/jobs/{job_id}
+- GET /agendas/jobs/{job_id}/events（Server-Sent Events）
+- GET /agendas/draft（事前生成した下書き）
+
+ワーカーの代わりに、取得されるたびにジョブの状態を進めるリポジトリを使う。
+"""
+
+import json
+from collections.abc import Generator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.use_cases.agenda_pregeneration_use_cases import AgendaDraft
+from src.application.use_cases.agenda_use_cases import GENERATION_TIMEOUT_MESSAGE, AgendaInputCheck, GenerateResult
+from src.config import settings
+from src.domain.entities.agenda import Agenda
+from src.domain.entities.agenda_job import AgendaJob, AgendaJobStage, AgendaJobStatus
+from src.domain.entities.generated_agenda import AgendaStatus, GeneratedAgenda
+from src.main import app
+from src.presentation.api.v1.dependencies import get_current_user_id
+from src.presentation.api.v1.endpoints import agendas
+from src.presentation.api.v1.endpoints.agendas import get_agenda_job_repository, get_service_client
+
+TEST_USER_ID = UUID("22222222-2222-2222-2222-222222222222")
+GENERATE_PATH = "/api/v1/agendas/generate"
+
+
+class ScriptedJobRepository:
+    """ワーカーの代わりに、取得されるたびにジョブを次の状態へ進めるリポジトリ."""
+
+    def __init__(self) -> None:
+        self.jobs: dict[UUID, AgendaJob] = {}
+        self.script: list[dict[str, object]] = []
+
+    async def create(self, job: AgendaJob) -> AgendaJob:
+        self.jobs[job.id] = job
+        return job
+
+    async def create_or_get_active(self, job: AgendaJob) -> AgendaJob:
+        for active in self.jobs.values():
+            if (
+                job.input_fingerprint is not None
+                and not active.is_finished
+                and (active.user_id, active.agent_id, active.input_fingerprint)
+                == (job.user_id, job.agent_id, job.input_fingerprint)
+            ):
+                active = replace(active, run_after=min(active.run_after, job.run_after))
+                self.jobs[active.id] = active
+                return active
+        return await self.create(job)
+
+    async def get_by_id(self, job_id: UUID, user_id: UUID) -> AgendaJob | None:
+        job = self.jobs.get(job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        if self.script:
+            job = replace(job, **self.script.pop(0))  # type: ignore[arg-type]
+            self.jobs[job_id] = job
+        return job
+
+    def add_job(self, **changes: object) -> AgendaJob:
+        now = datetime.now(UTC)
+        job = AgendaJob(
+            id=uuid4(),
+            user_id=TEST_USER_ID,
+            agent_id=uuid4(),
+            status=AgendaJobStatus.QUEUED,
+            attempts=0,
+            max_attempts=3,
+            run_after=now,
+            created_at=now,
+            updated_at=now,
+        )
+        job = replace(job, **changes)  # type: ignore[arg-type]
+        self.jobs[job.id] = job
+        return job
+
+
+def _running(stage: AgendaJobStage) -> dict[str, object]:
+    return {"status": AgendaJobStatus.RUNNING, "stage": stage, "attempts": 1}
+
+
+def _succeeded(agenda_id: UUID) -> dict[str, object]:
+    return {
+        "status": AgendaJobStatus.SUCCEEDED,
+        "stage": AgendaJobStage.PERSIST,
+        "attempts": 1,
+        "agenda_id": agenda_id,
+        "result": {
+            "has_knowledge": True,
+            "has_slack_messages": False,
+            "slack_message_count": 0,
+            "dictionary_entry_count": 0,
+        },
+        "finished_at": datetime.now(UTC),
+    }
+
+
+@pytest.fixture
+def job_repository() -> ScriptedJobRepository:
+    return ScriptedJobRepository()
+
+
+@pytest.fixture
+def check_inputs() -> Generator[AsyncMock, None, None]:
+    """生成前の入力の確認（既定では前回のアジェンダを再利用できない）."""
+    with patch.object(agendas, "CheckAgendaInputsUseCase") as use_case_class:
+        use_case_class.return_value.execute = AsyncMock(return_value=AgendaInputCheck(fingerprint="fingerprint"))
+        yield use_case_class.return_value.execute
+
+
+@pytest.fixture
+def client(job_repository: ScriptedJobRepository, check_inputs: AsyncMock) -> Generator[TestClient, None, None]:
+    """ジョブのリポジトリとSupabaseクライアントを差し替えたテストクライアント."""
+    app.dependency_overrides[get_current_user_id] = lambda: TEST_USER_ID
+    app.dependency_overrides[get_service_client] = lambda: MagicMock()
+    app.dependency_overrides[get_agenda_job_repository] = lambda: job_repository
+    with (
+        patch.object(settings, "AGENDA_JOB_EVENTS_POLL_SECONDS", 0),
+        patch.object(agendas, "AgentRepositoryImpl") as agent_repository_class,
+        TestClient(app) as c,
+    ):
+        agent_repository_class.return_value.get_by_id.return_value = MagicMock()
+        yield c
+    app.dependency_overrides.clear()
+
+
+class TestGenerateAgenda:
+    """POST /agendas/generate のテスト."""
+
+    def test_respond_async_returns_job(self, client: TestClient, job_repository: ScriptedJobRepository) -> None:
+        """Prefer: respond-async の場合はジョブを登録して202とLocationを返す"""
+        agent_id = uuid4()
+
+        response = client.post(GENERATE_PATH, json={"agent_id": str(agent_id)}, headers={"Prefer": "respond-async"})
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status"] == "queued"
+        assert body["agent_id"] == str(agent_id)
+        assert response.headers["Location"] == f"/api/v1/agendas/jobs/{body['id']}"
+        assert response.headers["Preference-Applied"] == "respond-async"
+        assert job_repository.jobs[UUID(body["id"])].max_attempts == settings.AGENDA_JOB_MAX_ATTEMPTS
+
+    def test_waits_for_job_and_returns_agenda(self, client: TestClient, job_repository: ScriptedJobRepository) -> None:
+        """指定がない場合はジョブの完了を待ってアジェンダを返す"""
+        agent_id = uuid4()
+        now = datetime.now(UTC)
+        agenda = Agenda(
+            id=uuid4(), agent_id=agent_id, user_id=TEST_USER_ID, content="# 議題", generated_at=now, created_at=now
+        )
+        job_repository.script = [_running(AgendaJobStage.LLM), _succeeded(agenda.id)]
+
+        with patch.object(agendas, "AgendaRepositoryImpl") as agenda_repository_class:
+            agenda_repository_class.return_value.get_by_id = AsyncMock(return_value=agenda)
+            response = client.post(GENERATE_PATH, json={"agent_id": str(agent_id)})
+
+        assert response.status_code == 201
+        body = response.json()
+        assert body["agenda"]["id"] == str(agenda.id)
+        assert body["data_sources"]["has_knowledge"] is True
+        # 呼び出し元が待っているためリトライしない
+        assert all(job.max_attempts == 1 for job in job_repository.jobs.values())
+
+    def test_timed_out_generation_returns_504(self, client: TestClient, job_repository: ScriptedJobRepository) -> None:
+        """生成がタイムアウトしたジョブは504を返す"""
+        job_repository.script = [
+            {"status": AgendaJobStatus.FAILED, "error": GENERATION_TIMEOUT_MESSAGE, "finished_at": datetime.now(UTC)}
+        ]
+
+        response = client.post(GENERATE_PATH, json={"agent_id": str(uuid4())})
+
+        assert response.status_code == 504
+
+    def test_unknown_agent_returns_404(self, client: TestClient, job_repository: ScriptedJobRepository) -> None:
+        """エージェントが見つからない場合はジョブを登録せずに404を返す"""
+        with patch.object(agendas, "AgentRepositoryImpl") as agent_repository_class:
+            agent_repository_class.return_value.get_by_id.return_value = None
+            response = client.post(GENERATE_PATH, json={"agent_id": str(uuid4())})
+
+        assert response.status_code == 404
+        assert job_repository.jobs == {}
+
+    def test_unchanged_inputs_return_previous_agenda_without_job(
+        self, client: TestClient, job_repository: ScriptedJobRepository, check_inputs: AsyncMock
+    ) -> None:
+        """入力が前回の生成から変わっていない場合はジョブを登録せずに前回のアジェンダを200で返す"""
+        agent_id = uuid4()
+        now = datetime.now(UTC)
+        agenda = Agenda(
+            id=uuid4(), agent_id=agent_id, user_id=TEST_USER_ID, content="# 前回", generated_at=now, created_at=now
+        )
+        check_inputs.return_value = AgendaInputCheck(
+            fingerprint="fingerprint",
+            reusable=GenerateResult(
+                agenda=agenda,
+                has_knowledge=True,
+                has_slack_messages=False,
+                slack_message_count=0,
+                dictionary_entry_count=0,
+                reused=True,
+            ),
+        )
+
+        response = client.post(GENERATE_PATH, json={"agent_id": str(agent_id)}, headers={"Prefer": "respond-async"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["agenda"]["id"] == str(agenda.id)
+        assert body["data_sources"]["reused"] is True
+        assert job_repository.jobs == {}
+
+    def test_force_regenerates_unchanged_inputs(
+        self, client: TestClient, job_repository: ScriptedJobRepository, check_inputs: AsyncMock
+    ) -> None:
+        """forceを指定した場合は入力が変わっていなくても、生成し直すジョブを登録する"""
+        check_inputs.return_value = AgendaInputCheck(fingerprint="fingerprint", reusable=MagicMock())
+
+        response = client.post(
+            GENERATE_PATH, json={"agent_id": str(uuid4()), "force": True}, headers={"Prefer": "respond-async"}
+        )
+
+        assert response.status_code == 202
+        assert [job.force for job in job_repository.jobs.values()] == [True]
+
+    def test_concurrent_requests_share_one_job(self, client: TestClient, job_repository: ScriptedJobRepository) -> None:
+        """入力が同じ生成要求は、実行中のジョブを共有して1件だけ生成する"""
+        agent_id = uuid4()
+
+        first = client.post(GENERATE_PATH, json={"agent_id": str(agent_id)}, headers={"Prefer": "respond-async"})
+        second = client.post(GENERATE_PATH, json={"agent_id": str(agent_id)}, headers={"Prefer": "respond-async"})
+
+        assert first.json()["id"] == second.json()["id"]
+        assert len(job_repository.jobs) == 1
+        assert next(iter(job_repository.jobs.values())).input_fingerprint == "fingerprint"
+
+    def test_request_moves_up_scheduled_job_with_same_inputs(
+        self, client: TestClient, job_repository: ScriptedJobRepository
+    ) -> None:
+        """入力が同じジョブが先の日時に予定されている場合は、そのジョブをすぐ実行するよう早める"""
+        scheduled = job_repository.add_job(
+            run_after=datetime.now(UTC) + timedelta(minutes=10), input_fingerprint="fingerprint"
+        )
+
+        response = client.post(
+            GENERATE_PATH, json={"agent_id": str(scheduled.agent_id)}, headers={"Prefer": "respond-async"}
+        )
+
+        assert response.json()["id"] == str(scheduled.id)
+        assert len(job_repository.jobs) == 1
+        assert job_repository.jobs[scheduled.id].run_after <= datetime.now(UTC)
+
+
+class TestAgendaJobStatus:
+    """GET /agendas/jobs/{job_id} のテスト."""
+
+    def test_returns_job(self, client: TestClient, job_repository: ScriptedJobRepository) -> None:
+        """ジョブの状態を返す"""
+        job = job_repository.add_job(status=AgendaJobStatus.RUNNING, stage=AgendaJobStage.SLACK, attempts=1)
+
+        response = client.get(f"/api/v1/agendas/jobs/{job.id}")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["status"], body["stage"], body["attempts"]) == ("running", "slack", 1)
+
+    def test_other_users_job_is_not_found(self, client: TestClient, job_repository: ScriptedJobRepository) -> None:
+        """他のユーザーのジョブは404を返す"""
+        job = job_repository.add_job(user_id=uuid4())
+
+        assert client.get(f"/api/v1/agendas/jobs/{job.id}").status_code == 404
+
+
+class TestAgendaJobEvents:
+    """GET /agendas/jobs/{job_id}/events のテスト."""
+
+    def test_streams_stage_changes_until_finished(
+        self, client: TestClient, job_repository: ScriptedJobRepository
+    ) -> None:
+        """段階が変わるたびにイベントを送り、完了したら終了する"""
+        job = job_repository.add_job()
+        agenda_id = uuid4()
+        job_repository.script = [
+            {},
+            _running(AgendaJobStage.GATHERING),
+            _running(AgendaJobStage.GATHERING),
+            _running(AgendaJobStage.SLACK),
+            _running(AgendaJobStage.LLM),
+            _running(AgendaJobStage.PERSIST),
+            _succeeded(agenda_id),
+        ]
+
+        response = client.get(f"/api/v1/agendas/jobs/{job.id}/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        messages = [m for m in response.text.split("\n\n") if m]
+        names = [m.split("\n")[0].removeprefix("event: ") for m in messages]
+        assert names == ["queued", "gathering", "slack", "llm", "persist", "succeeded"]
+        last = json.loads(messages[-1].split("\n")[1].removeprefix("data: "))
+        assert last["agenda_id"] == str(agenda_id)
+
+
+class TestAgendaDraft:
+    """GET /agendas/draft のテスト."""
+
+    def test_returns_pregenerated_draft(self, client: TestClient) -> None:
+        """事前生成した下書きを対象の開催日時・データソースと一緒に返す"""
+        agent_id = uuid4()
+        now = datetime.now(UTC)
+        agenda = Agenda(
+            id=uuid4(), agent_id=agent_id, user_id=TEST_USER_ID, content="# 下書き", generated_at=now, created_at=now
+        )
+        generated_agenda = GeneratedAgenda(
+            id=uuid4(),
+            recurring_meeting_id=uuid4(),
+            target_date=now,
+            agenda_content={"content": agenda.content, "data_sources": _succeeded(agenda.id)["result"]},
+            sources=[],
+            status=AgendaStatus.DRAFT,
+            delivered_via=None,
+            created_at=now,
+            updated_at=None,
+            agenda_id=agenda.id,
+        )
+
+        with patch.object(agendas, "GetAgendaDraftUseCase") as use_case_class:
+            use_case_class.return_value.execute = AsyncMock(return_value=AgendaDraft(generated_agenda, agenda))
+            response = client.get("/api/v1/agendas/draft", params={"agent_id": str(agent_id)})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["agenda"]["id"] == str(agenda.id)
+        assert body["recurring_meeting_id"] == str(generated_agenda.recurring_meeting_id)
+        assert body["data_sources"]["has_knowledge"] is True
+
+    def test_returns_null_without_draft(self, client: TestClient) -> None:
+        """下書きがない場合はnullを返す"""
+        with patch.object(agendas, "GetAgendaDraftUseCase") as use_case_class:
+            use_case_class.return_value.execute = AsyncMock(return_value=None)
+            response = client.get("/api/v1/agendas/draft", params={"agent_id": str(uuid4())})
+
+        assert response.status_code == 200
+        assert response.json() is None
@@ -0,0 +1,77 @@
+"""
+全文検索APIの統合テスト
+
+テスト対象: Search API
+- トランスクリプト・ナレッジの全文検索（GET /search）
+"""
+
+from collections.abc import Generator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.domain.entities.search_entry import SearchEntry, SearchHit, SearchSourceType
+from src.main import app
+from src.presentation.api.v1.dependencies import get_current_user_id
+from src.presentation.api.v1.endpoints.search import get_repository
+
+TEST_USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+
+
+@pytest.fixture
+def authenticated_client() -> Generator[TestClient, None, None]:
+    """認証済みテストクライアントを作成."""
+    app.dependency_overrides[get_current_user_id] = lambda: TEST_USER_ID
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+class TestSearch:
+    """GET /search のテスト."""
+
+    def test_returns_hits_with_speaker_and_snippet(self, authenticated_client: TestClient) -> None:
+        """ヒットした発話の話者・タイムスタンプ・スニペットを返す"""
+        entry = SearchEntry(
+            id=uuid4(),
+            user_id=TEST_USER_ID,
+            source_type=SearchSourceType.TRANSCRIPT,
+            source_id=uuid4(),
+            entry_index=3,
+            content="来期の予算について確認します",
+            recurring_meeting_id=uuid4(),
+            source_date=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+            speaker="田中",
+            timestamp="10:05",
+        )
+        repository = MagicMock()
+        repository.search = AsyncMock(return_value=[SearchHit(entry=entry, score=0.8)])
+        app.dependency_overrides[get_repository] = lambda: repository
+
+        response = authenticated_client.get("/api/v1/search", params={"q": "予算", "source_type": "transcript"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["source_id"] == str(entry.source_id)
+        assert data[0]["speaker"] == "田中"
+        assert data[0]["timestamp"] == "10:05"
+        assert data[0]["snippet"] == "来期の予算について確認します"
+        repository.search.assert_awaited_once_with(
+            TEST_USER_ID,
+            "予算",
+            20,
+            source_type=SearchSourceType.TRANSCRIPT,
+            agent_id=None,
+            recurring_meeting_id=None,
+        )
+
+    def test_rejects_empty_query(self, authenticated_client: TestClient) -> None:
+        """検索語が空の場合は422を返す"""
+        app.dependency_overrides[get_repository] = MagicMock
+
+        response = authenticated_client.get("/api/v1/search", params={"q": ""})
+
+        assert response.status_code == 422
@@ -12,20 +12,27 @@ Transcript管理機能の統合テスト
 
 from collections.abc import Generator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
+from src.config import settings
 from src.domain.entities.meeting_transcript import (
     MeetingTranscript,
+    MeetingTranscriptSummary,
     TranscriptEntry,
     TranscriptStructuredData,
 )
+from src.domain.entities.page_cursor import PageCursor
+from src.infrastructure.repositories.embedding_cache_repository_impl import EmbeddingCacheRepositoryImpl
+from src.infrastructure.services import embedding_index_service as embedding_index_service_module
+from src.infrastructure.services import embedding_service as embedding_service_module
 from src.main import app
 from src.presentation.api.v1.dependencies import get_current_user_id
-from src.presentation.api.v1.endpoints.transcripts import get_repository
+from src.presentation.api.v1.endpoints import transcripts as transcripts_module
+from src.presentation.api.v1.endpoints.transcripts import get_recurring_meeting_repository, get_repository
 
 # テスト用の固定UUID
 TEST_USER_ID = UUID("11111111-1111-1111-1111-111111111111")
@@ -190,11 +197,107 @@ class TestTranscriptIntegration:
 
             # Assert: リポジトリがrecurring_meeting_idで呼び出されている
             mock_repository_with_transcript.get_by_recurring_meeting.assert_called_once_with(
-                TEST_RECURRING_MEETING_ID, None
+                TEST_RECURRING_MEETING_ID, None, cursor=None
             )
         finally:
             app.dependency_overrides.pop(get_repository, None)
 
+    def test_get_transcripts_with_limit_returns_next_cursor(
+        self,
+        authenticated_client: TestClient,
+        mock_repository: MagicMock,
+        sample_transcript: MeetingTranscript,
+    ) -> None:
+        """limit件を超える場合は次ページのカーソルをヘッダーで返し、カーソルで続きを取得できる"""
+        older = MeetingTranscript(
+            id=uuid4(),
+            recurring_meeting_id=TEST_RECURRING_MEETING_ID,
+            meeting_date=datetime(2024, 1, 8, 10, 0, 0, tzinfo=UTC),
+            google_doc_id="doc_older",
+            raw_text="",
+            structured_data=None,
+            match_confidence=0.9,
+            created_at=datetime(2024, 1, 8, 12, 0, 0, tzinfo=UTC),
+        )
+        mock_repository.get_by_recurring_meeting = AsyncMock(return_value=[sample_transcript, older])
+        app.dependency_overrides[get_repository] = lambda: mock_repository
+
+        try:
+            response = authenticated_client.get(
+                f"/api/v1/transcripts?recurring_meeting_id={TEST_RECURRING_MEETING_ID}&limit=1"
+            )
+
+            assert response.status_code == 200
+            assert [t["id"] for t in response.json()] == [str(TEST_TRANSCRIPT_ID)]
+            next_cursor = response.headers["X-Next-Cursor"]
+            # 続きの有無を判定するため1件多く取得する
+            mock_repository.get_by_recurring_meeting.assert_called_once_with(TEST_RECURRING_MEETING_ID, 2, cursor=None)
+
+            mock_repository.get_by_recurring_meeting = AsyncMock(return_value=[older])
+            response = authenticated_client.get(
+                f"/api/v1/transcripts?recurring_meeting_id={TEST_RECURRING_MEETING_ID}&limit=1&cursor={next_cursor}"
+            )
+
+            assert response.status_code == 200
+            assert "X-Next-Cursor" not in response.headers
+            cursor = mock_repository.get_by_recurring_meeting.call_args.kwargs["cursor"]
+            assert cursor == PageCursor(sample_transcript.meeting_date, TEST_TRANSCRIPT_ID)
+        finally:
+            app.dependency_overrides.pop(get_repository, None)
+
+    def test_get_pending_transcripts_returns_summaries(
+        self,
+        authenticated_client: TestClient,
+        mock_repository: MagicMock,
+    ) -> None:
+        """手動確認待ちの一覧は本文を含まない概要を返す"""
+        summary = MeetingTranscriptSummary(
+            id=TEST_TRANSCRIPT_ID,
+            recurring_meeting_id=TEST_RECURRING_MEETING_ID,
+            meeting_date=datetime(2024, 1, 15, 10, 0, 0, tzinfo=UTC),
+            google_doc_id="doc_pending",
+            match_confidence=0.4,
+            created_at=datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC),
+            raw_text_size=2048,
+            recurring_meeting_title="Weekly Standup",
+        )
+        mock_repository.get_needing_confirmation = AsyncMock(return_value=[summary])
+        app.dependency_overrides[get_repository] = lambda: mock_repository
+
+        try:
+            response = authenticated_client.get("/api/v1/transcripts/pending?limit=20")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 1
+            assert data[0]["id"] == str(TEST_TRANSCRIPT_ID)
+            assert data[0]["raw_text_size"] == 2048
+            assert data[0]["recurring_meeting_title"] == "Weekly Standup"
+            assert data[0]["needs_manual_confirmation"] is True
+            assert "raw_text" not in data[0]
+            assert "structured_data" not in data[0]
+            mock_repository.get_needing_confirmation.assert_called_once_with(TEST_USER_ID, 21, None)
+        finally:
+            app.dependency_overrides.pop(get_repository, None)
+
+    def test_get_transcripts_rejects_invalid_cursor(
+        self,
+        authenticated_client: TestClient,
+        mock_repository: MagicMock,
+    ) -> None:
+        """不正なカーソルは400を返す"""
+        app.dependency_overrides[get_repository] = lambda: mock_repository
+
+        try:
+            response = authenticated_client.get(
+                f"/api/v1/transcripts?recurring_meeting_id={TEST_RECURRING_MEETING_ID}&cursor=invalid"
+            )
+
+            assert response.status_code == 400
+            mock_repository.get_by_recurring_meeting.assert_not_called()
+        finally:
+            app.dependency_overrides.pop(get_repository, None)
+
     def test_get_transcripts_returns_empty_when_no_transcripts(
         self,
         authenticated_client: TestClient,
@@ -330,3 +433,46 @@ class TestTranscriptIntegration:
             assert "not found" in response.json()["detail"].lower()
         finally:
             app.dependency_overrides.pop(get_repository, None)
+
+    def test_link_transcript_uses_service_client_for_embedding_cache(
+        self,
+        authenticated_client: TestClient,
+        mock_repository_with_transcript: MagicMock,
+        sample_transcript: MeetingTranscript,
+    ) -> None:
+        """手動紐付けのembeddingキャッシュはユーザーではなくサービスキーのクライアントで読み書きする"""
+        # Arrange: ユーザーのクライアントを持つリポジトリと、サービスキーのクライアント
+        user_client = MagicMock(name="user_client")
+        service_client = MagicMock(name="service_client")
+        mock_repository_with_transcript.client = user_client
+        app.dependency_overrides[get_repository] = lambda: mock_repository_with_transcript
+        app.dependency_overrides[get_recurring_meeting_repository] = lambda: MagicMock()
+
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(return_value=sample_transcript)
+        use_case_factory = MagicMock(return_value=use_case)
+
+        try:
+            with (
+                patch.object(settings, "EMBEDDING_INDEX_BACKEND", "pgvector"),
+                patch.object(embedding_index_service_module, "is_bedrock_configured", return_value=True),
+                patch.object(embedding_service_module, "get_supabase_client", return_value=service_client),
+                patch.object(transcripts_module, "LinkTranscriptUseCase", use_case_factory),
+            ):
+                # Act: POST /api/v1/transcripts/{transcript_id}/link
+                response = authenticated_client.post(
+                    f"/api/v1/transcripts/{TEST_TRANSCRIPT_ID}/link",
+                    json={"recurring_meeting_id": str(TEST_RECURRING_MEETING_ID)},
+                )
+
+            # Assert: インデックスはユーザーのクライアント、キャッシュはサービスキーのクライアントを使う
+            assert response.status_code == 200
+            index_service = use_case_factory.call_args.kwargs["embedding_index_service"]
+            assert index_service is not None
+            assert index_service.repository.client is user_client
+            cache = index_service.embedding_service.cache
+            assert isinstance(cache, EmbeddingCacheRepositoryImpl)
+            assert cache.client is service_client
+        finally:
+            app.dependency_overrides.pop(get_repository, None)
+            app.dependency_overrides.pop(get_recurring_meeting_repository, None)
@@ -0,0 +1,207 @@
+"""
+Google プッシュ通知Webhookの統合テスト
+
+テスト対象: Webhook API
+- Calendar / Drive の通知受信（POST /webhooks/google）
+- プッシュ通知チャネルの登録（POST /webhooks/google/watch）
+
+Googleの代わりに、登録済みチャネルへの通知（sync → exists/update ...）を
+ヘッダー付きで再生するスタンドインを使う。
+"""
+
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import settings
+from src.domain.entities.watch_channel import WatchChannel, WatchResourceType
+from src.main import app
+from src.presentation.api.v1.dependencies import get_current_user_id
+from src.presentation.api.v1.endpoints import webhooks
+from src.presentation.api.v1.endpoints.webhooks import (
+    get_google_integration_repository,
+    get_notification_channel_repository,
+    get_sync_debouncer,
+    get_watch_channel_repository,
+)
+
+TEST_USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+WEBHOOK_PATH = "/api/v1/webhooks/google"
+
+
+class GooglePushReplayer:
+    """Googleのプッシュ通知を再生するスタンドイン.
+
+    登録済みチャネルを保持し、Googleと同じヘッダーで通知を送る。
+    """
+
+    def __init__(self, client: TestClient) -> None:
+        self.client = client
+        self.channels: dict[UUID, WatchChannel] = {}
+        self.message_numbers: dict[UUID, int] = {}
+
+    def register(self, resource_type: WatchResourceType, integration_id: UUID | None = None) -> WatchChannel:
+        """チャネルを登録する."""
+        channel = WatchChannel(
+            id=uuid4(),
+            user_id=TEST_USER_ID,
+            integration_id=integration_id or uuid4(),
+            resource_type=resource_type,
+            resource_id=f"resource-{uuid4().hex[:8]}",
+            token=f"token-{uuid4().hex}",
+            expiration=datetime.now(UTC) + timedelta(days=7),
+            created_at=datetime.now(UTC),
+        )
+        self.channels[channel.id] = channel
+        return channel
+
+    def repository(self) -> MagicMock:
+        """登録済みチャネルを返すリポジトリ."""
+        repository = MagicMock()
+        repository.get_by_id = AsyncMock(side_effect=lambda channel_id: self.channels.get(channel_id))
+        return repository
+
+    def notify(self, channel: WatchChannel, state: str, **overrides: str) -> int:
+        """通知を1件送り、レスポンスのステータスコードを返す."""
+        number = self.message_numbers.get(channel.id, 0) + 1
+        self.message_numbers[channel.id] = number
+        headers = {
+            "X-Goog-Channel-ID": str(channel.id),
+            "X-Goog-Channel-Token": channel.token,
+            "X-Goog-Resource-ID": channel.resource_id,
+            "X-Goog-Resource-State": state,
+            "X-Goog-Message-Number": str(number),
+            **overrides,
+        }
+        return int(self.client.post(WEBHOOK_PATH, headers=headers).status_code)
+
+    def replay(self, channel: WatchChannel, states: list[str]) -> list[int]:
+        """登録直後の確認通知に続けて変更通知を再生する."""
+        return [self.notify(channel, state) for state in ["sync", *states]]
+
+
+@pytest.fixture
+def debouncer() -> MagicMock:
+    """予約された同期を記録するデバウンサー."""
+    scheduled: set[str] = set()
+    debouncer = MagicMock()
+
+    def schedule(key: str, job: object) -> bool:
+        is_new = key not in scheduled
+        scheduled.add(key)
+        return is_new
+
+    debouncer.schedule = MagicMock(side_effect=schedule)
+    return debouncer
+
+
+@pytest.fixture
+def replayer(debouncer: MagicMock) -> Generator[GooglePushReplayer, None, None]:
+    """通知を再生するスタンドインと、それを使うテストクライアント."""
+    with TestClient(app) as client:
+        replayer = GooglePushReplayer(client)
+        app.dependency_overrides[get_notification_channel_repository] = replayer.repository
+        app.dependency_overrides[get_sync_debouncer] = lambda: debouncer
+        yield replayer
+    app.dependency_overrides.clear()
+
+
+class TestReceiveGoogleNotification:
+    """POST /webhooks/google のテスト."""
+
+    def test_sync_message_is_acknowledged_without_sync(
+        self, replayer: GooglePushReplayer, debouncer: MagicMock
+    ) -> None:
+        """登録直後の確認通知には応答するだけで同期しない"""
+        channel = replayer.register(WatchResourceType.CALENDAR)
+
+        assert replayer.replay(channel, []) == [204]
+        debouncer.schedule.assert_not_called()
+
+    def test_change_notifications_schedule_sync_for_notified_integration_only(
+        self, replayer: GooglePushReplayer, debouncer: MagicMock
+    ) -> None:
+        """変更通知は通知を受けた連携・種別の同期だけを予約する"""
+        integration_id = uuid4()
+        calendar = replayer.register(WatchResourceType.CALENDAR, integration_id)
+        drive = replayer.register(WatchResourceType.DRIVE, integration_id)
+        replayer.register(WatchResourceType.CALENDAR)  # 他の連携には通知しない
+
+        statuses = replayer.replay(calendar, ["exists", "exists", "exists"]) + replayer.replay(drive, ["change"])
+
+        assert set(statuses) == {204}
+        keys = [c.args[0] for c in debouncer.schedule.call_args_list]
+        assert keys == [f"calendar:{integration_id}"] * 3 + [f"drive:{integration_id}"]
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"X-Goog-Channel-Token": "forged-token"},
+            {"X-Goog-Resource-ID": "other-resource"},
+            {"X-Goog-Channel-ID": str(uuid4())},
+        ],
+    )
+    def test_rejects_notification_that_does_not_match_channel(
+        self, replayer: GooglePushReplayer, debouncer: MagicMock, overrides: dict[str, str]
+    ) -> None:
+        """保存済みのチャネルと一致しない通知は404で拒否し、同期しない"""
+        channel = replayer.register(WatchResourceType.DRIVE)
+
+        assert replayer.notify(channel, "change", **overrides) == 404
+        debouncer.schedule.assert_not_called()
+
+    def test_rejects_request_without_channel_headers(self, replayer: GooglePushReplayer) -> None:
+        """チャネルのヘッダーがないリクエストは422を返す"""
+        response = replayer.client.post(WEBHOOK_PATH)
+
+        assert response.status_code == 422
+
+
+class TestWatchGoogleChanges:
+    """POST /webhooks/google/watch のテスト."""
+
+    @pytest.fixture
+    def authenticated_client(self) -> Generator[TestClient, None, None]:
+        app.dependency_overrides[get_current_user_id] = lambda: TEST_USER_ID
+        app.dependency_overrides[get_google_integration_repository] = lambda: MagicMock()
+        app.dependency_overrides[get_watch_channel_repository] = lambda: MagicMock()
+        with TestClient(app) as client:
+            yield client
+        app.dependency_overrides.clear()
+
+    def test_returns_registered_channels(self, authenticated_client: TestClient) -> None:
+        """登録したチャネルの種別と有効期限を返す"""
+        expiration = datetime(2026, 10, 26, tzinfo=UTC)
+        channel = WatchChannel(
+            id=uuid4(),
+            user_id=TEST_USER_ID,
+            integration_id=uuid4(),
+            resource_type=WatchResourceType.CALENDAR,
+            resource_id="resource-1",
+            token="token",
+            expiration=expiration,
+            created_at=datetime.now(UTC),
+        )
+
+        with (
+            patch.object(settings, "GOOGLE_WEBHOOK_URL", "https://example.com/api/v1/webhooks/google"),
+            patch.object(webhooks, "WatchGoogleChangesUseCase") as use_case_cls,
+        ):
+            use_case_cls.return_value.execute = AsyncMock(return_value=[channel])
+            response = authenticated_client.post(f"{WEBHOOK_PATH}/watch")
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": str(channel.id), "resource_type": "calendar", "expiration": "2026-10-26T00:00:00Z"}
+        ]
+
+    def test_returns_503_when_webhook_url_is_not_configured(self, authenticated_client: TestClient) -> None:
+        """GOOGLE_WEBHOOK_URLが未設定の場合は503を返す"""
+        with patch.object(settings, "GOOGLE_WEBHOOK_URL", None):
+            response = authenticated_client.post(f"{WEBHOOK_PATH}/watch")
+
+        assert response.status_code == 503
@@ -5,11 +5,17 @@ AC14: 日時比較
 AC15: 参加者名と話者名照合
 """
 
+import random
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
 from src.domain.services.matching_algorithm import (
+    BatchMatcher,
+    DocumentMatchFeatures,
+    MeetingMatchFeatures,
+    _levenshtein_distance,
     calculate_jaccard,
     calculate_match_confidence,
     calculate_string_similarity,
@@ -44,6 +50,94 @@ class TestStringMatching:
         similarity = calculate_string_similarity("Weekly Standup", "weekly standup")
         assert similarity == 1.0
 
+    def test_threshold_matches_unbounded(self) -> None:
+        """閾値以上なら閾値なしと同じ類似度、未満なら0.0を返すこと."""
+        rng = random.Random(3)  # noqa: S311
+        for _ in range(300):
+            s1 = "".join(rng.choices("abcd ", k=rng.randint(1, 30)))
+            s2 = "".join(rng.choices("abcd ", k=rng.randint(1, 30)))
+            threshold = rng.choice([0.1, 0.25, 0.5, 0.75, 0.9])
+            unbounded = calculate_string_similarity(s1, s2)
+            expected = unbounded if unbounded >= threshold else 0.0
+            assert calculate_string_similarity(s1, s2, threshold) == expected
+
+    def test_threshold_stops_levenshtein_early(self) -> None:
+        """閾値から求めた打ち切り距離を渡し、超過した場合は打ち切った距離で0.0を返すこと."""
+        distances: list[int] = []
+
+        def spy(s1: str, s2: str, max_distance: int | None = None) -> int:
+            distances.append(_levenshtein_distance(s1, s2, max_distance))
+            return distances[-1]
+
+        with patch("src.domain.services.matching_algorithm._levenshtein_distance", side_effect=spy) as distance:
+            similarity = calculate_string_similarity("Weekly Standup", "Budget Review", 0.5)
+
+        # 長い方の14文字に対して距離7までが類似度0.5以上
+        distance.assert_called_once_with("weekly standup", "budget review", 7)
+        assert distances == [8]
+        assert similarity == 0.0
+
+
+def _reference_levenshtein(s1: str, s2: str) -> int:
+    """行単位の動的計画法による参照実装."""
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            current_row.append(min(previous_row[j + 1] + 1, current_row[j] + 1, previous_row[j] + (c1 != c2)))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def _reference_similarity(str1: str, str2: str) -> float:
+    """打ち切りのない参照実装による会議名の類似度."""
+    if not str1 or not str2:
+        return 0.0
+    s1 = str1.lower()
+    s2 = str2.lower()
+    if s1 == s2:
+        return 1.0
+    if s1 in s2 or s2 in s1:
+        return min(len(s1), len(s2)) / max(len(s1), len(s2))
+    return max(0.0, 1.0 - (_reference_levenshtein(s1, s2) / max(len(s1), len(s2))))
+
+
+class TestLevenshteinDistance:
+    """ビット並列Levenshtein距離のテスト."""
+
+    @pytest.mark.parametrize(
+        ("s1", "s2", "expected"),
+        [
+            ("kitten", "sitting", 3),
+            ("", "abc", 3),
+            ("abc", "", 3),
+            ("定例mtg - 2026/10/17", "定例mtg", 13),
+            ("週次定例", "週時定例", 1),
+        ],
+    )
+    def test_known_distances(self, s1: str, s2: str, expected: int) -> None:
+        """既知の距離を返すこと."""
+        assert _levenshtein_distance(s1, s2) == expected
+
+    def test_matches_reference_on_random_strings(self) -> None:
+        """64文字を超える文字列やUnicodeを含めて参照実装と一致すること."""
+        rng = random.Random(1)  # noqa: S311
+        alphabet = "abc定例会議 -0123"
+        for _ in range(300):
+            s1 = "".join(rng.choices(alphabet, k=rng.randint(0, 90)))
+            s2 = "".join(rng.choices(alphabet, k=rng.randint(0, 90)))
+            assert _levenshtein_distance(s1, s2) == _reference_levenshtein(s1, s2)
+
+    def test_cutoff(self) -> None:
+        """打ち切り距離を超える場合はmax_distance + 1を返し、以内なら正確な距離を返すこと."""
+        rng = random.Random(2)  # noqa: S311
+        for _ in range(300):
+            s1 = "".join(rng.choices("abcd", k=rng.randint(0, 40)))
+            s2 = "".join(rng.choices("abcd", k=rng.randint(0, 40)))
+            max_distance = rng.randint(0, 30)
+            expected = _reference_levenshtein(s1, s2)
+            assert _levenshtein_distance(s1, s2, max_distance) == min(expected, max_distance + 1)
+
 
 class TestTimeMatching:
     """AC14: 日時比較のテスト."""
@@ -169,3 +263,120 @@ class TestMatchConfidence:
             transcript_speakers=["unknown"],  # 不一致 → 0
         )
         assert name_only == pytest.approx(0.4, abs=0.05)
+
+
+class TestBatchMatcher:
+    """BatchMatcherのテスト."""
+
+    def test_scores_identical_to_pairwise(self) -> None:
+        """行列計算の信頼度がcalculate_match_confidenceと完全に一致すること."""
+        rng = random.Random(0)  # noqa: S311
+        base = datetime(2026, 2, 1, 10, 0)
+        words = ["Weekly", "Standup", "定例", "1on1", "Sync", "Review", "MTG"]
+        users = ["alice", "bob", "carol", "dave", "eve"]
+        meetings = [
+            (
+                " ".join(rng.sample(words, 2)),
+                base + timedelta(minutes=rng.randint(-3000, 3000)),
+                [f"{u}@example.com" for u in rng.sample(users, rng.randint(0, 3))],
+            )
+            for _ in range(12)
+        ]
+        documents = [
+            (
+                " ".join(rng.sample(words, 3)),
+                base + timedelta(seconds=rng.randint(-200000, 200000), microseconds=rng.randint(0, 999999)),
+                rng.sample(users, rng.randint(0, 4)),
+            )
+            for _ in range(15)
+        ]
+
+        matcher = BatchMatcher([MeetingMatchFeatures.from_attendee_emails(*m) for m in meetings])
+        scores = matcher.score([DocumentMatchFeatures.from_speakers(*d) for d in documents])
+
+        for i, (doc_name, doc_created, speakers) in enumerate(documents):
+            for j, (title, event_datetime, attendees) in enumerate(meetings):
+                expected = calculate_match_confidence(doc_name, doc_created, title, event_datetime, attendees, speakers)
+                assert scores[i, j] == expected
+
+    def test_low_name_similarity_keeps_reference_score(self) -> None:
+        """類似度の低い会議名でも参照実装と同じ信頼度を返し、紐付け候補から外さないこと."""
+        doc_created = datetime(2026, 2, 1, 10, 0)
+        event_datetime = datetime(2026, 4, 1, 10, 0)
+
+        confidence = calculate_match_confidence("abcdefghij", doc_created, "abxxxxxxxx", event_datetime, [], [])
+        matches = BatchMatcher(
+            [MeetingMatchFeatures.from_attendee_emails("abxxxxxxxx", event_datetime, [])]
+        ).best_matches([DocumentMatchFeatures.from_speakers("abcdefghij", doc_created, [])])
+
+        # 距離8 / 10文字 → 類似度0.2 → 0.2 * 0.4
+        assert confidence == pytest.approx(0.08)
+        assert matches == [(0, confidence)]
+
+    def test_scores_identical_to_reference_similarity(self) -> None:
+        """会議名の類似度が打ち切りのない参照実装で計算した場合と一致すること."""
+        rng = random.Random(4)  # noqa: S311
+        now = datetime(2026, 2, 1, 10, 0)
+        titles = ["".join(rng.choices("abcdef ", k=rng.randint(1, 20))) for _ in range(10)]
+        names = ["".join(rng.choices("abcdef ", k=rng.randint(1, 20))) for _ in range(10)]
+
+        matcher = BatchMatcher([MeetingMatchFeatures.from_attendee_emails(t, now, []) for t in titles])
+        scores = matcher.score([DocumentMatchFeatures.from_speakers(n, now, []) for n in names])
+
+        for i, name in enumerate(names):
+            for j, title in enumerate(titles):
+                expected = _reference_similarity(name, title) * 0.4 + 1.0 * 0.3
+                assert scores[i, j] == pytest.approx(expected)
+                assert calculate_match_confidence(name, now, title, now, [], []) == scores[i, j]
+
+    def test_compares_with_nearest_occurrence(self) -> None:
+        """開催日時がある場合は最も近い開催日時と比較した場合と一致すること."""
+        base = datetime(2026, 1, 5, 10, 0)
+        occurrences = [base + timedelta(weeks=i) for i in range(10)]
+        meeting = MeetingMatchFeatures.from_attendee_emails(
+            "Weekly Standup", occurrences[-1], ["user1@example.com"], occurrences
+        )
+        created = [base + timedelta(days=d, hours=h) for d in (-3, 0, 15, 40, 90) for h in (-5, 1, 13)]
+
+        scores = BatchMatcher([meeting]).score(
+            [DocumentMatchFeatures.from_speakers("Weekly Standup", c, ["user1"]) for c in created]
+        )
+
+        for row, doc_created in enumerate(created):
+            gaps = [abs(o - doc_created) for o in occurrences]
+            nearest = occurrences[gaps.index(min(gaps))]
+            expected = calculate_match_confidence(
+                "Weekly Standup", doc_created, "Weekly Standup", nearest, ["user1@example.com"], ["user1"]
+            )
+            assert scores[row, 0] == expected
+
+    def test_best_matches_picks_first_highest(self) -> None:
+        """最も高い定例MTGを選び、同点の場合は先頭を選ぶこと."""
+        now = datetime(2026, 2, 1, 10, 0)
+        matcher = BatchMatcher(
+            [
+                MeetingMatchFeatures.from_attendee_emails("Weekly Standup", now, ["user1@example.com"]),
+                MeetingMatchFeatures.from_attendee_emails("Weekly Standup", now, ["user1@example.com"]),
+                MeetingMatchFeatures.from_attendee_emails("Budget Review", now, []),
+            ]
+        )
+
+        matches = matcher.best_matches([DocumentMatchFeatures.from_speakers("Weekly Standup", now, ["user1"])])
+
+        assert len(matches) == 1
+        assert matches[0] is not None
+        index, score = matches[0]
+        assert index == 0
+        assert score == pytest.approx(1.0)
+
+    def test_best_matches_none_when_no_score(self) -> None:
+        """どの定例MTGとも一致しない場合はNoneを返すこと."""
+        now = datetime(2026, 2, 1, 10, 0)
+        matcher = BatchMatcher([MeetingMatchFeatures.from_attendee_emails("ABC", now, [])])
+
+        matches = matcher.best_matches(
+            [DocumentMatchFeatures.from_speakers("XYZ", now + timedelta(hours=48), ["someone"])]
+        )
+
+        assert matches == [None]
+        assert BatchMatcher([]).best_matches([DocumentMatchFeatures.from_speakers("XYZ", now, [])]) == [None]
@@ -6,8 +6,10 @@ AC12: テキスト取得・構造化
 from src.domain.services.transcript_parser import (
     TRANSCRIPT_PATTERN,
     extract_speakers,
+    iter_transcript_entries,
     parse_to_structured_data,
     parse_transcript,
+    parse_transcript_with_stats,
 )
 
 
@@ -135,3 +137,44 @@ class TestExtractSpeakers:
         """話者がいない場合は空リストを返す."""
         speakers = extract_speakers("")
         assert speakers == []
+
+
+class TestParseTranscriptWithStats:
+    """parse_transcript_with_stats関数のテスト."""
+
+    def test_collects_entries_speakers_and_stats(self) -> None:
+        """発話・話者・発話回数・時間範囲を1回の走査で取得する."""
+        raw_text = """田中 (23:50)
+発言1
+
+鈴木 (23:55)
+発言2
+
+田中 (00:10)
+発言3"""
+
+        result = parse_transcript_with_stats(raw_text)
+
+        assert result.entries == parse_transcript(raw_text)
+        assert result.speakers == ["田中", "鈴木"]
+        assert result.turn_counts == {"田中": 2, "鈴木": 1}
+        assert (result.first_timestamp, result.last_timestamp) == ("23:50", "00:10")
+        assert result.duration_minutes == 20
+        assert result.to_structured_data() == parse_to_structured_data(raw_text)
+
+    def test_empty_result(self) -> None:
+        """発話がない場合は空の結果を返す."""
+        result = parse_transcript_with_stats("invalid text without pattern")
+
+        assert result.entries == []
+        assert result.duration_minutes is None
+        assert result.to_structured_data() is None
+
+    def test_iterates_lazily(self) -> None:
+        """発話を先頭から順に返す."""
+        raw_text = "\n\n".join(f"話者{i} (10:{i:02d})\n発言{i}" for i in range(50))
+
+        entries = iter_transcript_entries(raw_text)
+
+        assert next(entries).text == "発言0"
+        assert next(entries).speaker == "話者1"
@@ -16,6 +16,7 @@ from src.application.use_cases.transcript_use_cases import (
     GetTranscriptsByDateRangeUseCase,
     GetTranscriptsByRecurringMeetingUseCase,
     GetTranscriptsNeedingConfirmationUseCase,
+    GetTranscriptSummariesUseCase,
     GetTranscriptUseCase,
 )
 from src.domain.entities.meeting_transcript import (
@@ -140,7 +141,7 @@ class TestGetTranscriptsByRecurringMeetingUseCase:
 
         # Assert
         assert result == transcripts
-        mock_repository.get_by_recurring_meeting.assert_called_once_with(recurring_meeting_id, None)
+        mock_repository.get_by_recurring_meeting.assert_called_once_with(recurring_meeting_id, None, cursor=None)
 
     @pytest.mark.asyncio
     async def test_get_transcripts_with_limit(
@@ -158,7 +159,7 @@ class TestGetTranscriptsByRecurringMeetingUseCase:
 
         # Assert
         assert result == transcripts
-        mock_repository.get_by_recurring_meeting.assert_called_once_with(recurring_meeting_id, 5)
+        mock_repository.get_by_recurring_meeting.assert_called_once_with(recurring_meeting_id, 5, cursor=None)
 
 
 class TestGetTranscriptsByDateRangeUseCase:
@@ -226,25 +227,22 @@ class TestGetTranscriptsNeedingConfirmationUseCase:
     async def test_get_transcripts_needing_confirmation(
         self,
         mock_repository: MagicMock,
-        sample_transcript: MeetingTranscript,
         low_confidence_transcript: MeetingTranscript,
     ) -> None:
-        """手動確認が必要なトランスクリプトのみを返すこと."""
+        """手動確認が必要なものへの絞り込みをリポジトリに委ねること."""
         # Arrange
-        # sample_transcript: match_confidence=0.85 (自動紐付け)
-        # low_confidence_transcript: match_confidence=0.5 (手動確認必要)
-        all_transcripts = [sample_transcript, low_confidence_transcript]
-        mock_repository.get_by_recurring_meeting = AsyncMock(return_value=all_transcripts)
+        mock_repository.get_by_recurring_meeting = AsyncMock(return_value=[low_confidence_transcript])
         use_case = GetTranscriptsNeedingConfirmationUseCase(mock_repository)
-        recurring_meeting_id = sample_transcript.recurring_meeting_id
+        recurring_meeting_id = low_confidence_transcript.recurring_meeting_id
 
         # Act
         result = await use_case.execute(recurring_meeting_id)
 
         # Assert
-        assert len(result) == 1
-        assert result[0] == low_confidence_transcript
-        assert result[0].needs_manual_confirmation() is True
+        assert result == [low_confidence_transcript]
+        mock_repository.get_by_recurring_meeting.assert_called_once_with(
+            recurring_meeting_id, None, needs_confirmation_only=True
+        )
 
     @pytest.mark.asyncio
     async def test_get_transcripts_needing_confirmation_empty(
@@ -254,8 +252,7 @@ class TestGetTranscriptsNeedingConfirmationUseCase:
     ) -> None:
         """手動確認が必要なトランスクリプトがない場合は空リストを返すこと."""
         # Arrange
-        all_transcripts = [sample_transcript]  # match_confidence=0.85
-        mock_repository.get_by_recurring_meeting = AsyncMock(return_value=all_transcripts)
+        mock_repository.get_by_recurring_meeting = AsyncMock(return_value=[])
         use_case = GetTranscriptsNeedingConfirmationUseCase(mock_repository)
         recurring_meeting_id = sample_transcript.recurring_meeting_id
 
@@ -264,3 +261,23 @@ class TestGetTranscriptsNeedingConfirmationUseCase:
 
         # Assert
         assert len(result) == 0
+
+
+class TestGetTranscriptSummariesUseCase:
+    """GetTranscriptSummariesUseCaseのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_get_summaries(self, mock_repository: MagicMock) -> None:
+        """条件をそのままリポジトリに渡すこと."""
+        # Arrange
+        user_id = uuid4()
+        recurring_meeting_id = uuid4()
+        mock_repository.get_summaries = AsyncMock(return_value=[])
+        use_case = GetTranscriptSummariesUseCase(mock_repository)
+
+        # Act
+        result = await use_case.execute(user_id, recurring_meeting_id, needs_confirmation_only=True, limit=20)
+
+        # Assert
+        assert result == []
+        mock_repository.get_summaries.assert_called_once_with(user_id, recurring_meeting_id, True, 20, None)
@@ -4,7 +4,7 @@
 import { useState } from 'react'
 import { Button, Modal } from '../../components/ui'
 import { AgendaEditor } from './AgendaEditor'
-import { useGenerateAgenda } from './hooks'
+import { useAgendaDraft, useGenerateAgenda } from './hooks'
 import type { Agenda, DataSourcesInfo } from './types'
 
 interface Props {
@@ -45,16 +45,24 @@ export function AgendaGeneratePage({ agentId, onClose }: Props) {
   const [generatedAgenda, setGeneratedAgenda] = useState<Agenda | null>(null)
   const [dataSources, setDataSources] = useState<DataSourcesInfo | null>(null)
   const [error, setError] = useState<string | null>(null)
+  const [draftDismissed, setDraftDismissed] = useState(false)
 
   const generateMutation = useGenerateAgenda()
+  const draftQuery = useAgendaDraft(agentId)
 
-  const handleGenerate = async () => {
+  // 次回開催に向けて事前生成した下書きがあれば、生成を待たずに表示する
+  const draft = draftDismissed || generatedAgenda ? null : (draftQuery.data ?? null)
+  const shownAgenda = generatedAgenda ?? draft?.agenda ?? null
+  const shownDataSources = draft ? draft.data_sources : dataSources
+
+  const handleGenerate = async (force = false) => {
     setError(null)
+    setDraftDismissed(true)
     setGeneratedAgenda(null)
     setDataSources(null)
 
     try {
-      const result = await generateMutation.mutateAsync({ agent_id: agentId })
+      const result = await generateMutation.mutateAsync({ agent_id: agentId, force })
       setGeneratedAgenda(result.agenda)
       setDataSources(result.data_sources)
     } catch (err) {
@@ -68,10 +76,10 @@ export function AgendaGeneratePage({ agentId, onClose }: Props) {
     <Modal
       isOpen
       onClose={onClose}
-      title={generatedAgenda ? 'アジェンダが生成されました' : 'アジェンダを生成'}
+      title={draft ? '事前に生成したアジェンダ' : generatedAgenda ? 'アジェンダが生成されました' : 'アジェンダを生成'}
       size="lg"
     >
-      {!generatedAgenda ? (
+      {!shownAgenda ? (
         <div
           style={{
             textAlign: 'center',
@@ -163,7 +171,7 @@ export function AgendaGeneratePage({ agentId, onClose }: Props) {
             </div>
           ) : (
             /* Main CTA - One Button Experience */
-            <Button size="lg" onClick={handleGenerate}>
+            <Button size="lg" onClick={() => handleGenerate()}>
               <span style={{ marginRight: 'var(--space-2)', fontSize: '20px' }}>✨</span>
               アジェンダを生成する
             </Button>
@@ -171,8 +179,51 @@ export function AgendaGeneratePage({ agentId, onClose }: Props) {
         </div>
       ) : (
         <div className="animate-fade-in">
+          {/* Pre-generated draft */}
+          {draft && (
+            <div
+              style={{
+                display: 'flex',
+                alignItems: 'center',
+                justifyContent: 'space-between',
+                gap: 'var(--space-3)',
+                marginBottom: 'var(--space-4)',
+                fontSize: 'var(--font-size-sm)',
+                color: 'var(--color-warm-gray-600)',
+              }}
+            >
+              <span>
+                {new Date(draft.target_date).toLocaleString('ja-JP')} の開催に向けて
+                {new Date(draft.generated_at).toLocaleString('ja-JP')} に生成しました
+              </span>
+              <Button variant="secondary" size="sm" onClick={() => handleGenerate()}>
+                最新の情報で再生成
+              </Button>
+            </div>
+          )}
+
+          {/* Reused agenda (inputs unchanged since the last generation) */}
+          {shownDataSources?.reused && (
+            <div
+              style={{
+                display: 'flex',
+                alignItems: 'center',
+                justifyContent: 'space-between',
+                gap: 'var(--space-3)',
+                marginBottom: 'var(--space-4)',
+                fontSize: 'var(--font-size-sm)',
+                color: 'var(--color-warm-gray-600)',
+              }}
+            >
+              <span>前回の生成から情報が更新されていないため、前回のアジェンダを表示しています</span>
+              <Button variant="secondary" size="sm" onClick={() => handleGenerate(true)}>
+                それでも再生成
+              </Button>
+            </div>
+          )}
+
           {/* Data Sources Summary */}
-          {dataSources && (
+          {shownDataSources && !shownDataSources.reused && (
             <div
               style={{
                 marginBottom: 'var(--space-6)',
@@ -190,6 +241,11 @@ export function AgendaGeneratePage({ agentId, onClose }: Props) {
                 }}
               >
                 使用したデータソース
+                {shownDataSources.incremental && (
+                  <span style={{ fontWeight: 400, marginLeft: 'var(--space-2)' }}>
+                    （前回のアジェンダを新しい情報だけで更新しました）
+                  </span>
+                )}
               </p>
               <div
                 style={{
@@ -200,26 +256,26 @@ export function AgendaGeneratePage({ agentId, onClose }: Props) {
               >
                 <DataSourceBadge
                   label="ナレッジ"
-                  value={dataSources.has_knowledge ? '参照済' : 'なし'}
-                  active={dataSources.has_knowledge}
+                  value={shownDataSources.has_knowledge ? '参照済' : 'なし'}
+                  active={shownDataSources.has_knowledge}
                 />
                 <DataSourceBadge
                   label="議事録"
-                  value={dataSources.has_transcripts ? `${dataSources.transcript_count}件` : 'なし'}
-                  active={dataSources.has_transcripts}
+                  value={shownDataSources.has_transcripts ? `${shownDataSources.transcript_count}件` : 'なし'}
+                  active={shownDataSources.has_transcripts}
                 />
                 <DataSourceBadge
                   label="Slackメッセージ"
-                  value={dataSources.has_slack_messages ? `${dataSources.slack_message_count}件` : 'なし'}
-                  active={dataSources.has_slack_messages}
+                  value={shownDataSources.has_slack_messages ? `${shownDataSources.slack_message_count}件` : 'なし'}
+                  active={shownDataSources.has_slack_messages}
                 />
                 <DataSourceBadge
                   label="辞書エントリ"
-                  value={`${dataSources.dictionary_entry_count}件`}
-                  active={dataSources.dictionary_entry_count > 0}
+                  value={`${shownDataSources.dictionary_entry_count}件`}
+                  active={shownDataSources.dictionary_entry_count > 0}
                 />
               </div>
-              {dataSources.slack_error && (
+              {shownDataSources.slack_error && (
                 <div
                   style={{
                     marginTop: 'var(--space-3)',
@@ -231,14 +287,14 @@ export function AgendaGeneratePage({ agentId, onClose }: Props) {
                     color: 'var(--color-warning-700)',
                   }}
                 >
-                  ⚠️ {dataSources.slack_error}
+                  ⚠️ {shownDataSources.slack_error}
                 </div>
               )}
             </div>
           )}
 
           {/* Editor */}
-          <AgendaEditor agenda={generatedAgenda} onSaved={onClose} onCancel={onClose} />
+          <AgendaEditor key={shownAgenda.id} agenda={shownAgenda} onSaved={onClose} onCancel={onClose} />
         </div>
       )}
     </Modal>
@@ -3,7 +3,7 @@
  */
 
 import { apiClient } from '../../lib/api-client'
-import type { Agenda, AgendaGenerateRequest, AgendaGenerateResponse, AgendaUpdate } from './types'
+import type { Agenda, AgendaDraft, AgendaGenerateRequest, AgendaGenerateResponse, AgendaUpdate } from './types'
 
 const BASE_PATH = '/api/v1/agendas'
 
@@ -14,6 +14,11 @@ export async function generateAgenda(data: AgendaGenerateRequest): Promise<Agend
   })
 }
 
+export async function getAgendaDraft(agentId: string): Promise<AgendaDraft | null> {
+  const params = new URLSearchParams({ agent_id: agentId })
+  return apiClient<AgendaDraft | null>(`${BASE_PATH}/draft?${params.toString()}`)
+}
+
 export async function getAgendas(agentId: string, limit?: number): Promise<Agenda[]> {
   const params = new URLSearchParams({ agent_id: agentId })
   if (limit) {
@@ -3,7 +3,7 @@
  */
 
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
-import { deleteAgenda, generateAgenda, getAgenda, getAgendas, updateAgenda } from './api'
+import { deleteAgenda, generateAgenda, getAgenda, getAgendaDraft, getAgendas, updateAgenda } from './api'
 import type { AgendaGenerateRequest, AgendaUpdate } from './types'
 
 export const agendaKeys = {
@@ -12,6 +12,7 @@ export const agendaKeys = {
   list: (agentId: string) => [...agendaKeys.lists(), agentId] as const,
   details: () => [...agendaKeys.all, 'detail'] as const,
   detail: (id: string) => [...agendaKeys.details(), id] as const,
+  draft: (agentId: string) => [...agendaKeys.all, 'draft', agentId] as const,
 }
 
 export function useAgendas(agentId: string, limit?: number) {
@@ -30,6 +31,14 @@ export function useAgenda(id: string) {
   })
 }
 
+export function useAgendaDraft(agentId: string) {
+  return useQuery({
+    queryKey: agendaKeys.draft(agentId),
+    queryFn: () => getAgendaDraft(agentId),
+    enabled: !!agentId,
+  })
+}
+
 export function useGenerateAgenda() {
   const queryClient = useQueryClient()
 
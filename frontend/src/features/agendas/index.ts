@@ -6,8 +6,23 @@
 export { AgendaEditor } from './AgendaEditor'
 export { AgendaGeneratePage } from './AgendaGeneratePage'
 // API
-export { deleteAgenda, generateAgenda, getAgenda, getAgendas, updateAgenda } from './api'
+export { deleteAgenda, generateAgenda, getAgenda, getAgendaDraft, getAgendas, updateAgenda } from './api'
 // Hooks
-export { agendaKeys, useAgenda, useAgendas, useDeleteAgenda, useGenerateAgenda, useUpdateAgenda } from './hooks'
+export {
+  agendaKeys,
+  useAgenda,
+  useAgendaDraft,
+  useAgendas,
+  useDeleteAgenda,
+  useGenerateAgenda,
+  useUpdateAgenda,
+} from './hooks'
 // Types
-export type { Agenda, AgendaGenerateRequest, AgendaGenerateResponse, AgendaUpdate, DataSourcesInfo } from './types'
+export type {
+  Agenda,
+  AgendaDraft,
+  AgendaGenerateRequest,
+  AgendaGenerateResponse,
+  AgendaUpdate,
+  DataSourcesInfo,
+} from './types'
@@ -14,6 +14,8 @@ export interface Agenda {
 
 export interface AgendaGenerateRequest {
   agent_id: string
+  // 入力が前回の生成から変わっていなくても生成し直す
+  force?: boolean
 }
 
 export interface AgendaUpdate {
@@ -28,9 +30,21 @@ export interface DataSourcesInfo {
   has_transcripts: boolean
   transcript_count: number
   slack_error: string | null
+  // 入力が前回の生成から変わっていないため、前回のアジェンダを返した
+  reused?: boolean
+  // 前回のアジェンダを、その後に追加された情報だけで更新した
+  incremental?: boolean
 }
 
 export interface AgendaGenerateResponse {
   agenda: Agenda
   data_sources: DataSourcesInfo
 }
+
+export interface AgendaDraft {
+  recurring_meeting_id: string
+  target_date: string
+  agenda: Agenda
+  data_sources: DataSourcesInfo | null
+  generated_at: string
+}
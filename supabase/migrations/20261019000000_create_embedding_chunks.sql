@@ -0,0 +1,113 @@
+-- embedding_chunks テーブル
+-- ナレッジ・トランスクリプト・Slackメッセージをチャンク分割した埋め込みインデックス
+-- アジェンダ生成時に未決事項と関連する過去の議論を類似検索するために使用
+
+CREATE EXTENSION IF NOT EXISTS vector WITH SCHEMA extensions;
+
+CREATE TABLE public.embedding_chunks (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    agent_id UUID REFERENCES public.agents(id) ON DELETE CASCADE,
+    recurring_meeting_id UUID REFERENCES public.recurring_meetings(id) ON DELETE CASCADE,
+    source_type TEXT NOT NULL CHECK (source_type IN ('knowledge', 'transcript', 'slack')),
+    -- knowledge/meeting_transcriptsのID、Slackは"チャンネルID:ts"
+    source_id TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    speaker TEXT,
+    entry_timestamp TEXT,
+    source_date TIMESTAMPTZ,
+    embedding extensions.vector(1024) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE(user_id, source_type, source_id, chunk_index)
+);
+
+-- RLSポリシー
+ALTER TABLE public.embedding_chunks ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can manage own embedding chunks" ON public.embedding_chunks
+    FOR ALL USING ((SELECT auth.uid()) = user_id);
+
+-- インデックス
+-- Titan Embeddingsは正規化済みベクトルを返すためコサイン距離で検索する
+CREATE INDEX idx_embedding_chunks_embedding ON public.embedding_chunks
+    USING hnsw (embedding extensions.vector_cosine_ops);
+CREATE INDEX idx_embedding_chunks_source ON public.embedding_chunks(user_id, source_type, source_id);
+CREATE INDEX idx_embedding_chunks_agent_id ON public.embedding_chunks(agent_id);
+CREATE INDEX idx_embedding_chunks_recurring_meeting_id ON public.embedding_chunks(recurring_meeting_id);
+
+-- 類似検索関数
+-- p_agent_idに紐づくチャンク、またはp_recurring_meeting_idsのいずれかに紐づくチャンクを対象とする
+-- どちらも指定しない場合はユーザーの全チャンクが対象
+CREATE OR REPLACE FUNCTION public.match_embedding_chunks(
+    query_embedding extensions.vector(1024),
+    p_user_id UUID,
+    p_agent_id UUID DEFAULT NULL,
+    p_recurring_meeting_ids UUID[] DEFAULT NULL,
+    match_count INTEGER DEFAULT 8
+)
+RETURNS TABLE (
+    id UUID,
+    user_id UUID,
+    agent_id UUID,
+    recurring_meeting_id UUID,
+    source_type TEXT,
+    source_id TEXT,
+    chunk_index INTEGER,
+    content TEXT,
+    speaker TEXT,
+    entry_timestamp TEXT,
+    source_date TIMESTAMPTZ,
+    created_at TIMESTAMPTZ,
+    similarity DOUBLE PRECISION
+)
+LANGUAGE sql
+STABLE
+SET search_path = public, extensions
+AS $$
+    SELECT
+        c.id,
+        c.user_id,
+        c.agent_id,
+        c.recurring_meeting_id,
+        c.source_type,
+        c.source_id,
+        c.chunk_index,
+        c.content,
+        c.speaker,
+        c.entry_timestamp,
+        c.source_date,
+        c.created_at,
+        1 - (c.embedding <=> query_embedding) AS similarity
+    FROM public.embedding_chunks c
+    WHERE c.user_id = p_user_id
+      AND (
+          (p_agent_id IS NULL AND p_recurring_meeting_ids IS NULL)
+          OR c.agent_id = p_agent_id
+          OR c.recurring_meeting_id = ANY(p_recurring_meeting_ids)
+      )
+    ORDER BY c.embedding <=> query_embedding
+    LIMIT match_count;
+$$;
+
+-- 元データ削除時にチャンクも削除する
+CREATE OR REPLACE FUNCTION public.delete_embedding_chunks_for_source()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+    DELETE FROM public.embedding_chunks
+    WHERE source_type = TG_ARGV[0]
+      AND source_id = OLD.id::TEXT;
+    RETURN OLD;
+END;
+$$;
+
+CREATE TRIGGER delete_knowledge_embedding_chunks
+    AFTER DELETE ON public.knowledge
+    FOR EACH ROW EXECUTE FUNCTION public.delete_embedding_chunks_for_source('knowledge');
+
+CREATE TRIGGER delete_meeting_transcript_embedding_chunks
+    AFTER DELETE ON public.meeting_transcripts
+    FOR EACH ROW EXECUTE FUNCTION public.delete_embedding_chunks_for_source('transcript');
@@ -0,0 +1,14 @@
+-- embedding_cache テーブル
+-- 正規化済みテキストのハッシュ（モデルID・次元数を含む）をキーに埋め込みベクトルをキャッシュ
+-- 同じテキストの再取り込み・バックフィルでBedrockを呼び出さないために使用
+
+CREATE TABLE public.embedding_cache (
+    content_hash TEXT NOT NULL,
+    dimensions INTEGER NOT NULL CHECK (dimensions IN (256, 512, 1024)),
+    embedding REAL[] NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (content_hash, dimensions)
+);
+
+-- RLS（ユーザーに紐づかないためサーバー（service key）からのみアクセスする）
+ALTER TABLE public.embedding_cache ENABLE ROW LEVEL SECURITY;
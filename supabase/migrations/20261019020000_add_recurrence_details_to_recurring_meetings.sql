@@ -0,0 +1,8 @@
+-- recurring_meetings に繰り返しルールの展開に必要な情報を追加
+-- next_occurrence だけでは過去の開催日時が分からないため、
+-- DTSTART・タイムゾーン・EXDATE を保存してアプリ側でRRULEを展開する
+
+ALTER TABLE public.recurring_meetings
+    ADD COLUMN start_datetime TIMESTAMPTZ,
+    ADD COLUMN timezone TEXT,
+    ADD COLUMN exdates TIMESTAMPTZ[] NOT NULL DEFAULT '{}';
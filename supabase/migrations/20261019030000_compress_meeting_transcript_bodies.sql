@@ -0,0 +1,18 @@
+-- meeting_transcripts の本文をzstd圧縮して保存する
+-- 一覧・重複チェックでは本文を取得せず、参照時にアプリ側で取得・展開する
+-- 既存行は raw_text のまま残し、新規作成・更新時に圧縮列へ移す
+
+ALTER TABLE public.meeting_transcripts
+    ALTER COLUMN raw_text DROP NOT NULL,
+    ADD COLUMN raw_text_compressed TEXT,                       -- base64エンコードしたzstdフレーム
+    ADD COLUMN raw_text_codec TEXT CHECK (raw_text_codec IN ('zstd')),
+    ADD COLUMN raw_text_dictionary_id BIGINT NOT NULL DEFAULT 0, -- 学習済み辞書のID（辞書なしは0）
+    ADD COLUMN raw_text_size INTEGER;                          -- 圧縮前のUTF-8バイト数
+
+UPDATE public.meeting_transcripts
+SET raw_text_size = octet_length(raw_text)
+WHERE raw_text IS NOT NULL;
+
+ALTER TABLE public.meeting_transcripts
+    ADD CONSTRAINT meeting_transcripts_body_present
+    CHECK (raw_text IS NOT NULL OR raw_text_compressed IS NOT NULL);
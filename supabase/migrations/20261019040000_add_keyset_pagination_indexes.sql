@@ -0,0 +1,23 @@
+-- 一覧APIのキーセットページネーション用の複合インデックス
+-- 各一覧は (日付, id) の降順で並べ、前ページ最後の行より後ろだけを取得する。
+-- 絞り込み列 + (日付, id) のインデックスがあれば、ページが深くなっても
+-- インデックスの範囲走査だけで済む（OFFSETのような読み飛ばしが発生しない）。
+-- 既存の (agent_id, 日付) のインデックスはこれらで代替できるため削除する。
+
+-- GET /agendas
+CREATE INDEX IF NOT EXISTS idx_agendas_agent_user_generated_at
+    ON public.agendas(agent_id, user_id, generated_at DESC, id DESC);
+DROP INDEX IF EXISTS public.idx_agendas_generated_at;
+
+-- GET /knowledge
+CREATE INDEX IF NOT EXISTS idx_knowledge_agent_user_meeting_date
+    ON public.knowledge(agent_id, user_id, meeting_date DESC, id DESC);
+DROP INDEX IF EXISTS public.idx_knowledge_meeting_date;
+
+-- GET /transcripts, GET /transcripts/summaries?recurring_meeting_id=...
+CREATE INDEX IF NOT EXISTS idx_meeting_transcripts_recurring_meeting_date
+    ON public.meeting_transcripts(recurring_meeting_id, meeting_date DESC, id DESC);
+
+-- GET /dictionary
+CREATE INDEX IF NOT EXISTS idx_dictionary_entries_user_created_at
+    ON public.dictionary_entries(user_id, created_at DESC, id DESC);
@@ -0,0 +1,65 @@
+-- リポジトリのクエリ形状に合わせた複合・部分インデックス
+-- 各 *RepositoryImpl の絞り込み列 + 並び順の列をまとめて1本のインデックスで
+-- 引けるようにし、先頭列が同じ単一列インデックスは削除する。
+-- backend/tests/infrastructure/repositories/test_query_plans.py が
+-- これらのクエリでシーケンシャルスキャンにならないことを検証する。
+
+-- meeting_transcripts ------------------------------------------------------
+
+-- get_by_google_doc_id / exists_by_google_doc_id（同期時の重複チェック）
+-- UNIQUE(recurring_meeting_id, google_doc_id) は先頭列が違うため使えない
+CREATE INDEX IF NOT EXISTS idx_meeting_transcripts_google_doc_id
+    ON public.meeting_transcripts(google_doc_id);
+
+-- get_needing_confirmation / get_summaries(needs_confirmation_only=True)
+-- 手動確認待ち（信頼度0.7未満）は全体のごく一部なので部分インデックスにする
+CREATE INDEX IF NOT EXISTS idx_meeting_transcripts_needing_confirmation
+    ON public.meeting_transcripts(recurring_meeting_id, meeting_date DESC, id DESC)
+    WHERE match_confidence < 0.7;
+
+-- (recurring_meeting_id, meeting_date DESC, id DESC) で代替できる
+DROP INDEX IF EXISTS public.idx_meeting_transcripts_recurring_meeting_id;
+DROP INDEX IF EXISTS public.idx_meeting_transcripts_meeting_date;
+
+-- recurring_meetings -------------------------------------------------------
+
+-- get_all: user_id で絞り込み next_occurrence 順
+CREATE INDEX IF NOT EXISTS idx_recurring_meetings_user_next_occurrence
+    ON public.recurring_meetings(user_id, next_occurrence);
+
+-- get_list_by_agent_id: agent_id + user_id で絞り込み next_occurrence 順
+CREATE INDEX IF NOT EXISTS idx_recurring_meetings_agent_user_next_occurrence
+    ON public.recurring_meetings(agent_id, user_id, next_occurrence)
+    WHERE agent_id IS NOT NULL;
+
+-- get_unlinked: エージェント未紐付けの定例MTG
+CREATE INDEX IF NOT EXISTS idx_recurring_meetings_unlinked
+    ON public.recurring_meetings(user_id, next_occurrence)
+    WHERE agent_id IS NULL;
+
+DROP INDEX IF EXISTS public.idx_recurring_meetings_user_id;
+DROP INDEX IF EXISTS public.idx_recurring_meetings_next_occurrence;
+
+-- agents -------------------------------------------------------------------
+
+-- get_all: user_id で絞り込み created_at 降順
+CREATE INDEX IF NOT EXISTS idx_agents_user_created_at
+    ON public.agents(user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_agents_user_id;
+
+-- dictionary_entries -------------------------------------------------------
+
+-- find_by_agent_id: agent_id + user_id で絞り込み created_at 降順
+CREATE INDEX IF NOT EXISTS idx_dictionary_entries_agent_user_created_at
+    ON public.dictionary_entries(agent_id, user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_dictionary_entries_agent_id;
+-- (user_id, created_at DESC, id DESC) と UNIQUE(user_id, canonical_name) で代替できる
+DROP INDEX IF EXISTS public.idx_dictionary_entries_user_id;
+
+-- slack_messages -----------------------------------------------------------
+
+-- get_messages_by_channel: integration_id + channel_id で絞り込み posted_at の範囲・昇順
+CREATE INDEX IF NOT EXISTS idx_slack_messages_integration_channel_posted_at
+    ON public.slack_messages(integration_id, channel_id, posted_at);
+DROP INDEX IF EXISTS public.idx_slack_messages_integration_channel;
+DROP INDEX IF EXISTS public.idx_slack_messages_posted_at;
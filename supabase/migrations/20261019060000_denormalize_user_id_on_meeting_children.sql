@@ -0,0 +1,102 @@
+-- meeting_transcripts / generated_agendas に user_id を非正規化する
+-- RLSポリシーの行ごとの EXISTS (recurring_meetings) と、
+-- リポジトリの recurring_meetings!inner(user_id) JOIN をなくし、
+-- user_id 先頭のインデックス1本で引けるようにする。
+-- user_id はトリガーで親の recurring_meetings から設定する（クライアントの値は使わない）。
+
+-- 1. 列の追加とバックフィル ------------------------------------------------
+
+ALTER TABLE public.meeting_transcripts
+    ADD COLUMN user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE;
+ALTER TABLE public.generated_agendas
+    ADD COLUMN user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE;
+
+UPDATE public.meeting_transcripts t
+SET user_id = rm.user_id
+FROM public.recurring_meetings rm
+WHERE rm.id = t.recurring_meeting_id;
+
+UPDATE public.generated_agendas a
+SET user_id = rm.user_id
+FROM public.recurring_meetings rm
+WHERE rm.id = a.recurring_meeting_id;
+
+ALTER TABLE public.meeting_transcripts ALTER COLUMN user_id SET NOT NULL;
+ALTER TABLE public.generated_agendas ALTER COLUMN user_id SET NOT NULL;
+
+-- 2. トリガー ---------------------------------------------------------------
+
+-- 作成時・recurring_meeting_id 変更時に親の user_id をコピーする
+-- RLSで親が見えない場合も正しい値を入れ、所有者の検証はRLSポリシー側で行う
+CREATE OR REPLACE FUNCTION public.set_user_id_from_recurring_meeting()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    SELECT rm.user_id INTO NEW.user_id
+    FROM public.recurring_meetings rm
+    WHERE rm.id = NEW.recurring_meeting_id;
+    RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER set_meeting_transcripts_user_id
+    BEFORE INSERT OR UPDATE OF recurring_meeting_id, user_id ON public.meeting_transcripts
+    FOR EACH ROW EXECUTE FUNCTION public.set_user_id_from_recurring_meeting();
+
+CREATE TRIGGER set_generated_agendas_user_id
+    BEFORE INSERT OR UPDATE OF recurring_meeting_id, user_id ON public.generated_agendas
+    FOR EACH ROW EXECUTE FUNCTION public.set_user_id_from_recurring_meeting();
+
+-- 親の user_id が変わった場合は子に伝播する
+CREATE OR REPLACE FUNCTION public.propagate_recurring_meeting_user_id()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    UPDATE public.meeting_transcripts SET user_id = NEW.user_id WHERE recurring_meeting_id = NEW.id;
+    UPDATE public.generated_agendas SET user_id = NEW.user_id WHERE recurring_meeting_id = NEW.id;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER propagate_recurring_meetings_user_id
+    AFTER UPDATE OF user_id ON public.recurring_meetings
+    FOR EACH ROW
+    WHEN (OLD.user_id IS DISTINCT FROM NEW.user_id)
+    EXECUTE FUNCTION public.propagate_recurring_meeting_user_id();
+
+-- 3. RLSポリシー ------------------------------------------------------------
+
+-- (SELECT auth.uid()) は文ごとに1回だけ評価され、user_id のインデックスで絞り込める
+DROP POLICY IF EXISTS "Users can manage own meeting transcripts" ON public.meeting_transcripts;
+CREATE POLICY "Users can manage own meeting transcripts" ON public.meeting_transcripts
+    FOR ALL USING ((SELECT auth.uid()) = user_id);
+
+DROP POLICY IF EXISTS "Users can manage own generated agendas" ON public.generated_agendas;
+CREATE POLICY "Users can manage own generated agendas" ON public.generated_agendas
+    FOR ALL USING ((SELECT auth.uid()) = user_id);
+
+-- 4. インデックス -----------------------------------------------------------
+
+-- get_summaries / RLS: user_id で絞り込み (meeting_date, id) の降順
+CREATE INDEX IF NOT EXISTS idx_meeting_transcripts_user_meeting_date
+    ON public.meeting_transcripts(user_id, meeting_date DESC, id DESC);
+
+-- get_by_google_doc_id / exists_by_google_doc_id
+DROP INDEX IF EXISTS public.idx_meeting_transcripts_google_doc_id;
+CREATE INDEX IF NOT EXISTS idx_meeting_transcripts_user_google_doc_id
+    ON public.meeting_transcripts(user_id, google_doc_id);
+
+-- get_needing_confirmation: ユーザー単位で引けるよう user_id 先頭にする
+DROP INDEX IF EXISTS public.idx_meeting_transcripts_needing_confirmation;
+CREATE INDEX IF NOT EXISTS idx_meeting_transcripts_needing_confirmation
+    ON public.meeting_transcripts(user_id, meeting_date DESC, id DESC)
+    WHERE match_confidence < 0.7;
+
+CREATE INDEX IF NOT EXISTS idx_generated_agendas_user_target_date
+    ON public.generated_agendas(user_id, target_date DESC);
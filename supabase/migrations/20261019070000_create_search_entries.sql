@@ -0,0 +1,110 @@
+-- search_entries テーブル
+-- トランスクリプト（発話単位）・ナレッジ（チャンク単位）の全文検索インデックス
+-- トランスクリプト本文は圧縮して保存しているため、検索用の本文とtsvectorをここに持つ。
+-- 日本語は語の区切りがないため、アプリ側で文字バイグラムを語彙素とする
+-- tsvector / tsquery を組み立てる（backend/src/domain/services/search_tokenizer.py）。
+
+CREATE EXTENSION IF NOT EXISTS btree_gin WITH SCHEMA extensions;
+
+CREATE TABLE public.search_entries (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    agent_id UUID REFERENCES public.agents(id) ON DELETE SET NULL,
+    recurring_meeting_id UUID REFERENCES public.recurring_meetings(id) ON DELETE CASCADE,
+    source_type TEXT NOT NULL CHECK (source_type IN ('knowledge', 'transcript')),
+    source_id UUID NOT NULL,                 -- knowledge / meeting_transcripts のID
+    entry_index INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    speaker TEXT,
+    entry_timestamp TEXT,
+    source_date TIMESTAMPTZ,
+    search_vector TSVECTOR NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE(user_id, source_type, source_id, entry_index)
+);
+
+-- RLSポリシー
+ALTER TABLE public.search_entries ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can manage own search entries" ON public.search_entries
+    FOR ALL USING ((SELECT auth.uid()) = user_id);
+
+-- インデックス
+-- user_id とバイグラムを1本のGINインデックスで引く（他ユーザーの一致を読まない）
+CREATE INDEX idx_search_entries_user_vector ON public.search_entries
+    USING gin (user_id, search_vector);
+CREATE INDEX idx_search_entries_agent_id ON public.search_entries(agent_id);
+CREATE INDEX idx_search_entries_recurring_meeting_id ON public.search_entries(recurring_meeting_id);
+
+-- 全文検索関数
+-- p_query はバイグラムのtsquery（パーサーを通さないよう ::tsquery でキャストする）
+CREATE OR REPLACE FUNCTION public.search_entries_by_query(
+    p_user_id UUID,
+    p_query TEXT,
+    p_source_type TEXT DEFAULT NULL,
+    p_agent_id UUID DEFAULT NULL,
+    p_recurring_meeting_id UUID DEFAULT NULL,
+    match_count INTEGER DEFAULT 20
+)
+RETURNS TABLE (
+    id UUID,
+    user_id UUID,
+    agent_id UUID,
+    recurring_meeting_id UUID,
+    source_type TEXT,
+    source_id UUID,
+    entry_index INTEGER,
+    content TEXT,
+    speaker TEXT,
+    entry_timestamp TEXT,
+    source_date TIMESTAMPTZ,
+    rank REAL
+)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT
+        e.id,
+        e.user_id,
+        e.agent_id,
+        e.recurring_meeting_id,
+        e.source_type,
+        e.source_id,
+        e.entry_index,
+        e.content,
+        e.speaker,
+        e.entry_timestamp,
+        e.source_date,
+        ts_rank_cd(e.search_vector, q) AS rank
+    FROM public.search_entries e, CAST(p_query AS tsquery) AS q
+    WHERE e.user_id = p_user_id
+      AND e.search_vector @@ q
+      AND (p_source_type IS NULL OR e.source_type = p_source_type)
+      AND (p_agent_id IS NULL OR e.agent_id = p_agent_id)
+      AND (p_recurring_meeting_id IS NULL OR e.recurring_meeting_id = p_recurring_meeting_id)
+    ORDER BY rank DESC, e.source_date DESC NULLS LAST
+    LIMIT match_count;
+$$;
+
+-- 元データ削除時にエントリも削除する
+CREATE OR REPLACE FUNCTION public.delete_search_entries_for_source()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+    DELETE FROM public.search_entries
+    WHERE source_type = TG_ARGV[0]
+      AND source_id = OLD.id;
+    RETURN OLD;
+END;
+$$;
+
+CREATE TRIGGER delete_knowledge_search_entries
+    AFTER DELETE ON public.knowledge
+    FOR EACH ROW EXECUTE FUNCTION public.delete_search_entries_for_source('knowledge');
+
+CREATE TRIGGER delete_meeting_transcript_search_entries
+    AFTER DELETE ON public.meeting_transcripts
+    FOR EACH ROW EXECUTE FUNCTION public.delete_search_entries_for_source('transcript');
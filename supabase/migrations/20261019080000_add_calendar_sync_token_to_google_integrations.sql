@@ -0,0 +1,6 @@
+-- google_integrations にGoogle CalendarのsyncTokenを保存する列を追加
+-- 2回目以降の同期は前回からの変更分だけを取得する。
+-- トークンが失効した場合（410 Gone）はNULLに戻してフル同期する。
+
+ALTER TABLE public.google_integrations
+    ADD COLUMN calendar_sync_token TEXT;
@@ -0,0 +1,27 @@
+-- google_watch_channels テーブル
+-- Google Calendar events.watch / Drive changes.watch のプッシュ通知チャネル
+-- 通知（POST /api/v1/webhooks/google）はユーザーコンテキストなしで届くため、
+-- チャネルIDで引いて token を照合してから対象の連携だけを差分同期する。
+
+CREATE TABLE public.google_watch_channels (
+    id UUID PRIMARY KEY,                      -- Googleに登録したチャネルID
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    integration_id UUID NOT NULL REFERENCES public.google_integrations(id) ON DELETE CASCADE,
+    resource_type TEXT NOT NULL CHECK (resource_type IN ('calendar', 'drive')),
+    resource_id TEXT NOT NULL,                -- Googleが採番した監視対象リソースのID
+    token TEXT NOT NULL,                      -- 通知の検証用トークン（X-Goog-Channel-Token）
+    expiration TIMESTAMPTZ NOT NULL,
+    page_token TEXT,                          -- Drive changes.list の続きのページトークン
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- RLSポリシー
+ALTER TABLE public.google_watch_channels ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can manage own watch channels" ON public.google_watch_channels
+    FOR ALL USING ((SELECT auth.uid()) = user_id);
+
+-- インデックス
+CREATE INDEX idx_google_watch_channels_integration ON public.google_watch_channels(integration_id, resource_type);
+CREATE INDEX idx_google_watch_channels_expiration ON public.google_watch_channels(expiration);
+CREATE INDEX idx_google_watch_channels_user_id ON public.google_watch_channels(user_id);
@@ -0,0 +1,66 @@
+-- agenda_jobs テーブル
+-- アジェンダ生成ジョブのキュー。POST /api/v1/agendas/generate で登録し、
+-- ワーカー（APIプロセス内 / scripts/run_agenda_worker.py）が claim_agenda_job で取得して実行する。
+-- 外部のメッセージブローカーを使わず、FOR UPDATE SKIP LOCKED で複数ワーカーに配る。
+
+CREATE TABLE public.agenda_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    agent_id UUID NOT NULL REFERENCES public.agents(id) ON DELETE CASCADE,
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    stage TEXT CHECK (stage IN ('gathering', 'slack', 'llm', 'persist')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),  -- リトライ時はバックオフ後の日時
+    locked_by TEXT,                                -- 実行中のワーカー
+    agenda_id UUID REFERENCES public.agendas(id) ON DELETE SET NULL,
+    result JSONB,                                  -- 生成に使ったデータソースの情報
+    error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- 段階の更新ごとに進む（ワーカーの生存確認）
+    finished_at TIMESTAMPTZ
+);
+
+-- RLSポリシー
+ALTER TABLE public.agenda_jobs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own agenda jobs" ON public.agenda_jobs
+    FOR SELECT USING ((SELECT auth.uid()) = user_id);
+
+-- インデックス
+-- 実行待ち・実行中のジョブだけを載せる（完了したジョブは取得対象にならない）
+CREATE INDEX idx_agenda_jobs_queued ON public.agenda_jobs(run_after) WHERE status = 'queued';
+CREATE INDEX idx_agenda_jobs_running ON public.agenda_jobs(updated_at) WHERE status = 'running';
+CREATE INDEX idx_agenda_jobs_user_id ON public.agenda_jobs(user_id);
+
+-- 実行できる次のジョブを1件取得して実行中にする
+-- 実行待ちで run_after を過ぎたジョブと、ワーカーが止まって p_stale_after_seconds の間
+-- 更新されていない実行中のジョブが対象。ロック中の行は飛ばすため、同時に呼んでも同じジョブは返らない。
+CREATE OR REPLACE FUNCTION public.claim_agenda_job(
+    p_worker_id TEXT,
+    p_stale_after_seconds INTEGER DEFAULT 300
+)
+RETURNS SETOF public.agenda_jobs
+LANGUAGE sql
+SET search_path = public
+AS $$
+    UPDATE public.agenda_jobs j
+    SET status = 'running',
+        stage = NULL,
+        attempts = j.attempts + 1,
+        locked_by = p_worker_id,
+        updated_at = NOW()
+    WHERE j.id = (
+        SELECT c.id
+        FROM public.agenda_jobs c
+        WHERE (c.status = 'queued' AND c.run_after <= NOW())
+           OR (c.status = 'running' AND c.updated_at < NOW() - make_interval(secs => p_stale_after_seconds))
+        ORDER BY c.run_after
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING j.*;
+$$;
+
+-- ジョブの取得はサービスキーのワーカーだけが行う
+REVOKE EXECUTE ON FUNCTION public.claim_agenda_job(TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,35 @@
+-- 定例MTGの次回開催前のアジェンダ事前生成
+-- scripts/pregenerate_agendas.py が次回開催の近い定例MTGについて agenda_jobs に生成ジョブを登録し、
+-- ワーカーが生成したアジェンダを generated_agendas に開催回の下書きとして保存する。
+
+-- 1. generated_agendas ------------------------------------------------------
+
+ALTER TABLE public.generated_agendas
+    ADD COLUMN agenda_id UUID REFERENCES public.agendas(id) ON DELETE SET NULL,  -- 下書きのアジェンダ
+    ADD COLUMN input_fingerprint TEXT;  -- 生成時の入力（ナレッジ・議事録・辞書）のフィンガープリント
+
+-- 開催回ごとに1件（upsert の on_conflict に使う）
+-- (recurring_meeting_id, target_date) 先頭で get_upcoming の検索にも使えるため、単独のインデックスは不要
+CREATE UNIQUE INDEX idx_generated_agendas_occurrence
+    ON public.generated_agendas(recurring_meeting_id, target_date);
+
+DROP INDEX IF EXISTS public.idx_generated_agendas_recurring_meeting_id;
+
+-- 2. agenda_jobs ------------------------------------------------------------
+
+ALTER TABLE public.agenda_jobs
+    ADD COLUMN recurring_meeting_id UUID REFERENCES public.recurring_meetings(id) ON DELETE CASCADE,
+    ADD COLUMN target_date TIMESTAMPTZ,
+    ADD COLUMN input_fingerprint TEXT;
+
+-- get_active_recurring_meeting_ids: 実行待ち・実行中の事前生成ジョブ
+CREATE INDEX idx_agenda_jobs_active_recurring_meeting
+    ON public.agenda_jobs(recurring_meeting_id)
+    WHERE recurring_meeting_id IS NOT NULL AND status IN ('queued', 'running');
+
+-- 3. recurring_meetings -----------------------------------------------------
+
+-- get_linked_occurring_between: 全ユーザーのエージェント紐付け済み定例MTGを次回開催日時で絞り込む
+CREATE INDEX idx_recurring_meetings_linked_next_occurrence
+    ON public.recurring_meetings(next_occurrence)
+    WHERE agent_id IS NOT NULL;
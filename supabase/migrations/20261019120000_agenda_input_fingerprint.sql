@@ -0,0 +1,10 @@
+-- アジェンダ生成の入力が変わっていない場合の再生成の省略
+-- 生成時の入力（ナレッジ・議事録・Slack・辞書）のフィンガープリントをアジェンダに保存し、
+-- 次の生成要求で一致すれば前回のアジェンダを返す。
+
+ALTER TABLE public.agendas
+    ADD COLUMN input_fingerprint TEXT;  -- 生成時の入力のフィンガープリント
+
+-- 入力が変わっていなくても生成し直すジョブ
+ALTER TABLE public.agenda_jobs
+    ADD COLUMN force BOOLEAN NOT NULL DEFAULT false;
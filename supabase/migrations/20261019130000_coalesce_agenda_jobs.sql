@@ -0,0 +1,51 @@
+-- 同じ入力のアジェンダ生成ジョブの集約
+-- ダブルクリック・複数タブ・複数メンバーが同時に生成しても、(user_id, agent_id, input_fingerprint) が
+-- 同じ実行待ち・実行中のジョブは1件だけにする。後から登録しようとした呼び出しは既存のジョブを受け取り、
+-- その完了を待つ。agenda_jobs 自体をプロセス間のロックとして使う。
+
+-- 実行待ち・実行中のジョブは入力ごとに1件（enqueue_agenda_job の ON CONFLICT に使う）
+CREATE UNIQUE INDEX idx_agenda_jobs_active_input
+    ON public.agenda_jobs(user_id, agent_id, input_fingerprint)
+    WHERE input_fingerprint IS NOT NULL AND status IN ('queued', 'running');
+
+-- ジョブを登録する。入力が同じ実行待ち・実行中のジョブがあれば、登録せずにそのジョブを返す。
+-- 既存のジョブの run_after は登録しようとしたジョブの run_after までに早める（事前生成のジッターや
+-- リトライのバックオフで先に予定されたジョブに、すぐ実行したい生成要求をまとめても待たせない）。
+-- 競合したジョブが確認の前に完了していた場合は登録し直す。
+CREATE OR REPLACE FUNCTION public.enqueue_agenda_job(p_job JSONB)
+RETURNS SETOF public.agenda_jobs
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_job public.agenda_jobs := jsonb_populate_record(NULL::public.agenda_jobs, p_job);
+BEGIN
+    LOOP
+        RETURN QUERY
+            INSERT INTO public.agenda_jobs
+            SELECT v_job.*
+            ON CONFLICT (user_id, agent_id, input_fingerprint)
+                WHERE input_fingerprint IS NOT NULL AND status IN ('queued', 'running')
+                DO NOTHING
+            RETURNING *;
+        IF FOUND THEN
+            RETURN;
+        END IF;
+
+        RETURN QUERY
+            UPDATE public.agenda_jobs j
+            SET run_after = LEAST(j.run_after, v_job.run_after)
+            WHERE j.user_id = v_job.user_id
+              AND j.agent_id = v_job.agent_id
+              AND j.input_fingerprint = v_job.input_fingerprint
+              AND j.status IN ('queued', 'running')
+            RETURNING j.*;
+        IF FOUND THEN
+            RETURN;
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- ジョブの登録はサービスキーのAPI・スクリプトだけが行う
+REVOKE EXECUTE ON FUNCTION public.enqueue_agenda_job(JSONB) FROM PUBLIC, anon, authenticated;